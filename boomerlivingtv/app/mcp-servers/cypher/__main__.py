@@ -5,8 +5,13 @@ Handles Cypher query execution and Neo4j database operations
 """
 
 import asyncio
+import json
 import os
 import logging
+import secrets
+import sys
+import time
+from collections import OrderedDict
 from typing import Any, Dict, List, Optional, Union
 from neo4j import GraphDatabase
 from mcp.server import Server
@@ -19,6 +24,11 @@ from mcp.types import (
     EmbeddedResource,
 )
 
+# shared/ is mounted next to this file in Docker and is a sibling directory locally
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared.stats import DatabaseStats
+from shared.utils import serialize_neo4j_value, serialize_record
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -29,7 +39,17 @@ class CypherServer:
         self.neo4j_user = os.getenv('NEO4J_USER', 'neo4j')
         self.neo4j_password = os.getenv('NEO4J_PASSWORD', 'password123')
         
+        # Result paging: rows per page (default and hard cap), byte budget per page,
+        # and how long / how many unfinished results are kept for continuation
+        self.default_page_rows = int(os.getenv('CYPHER_DEFAULT_ROWS', '100'))
+        self.max_page_rows = int(os.getenv('CYPHER_MAX_ROWS', '1000'))
+        self.max_page_bytes = int(os.getenv('CYPHER_MAX_BYTES', str(1024 * 1024)))
+        self.cursor_ttl_seconds = float(os.getenv('CYPHER_CURSOR_TTL_SECONDS', '300'))
+        self.max_open_cursors = int(os.getenv('CYPHER_MAX_OPEN_CURSORS', '8'))
+        self.cursors: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        
         self.neo4j_driver = None
+        self.stats = None
         self.server = Server("mcp-neo4j-cypher")
         
     async def initialize(self):
@@ -42,6 +62,10 @@ class CypherServer:
             
             # Test connection
             await self.test_connection()
+            
+            # Counts, constraints and indexes are cached and refreshed in the background
+            self.stats = DatabaseStats(neo4j_driver=self.neo4j_driver, include_schema=True)
+            self.stats.start()
             logger.info("Cypher server initialized successfully")
             
         except Exception as e:
@@ -59,47 +83,88 @@ class CypherServer:
             logger.error(f"Neo4j connection failed: {e}")
             raise
 
-    async def execute_cypher(self, query: str, parameters: Dict[str, Any] = None) -> Dict[str, Any]:
-        """Execute a Cypher query"""
+    async def execute_cypher(self, query: str = None, parameters: Dict[str, Any] = None,
+                             limit: Optional[int] = None, max_bytes: Optional[int] = None,
+                             continuation_token: Optional[str] = None,
+                             allow_continuation: bool = True) -> Dict[str, Any]:
+        """
+        Execute a Cypher query and return one page of its results.
+        
+        Records are pulled lazily and serialized until the row limit or the byte
+        budget is reached. If rows remain, the open result is kept under a
+        continuation token; calling again with that token returns the next page
+        without re-running the query.
+        
+        Args:
+            query: Cypher query (ignored when continuation_token is given)
+            parameters: Query parameters
+            limit: Maximum rows in this page (capped at CYPHER_MAX_ROWS)
+            max_bytes: Serialized byte budget for this page (capped at CYPHER_MAX_BYTES)
+            continuation_token: Token returned by a previous page
+            allow_continuation: Keep unread rows open under a token; when False the
+                result is closed after the first page and has_more marks truncation
+        """
+        self.expire_cursors()
+        limit = max(1, min(int(limit or self.default_page_rows), self.max_page_rows))
+        max_bytes = max(1, min(int(max_bytes or self.max_page_bytes), self.max_page_bytes))
+        
         try:
-            with self.neo4j_driver.session() as session:
-                result = session.run(query, parameters or {})
-                
-                # Convert result to serializable format
-                records = []
-                for record in result:
-                    record_dict = {}
-                    for key in record.keys():
-                        value = record[key]
-                        # Handle Neo4j types
-                        if hasattr(value, '__dict__'):
-                            if hasattr(value, 'labels'):  # Node
-                                record_dict[key] = {
-                                    'type': 'node',
-                                    'labels': list(value.labels),
-                                    'properties': dict(value)
-                                }
-                            elif hasattr(value, 'type'):  # Relationship
-                                record_dict[key] = {
-                                    'type': 'relationship',
-                                    'rel_type': value.type,
-                                    'properties': dict(value)
-                                }
-                            else:
-                                record_dict[key] = str(value)
-                        else:
-                            record_dict[key] = value
-                    records.append(record_dict)
-                
-                return {
-                    'success': True,
-                    'records': records,
-                    'summary': {
-                        'query': query,
-                        'parameters': parameters,
-                        'records_available': len(records)
+            if continuation_token:
+                cursor = self.cursors.pop(continuation_token, None)
+                if cursor is None:
+                    return {
+                        'success': False,
+                        'error': f"Unknown or expired continuation token: {continuation_token}"
                     }
+                query, parameters = cursor['query'], cursor['parameters']
+            else:
+                session = self.neo4j_driver.session(fetch_size=limit + 1)
+                try:
+                    result = session.run(query, parameters or {})
+                    keys = result.keys()
+                except Exception:
+                    session.close()
+                    raise
+                cursor = {'session': session, 'result': result, 'keys': keys, 'query': query,
+                          'parameters': parameters, 'rows_sent': 0}
+            
+            try:
+                records, page_bytes, stopped_by, serialization_ms = self.read_page(cursor['result'], limit, max_bytes)
+                cursor['rows_sent'] += len(records)
+                
+                # peek() buffers the next record without consuming it
+                has_more = cursor['result'].peek() is not None
+            except Exception:
+                # The cursor is no longer in self.cursors, so nothing else would close it
+                cursor['session'].close()
+                raise
+            token = None
+            if has_more and allow_continuation:
+                token = continuation_token or secrets.token_urlsafe(16)
+                cursor['expires_at'] = time.monotonic() + self.cursor_ttl_seconds
+                self.cursors[token] = cursor
+                while len(self.cursors) > self.max_open_cursors:
+                    _, oldest = self.cursors.popitem(last=False)
+                    oldest['session'].close()
+            else:
+                cursor['session'].close()
+            
+            return {
+                'success': True,
+                'columns': list(cursor['keys']),
+                'records': records,
+                'summary': {
+                    'query': query,
+                    'parameters': parameters,
+                    'rows_returned': len(records),
+                    'bytes_returned': page_bytes,
+                    'serialization_ms': round(serialization_ms, 2),
+                    'rows_returned_total': cursor['rows_sent'],
+                    'stopped_by': stopped_by if has_more else None,
+                    'has_more': has_more,
+                    'continuation_token': token
                 }
+            }
                 
         except Exception as e:
             logger.error(f"Failed to execute Cypher query: {e}")
@@ -109,47 +174,51 @@ class CypherServer:
                 'query': query,
                 'parameters': parameters
             }
+    
+    @staticmethod
+    def read_page(result, limit: int, max_bytes: int):
+        """
+        Serialize records from a result until the row limit or byte budget is hit.
+        
+        At least one record is returned, so a single oversized row cannot stall
+        pagination.
+        
+        Returns:
+            Tuple of (records, serialized bytes, 'row_limit' or 'byte_budget', serialization ms)
+        """
+        records = []
+        page_bytes = 0
+        stopped_by = 'row_limit'
+        serialization_seconds = 0.0
+        while len(records) < limit:
+            record = result.peek()
+            if record is None:
+                break
+            started = time.perf_counter()
+            row = serialize_record(record)
+            row_bytes = len(json.dumps(row, ensure_ascii=False, default=str).encode('utf-8'))
+            serialization_seconds += time.perf_counter() - started
+            if records and page_bytes + row_bytes > max_bytes:
+                stopped_by = 'byte_budget'
+                break
+            next(result)
+            records.append(row)
+            page_bytes += row_bytes
+        return records, page_bytes, stopped_by, serialization_seconds * 1000
+    
+    def expire_cursors(self) -> None:
+        """Close results whose continuation token has not been used within the TTL"""
+        now = time.monotonic()
+        for token in [token for token, cursor in self.cursors.items() if cursor['expires_at'] <= now]:
+            self.cursors.pop(token)['session'].close()
 
     async def get_database_info(self) -> Dict[str, Any]:
-        """Get Neo4j database information"""
-        try:
-            with self.neo4j_driver.session() as session:
-                # Get node counts by label
-                node_counts = {}
-                labels_result = session.run("CALL db.labels()")
-                for record in labels_result:
-                    label = record['label']
-                    count_result = session.run(f"MATCH (n:{label}) RETURN count(n) as count")
-                    node_counts[label] = count_result.single()['count']
-                
-                # Get relationship counts by type
-                rel_counts = {}
-                types_result = session.run("CALL db.relationshipTypes()")
-                for record in types_result:
-                    rel_type = record['relationshipType']
-                    count_result = session.run(f"MATCH ()-[r:{rel_type}]->() RETURN count(r) as count")
-                    rel_counts[rel_type] = count_result.single()['count']
-                
-                # Get constraints
-                constraints_result = session.run("SHOW CONSTRAINTS")
-                constraints = [dict(record) for record in constraints_result]
-                
-                # Get indexes
-                indexes_result = session.run("SHOW INDEXES")
-                indexes = [dict(record) for record in indexes_result]
-                
-                return {
-                    'node_counts': node_counts,
-                    'relationship_counts': rel_counts,
-                    'constraints': constraints,
-                    'indexes': indexes,
-                    'total_nodes': sum(node_counts.values()),
-                    'total_relationships': sum(rel_counts.values())
-                }
-                
-        except Exception as e:
-            logger.error(f"Failed to get database info: {e}")
-            return {'error': str(e)}
+        """Get Neo4j database information (cached count-store statistics)"""
+        info = await asyncio.to_thread(self.stats.get_neo4j)
+        if 'error' in info:
+            logger.error(f"Failed to get database info: {info['error']}")
+            return {'error': info['error']}
+        return info
 
     async def get_sample_data(self, limit: int = 10) -> Dict[str, Any]:
         """Get sample data from the database"""
@@ -163,7 +232,7 @@ class CypherServer:
                     node = record['n']
                     nodes.append({
                         'labels': list(node.labels),
-                        'properties': dict(node)
+                        'properties': serialize_neo4j_value(dict(node))
                     })
                 
                 # Sample relationships
@@ -174,7 +243,7 @@ class CypherServer:
                     rel = record['r']
                     relationships.append({
                         'type': rel.type,
-                        'properties': dict(rel)
+                        'properties': serialize_neo4j_value(dict(rel))
                     })
                 
                 return {
@@ -318,9 +387,22 @@ class CypherServer:
                                 "type": "object",
                                 "description": "Query parameters",
                                 "default": {}
+                            },
+                            "limit": {
+                                "type": "integer",
+                                "description": "Maximum rows to return in this page",
+                                "default": 100
+                            },
+                            "max_bytes": {
+                                "type": "integer",
+                                "description": "Byte budget for the serialized rows of this page"
+                            },
+                            "continuation_token": {
+                                "type": "string",
+                                "description": "Token from a previous page's summary; returns the next page of that query"
                             }
                         },
-                        "required": ["query"]
+                        "required": []
                     }
                 ),
                 Tool(
@@ -393,11 +475,22 @@ class CypherServer:
             if name == "execute_cypher":
                 query = arguments.get("query")
                 parameters = arguments.get("parameters", {})
-                result = await self.execute_cypher(query, parameters)
+                continuation_token = arguments.get("continuation_token")
+                if not query and not continuation_token:
+                    return [TextContent(
+                        type="text",
+                        text="Either query or continuation_token is required"
+                    )]
+                result = await self.execute_cypher(
+                    query, parameters,
+                    limit=arguments.get("limit"),
+                    max_bytes=arguments.get("max_bytes"),
+                    continuation_token=continuation_token
+                )
                 
                 return [TextContent(
                     type="text",
-                    text=f"Query Result:\n{result}"
+                    text=f"Query Result:\n{json.dumps(result, ensure_ascii=False, default=str)}"
                 )]
                 
             elif name == "get_database_schema":
@@ -436,7 +529,8 @@ class CypherServer:
                         text=f"Unknown search type: {search_type}"
                     )]
                 
-                result = await self.execute_cypher(query, params)
+                # One page only: the tool has no way to hand back a continuation token
+                result = await self.execute_cypher(query, params, limit=limit, allow_continuation=False)
                 
                 return [TextContent(
                     type="text",
@@ -461,7 +555,7 @@ class CypherServer:
                         text=f"Unknown analysis type: {analysis_type}"
                     )]
                 
-                result = await self.execute_cypher(query)
+                result = await self.execute_cypher(query, limit=self.max_page_rows, allow_continuation=False)
                 
                 return [TextContent(
                     type="text",
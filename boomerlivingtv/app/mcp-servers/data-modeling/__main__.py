@@ -263,8 +263,13 @@ class DataModelingServer:
             logger.error(f"Failed to generate Neo4j model: {e}")
             raise
 
-    async def migrate_data_to_neo4j(self) -> Dict[str, Any]:
-        """Migrate PostgreSQL data to Neo4j"""
+    async def migrate_data_to_neo4j(self, clear_existing: bool = False) -> Dict[str, Any]:
+        """
+        Migrate PostgreSQL data to Neo4j.
+        
+        Articles are upserted, so without clear_existing the graph stays
+        queryable during a refresh and re-running the migration is safe.
+        """
         try:
             conn = psycopg2.connect(**self.postgres_config)
             cursor = conn.cursor()
@@ -288,7 +293,11 @@ class DataModelingServer:
             
             with self.neo4j_driver.session() as session:
                 # Clear existing data (optional)
-                session.run("MATCH (n) DETACH DELETE n")
+                if clear_existing:
+                    session.run("""
+                        MATCH (n)
+                        CALL { WITH n DETACH DELETE n } IN TRANSACTIONS OF 10000 ROWS
+                    """).consume()
                 
                 # Create constraints and indexes
                 constraints = [
@@ -317,26 +326,30 @@ class DataModelingServer:
                     // Create Website
                     MERGE (website:Website {site_name: $site_name})
                     
-                    // Create Article
-                    CREATE (article:Article {
-                        id: $article_id,
-                        title: $title,
-                        url: $url,
-                        publish_date: date($publish_date),
-                        content: $content,
-                        summary: $summary,
-                        language: $language
-                    })
+                    // Upsert Article
+                    MERGE (article:Article {id: $article_id})
+                    SET article.title = $title,
+                        article.url = $url,
+                        article.publish_date = date($publish_date),
+                        article.content = $content,
+                        article.summary = $summary,
+                        article.language = $language
                     
-                    // Create relationships
-                    CREATE (author)-[:WROTE]->(article)
-                    CREATE (article)-[:BELONGS_TO]->(domain)
-                    CREATE (article)-[:PUBLISHED_ON]->(website)
+                    // Replace relationships left from a previous version of the article
+                    WITH author, domain, website, article
+                    CALL { WITH article
+                           OPTIONAL MATCH (article)-[r:BELONGS_TO|PUBLISHED_ON|TAGGED_WITH]->()
+                           DELETE r }
+                    CALL { WITH article
+                           OPTIONAL MATCH (:Author)-[r:WROTE]->(article)
+                           DELETE r }
+                    MERGE (author)-[:WROTE]->(article)
+                    MERGE (article)-[:BELONGS_TO]->(domain)
+                    MERGE (article)-[:PUBLISHED_ON]->(website)
                     
-                    // Create author specialization relationship
+                    // Author specialization counts are recomputed, so re-runs do not inflate them
                     MERGE (author)-[spec:SPECIALIZES_IN]->(domain)
-                    ON CREATE SET spec.article_count = 1
-                    ON MATCH SET spec.article_count = spec.article_count + 1
+                    SET spec.article_count = COUNT { (author)-[:WROTE]->(:Article)-[:BELONGS_TO]->(domain) }
                     
                     RETURN article.id as created_article
                     """
@@ -364,7 +377,7 @@ class DataModelingServer:
                             tag_cypher = """
                             MATCH (article:Article {id: $article_id})
                             MERGE (tag:Tag {name: $tag})
-                            CREATE (article)-[:TAGGED_WITH]->(tag)
+                            MERGE (article)-[:TAGGED_WITH]->(tag)
                             """
                             session.run(tag_cypher, {'article_id': article_id, 'tag': tag})
                             migration_stats['relationships'] += 1
@@ -463,7 +476,7 @@ class DataModelingServer:
                 
             elif name == "migrate_to_neo4j":
                 clear_existing = arguments.get("clear_existing", False)
-                stats = await self.migrate_data_to_neo4j()
+                stats = await self.migrate_data_to_neo4j(clear_existing)
                 
                 return [TextContent(
                     type="text",
@@ -5,16 +5,24 @@ Provides a web interface to monitor and manage MCP servers
 """
 
 import os
+import sys
+import time
 import asyncio
+import bisect
 import logging
 from typing import Dict, Any, List
-import requests
-import psycopg2
-from neo4j import GraphDatabase
+import httpx
+import asyncpg
+from neo4j import AsyncGraphDatabase
 from fastapi import FastAPI, HTTPException
 from fastapi.responses import HTMLResponse
 from pydantic import BaseModel
 
+# shared/ is mounted next to this file in Docker and is a sibling directory locally
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from shared.stats import AsyncDatabaseStats
+from shared.utils import serialize_record
+
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
@@ -34,6 +42,53 @@ class QueryRequest(BaseModel):
     query: str
     parameters: Dict[str, Any] = {}
 
+class LatencyHistogram:
+    """Fixed-bucket latency histogram for one backend"""
+    
+    # Upper bounds in milliseconds; slower calls land in the overflow bucket
+    BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+    
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self.errors = 0
+        self.total_ms = 0.0
+        self.max_ms = 0.0
+    
+    def record(self, seconds: float, succeeded: bool = True):
+        elapsed_ms = seconds * 1000
+        self.counts[bisect.bisect_left(self.BUCKETS_MS, elapsed_ms)] += 1
+        self.total_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+        if not succeeded:
+            self.errors += 1
+    
+    def percentile(self, fraction: float):
+        """Upper bound of the bucket holding the given fraction of calls (None if overflow)"""
+        total = sum(self.counts)
+        if not total:
+            return None
+        running = 0
+        for bound, count in zip(self.BUCKETS_MS + (None,), self.counts):
+            running += count
+            if running >= fraction * total:
+                return bound
+    
+    def snapshot(self) -> Dict[str, Any]:
+        total = sum(self.counts)
+        return {
+            'count': total,
+            'errors': self.errors,
+            'mean_ms': round(self.total_ms / total, 2) if total else None,
+            'max_ms': round(self.max_ms, 2),
+            'p50_ms': self.percentile(0.5),
+            'p95_ms': self.percentile(0.95),
+            'p99_ms': self.percentile(0.99),
+            'buckets': {
+                **{f"le_{bound}ms": count for bound, count in zip(self.BUCKETS_MS, self.counts)},
+                f"gt_{self.BUCKETS_MS[-1]}ms": self.counts[-1]
+            }
+        }
+
 class MCPManager:
     def __init__(self):
         self.data_modeling_url = os.getenv('MCP_DATA_MODELING_URL', 'http://localhost:8001')
@@ -46,92 +101,127 @@ class MCPManager:
             'user': os.getenv('POSTGRES_USER', 'postgres'),
             'password': os.getenv('POSTGRES_PASSWORD', 'password123')
         }
+        self.postgres_pool_size = int(os.getenv('POSTGRES_POOL_SIZE', 5))
         
         self.neo4j_uri = os.getenv('NEO4J_URI', 'bolt://localhost:7687')
         self.neo4j_user = os.getenv('NEO4J_USER', 'neo4j')
         self.neo4j_password = os.getenv('NEO4J_PASSWORD', 'password123')
+        
+        # Deadline for one status check; a slow backend reports 'timeout' instead of stalling /api/status
+        self.check_timeout = float(os.getenv('MANAGER_CHECK_TIMEOUT_SECONDS', 3))
+        
+        self.latency = {
+            name: LatencyHistogram()
+            for name in ('data_modeling', 'cypher', 'postgres', 'neo4j', 'neo4j_query')
+        }
+        
+        # Long-lived clients, opened on startup and shared by every request
+        self.http_client = None
+        self.neo4j_driver = None
+        self.postgres_pool = None
+        self.stats = None
+
+    async def start(self):
+        """Open the backend clients and start the statistics refresh"""
+        self.http_client = httpx.AsyncClient(
+            timeout=httpx.Timeout(self.check_timeout),
+            limits=httpx.Limits(max_keepalive_connections=10, keepalive_expiry=60)
+        )
+        self.neo4j_driver = AsyncGraphDatabase.driver(
+            self.neo4j_uri,
+            auth=(self.neo4j_user, self.neo4j_password)
+        )
+        # min_size=0 so the manager still starts while Postgres is down
+        self.postgres_pool = await asyncpg.create_pool(
+            min_size=0,
+            max_size=self.postgres_pool_size,
+            **self.postgres_config
+        )
+        
+        # Database figures are served from this cache, refreshed in the background
+        self.stats = AsyncDatabaseStats(
+            neo4j_driver=self.neo4j_driver,
+            postgres_pool=self.postgres_pool,
+            read_timeout_seconds=self.check_timeout,
+            on_read=lambda source, seconds, succeeded: self.latency[source].record(seconds, succeeded)
+        )
+        self.stats.start()
 
-    async def check_server_status(self, url: str) -> Dict[str, Any]:
+    async def close(self):
+        """Stop the statistics refresh and close every backend client"""
+        await self.stats.stop()
+        await self.http_client.aclose()
+        await self.neo4j_driver.close()
+        await self.postgres_pool.close()
+
+    async def check_server_status(self, name: str, url: str) -> Dict[str, Any]:
         """Check if a server is responding"""
+        started = time.perf_counter()
+        succeeded = False
         try:
-            response = requests.get(f"{url}/health", timeout=5)
+            response = await self.http_client.get(f"{url}/health")
+            succeeded = response.status_code == 200
             return {
-                'status': 'healthy' if response.status_code == 200 else 'unhealthy',
+                'status': 'healthy' if succeeded else 'unhealthy',
                 'response_time': response.elapsed.total_seconds(),
                 'status_code': response.status_code
             }
         except Exception as e:
             return {
                 'status': 'unreachable',
-                'error': str(e)
+                'error': str(e) or type(e).__name__
             }
+        finally:
+            # Also runs when with_deadline cancels the check, so timeouts are counted
+            self.latency[name].record(time.perf_counter() - started, succeeded)
 
     async def check_postgres_status(self) -> Dict[str, Any]:
-        """Check PostgreSQL connection and data"""
-        try:
-            conn = psycopg2.connect(**self.postgres_config)
-            cursor = conn.cursor()
-            
-            # Check table existence and record counts
-            cursor.execute("SELECT COUNT(*) FROM structured_content")
-            content_count = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(DISTINCT author) FROM structured_content")
-            author_count = cursor.fetchone()[0]
-            
-            cursor.execute("SELECT COUNT(DISTINCT domain) FROM structured_content")
-            domain_count = cursor.fetchone()[0]
-            
-            conn.close()
-            
-            return {
-                'status': 'healthy',
-                'content_records': content_count,
-                'unique_authors': author_count,
-                'unique_domains': domain_count
-            }
-        except Exception as e:
-            return {
-                'status': 'unhealthy',
-                'error': str(e)
-            }
+        """Check PostgreSQL connection and data (cached planner estimates)"""
+        return await self.stats.get_postgres()
 
     async def check_neo4j_status(self) -> Dict[str, Any]:
-        """Check Neo4j connection and data"""
+        """Check Neo4j connection and data (cached count-store figures)"""
+        return await self.stats.get_neo4j()
+
+    async def with_deadline(self, check) -> Dict[str, Any]:
+        """Await a status check, reporting a timeout instead of waiting past the deadline"""
         try:
-            driver = GraphDatabase.driver(
-                self.neo4j_uri,
-                auth=(self.neo4j_user, self.neo4j_password)
-            )
-            
-            with driver.session() as session:
-                # Get node and relationship counts
-                result = session.run("MATCH (n) RETURN count(n) as node_count")
-                node_count = result.single()['node_count']
-                
-                result = session.run("MATCH ()-[r]->() RETURN count(r) as rel_count")
-                rel_count = result.single()['rel_count']
-                
-                # Get label counts
-                labels_result = session.run("CALL db.labels()")
-                labels = [record['label'] for record in labels_result]
-            
-            driver.close()
-            
+            return await asyncio.wait_for(check, self.check_timeout)
+        except asyncio.TimeoutError:
             return {
-                'status': 'healthy',
-                'total_nodes': node_count,
-                'total_relationships': rel_count,
-                'node_labels': labels
+                'status': 'unreachable',
+                'error': f"No response within {self.check_timeout}s"
             }
-        except Exception as e:
-            return {
-                'status': 'unhealthy',
-                'error': str(e)
+
+    async def check_all(self) -> Dict[str, Any]:
+        """Run every status check concurrently"""
+        data_modeling, cypher, postgres, neo4j = await asyncio.gather(
+            self.with_deadline(self.check_server_status('data_modeling', self.data_modeling_url)),
+            self.with_deadline(self.check_server_status('cypher', self.cypher_url)),
+            self.with_deadline(self.check_postgres_status()),
+            self.with_deadline(self.check_neo4j_status())
+        )
+        return {
+            'servers': {
+                'Data Modeling Server': data_modeling,
+                'Cypher Server': cypher
+            },
+            'databases': {
+                'PostgreSQL': postgres,
+                'Neo4j': neo4j
             }
+        }
 
 manager = MCPManager()
 
+@app.on_event("startup")
+async def start_manager():
+    await manager.start()
+
+@app.on_event("shutdown")
+async def close_manager():
+    await manager.close()
+
 @app.get("/", response_class=HTMLResponse)
 async def dashboard():
     """Main dashboard"""
@@ -164,6 +254,11 @@ async def dashboard():
             <div id="database-status">Loading...</div>
         </div>
         
+        <div class="section">
+            <h2>Backend Latency</h2>
+            <div id="latency">Loading...</div>
+        </div>
+        
         <div class="section">
             <h2>Quick Actions</h2>
             <a href="/migrate" class="button">Migrate Data to Neo4j</a>
@@ -192,13 +287,27 @@ async def dashboard():
                                 <h3>${name}</h3>
                                 <p>Status: ${status.status}</p>
                                 ${status.error ? `<p>Error: ${status.error}</p>` : ''}
-                                ${status.content_records ? `<p>Records: ${status.content_records}</p>` : ''}
+                                ${status.content_records ? `<p>Records: ${status.estimated ? '~' : ''}${status.content_records}</p>` : ''}
                                 ${status.total_nodes ? `<p>Nodes: ${status.total_nodes}, Relationships: ${status.total_relationships}</p>` : ''}
+                                ${status.age_seconds !== undefined ? `<p>Updated ${status.age_seconds}s ago</p>` : ''}
                             </div>`
                         ).join('');
                 } catch (error) {
                     console.error('Failed to load status:', error);
                 }
+                
+                try {
+                    const response = await fetch('/api/latency');
+                    const data = await response.json();
+                    
+                    document.getElementById('latency').innerHTML = 
+                        Object.entries(data).map(([name, latency]) => 
+                            `<p>${name}: ${latency.count} calls, ${latency.errors} errors, ` +
+                            `mean ${latency.mean_ms ?? '-'} ms, p95 ${latency.p95_ms ?? '-'} ms, max ${latency.max_ms} ms</p>`
+                        ).join('');
+                } catch (error) {
+                    console.error('Failed to load latency:', error);
+                }
             }
             
             loadStatus();
@@ -211,20 +320,12 @@ async def dashboard():
 @app.get("/api/status")
 async def get_status():
     """Get status of all servers and databases"""
-    servers = {
-        'Data Modeling Server': await manager.check_server_status(manager.data_modeling_url),
-        'Cypher Server': await manager.check_server_status(manager.cypher_url)
-    }
-    
-    databases = {
-        'PostgreSQL': await manager.check_postgres_status(),
-        'Neo4j': await manager.check_neo4j_status()
-    }
-    
-    return {
-        'servers': servers,
-        'databases': databases
-    }
+    return await manager.check_all()
+
+@app.get("/api/latency")
+async def get_latency():
+    """Latency histograms of the backend calls made by the manager"""
+    return {name: histogram.snapshot() for name, histogram in manager.latency.items()}
 
 @app.post("/api/migrate")
 async def migrate_data(request: MigrationRequest):
@@ -232,11 +333,13 @@ async def migrate_data(request: MigrationRequest):
     try:
         # This would typically call the data modeling server
         # For now, we'll simulate the migration
-        postgres_status = await manager.check_postgres_status()
+        postgres_status, neo4j_status = await asyncio.gather(
+            manager.with_deadline(manager.check_postgres_status()),
+            manager.with_deadline(manager.check_neo4j_status())
+        )
         if postgres_status['status'] != 'healthy':
             raise HTTPException(status_code=400, detail="PostgreSQL is not healthy")
         
-        neo4j_status = await manager.check_neo4j_status()
         if neo4j_status['status'] != 'healthy':
             raise HTTPException(status_code=400, detail="Neo4j is not healthy")
         
@@ -253,16 +356,15 @@ async def migrate_data(request: MigrationRequest):
 async def execute_cypher(request: QueryRequest):
     """Execute a Cypher query"""
     try:
-        driver = GraphDatabase.driver(
-            manager.neo4j_uri,
-            auth=(manager.neo4j_user, manager.neo4j_password)
-        )
-        
-        with driver.session() as session:
-            result = session.run(request.query, request.parameters)
-            records = [dict(record) for record in result]
-        
-        driver.close()
+        started = time.perf_counter()
+        succeeded = False
+        try:
+            async with manager.neo4j_driver.session() as session:
+                result = await session.run(request.query, request.parameters)
+                records = [serialize_record(record) async for record in result]
+            succeeded = True
+        finally:
+            manager.latency['neo4j_query'].record(time.perf_counter() - started, succeeded)
         
         return {
             'status': 'success',
@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+Cached database statistics for MCP servers
+
+Neo4j label and relationship-type counts come from the count store in a single
+query, Postgres figures from planner estimates (pg_class / pg_stats), so a
+dashboard refresh never scans the data. Snapshots are kept for a short TTL and
+can be refreshed in the background: DatabaseStats uses blocking clients and a
+thread, AsyncDatabaseStats an async Neo4j driver, an asyncpg pool and a task.
+"""
+
+import asyncio
+import logging
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, List, Optional
+
+from .utils import serialize_record
+
+logger = logging.getLogger(__name__)
+
+# apoc.meta.stats() reads the count store: one round trip, no scans
+NEO4J_COUNTS_QUERY = """
+CALL apoc.meta.stats() YIELD nodeCount, relCount, labels, relTypesCount
+RETURN nodeCount, relCount, labels, relTypesCount
+"""
+
+# Without APOC: labels and types first, then one UNION of count-store lookups.
+# Each list is collected in its own subquery so an empty database (no labels or
+# no relationship types) still returns one row of empty lists.
+NEO4J_TOKENS_QUERY = """
+CALL { CALL db.labels() YIELD label RETURN collect(label) AS labels }
+CALL { CALL db.relationshipTypes() YIELD relationshipType RETURN collect(relationshipType) AS types }
+RETURN labels, types
+"""
+
+# Planner estimates; n_distinct < 0 is a fraction of the row count
+POSTGRES_ESTIMATES_QUERY = """
+SELECT c.reltuples::bigint AS rows,
+       (SELECT n_distinct FROM pg_stats
+         WHERE schemaname = n.nspname AND tablename = c.relname AND attname = 'author') AS authors,
+       (SELECT n_distinct FROM pg_stats
+         WHERE schemaname = n.nspname AND tablename = c.relname AND attname = 'domain') AS domains
+FROM pg_class c
+JOIN pg_namespace n ON n.oid = c.relnamespace
+WHERE c.oid = to_regclass(%s)
+"""
+
+# asyncpg takes $n placeholders instead of %s
+POSTGRES_ESTIMATES_QUERY_ASYNC = POSTGRES_ESTIMATES_QUERY.replace('%s', '$1')
+
+POSTGRES_EXACT_QUERY = """
+SELECT COUNT(*), COUNT(DISTINCT author), COUNT(DISTINCT domain) FROM {table}
+"""
+
+def _quote_name(name: str) -> str:
+    """Backtick-quote a label or relationship type for Cypher"""
+    return "`" + name.replace("`", "``") + "`"
+
+def _distinct_estimate(n_distinct: Optional[float], rows: int) -> Optional[int]:
+    """Turn a pg_stats n_distinct value into a count"""
+    if n_distinct is None:
+        return None
+    if n_distinct < 0:
+        return int(round(-n_distinct * rows))
+    return int(n_distinct)
+
+def _count_union_query(labels: List[str], types: List[str]) -> str:
+    """One UNION ALL of count-store lookups for the totals and every label and type"""
+    parts = ["MATCH (n) RETURN 'node' AS kind, '' AS name, count(n) AS count",
+             "MATCH ()-[r]->() RETURN 'rel' AS kind, '' AS name, count(r) AS count"]
+    parts += [f"MATCH (n:{_quote_name(label)}) RETURN 'node' AS kind, $labels[{i}] AS name, count(n) AS count"
+              for i, label in enumerate(labels)]
+    parts += [f"MATCH ()-[r:{_quote_name(rel_type)}]->() RETURN 'rel' AS kind, $types[{i}] AS name, count(r) AS count"
+              for i, rel_type in enumerate(types)]
+    return " UNION ALL ".join(parts)
+
+def _apoc_counts(record) -> Dict[str, Any]:
+    return _neo4j_snapshot(record['nodeCount'], record['relCount'],
+                           dict(record['labels']), dict(record['relTypesCount']))
+
+def _union_counts(rows) -> Dict[str, Any]:
+    counts = {'node': {}, 'rel': {}}
+    for row in rows:
+        counts[row['kind']][row['name']] = row['count']
+    return _neo4j_snapshot(counts['node'].pop(''), counts['rel'].pop(''), counts['node'], counts['rel'])
+
+def _neo4j_snapshot(total_nodes: int, total_relationships: int,
+                    node_counts: Dict[str, int], rel_counts: Dict[str, int]) -> Dict[str, Any]:
+    return {
+        'status': 'healthy',
+        'total_nodes': total_nodes,
+        'total_relationships': total_relationships,
+        'node_labels': sorted(node_counts),
+        'node_counts': node_counts,
+        'relationship_counts': rel_counts
+    }
+
+def _postgres_snapshot(row, estimated: bool) -> Dict[str, Any]:
+    rows, authors, domains = row
+    return {
+        'status': 'healthy',
+        'estimated': estimated,
+        'content_records': rows,
+        'unique_authors': _distinct_estimate(authors, rows) if estimated else authors,
+        'unique_domains': _distinct_estimate(domains, rows) if estimated else domains
+    }
+
+def _estimates_usable(row) -> bool:
+    # reltuples is -1 (or stats are missing) until the first ANALYZE
+    rows, authors, domains = row
+    return rows >= 0 and authors is not None and domains is not None
+
+def neo4j_counts(driver, include_schema: bool = False) -> Dict[str, Any]:
+    """
+    Gather node and relationship counts per label and type.
+
+    Args:
+        driver: Neo4j driver
+        include_schema: Also list constraints and indexes
+    """
+    with driver.session() as session:
+        try:
+            stats = _apoc_counts(session.run(NEO4J_COUNTS_QUERY).single())
+        except Exception as e:
+            logger.debug(f"apoc.meta.stats unavailable, using count-store queries: {e}")
+            tokens = session.run(NEO4J_TOKENS_QUERY).single()
+            stats = _union_counts(session.run(_count_union_query(tokens['labels'], tokens['types']),
+                                              labels=tokens['labels'], types=tokens['types']))
+
+        if include_schema:
+            stats['constraints'] = [serialize_record(record) for record in session.run("SHOW CONSTRAINTS")]
+            stats['indexes'] = [serialize_record(record) for record in session.run("SHOW INDEXES")]
+
+    return stats
+
+async def neo4j_counts_async(driver) -> Dict[str, Any]:
+    """Async-driver version of neo4j_counts (without schema)"""
+    async with driver.session() as session:
+        try:
+            result = await session.run(NEO4J_COUNTS_QUERY)
+            return _apoc_counts(await result.single())
+        except Exception as e:
+            logger.debug(f"apoc.meta.stats unavailable, using count-store queries: {e}")
+            result = await session.run(NEO4J_TOKENS_QUERY)
+            tokens = await result.single()
+            result = await session.run(_count_union_query(tokens['labels'], tokens['types']),
+                                       labels=tokens['labels'], types=tokens['types'])
+            return _union_counts([row async for row in result])
+
+def postgres_estimates(conn, table: str = 'structured_content') -> Dict[str, Any]:
+    """
+    Estimate row and distinct author/domain counts from planner statistics.
+
+    Falls back to exact counts when the table has never been analyzed.
+
+    Args:
+        conn: psycopg2 connection
+        table: Table to describe
+    """
+    with conn.cursor() as cursor:
+        cursor.execute(POSTGRES_ESTIMATES_QUERY, (table,))
+        row = cursor.fetchone()
+        if row is None:
+            raise ValueError(f"Table {table} does not exist")
+        if _estimates_usable(row):
+            return _postgres_snapshot(row, estimated=True)
+
+        cursor.execute(POSTGRES_EXACT_QUERY.format(table=table))
+        return _postgres_snapshot(cursor.fetchone(), estimated=False)
+
+async def postgres_estimates_async(pool, table: str = 'structured_content') -> Dict[str, Any]:
+    """asyncpg-pool version of postgres_estimates"""
+    async with pool.acquire() as conn:
+        row = await conn.fetchrow(POSTGRES_ESTIMATES_QUERY_ASYNC, table)
+        if row is None:
+            raise ValueError(f"Table {table} does not exist")
+        if _estimates_usable(tuple(row)):
+            return _postgres_snapshot(tuple(row), estimated=True)
+
+        row = await conn.fetchrow(POSTGRES_EXACT_QUERY.format(table=table))
+        return _postgres_snapshot(tuple(row), estimated=False)
+
+class _StatsCache:
+    """TTL bookkeeping shared by DatabaseStats and AsyncDatabaseStats; subclasses do the reads"""
+
+    def __init__(self, ttl_seconds: Optional[float] = None, refresh_interval_seconds: Optional[float] = None,
+                 on_read: Optional[Callable[[str, float, bool], None]] = None):
+        self.ttl_seconds = float(ttl_seconds if ttl_seconds is not None
+                                 else os.getenv('STATS_TTL_SECONDS', '30'))
+        self.refresh_interval_seconds = float(refresh_interval_seconds if refresh_interval_seconds is not None
+                                              else os.getenv('STATS_REFRESH_SECONDS', '15'))
+        self.on_read = on_read
+
+        # source -> (snapshot, monotonic time it was taken)
+        self.snapshots: Dict[str, tuple] = {}
+
+    def _fresh_entry(self, source: str, max_age: Optional[float]) -> Optional[tuple]:
+        """Cached (snapshot, taken_at) if it is at most max_age seconds old"""
+        entry = self.snapshots.get(source)
+        if max_age is not None and entry is not None and time.monotonic() - entry[1] <= max_age:
+            return entry
+        return None
+
+    def _failed_snapshot(self, source: str, error: Exception) -> Dict[str, Any]:
+        logger.warning(f"Failed to read {source} statistics: {error!r}")
+        return {'status': 'unhealthy', 'error': str(error) or type(error).__name__}
+
+    def _store(self, source: str, snapshot: Dict[str, Any], elapsed: float, succeeded: bool) -> tuple:
+        """Report the read and cache its snapshot"""
+        if self.on_read is not None:
+            self.on_read(source, elapsed, succeeded)
+        snapshot['query_ms'] = round(elapsed * 1000, 2)
+        self.snapshots[source] = (snapshot, time.monotonic())
+        return self.snapshots[source]
+
+    @staticmethod
+    def _with_age(entry: tuple) -> Dict[str, Any]:
+        snapshot, taken_at = entry
+        return {**snapshot, 'age_seconds': round(time.monotonic() - taken_at, 1)}
+
+class DatabaseStats(_StatsCache):
+    """TTL cache of Neo4j and Postgres statistics with optional background refresh"""
+
+    def __init__(self, neo4j_driver=None, postgres_connect: Optional[Callable[[], Any]] = None,
+                 include_schema: bool = False, ttl_seconds: Optional[float] = None,
+                 refresh_interval_seconds: Optional[float] = None):
+        """
+        Args:
+            neo4j_driver: Shared Neo4j driver (None skips Neo4j)
+            postgres_connect: Callable returning a new psycopg2 connection (None skips Postgres)
+            include_schema: Include Neo4j constraints and indexes
+            ttl_seconds: Seconds a snapshot is served before it is re-read (STATS_TTL_SECONDS)
+            refresh_interval_seconds: Background refresh period, 0 disables (STATS_REFRESH_SECONDS)
+        """
+        super().__init__(ttl_seconds, refresh_interval_seconds)
+        self.neo4j_driver = neo4j_driver
+        self.postgres_connect = postgres_connect
+        self.include_schema = include_schema
+
+        self.postgres_conn = None
+        self.locks = {'neo4j': threading.Lock(), 'postgres': threading.Lock()}
+        self.stop_event = threading.Event()
+        self.thread = None
+
+    def read_neo4j(self) -> Dict[str, Any]:
+        return neo4j_counts(self.neo4j_driver, self.include_schema)
+
+    def read_postgres(self) -> Dict[str, Any]:
+        # One connection reused across refreshes, reopened after a failure
+        if self.postgres_conn is None or self.postgres_conn.closed:
+            self.postgres_conn = self.postgres_connect()
+            self.postgres_conn.autocommit = True
+        try:
+            return postgres_estimates(self.postgres_conn)
+        except Exception:
+            self.postgres_conn.close()
+            self.postgres_conn = None
+            raise
+
+    def refresh(self, source: str, max_age: Optional[float] = None) -> tuple:
+        """
+        Re-read one source ('neo4j' or 'postgres') and cache the snapshot.
+
+        Args:
+            source: 'neo4j' or 'postgres'
+            max_age: Keep the cached snapshot if it is at most this many seconds old
+
+        Returns:
+            Tuple of (snapshot, monotonic time it was taken)
+        """
+        reader = self.read_neo4j if source == 'neo4j' else self.read_postgres
+        with self.locks[source]:
+            # Concurrent callers wait here for a single read instead of each querying
+            entry = self._fresh_entry(source, max_age)
+            if entry is not None:
+                return entry
+            started = time.perf_counter()
+            try:
+                snapshot, succeeded = reader(), True
+            except Exception as e:
+                snapshot, succeeded = self._failed_snapshot(source, e), False
+            return self._store(source, snapshot, time.perf_counter() - started, succeeded)
+
+    def get(self, source: str) -> Dict[str, Any]:
+        """
+        Get the cached statistics for a source, re-reading them if older than the TTL.
+
+        Returns:
+            Snapshot dict with 'age_seconds' added
+        """
+        entry = self._fresh_entry(source, self.ttl_seconds) or self.refresh(source, max_age=self.ttl_seconds)
+        return self._with_age(entry)
+
+    def get_neo4j(self) -> Dict[str, Any]:
+        return self.get('neo4j')
+
+    def get_postgres(self) -> Dict[str, Any]:
+        return self.get('postgres')
+
+    def sources(self):
+        if self.neo4j_driver is not None:
+            yield 'neo4j'
+        if self.postgres_connect is not None:
+            yield 'postgres'
+
+    def start(self) -> None:
+        """Start refreshing every configured source in a daemon thread"""
+        if self.refresh_interval_seconds <= 0 or self.thread is not None:
+            return
+        self.stop_event.clear()
+        self.thread = threading.Thread(target=self._refresh_loop, name="database-stats", daemon=True)
+        self.thread.start()
+
+    def _refresh_loop(self) -> None:
+        while not self.stop_event.is_set():
+            for source in self.sources():
+                self.refresh(source)
+            self.stop_event.wait(self.refresh_interval_seconds)
+
+    def stop(self) -> None:
+        """Stop the background refresh and close the Postgres connection"""
+        self.stop_event.set()
+        if self.thread is not None:
+            self.thread.join(timeout=5)
+            self.thread = None
+        if self.postgres_conn is not None:
+            self.postgres_conn.close()
+            self.postgres_conn = None
+
+class AsyncDatabaseStats(_StatsCache):
+    """asyncio counterpart of DatabaseStats for an async Neo4j driver and an asyncpg pool"""
+
+    def __init__(self, neo4j_driver=None, postgres_pool=None, ttl_seconds: Optional[float] = None,
+                 refresh_interval_seconds: Optional[float] = None, read_timeout_seconds: float = 10.0,
+                 on_read: Optional[Callable[[str, float, bool], None]] = None):
+        """
+        Args:
+            neo4j_driver: Shared async Neo4j driver (None skips Neo4j)
+            postgres_pool: asyncpg pool (None skips Postgres)
+            ttl_seconds: Seconds a snapshot is served before it is re-read (STATS_TTL_SECONDS)
+            refresh_interval_seconds: Background refresh period, 0 disables (STATS_REFRESH_SECONDS)
+            read_timeout_seconds: Deadline for one background read
+            on_read: Called with (source, seconds, succeeded) after every read
+        """
+        super().__init__(ttl_seconds, refresh_interval_seconds, on_read)
+        self.neo4j_driver = neo4j_driver
+        self.postgres_pool = postgres_pool
+        self.read_timeout_seconds = read_timeout_seconds
+
+        self.locks = {'neo4j': asyncio.Lock(), 'postgres': asyncio.Lock()}
+        self.task = None
+
+    async def refresh(self, source: str, max_age: Optional[float] = None) -> tuple:
+        """
+        Re-read one source ('neo4j' or 'postgres') and cache the snapshot.
+
+        Args:
+            source: 'neo4j' or 'postgres'
+            max_age: Keep the cached snapshot if it is at most this many seconds old
+
+        Returns:
+            Tuple of (snapshot, monotonic time it was taken)
+        """
+        async with self.locks[source]:
+            # Concurrent callers wait here for a single read instead of each querying
+            entry = self._fresh_entry(source, max_age)
+            if entry is not None:
+                return entry
+            started = time.perf_counter()
+            try:
+                if source == 'neo4j':
+                    snapshot = await neo4j_counts_async(self.neo4j_driver)
+                else:
+                    snapshot = await postgres_estimates_async(self.postgres_pool)
+                succeeded = True
+            except Exception as e:
+                snapshot, succeeded = self._failed_snapshot(source, e), False
+            except asyncio.CancelledError:
+                # A caller's deadline cut the read short; still report how long it ran
+                if self.on_read is not None:
+                    self.on_read(source, time.perf_counter() - started, False)
+                raise
+            return self._store(source, snapshot, time.perf_counter() - started, succeeded)
+
+    async def get(self, source: str) -> Dict[str, Any]:
+        """
+        Get the cached statistics for a source, re-reading them if older than the TTL.
+
+        Returns:
+            Snapshot dict with 'age_seconds' added
+        """
+        entry = self._fresh_entry(source, self.ttl_seconds) or await self.refresh(source, max_age=self.ttl_seconds)
+        return self._with_age(entry)
+
+    async def get_neo4j(self) -> Dict[str, Any]:
+        return await self.get('neo4j')
+
+    async def get_postgres(self) -> Dict[str, Any]:
+        return await self.get('postgres')
+
+    def sources(self):
+        if self.neo4j_driver is not None:
+            yield 'neo4j'
+        if self.postgres_pool is not None:
+            yield 'postgres'
+
+    def start(self) -> None:
+        """Start refreshing every configured source in a background task"""
+        if self.refresh_interval_seconds <= 0 or self.task is not None:
+            return
+        self.task = asyncio.create_task(self._refresh_loop())
+
+    async def _refresh_loop(self) -> None:
+        while True:
+            await asyncio.gather(*(self._refresh_with_deadline(source) for source in self.sources()))
+            await asyncio.sleep(self.refresh_interval_seconds)
+
+    async def _refresh_with_deadline(self, source: str) -> None:
+        try:
+            await asyncio.wait_for(self.refresh(source), self.read_timeout_seconds)
+        except asyncio.TimeoutError:
+            logger.warning(f"Refreshing {source} statistics exceeded {self.read_timeout_seconds}s")
+            # Cache the failure so status requests do not each wait out the deadline again
+            error = f"No response within {self.read_timeout_seconds}s"
+            # refresh() already reported the cancelled read to on_read
+            self.snapshots[source] = ({'status': 'unhealthy', 'error': error}, time.monotonic())
+
+    async def stop(self) -> None:
+        """Cancel the background refresh"""
+        if self.task is not None:
+            self.task.cancel()
+            try:
+                await self.task
+            except asyncio.CancelledError:
+                pass
+            self.task = None
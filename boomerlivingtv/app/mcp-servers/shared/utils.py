@@ -6,7 +6,10 @@ Shared utilities for MCP servers
 import logging
 import json
 from typing import Any, Dict, List, Optional
-from datetime import datetime, date
+from datetime import datetime, date, time
+from neo4j.graph import Node, Relationship, Path
+from neo4j.spatial import Point
+from neo4j.time import Date as Neo4jDate, DateTime as Neo4jDateTime, Time as Neo4jTime, Duration as Neo4jDuration
 
 def setup_logging(name: str, level: str = "INFO") -> logging.Logger:
     """Setup logging for MCP servers"""
@@ -23,37 +26,100 @@ def setup_logging(name: str, level: str = "INFO") -> logging.Logger:
     
     return logger
 
-def serialize_neo4j_value(value: Any) -> Any:
-    """Serialize Neo4j values to JSON-compatible format"""
-    if hasattr(value, '__dict__'):
-        if hasattr(value, 'labels'):  # Node
-            return {
-                'type': 'node',
-                'labels': list(value.labels),
-                'properties': dict(value)
-            }
-        elif hasattr(value, 'type'):  # Relationship
-            return {
-                'type': 'relationship',
-                'rel_type': value.type,
-                'properties': dict(value)
-            }
-        else:
-            return str(value)
-    elif isinstance(value, (datetime, date)):
-        return value.isoformat()
+# Types returned unchanged by serialize_neo4j_value
+_PASSTHROUGH_TYPES = frozenset([str, int, float, bool, type(None)])
+
+def _serialize_properties(entity: Any) -> Dict[str, Any]:
+    """Serialize the properties of a node or relationship"""
+    return {key: serialize_neo4j_value(value) for key, value in entity.items()}
+
+def _serialize_node(node: Node) -> Dict[str, Any]:
+    return {
+        'type': 'node',
+        'labels': list(node.labels),
+        'properties': _serialize_properties(node)
+    }
+
+def _serialize_relationship(relationship: Relationship) -> Dict[str, Any]:
+    return {
+        'type': 'relationship',
+        'rel_type': relationship.type,
+        'properties': _serialize_properties(relationship)
+    }
+
+def _serialize_path(path: Path) -> Dict[str, Any]:
+    return {
+        'type': 'path',
+        'nodes': [_serialize_node(node) for node in path.nodes],
+        'relationships': [_serialize_relationship(rel) for rel in path.relationships]
+    }
+
+def _serialize_point(point: Point) -> Dict[str, Any]:
+    return {'type': 'point', 'srid': point.srid, 'coordinates': list(point)}
+
+def _serialize_list(values: Any) -> List[Any]:
+    return [serialize_neo4j_value(value) for value in values]
+
+def _serialize_dict(values: Dict[Any, Any]) -> Dict[str, Any]:
+    return {str(key): serialize_neo4j_value(value) for key, value in values.items()}
+
+def _iso_format(value: Any) -> str:
+    return value.iso_format()
+
+def _isoformat(value: Any) -> str:
+    return value.isoformat()
+
+# Serializer per exact type. Subclasses (neo4j builds one Relationship class per
+# relationship type) are resolved through the MRO once and cached here.
+_SERIALIZERS = {
+    Node: _serialize_node,
+    Relationship: _serialize_relationship,
+    Path: _serialize_path,
+    Neo4jDate: _iso_format,
+    Neo4jDateTime: _iso_format,
+    Neo4jTime: _iso_format,
+    Neo4jDuration: _iso_format,
+    datetime: _isoformat,
+    date: _isoformat,
+    time: _isoformat,
+    list: _serialize_list,
+    tuple: _serialize_list,
+    dict: _serialize_dict,
+    bytes: lambda value: value.hex(),
+}
+
+def _resolve_serializer(value_type: type):
+    """Find (and cache) the serializer for a type not registered directly"""
+    if issubclass(value_type, Point):
+        # Points are tuples, so check them before walking the MRO
+        serializer = _serialize_point
     else:
+        serializer = next(
+            (_SERIALIZERS[base] for base in value_type.__mro__[1:] if base in _SERIALIZERS), str
+        )
+    _SERIALIZERS[value_type] = serializer
+    return serializer
+
+def serialize_neo4j_value(value: Any) -> Any:
+    """
+    Serialize Neo4j values to JSON-compatible format.
+    
+    Dispatches on the exact type with one dict lookup instead of probing
+    attributes; nested lists, maps and entity properties are serialized too.
+    """
+    value_type = type(value)
+    if value_type in _PASSTHROUGH_TYPES:
         return value
+    serializer = _SERIALIZERS.get(value_type) or _resolve_serializer(value_type)
+    return serializer(value)
+
+def serialize_record(record: Any) -> Dict[str, Any]:
+    """Serialize a neo4j Record (or any mapping) to a JSON-compatible dict"""
+    return {key: serialize_neo4j_value(value) for key, value in record.items()}
 
 def format_cypher_result(records: List[Dict[str, Any]]) -> Dict[str, Any]:
     """Format Cypher query results for display"""
-    formatted_records = []
-    
-    for record in records:
-        formatted_record = {}
-        for key, value in record.items():
-            formatted_record[key] = serialize_neo4j_value(value)
-        formatted_records.append(formatted_record)
+    formatted_records = [serialize_record(record) for record in records]
     
     return {
         'records': formatted_records,
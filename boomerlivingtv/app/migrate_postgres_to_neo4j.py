@@ -2,11 +2,28 @@
 """
 Migrate PostgreSQL structured_content data to Neo4j
 This script creates a comprehensive graph model based on the structured_content table
+
+Rows are streamed through a server-side cursor and written as UNWIND batches, and
+every derived node/relationship phase runs as committed sub-transactions, so memory
+stays bounded regardless of the table size.
+
+A delta mode upserts only rows extracted after the last migrated (extracted_at, id)
+and recomputes aggregates for the affected keys, checkpointing as it goes.
+
+Usage:
+    python migrate_postgres_to_neo4j.py [--batch-size 5000] [--parallelism 4]
+    python migrate_postgres_to_neo4j.py --mode delta [--checkpoint migration_checkpoint.json]
 """
 
+import argparse
+import os
 import psycopg2
 import json
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from neo4j import GraphDatabase
+from neo4j.exceptions import TransientError
 from datetime import datetime
 import sys
 
@@ -25,10 +42,33 @@ NEO4J_CONFIG = {
     'password': 'password123'
 }
 
+# Rows per UNWIND batch / sub-transaction, and concurrent writers per phase.
+# parallelism > 1 uses CALL { ... } IN n CONCURRENT TRANSACTIONS (Neo4j 5.21+)
+MIGRATION_CONFIG = {
+    'batch_size': 5000,
+    'parallelism': 1,
+    'checkpoint_path': 'migration_checkpoint.json'
+}
+
+ARTICLE_COLUMNS = """
+    id, url, raw_html_id, domain, site_name, title, author,
+    publish_date, summary, tags, language, extracted_at, is_latest, run_id
+"""
+
+# Article properties whose values key the aggregated nodes a delta run recomputes
+AFFECTED_KEYS = ['author', 'domain', 'site_name', 'language', 'run_id', 'tags']
+
 class PostgresNeo4jMigrator:
-    def __init__(self):
+    def __init__(self, batch_size=None, parallelism=None, checkpoint_path=None):
         self.postgres_conn = None
         self.neo4j_driver = None
+        self.batch_size = max(1, int(batch_size or MIGRATION_CONFIG['batch_size']))
+        self.parallelism = max(1, int(parallelism or MIGRATION_CONFIG['parallelism']))
+        self.checkpoint_path = checkpoint_path or MIGRATION_CONFIG['checkpoint_path']
+        self.source_records = 0
+        # Highest (extracted_at, id) written in stream order, and keys whose aggregates are stale
+        self.high_water = None
+        self.affected = {key: set() for key in AFFECTED_KEYS}
         
     def connect_databases(self):
         """Connect to both PostgreSQL and Neo4j"""
@@ -54,11 +94,42 @@ class PostgresNeo4jMigrator:
             print(f"❌ Database connection failed: {e}")
             sys.exit(1)
     
+    def in_transactions(self, concurrent=True):
+        """Suffix for CALL { ... } subqueries committing every batch_size rows"""
+        if concurrent and self.parallelism > 1:
+            return f"IN {self.parallelism} CONCURRENT TRANSACTIONS OF {self.batch_size} ROWS"
+        return f"IN TRANSACTIONS OF {self.batch_size} ROWS"
+    
+    def run_batched(self, name, query, parameters=None, concurrent=True):
+        """
+        Run a CALL { ... } IN TRANSACTIONS phase.
+        
+        The query contains an {in_transactions} placeholder. Phases MERGE rather
+        than CREATE, so when concurrent sub-transactions deadlock the phase is
+        safely re-run serially. Phases that MERGE the same relationship from
+        several driving rows pass concurrent=False.
+        """
+        concurrent = concurrent and self.parallelism > 1
+        with self.neo4j_driver.session() as session:
+            try:
+                return session.run(query.format(in_transactions=self.in_transactions(concurrent)),
+                                   parameters or {}).consume()
+            except TransientError as e:
+                if not concurrent:
+                    raise
+                print(f"⚠️  {name}: concurrent transactions failed ({e.code}), re-running serially")
+                return session.run(query.format(in_transactions=self.in_transactions(concurrent=False)),
+                                   parameters or {}).consume()
+    
     def clear_neo4j_data(self):
         """Clear existing Neo4j data"""
         print("🧹 Clearing existing Neo4j data...")
         with self.neo4j_driver.session() as session:
-            session.run("MATCH (n) DETACH DELETE n")
+            # Deleting in committed batches keeps the transaction state bounded
+            session.run(f"""
+                MATCH (n)
+                CALL {{ WITH n DETACH DELETE n }} {self.in_transactions(concurrent=False)}
+            """).consume()
         print("✅ Neo4j data cleared")
     
     def create_constraints_and_indexes(self):
@@ -78,6 +149,7 @@ class PostgresNeo4jMigrator:
             # Indexes
             "CREATE INDEX article_publish_date IF NOT EXISTS FOR (a:Article) ON (a.publish_date)",
             "CREATE INDEX article_title IF NOT EXISTS FOR (a:Article) ON (a.title)",
+            "CREATE INDEX article_url IF NOT EXISTS FOR (a:Article) ON (a.url)",
             "CREATE INDEX tag_usage IF NOT EXISTS FOR (t:Tag) ON (t.usage_count)"
         ]
         
@@ -90,101 +162,184 @@ class PostgresNeo4jMigrator:
         
         print("✅ Constraints and indexes created")
     
-    def fetch_postgres_data(self):
-        """Fetch all data from PostgreSQL structured_content table"""
-        print("📊 Fetching data from PostgreSQL...")
-        
-        cursor = self.postgres_conn.cursor()
-        
-        # Fetch all structured content (excluding 'content' field as requested)
-        cursor.execute("""
-            SELECT id, url, raw_html_id, domain, site_name, title, author, 
-                   publish_date, summary, tags, language, extracted_at, is_latest, run_id
-            FROM structured_content
-            ORDER BY id
-        """)
+    def fetch_postgres_data(self, since=None):
+        """
+        Stream structured_content rows from PostgreSQL in batches.
+        
+        A named (server-side) cursor keeps only one batch in client memory.
         
-        records = cursor.fetchall()
-        print(f"✅ Fetched {len(records)} records from PostgreSQL")
+        Args:
+            since: Optional (extracted_at, id) high-water mark; only later rows are
+                returned, ordered by (extracted_at, id)
         
-        return records
+        Yields:
+            Lists of up to batch_size row tuples
+        """
+        print(f"📊 Streaming data from PostgreSQL in batches of {self.batch_size}...")
+        
+        cursor = self.postgres_conn.cursor(name='structured_content_migration')
+        cursor.itersize = self.batch_size
+        try:
+            # Fetch structured content (excluding 'content' field as requested)
+            if since:
+                cursor.execute(f"""
+                    SELECT {ARTICLE_COLUMNS}
+                    FROM structured_content
+                    WHERE (extracted_at, id) > (%s, %s)
+                    ORDER BY extracted_at, id
+                """, (since[0], since[1]))
+            else:
+                cursor.execute(f"""
+                    SELECT {ARTICLE_COLUMNS}
+                    FROM structured_content
+                    ORDER BY id
+                """)
+            while True:
+                records = cursor.fetchmany(self.batch_size)
+                if not records:
+                    break
+                self.source_records += len(records)
+                yield records
+        finally:
+            cursor.close()
+        
+        print(f"✅ Streamed {self.source_records} records from PostgreSQL")
     
-    def create_article_nodes(self, records):
-        """Create Article nodes in Neo4j"""
-        print("📝 Creating Article nodes...")
+    @staticmethod
+    def article_row(record):
+        """Convert a structured_content row into Article UNWIND parameters"""
+        (id, url, raw_html_id, domain, site_name, title, author, 
+         publish_date, summary, tags, language, extracted_at, is_latest, run_id) = record
         
+        # Handle tags (could be JSON string or already a list)
+        if tags:
+            if isinstance(tags, str):
+                tags_list = json.loads(tags)
+            elif isinstance(tags, list):
+                tags_list = tags
+            else:
+                tags_list = []
+        else:
+            tags_list = []
+        
+        return {
+            'id': id,
+            'url': url,
+            'title': title,
+            'summary': summary,
+            'publish_date': str(publish_date) if publish_date else '2024-01-01',
+            'language': language or 'en',
+            'extracted_at': extracted_at.isoformat() if extracted_at else datetime.now().isoformat(),
+            'is_latest': is_latest if is_latest is not None else True,
+            'domain': domain,
+            'site_name': site_name,
+            'author': author,
+            'run_id': run_id,
+            'tags': tags_list
+        }
+    
+    @staticmethod
+    def _write_articles(tx, rows):
+        """Write one batch of Article nodes"""
+        tx.run("""
+            UNWIND $rows AS row
+            MERGE (a:Article {id: row.id})
+            SET a.url = row.url,
+                a.title = row.title,
+                a.summary = row.summary,
+                a.publish_date = date(row.publish_date),
+                a.language = row.language,
+                a.extracted_at = datetime(row.extracted_at),
+                a.is_latest = row.is_latest,
+                a.domain = row.domain,
+                a.site_name = row.site_name,
+                a.author = row.author,
+                a.run_id = row.run_id,
+                a.tags = row.tags
+        """, rows=rows).consume()
+        return len(rows)
+    
+    def write_article_batch(self, rows):
+        """Write one batch in its own managed (retried) transaction"""
         with self.neo4j_driver.session() as session:
-            for record in records:
-                (id, url, raw_html_id, domain, site_name, title, author, 
-                 publish_date, summary, tags, language, extracted_at, is_latest, run_id) = record
-                
-                # Handle tags (could be JSON string or already a list)
-                if tags:
-                    if isinstance(tags, str):
-                        tags_list = json.loads(tags)
-                    elif isinstance(tags, list):
-                        tags_list = tags
-                    else:
-                        tags_list = []
-                else:
-                    tags_list = []
-                
-                session.run("""
-                    CREATE (a:Article {
-                        id: $id,
-                        url: $url,
-                        title: $title,
-                        summary: $summary,
-                        publish_date: date($publish_date),
-                        language: $language,
-                        extracted_at: datetime($extracted_at),
-                        is_latest: $is_latest,
-                        domain: $domain,
-                        site_name: $site_name,
-                        author: $author,
-                        run_id: $run_id,
-                        tags: $tags
-                    })
-                """, {
-                    'id': id,
-                    'url': url,
-                    'title': title,
-                    'summary': summary,
-                    'publish_date': str(publish_date) if publish_date else '2024-01-01',
-                    'language': language or 'en',
-                    'extracted_at': extracted_at.isoformat() if extracted_at else datetime.now().isoformat(),
-                    'is_latest': is_latest if is_latest is not None else True,
-                    'domain': domain,
-                    'site_name': site_name,
-                    'author': author,
-                    'run_id': run_id,
-                    'tags': tags_list
-                })
-        
-        print(f"✅ Created {len(records)} Article nodes")
+            return session.execute_write(self._write_articles, rows)
+    
+    def write_batches(self, batches, write_batch, on_written):
+        """
+        Write streamed row batches with up to parallelism concurrent writers.
+        
+        Reading stops while 2 x parallelism batches are in flight, so memory
+        stays bounded. on_written is called in stream order, so a checkpoint
+        taken there never skips a batch that has not been committed.
+        
+        Args:
+            batches: Iterable of row tuple lists
+            write_batch: Callable writing a list of article_row dicts
+            on_written: Callable(records, result) run after each batch commits
+        """
+        in_flight = deque()
+        with ThreadPoolExecutor(max_workers=self.parallelism) as executor:
+            for records in batches:
+                rows = [self.article_row(record) for record in records]
+                in_flight.append((records, executor.submit(write_batch, rows)))
+                while len(in_flight) >= 2 * self.parallelism:
+                    records, future = in_flight.popleft()
+                    on_written(records, future.result())
+            while in_flight:
+                records, future = in_flight.popleft()
+                on_written(records, future.result())
+    
+    def advance_high_water(self, records):
+        """Track the highest (extracted_at, id) seen in written rows"""
+        for record in records:
+            if record[11] is None:
+                continue
+            key = (record[11].isoformat(), record[0])
+            if self.high_water is None or (key[0], key[1]) > (self.high_water[0], self.high_water[1]):
+                self.high_water = key
+    
+    def create_article_nodes(self, batches):
+        """Create Article nodes from streamed row batches"""
+        print(f"📝 Creating Article nodes ({self.parallelism} writers)...")
+        
+        start = time.perf_counter()
+        created = 0
+        
+        def on_written(records, count):
+            nonlocal created
+            created += count
+            self.advance_high_water(records)
+        
+        self.write_batches(batches, self.write_article_batch, on_written)
+        
+        elapsed = time.perf_counter() - start
+        rate = created / elapsed if elapsed > 0 else 0.0
+        print(f"✅ Created {created} Article nodes ({rate:.0f} rows/s)")
+        return created
     
     def create_author_nodes(self):
         """Create Author nodes with aggregated properties"""
         print("👥 Creating Author nodes...")
         
-        with self.neo4j_driver.session() as session:
-            session.run("""
-                MATCH (a:Article)
-                WHERE a.author IS NOT NULL
-                WITH a.author AS author_name, 
-                     count(a) AS total_articles,
-                     min(a.publish_date) AS first_publication,
-                     max(a.publish_date) AS latest_publication,
-                     collect(DISTINCT a.domain)[0] AS primary_domain
-                CREATE (author:Author {
-                    name: author_name,
-                    total_articles: total_articles,
-                    specialization: primary_domain,
-                    first_publication: first_publication,
-                    latest_publication: latest_publication
-                })
-            """)
+        self.run_batched('Author', """
+            MATCH (a:Article)
+            WHERE a.author IS NOT NULL
+            WITH a.author AS author_name, 
+                 count(a) AS total_articles,
+                 min(a.publish_date) AS first_publication,
+                 max(a.publish_date) AS latest_publication,
+                 collect(DISTINCT a.domain)[0] AS primary_domain
+            CALL {{
+                WITH author_name, total_articles, first_publication, latest_publication, primary_domain
+                MERGE (author:Author {{name: author_name}})
+                SET author.total_articles = total_articles,
+                    author.specialization = primary_domain,
+                    author.first_publication = first_publication,
+                    author.latest_publication = latest_publication
+            }} {in_transactions}
+        """)
         
+        with self.neo4j_driver.session() as session:
             # Get count of created authors
             result = session.run("MATCH (a:Author) RETURN count(a) as count")
             author_count = result.single()['count']
@@ -194,21 +349,22 @@ class PostgresNeo4jMigrator:
         """Create Domain nodes with statistics"""
         print("🏷️ Creating Domain nodes...")
         
-        with self.neo4j_driver.session() as session:
-            session.run("""
-                MATCH (a:Article)
-                WHERE a.domain IS NOT NULL
-                WITH a.domain AS domain_name,
-                     count(a) AS article_count,
-                     collect(DISTINCT a.author) AS authors
-                CREATE (d:Domain {
-                    name: domain_name,
-                    article_count: article_count,
-                    author_count: size(authors),
-                    description: domain_name + ' related content and research'
-                })
-            """)
+        self.run_batched('Domain', """
+            MATCH (a:Article)
+            WHERE a.domain IS NOT NULL
+            WITH a.domain AS domain_name,
+                 count(a) AS article_count,
+                 count(DISTINCT a.author) AS author_count
+            CALL {{
+                WITH domain_name, article_count, author_count
+                MERGE (d:Domain {{name: domain_name}})
+                SET d.article_count = article_count,
+                    d.author_count = author_count,
+                    d.description = domain_name + ' related content and research'
+            }} {in_transactions}
+        """)
         
+        with self.neo4j_driver.session() as session:
             result = session.run("MATCH (d:Domain) RETURN count(d) as count")
             domain_count = result.single()['count']
             print(f"✅ Created {domain_count} Domain nodes")
@@ -217,18 +373,19 @@ class PostgresNeo4jMigrator:
         """Create Tag nodes from article tags"""
         print("🔖 Creating Tag nodes...")
         
-        with self.neo4j_driver.session() as session:
-            session.run("""
-                MATCH (a:Article)
-                WHERE a.tags IS NOT NULL AND size(a.tags) > 0
-                UNWIND a.tags AS tag_name
-                WITH tag_name, count(*) AS usage_count
-                CREATE (t:Tag {
-                    name: tag_name,
-                    usage_count: usage_count
-                })
-            """)
+        self.run_batched('Tag', """
+            MATCH (a:Article)
+            WHERE a.tags IS NOT NULL AND size(a.tags) > 0
+            UNWIND a.tags AS tag_name
+            WITH tag_name, count(*) AS usage_count
+            CALL {{
+                WITH tag_name, usage_count
+                MERGE (t:Tag {{name: tag_name}})
+                SET t.usage_count = usage_count
+            }} {in_transactions}
+        """)
         
+        with self.neo4j_driver.session() as session:
             result = session.run("MATCH (t:Tag) RETURN count(t) as count")
             tag_count = result.single()['count']
             print(f"✅ Created {tag_count} Tag nodes")
@@ -237,21 +394,22 @@ class PostgresNeo4jMigrator:
         """Create Website nodes"""
         print("🌐 Creating Website nodes...")
         
-        with self.neo4j_driver.session() as session:
-            session.run("""
-                MATCH (a:Article)
-                WHERE a.site_name IS NOT NULL
-                WITH a.site_name AS site_name,
-                     count(a) AS article_count,
-                     collect(DISTINCT a.domain) AS domains
-                CREATE (w:Website {
-                    site_name: site_name,
-                    article_count: article_count,
-                    domain_categories: domains,
-                    base_url: 'https://' + toLower(replace(site_name, ' ', '')) + '.com'
-                })
-            """)
+        self.run_batched('Website', """
+            MATCH (a:Article)
+            WHERE a.site_name IS NOT NULL
+            WITH a.site_name AS site_name,
+                 count(a) AS article_count,
+                 collect(DISTINCT a.domain) AS domains
+            CALL {{
+                WITH site_name, article_count, domains
+                MERGE (w:Website {{site_name: site_name}})
+                SET w.article_count = article_count,
+                    w.domain_categories = domains,
+                    w.base_url = 'https://' + toLower(replace(site_name, ' ', '')) + '.com'
+            }} {in_transactions}
+        """)
         
+        with self.neo4j_driver.session() as session:
             result = session.run("MATCH (w:Website) RETURN count(w) as count")
             website_count = result.single()['count']
             print(f"✅ Created {website_count} Website nodes")
@@ -260,24 +418,25 @@ class PostgresNeo4jMigrator:
         """Create Language nodes"""
         print("🌍 Creating Language nodes...")
         
-        with self.neo4j_driver.session() as session:
-            session.run("""
-                MATCH (a:Article)
-                WHERE a.language IS NOT NULL
-                WITH a.language AS lang_code,
-                     count(a) AS article_count
-                CREATE (l:Language {
-                    code: lang_code,
-                    name: CASE lang_code 
-                          WHEN 'en' THEN 'English'
-                          WHEN 'es' THEN 'Spanish'
-                          WHEN 'fr' THEN 'French'
-                          ELSE 'Unknown'
-                          END,
-                    article_count: article_count
-                })
-            """)
+        self.run_batched('Language', """
+            MATCH (a:Article)
+            WHERE a.language IS NOT NULL
+            WITH a.language AS lang_code,
+                 count(a) AS article_count
+            CALL {{
+                WITH lang_code, article_count
+                MERGE (l:Language {{code: lang_code}})
+                SET l.name = CASE lang_code 
+                             WHEN 'en' THEN 'English'
+                             WHEN 'es' THEN 'Spanish'
+                             WHEN 'fr' THEN 'French'
+                             ELSE 'Unknown'
+                             END,
+                    l.article_count = article_count
+            }} {in_transactions}
+        """)
         
+        with self.neo4j_driver.session() as session:
             result = session.run("MATCH (l:Language) RETURN count(l) as count")
             language_count = result.single()['count']
             print(f"✅ Created {language_count} Language nodes")
@@ -286,42 +445,54 @@ class PostgresNeo4jMigrator:
         """Create CrawlRun nodes"""
         print("🔄 Creating CrawlRun nodes...")
         
-        with self.neo4j_driver.session() as session:
-            session.run("""
-                MATCH (a:Article)
-                WHERE a.run_id IS NOT NULL
-                WITH a.run_id AS run_id,
-                     count(a) AS total_articles,
-                     min(a.extracted_at) AS started_at,
-                     max(a.extracted_at) AS completed_at
-                CREATE (c:CrawlRun {
-                    run_id: run_id,
-                    total_articles: total_articles,
-                    started_at: started_at,
-                    completed_at: completed_at,
-                    status: 'completed'
-                })
-            """)
+        self.run_batched('CrawlRun', """
+            MATCH (a:Article)
+            WHERE a.run_id IS NOT NULL
+            WITH a.run_id AS run_id,
+                 count(a) AS total_articles,
+                 min(a.extracted_at) AS started_at,
+                 max(a.extracted_at) AS completed_at
+            CALL {{
+                WITH run_id, total_articles, started_at, completed_at
+                MERGE (c:CrawlRun {{run_id: run_id}})
+                SET c.total_articles = total_articles,
+                    c.started_at = started_at,
+                    c.completed_at = completed_at,
+                    c.status = 'completed'
+            }} {in_transactions}
+        """)
         
+        with self.neo4j_driver.session() as session:
             result = session.run("MATCH (c:CrawlRun) RETURN count(c) as count")
             crawl_count = result.single()['count']
             print(f"✅ Created {crawl_count} CrawlRun nodes")
     
     def create_relationships(self):
-        """Create all relationships between nodes"""
-        print("🔗 Creating relationships...")
+        """
+        Create all relationships between nodes.
+        
+        Each phase is driven from one node at a time (an Article, or the node
+        an aggregate is grouped by) and looks its targets up through the unique
+        constraints, committing every batch_size driving rows. This replaces the
+        global MATCH (a), (b) WHERE a.x = b.y joins that built one transaction
+        per relationship type.
+        """
+        print(f"🔗 Creating relationships (batch size {self.batch_size}, parallelism {self.parallelism})...")
         
         relationships = [
             # Author WROTE Article
             {
                 'name': 'WROTE',
                 'query': """
-                    MATCH (author:Author), (article:Article)
-                    WHERE author.name = article.author
-                    CREATE (author)-[:WROTE {
-                        publish_date: article.publish_date,
-                        article_title: article.title
-                    }]->(article)
+                    MATCH (article:Article)
+                    WHERE article.author IS NOT NULL
+                    CALL {{
+                        WITH article
+                        MATCH (author:Author {{name: article.author}})
+                        MERGE (author)-[r:WROTE]->(article)
+                        SET r.publish_date = article.publish_date,
+                            r.article_title = article.title
+                    }} {in_transactions}
                 """
             },
             
@@ -329,17 +500,20 @@ class PostgresNeo4jMigrator:
             {
                 'name': 'SPECIALIZES_IN',
                 'query': """
-                    MATCH (author:Author)-[:WROTE]->(article:Article)
-                    WITH author, article.domain AS domain, count(article) AS article_count
-                    MATCH (d:Domain {name: domain})
-                    CREATE (author)-[:SPECIALIZES_IN {
-                        article_count: article_count,
-                        expertise_level: CASE 
-                            WHEN article_count >= 10 THEN 'Expert'
-                            WHEN article_count >= 5 THEN 'Proficient'
-                            ELSE 'Contributor'
-                        END
-                    }]->(d)
+                    MATCH (author:Author)
+                    CALL {{
+                        WITH author
+                        MATCH (author)-[:WROTE]->(article:Article)
+                        WITH author, article.domain AS domain, count(article) AS article_count
+                        MATCH (d:Domain {{name: domain}})
+                        MERGE (author)-[r:SPECIALIZES_IN]->(d)
+                        SET r.article_count = article_count,
+                            r.expertise_level = CASE 
+                                WHEN article_count >= 10 THEN 'Expert'
+                                WHEN article_count >= 5 THEN 'Proficient'
+                                ELSE 'Contributor'
+                            END
+                    }} {in_transactions}
                 """
             },
             
@@ -347,9 +521,13 @@ class PostgresNeo4jMigrator:
             {
                 'name': 'BELONGS_TO',
                 'query': """
-                    MATCH (article:Article), (domain:Domain)
-                    WHERE article.domain = domain.name
-                    CREATE (article)-[:BELONGS_TO]->(domain)
+                    MATCH (article:Article)
+                    WHERE article.domain IS NOT NULL
+                    CALL {{
+                        WITH article
+                        MATCH (domain:Domain {{name: article.domain}})
+                        MERGE (article)-[:BELONGS_TO]->(domain)
+                    }} {in_transactions}
                 """
             },
             
@@ -359,11 +537,13 @@ class PostgresNeo4jMigrator:
                 'query': """
                     MATCH (article:Article)
                     WHERE article.tags IS NOT NULL AND size(article.tags) > 0
-                    UNWIND article.tags AS tag_name
-                    MATCH (t:Tag {name: tag_name})
-                    CREATE (article)-[:TAGGED_WITH {
-                        relevance_score: rand() * 0.5 + 0.5
-                    }]->(t)
+                    CALL {{
+                        WITH article
+                        UNWIND article.tags AS tag_name
+                        MATCH (t:Tag {{name: tag_name}})
+                        MERGE (article)-[r:TAGGED_WITH]->(t)
+                        ON CREATE SET r.relevance_score = rand() * 0.5 + 0.5
+                    }} {in_transactions}
                 """
             },
             
@@ -371,9 +551,13 @@ class PostgresNeo4jMigrator:
             {
                 'name': 'WRITTEN_IN',
                 'query': """
-                    MATCH (article:Article), (language:Language)
-                    WHERE article.language = language.code
-                    CREATE (article)-[:WRITTEN_IN]->(language)
+                    MATCH (article:Article)
+                    WHERE article.language IS NOT NULL
+                    CALL {{
+                        WITH article
+                        MATCH (language:Language {{code: article.language}})
+                        MERGE (article)-[:WRITTEN_IN]->(language)
+                    }} {in_transactions}
                 """
             },
             
@@ -381,11 +565,14 @@ class PostgresNeo4jMigrator:
             {
                 'name': 'PUBLISHED_ON',
                 'query': """
-                    MATCH (article:Article), (website:Website)
-                    WHERE article.site_name = website.site_name
-                    CREATE (article)-[:PUBLISHED_ON {
-                        publish_date: article.publish_date
-                    }]->(website)
+                    MATCH (article:Article)
+                    WHERE article.site_name IS NOT NULL
+                    CALL {{
+                        WITH article
+                        MATCH (website:Website {{site_name: article.site_name}})
+                        MERGE (article)-[r:PUBLISHED_ON]->(website)
+                        SET r.publish_date = article.publish_date
+                    }} {in_transactions}
                 """
             },
             
@@ -393,9 +580,13 @@ class PostgresNeo4jMigrator:
             {
                 'name': 'EXTRACTED_IN',
                 'query': """
-                    MATCH (article:Article), (crawl:CrawlRun)
-                    WHERE article.run_id = crawl.run_id
-                    CREATE (article)-[:EXTRACTED_IN]->(crawl)
+                    MATCH (article:Article)
+                    WHERE article.run_id IS NOT NULL
+                    CALL {{
+                        WITH article
+                        MATCH (crawl:CrawlRun {{run_id: article.run_id}})
+                        MERGE (article)-[:EXTRACTED_IN]->(crawl)
+                    }} {in_transactions}
                 """
             },
             
@@ -403,17 +594,20 @@ class PostgresNeo4jMigrator:
             {
                 'name': 'FOCUSES_ON',
                 'query': """
-                    MATCH (website:Website)<-[:PUBLISHED_ON]-(article:Article)-[:BELONGS_TO]->(domain:Domain)
-                    WITH website, domain, count(article) AS article_count
-                    WHERE article_count >= 1
-                    CREATE (website)-[:FOCUSES_ON {
-                        article_count: article_count,
-                        focus_strength: CASE 
-                            WHEN article_count >= 10 THEN 'Primary'
-                            WHEN article_count >= 5 THEN 'Secondary'
-                            ELSE 'Minor'
-                        END
-                    }]->(domain)
+                    MATCH (website:Website)
+                    CALL {{
+                        WITH website
+                        MATCH (website)<-[:PUBLISHED_ON]-(article:Article)-[:BELONGS_TO]->(domain:Domain)
+                        WITH website, domain, count(article) AS article_count
+                        WHERE article_count >= 1
+                        MERGE (website)-[r:FOCUSES_ON]->(domain)
+                        SET r.article_count = article_count,
+                            r.focus_strength = CASE 
+                                WHEN article_count >= 10 THEN 'Primary'
+                                WHEN article_count >= 5 THEN 'Secondary'
+                                ELSE 'Minor'
+                            END
+                    }} {in_transactions}
                 """
             },
             
@@ -421,19 +615,21 @@ class PostgresNeo4jMigrator:
             {
                 'name': 'RELATED_TO',
                 'query': """
-                    MATCH (article:Article)-[:TAGGED_WITH]->(t1:Tag)
-                    MATCH (article)-[:TAGGED_WITH]->(t2:Tag)
-                    WHERE t1 <> t2 AND id(t1) < id(t2)
-                    WITH t1, t2, count(article) AS co_occurrence_count
-                    WHERE co_occurrence_count >= 2
-                    CREATE (t1)-[:RELATED_TO {
-                        co_occurrence_count: co_occurrence_count,
-                        strength: CASE 
-                            WHEN co_occurrence_count >= 10 THEN 'Strong'
-                            WHEN co_occurrence_count >= 5 THEN 'Moderate'
-                            ELSE 'Weak'
-                        END
-                    }]->(t2)
+                    MATCH (t1:Tag)
+                    CALL {{
+                        WITH t1
+                        MATCH (t1)<-[:TAGGED_WITH]-(article:Article)-[:TAGGED_WITH]->(t2:Tag)
+                        WHERE id(t1) < id(t2)
+                        WITH t1, t2, count(article) AS co_occurrence_count
+                        WHERE co_occurrence_count >= 2
+                        MERGE (t1)-[r:RELATED_TO]->(t2)
+                        SET r.co_occurrence_count = co_occurrence_count,
+                            r.strength = CASE 
+                                WHEN co_occurrence_count >= 10 THEN 'Strong'
+                                WHEN co_occurrence_count >= 5 THEN 'Moderate'
+                                ELSE 'Weak'
+                            END
+                    }} {in_transactions}
                 """
             },
             
@@ -441,25 +637,396 @@ class PostgresNeo4jMigrator:
             {
                 'name': 'COMMONLY_USED_IN',
                 'query': """
-                    MATCH (tag:Tag)<-[:TAGGED_WITH]-(article:Article)-[:BELONGS_TO]->(domain:Domain)
-                    WITH tag, domain, count(article) AS usage_count
-                    WHERE usage_count >= 1
-                    CREATE (tag)-[:COMMONLY_USED_IN {
-                        usage_count: usage_count,
-                        usage_percentage: toFloat(usage_count) / domain.article_count * 100
-                    }]->(domain)
+                    MATCH (tag:Tag)
+                    CALL {{
+                        WITH tag
+                        MATCH (tag)<-[:TAGGED_WITH]-(article:Article)-[:BELONGS_TO]->(domain:Domain)
+                        WITH tag, domain, count(article) AS usage_count
+                        WHERE usage_count >= 1
+                        MERGE (tag)-[r:COMMONLY_USED_IN]->(domain)
+                        SET r.usage_count = usage_count,
+                            r.usage_percentage = toFloat(usage_count) / domain.article_count * 100
+                    }} {in_transactions}
                 """
             }
         ]
         
-        with self.neo4j_driver.session() as session:
-            for rel in relationships:
-                print(f"  Creating {rel['name']} relationships...")
-                result = session.run(rel['query'])
-                # Get relationship count
+        for rel in relationships:
+            print(f"  Creating {rel['name']} relationships...")
+            start = time.perf_counter()
+            self.run_batched(rel['name'], rel['query'])
+            # Get relationship count
+            with self.neo4j_driver.session() as session:
                 count_result = session.run(f"MATCH ()-[r:{rel['name']}]->() RETURN count(r) as count")
                 count = count_result.single()['count']
-                print(f"    ✅ Created {count} {rel['name']} relationships")
+            print(f"    ✅ Created {count} {rel['name']} relationships ({time.perf_counter() - start:.1f}s)")
+    
+    def load_checkpoint(self):
+        """Load the delta checkpoint, or None if there is none"""
+        if not os.path.exists(self.checkpoint_path):
+            return None
+        with open(self.checkpoint_path, 'r') as f:
+            return json.load(f)
+    
+    def save_checkpoint(self, status):
+        """
+        Atomically write the high-water mark and the keys still awaiting recompute.
+        
+        Args:
+            status: 'articles' while rows are streaming, 'aggregates' while
+                aggregates are recomputed, 'completed' once the graph is consistent
+        """
+        checkpoint = {
+            'status': status,
+            'high_water': {'extracted_at': self.high_water[0], 'id': self.high_water[1]} if self.high_water else None,
+            'affected': {key: sorted(values, key=str) for key, values in self.affected.items()},
+            'updated_at': datetime.now().isoformat()
+        }
+        directory = os.path.dirname(self.checkpoint_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        temp_path = f"{self.checkpoint_path}.tmp"
+        with open(temp_path, 'w') as f:
+            json.dump(checkpoint, f, indent=2, default=str)
+        os.replace(temp_path, self.checkpoint_path)
+    
+    def graph_high_water(self):
+        """Latest extracted_at already in the graph, used when there is no checkpoint"""
+        with self.neo4j_driver.session() as session:
+            record = session.run("MATCH (a:Article) RETURN max(a.extracted_at) AS extracted_at").single()
+        extracted_at = record['extracted_at'] if record else None
+        return (extracted_at.iso_format(), 0) if extracted_at else None
+    
+    @staticmethod
+    def _upsert_articles(tx, rows):
+        """
+        Upsert one batch of Article nodes and rebuild their own relationships.
+        
+        Returns the previous key values of each article, so aggregates keyed on
+        values an article no longer has are recomputed as well.
+        """
+        result = tx.run("""
+            UNWIND $rows AS row
+            OPTIONAL MATCH (old:Article {id: row.id})
+            WITH row, old {.author, .domain, .site_name, .language, .run_id, .tags} AS previous
+            MERGE (a:Article {id: row.id})
+            SET a.url = row.url,
+                a.title = row.title,
+                a.summary = row.summary,
+                a.publish_date = date(row.publish_date),
+                a.language = row.language,
+                a.extracted_at = datetime(row.extracted_at),
+                a.is_latest = row.is_latest,
+                a.domain = row.domain,
+                a.site_name = row.site_name,
+                a.author = row.author,
+                a.run_id = row.run_id,
+                a.tags = row.tags
+            WITH a, row, previous
+            CALL { WITH a
+                   OPTIONAL MATCH (a)-[r:BELONGS_TO|TAGGED_WITH|WRITTEN_IN|PUBLISHED_ON|EXTRACTED_IN]->()
+                   DELETE r }
+            CALL { WITH a
+                   OPTIONAL MATCH (:Author)-[r:WROTE]->(a)
+                   DELETE r }
+            CALL { WITH a, row
+                   WITH a, row WHERE row.author IS NOT NULL
+                   MERGE (author:Author {name: row.author})
+                   MERGE (author)-[r:WROTE]->(a)
+                   SET r.publish_date = a.publish_date, r.article_title = a.title }
+            CALL { WITH a, row
+                   WITH a, row WHERE row.domain IS NOT NULL
+                   MERGE (domain:Domain {name: row.domain})
+                   MERGE (a)-[:BELONGS_TO]->(domain) }
+            CALL { WITH a, row
+                   UNWIND row.tags AS tag_name
+                   MERGE (t:Tag {name: tag_name})
+                   MERGE (a)-[r:TAGGED_WITH]->(t)
+                   ON CREATE SET r.relevance_score = rand() * 0.5 + 0.5 }
+            CALL { WITH a, row
+                   WITH a, row WHERE row.language IS NOT NULL
+                   MERGE (language:Language {code: row.language})
+                   MERGE (a)-[:WRITTEN_IN]->(language) }
+            CALL { WITH a, row
+                   WITH a, row WHERE row.site_name IS NOT NULL
+                   MERGE (website:Website {site_name: row.site_name})
+                   MERGE (a)-[r:PUBLISHED_ON]->(website)
+                   SET r.publish_date = a.publish_date }
+            CALL { WITH a, row
+                   WITH a, row WHERE row.run_id IS NOT NULL
+                   MERGE (crawl:CrawlRun {run_id: row.run_id})
+                   MERGE (a)-[:EXTRACTED_IN]->(crawl) }
+            // A newer extraction of a URL supersedes the older ones
+            CALL { WITH row
+                   WITH row WHERE row.is_latest
+                   MATCH (other:Article {url: row.url})
+                   WHERE other.id <> row.id AND other.is_latest
+                   SET other.is_latest = false }
+            RETURN previous
+        """, rows=rows)
+        return [record['previous'] for record in result]
+    
+    def upsert_article_batch(self, rows):
+        """Upsert one batch in its own managed (retried) transaction"""
+        with self.neo4j_driver.session() as session:
+            return session.execute_write(self._upsert_articles, rows)
+    
+    def add_affected(self, values):
+        """Record the aggregate keys referenced by one article's property values"""
+        for key in AFFECTED_KEYS:
+            value = values.get(key)
+            if key == 'tags':
+                self.affected[key].update(value or [])
+            elif value is not None:
+                self.affected[key].add(value)
+    
+    def upsert_changed_articles(self, since):
+        """Upsert rows extracted after the high-water mark, checkpointing after each batch"""
+        print(f"📝 Upserting articles extracted after {since[0] if since else 'the beginning'}...")
+        
+        start = time.perf_counter()
+        upserted = 0
+        
+        def on_written(records, previous):
+            nonlocal upserted
+            upserted += len(records)
+            for values in previous:
+                if values:
+                    self.add_affected(values)
+            for record in records:
+                self.add_affected(self.article_row(record))
+            self.advance_high_water(records)
+            self.save_checkpoint('articles')
+        
+        self.write_batches(self.fetch_postgres_data(since=since), self.upsert_article_batch, on_written)
+        
+        elapsed = time.perf_counter() - start
+        rate = upserted / elapsed if elapsed > 0 else 0.0
+        print(f"✅ Upserted {upserted} Article nodes ({rate:.0f} rows/s)")
+        return upserted
+    
+    def recompute_aggregates(self):
+        """
+        Recompute aggregate node properties and derived relationships for the affected keys.
+        
+        Aggregates are read through each node's relationships, so only the
+        affected nodes' neighbourhoods are scanned. Nodes left without articles
+        are deleted, as a full migration would not create them.
+        """
+        print("🧮 Recomputing aggregates for affected keys...")
+        
+        phases = [
+            ('Author', 'author', """
+                UNWIND $keys AS key
+                MATCH (author:Author {{name: key}})
+                CALL {{
+                    WITH author
+                    OPTIONAL MATCH (author)-[:WROTE]->(a:Article)
+                    WITH author, count(a) AS total_articles,
+                         min(a.publish_date) AS first_publication,
+                         max(a.publish_date) AS latest_publication,
+                         collect(DISTINCT a.domain)[0] AS primary_domain
+                    SET author.total_articles = total_articles,
+                        author.specialization = primary_domain,
+                        author.first_publication = first_publication,
+                        author.latest_publication = latest_publication
+                    FOREACH (_ IN CASE WHEN total_articles = 0 THEN [1] ELSE [] END | DETACH DELETE author)
+                }} {in_transactions}
+            """),
+            ('Domain', 'domain', """
+                UNWIND $keys AS key
+                MATCH (d:Domain {{name: key}})
+                CALL {{
+                    WITH d
+                    OPTIONAL MATCH (a:Article)-[:BELONGS_TO]->(d)
+                    WITH d, count(a) AS article_count, count(DISTINCT a.author) AS author_count
+                    SET d.article_count = article_count,
+                        d.author_count = author_count,
+                        d.description = d.name + ' related content and research'
+                    FOREACH (_ IN CASE WHEN article_count = 0 THEN [1] ELSE [] END | DETACH DELETE d)
+                }} {in_transactions}
+            """),
+            ('Tag', 'tags', """
+                UNWIND $keys AS key
+                MATCH (t:Tag {{name: key}})
+                CALL {{
+                    WITH t
+                    OPTIONAL MATCH (a:Article)-[:TAGGED_WITH]->(t)
+                    WITH t, count(a) AS usage_count
+                    SET t.usage_count = usage_count
+                    FOREACH (_ IN CASE WHEN usage_count = 0 THEN [1] ELSE [] END | DETACH DELETE t)
+                }} {in_transactions}
+            """),
+            ('Website', 'site_name', """
+                UNWIND $keys AS key
+                MATCH (w:Website {{site_name: key}})
+                CALL {{
+                    WITH w
+                    OPTIONAL MATCH (a:Article)-[:PUBLISHED_ON]->(w)
+                    WITH w, count(a) AS article_count, collect(DISTINCT a.domain) AS domains
+                    SET w.article_count = article_count,
+                        w.domain_categories = domains,
+                        w.base_url = 'https://' + toLower(replace(w.site_name, ' ', '')) + '.com'
+                    FOREACH (_ IN CASE WHEN article_count = 0 THEN [1] ELSE [] END | DETACH DELETE w)
+                }} {in_transactions}
+            """),
+            ('Language', 'language', """
+                UNWIND $keys AS key
+                MATCH (l:Language {{code: key}})
+                CALL {{
+                    WITH l
+                    OPTIONAL MATCH (a:Article)-[:WRITTEN_IN]->(l)
+                    WITH l, count(a) AS article_count
+                    SET l.name = CASE l.code 
+                                 WHEN 'en' THEN 'English'
+                                 WHEN 'es' THEN 'Spanish'
+                                 WHEN 'fr' THEN 'French'
+                                 ELSE 'Unknown'
+                                 END,
+                        l.article_count = article_count
+                    FOREACH (_ IN CASE WHEN article_count = 0 THEN [1] ELSE [] END | DETACH DELETE l)
+                }} {in_transactions}
+            """),
+            ('CrawlRun', 'run_id', """
+                UNWIND $keys AS key
+                MATCH (c:CrawlRun {{run_id: key}})
+                CALL {{
+                    WITH c
+                    OPTIONAL MATCH (a:Article)-[:EXTRACTED_IN]->(c)
+                    WITH c, count(a) AS total_articles,
+                         min(a.extracted_at) AS started_at,
+                         max(a.extracted_at) AS completed_at
+                    SET c.total_articles = total_articles,
+                        c.started_at = started_at,
+                        c.completed_at = completed_at,
+                        c.status = 'completed'
+                    FOREACH (_ IN CASE WHEN total_articles = 0 THEN [1] ELSE [] END | DETACH DELETE c)
+                }} {in_transactions}
+            """),
+            ('SPECIALIZES_IN', 'author', """
+                UNWIND $keys AS key
+                MATCH (author:Author {{name: key}})
+                CALL {{
+                    WITH author
+                    CALL {{ WITH author OPTIONAL MATCH (author)-[r:SPECIALIZES_IN]->() DELETE r }}
+                    MATCH (author)-[:WROTE]->(article:Article)
+                    WITH author, article.domain AS domain, count(article) AS article_count
+                    MATCH (d:Domain {{name: domain}})
+                    MERGE (author)-[r:SPECIALIZES_IN]->(d)
+                    SET r.article_count = article_count,
+                        r.expertise_level = CASE 
+                            WHEN article_count >= 10 THEN 'Expert'
+                            WHEN article_count >= 5 THEN 'Proficient'
+                            ELSE 'Contributor'
+                        END
+                }} {in_transactions}
+            """),
+            ('FOCUSES_ON', 'site_name', """
+                UNWIND $keys AS key
+                MATCH (website:Website {{site_name: key}})
+                CALL {{
+                    WITH website
+                    CALL {{ WITH website OPTIONAL MATCH (website)-[r:FOCUSES_ON]->() DELETE r }}
+                    MATCH (website)<-[:PUBLISHED_ON]-(article:Article)-[:BELONGS_TO]->(domain:Domain)
+                    WITH website, domain, count(article) AS article_count
+                    MERGE (website)-[r:FOCUSES_ON]->(domain)
+                    SET r.article_count = article_count,
+                        r.focus_strength = CASE 
+                            WHEN article_count >= 10 THEN 'Primary'
+                            WHEN article_count >= 5 THEN 'Secondary'
+                            ELSE 'Minor'
+                        END
+                }} {in_transactions}
+            """),
+            ('COMMONLY_USED_IN', 'tags', """
+                UNWIND $keys AS key
+                MATCH (tag:Tag {{name: key}})
+                CALL {{
+                    WITH tag
+                    CALL {{ WITH tag OPTIONAL MATCH (tag)-[r:COMMONLY_USED_IN]->() DELETE r }}
+                    MATCH (tag)<-[:TAGGED_WITH]-(article:Article)-[:BELONGS_TO]->(domain:Domain)
+                    WITH tag, domain, count(article) AS usage_count
+                    MERGE (tag)-[r:COMMONLY_USED_IN]->(domain)
+                    SET r.usage_count = usage_count,
+                        r.usage_percentage = toFloat(usage_count) / domain.article_count * 100
+                }} {in_transactions}
+            """),
+            # Percentages of unaffected tags change with their domain's article count
+            ('COMMONLY_USED_IN share', 'domain', """
+                UNWIND $keys AS key
+                MATCH (domain:Domain {{name: key}})
+                CALL {{
+                    WITH domain
+                    MATCH (:Tag)-[r:COMMONLY_USED_IN]->(domain)
+                    SET r.usage_percentage = toFloat(r.usage_count) / domain.article_count * 100
+                }} {in_transactions}
+            """)
+        ]
+        
+        for name, key, query in phases:
+            keys = sorted(self.affected[key], key=str)
+            if not keys:
+                continue
+            print(f"  Recomputing {name} for {len(keys)} keys...")
+            self.run_batched(name, query, {'keys': keys})
+        
+        # Both tags of a pair may be affected, so this phase MERGEs from one writer
+        tag_keys = sorted(self.affected['tags'], key=str)
+        if tag_keys:
+            print(f"  Recomputing RELATED_TO for {len(tag_keys)} tags...")
+            self.run_batched('RELATED_TO', """
+                UNWIND $keys AS key
+                MATCH (tag:Tag {{name: key}})
+                CALL {{
+                    WITH tag
+                    CALL {{ WITH tag OPTIONAL MATCH (tag)-[r:RELATED_TO]-() DELETE r }}
+                    MATCH (tag)<-[:TAGGED_WITH]-(article:Article)-[:TAGGED_WITH]->(other:Tag)
+                    WHERE other <> tag
+                    WITH tag, other, count(article) AS co_occurrence_count
+                    WHERE co_occurrence_count >= 2
+                    WITH CASE WHEN id(tag) < id(other) THEN [tag, other] ELSE [other, tag] END AS pair,
+                         co_occurrence_count
+                    WITH pair[0] AS t1, pair[1] AS t2, co_occurrence_count
+                    MERGE (t1)-[r:RELATED_TO]->(t2)
+                    SET r.co_occurrence_count = co_occurrence_count,
+                        r.strength = CASE 
+                            WHEN co_occurrence_count >= 10 THEN 'Strong'
+                            WHEN co_occurrence_count >= 5 THEN 'Moderate'
+                            ELSE 'Weak'
+                        END
+                }} {in_transactions}
+            """, {'keys': tag_keys}, concurrent=False)
+        
+        print(f"✅ Recomputed aggregates for {sum(len(values) for values in self.affected.values())} keys")
+    
+    def migrate_delta(self):
+        """
+        Upsert articles extracted since the last run and recompute what they affect.
+        
+        The checkpoint holds the (extracted_at, id) high-water mark and the keys
+        still awaiting recompute; an interrupted run resumes from it. Without a
+        checkpoint the latest extracted_at in the graph is used.
+        """
+        checkpoint = self.load_checkpoint()
+        if checkpoint:
+            if checkpoint.get('high_water'):
+                self.high_water = (checkpoint['high_water']['extracted_at'], checkpoint['high_water']['id'])
+            for key, values in (checkpoint.get('affected') or {}).items():
+                if key in self.affected:
+                    self.affected[key].update(values)
+            if checkpoint.get('status') != 'completed':
+                print(f"↩️  Resuming interrupted delta run ({checkpoint.get('status')}) from {self.checkpoint_path}")
+        else:
+            self.high_water = self.graph_high_water()
+        
+        upserted = self.upsert_changed_articles(self.high_water)
+        
+        self.save_checkpoint('aggregates')
+        self.recompute_aggregates()
+        
+        self.affected = {key: set() for key in AFFECTED_KEYS}
+        self.save_checkpoint('completed')
+        return upserted
     
     def get_migration_statistics(self):
         """Get final migration statistics"""
@@ -539,26 +1106,38 @@ class PostgresNeo4jMigrator:
             for record in result:
                 print(f"  • {record['t.name']}: {record['t.usage_count']} uses")
     
-    def migrate(self):
-        """Run the complete migration process"""
-        print("🚀 Starting PostgreSQL to Neo4j Migration")
+    def migrate(self, mode='full'):
+        """
+        Run the migration process.
+        
+        Args:
+            mode: 'full' rebuilds the graph; 'delta' upserts rows extracted since the last checkpoint
+        """
+        print(f"🚀 Starting PostgreSQL to Neo4j Migration ({mode})")
         print("=" * 60)
         
         try:
             # Step 1: Connect to databases
             self.connect_databases()
             
+            if mode == 'delta':
+                self.create_constraints_and_indexes()
+                upserted = self.migrate_delta()
+                total_nodes, total_relationships = self.get_migration_statistics()
+                print("\n🎉 Delta Migration Completed Successfully!")
+                print(f"  • Articles Upserted: {upserted}")
+                print(f"  • Total Nodes: {total_nodes}")
+                print(f"  • Total Relationships: {total_relationships}")
+                return
+            
             # Step 2: Clear existing Neo4j data
             self.clear_neo4j_data()
             
             # Step 3: Create constraints and indexes
             self.create_constraints_and_indexes()
             
-            # Step 4: Fetch PostgreSQL data
-            records = self.fetch_postgres_data()
-            
-            # Step 5: Create nodes
-            self.create_article_nodes(records)
+            # Step 4 & 5: Stream PostgreSQL data into Article nodes, then derive the other nodes
+            self.create_article_nodes(self.fetch_postgres_data())
             self.create_author_nodes()
             self.create_domain_nodes()
             self.create_tag_nodes()
@@ -569,6 +1148,9 @@ class PostgresNeo4jMigrator:
             # Step 6: Create relationships
             self.create_relationships()
             
+            # Later delta runs continue from the newest row migrated here
+            self.save_checkpoint('completed')
+            
             # Step 7: Get statistics
             total_nodes, total_relationships = self.get_migration_statistics()
             
@@ -579,7 +1161,7 @@ class PostgresNeo4jMigrator:
             print(f"📊 Final Results:")
             print(f"  • Total Nodes: {total_nodes}")
             print(f"  • Total Relationships: {total_relationships}")
-            print(f"  • Source Records: {len(records)}")
+            print(f"  • Source Records: {self.source_records}")
             
         except Exception as e:
             print(f"❌ Migration failed: {e}")
@@ -595,8 +1177,20 @@ class PostgresNeo4jMigrator:
 
 def main():
     """Main execution function"""
-    migrator = PostgresNeo4jMigrator()
-    migrator.migrate()
+    parser = argparse.ArgumentParser(description="Migrate PostgreSQL structured_content data to Neo4j")
+    parser.add_argument('--batch-size', type=int, default=MIGRATION_CONFIG['batch_size'],
+                        help='Rows per UNWIND batch and per committed sub-transaction')
+    parser.add_argument('--parallelism', type=int, default=MIGRATION_CONFIG['parallelism'],
+                        help='Concurrent Article writers and concurrent sub-transactions per phase (Neo4j 5.21+ when > 1)')
+    parser.add_argument('--mode', choices=['full', 'delta'], default='full',
+                        help='full clears and rebuilds the graph; delta upserts rows extracted since the last checkpoint')
+    parser.add_argument('--checkpoint', default=MIGRATION_CONFIG['checkpoint_path'],
+                        help='High-water mark checkpoint written by full and delta runs')
+    args = parser.parse_args()
+    
+    migrator = PostgresNeo4jMigrator(batch_size=args.batch_size, parallelism=args.parallelism,
+                                     checkpoint_path=args.checkpoint)
+    migrator.migrate(args.mode)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
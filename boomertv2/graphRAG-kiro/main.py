@@ -13,7 +13,9 @@ import sys
 from pathlib import Path
 from typing import Dict, Any, List
 
-from modules.retrieval import get_graph_retriever
+from modules.retrieval import get_graph_retriever, SEARCH_MODES, RRF_K
+from modules.neo4j_client import ExpansionPolicy, FULLTEXT_INDEX_NAME
+from modules.retrieval_cache import RetrievalCache
 from modules.config import load_config, create_default_config_file
 from modules.exceptions import GraphRAGException
 from modules.logging_config import setup_logging, get_logger, log_exception
@@ -55,11 +57,17 @@ class GraphRAGCLI:
             
             # Initialize retriever
             neo4j_config = self.config.get("neo4j", {})
+            retrieval_config = self.config.get("retrieval", {})
             self.retriever = get_graph_retriever(
                 neo4j_uri=neo4j_config.get("uri"),
                 neo4j_username=neo4j_config.get("username"),
                 neo4j_password=neo4j_config.get("password"),
-                neo4j_database=neo4j_config.get("database", "neo4j")
+                neo4j_database=neo4j_config.get("database", "neo4j"),
+                expansion_policy=ExpansionPolicy.from_config(retrieval_config.get("expansion")),
+                result_cache=RetrievalCache.from_config(retrieval_config.get("cache")),
+                search_mode=retrieval_config.get("search_mode", "vector"),
+                rrf_k=retrieval_config.get("rrf_k", RRF_K),
+                fulltext_index=retrieval_config.get("fulltext_index", FULLTEXT_INDEX_NAME)
             )
             
             self.logger.info("GraphRAG CLI initialized successfully")
@@ -70,7 +78,7 @@ class GraphRAGCLI:
             sys.exit(1)
     
     def query(self, query_text: str, limit: int = 5, expand_graph: bool = True, 
-              output_format: str = "text") -> None:
+              output_format: str = "text", search_mode: str = None) -> None:
         """
         Perform a query and display results.
         
@@ -79,12 +87,13 @@ class GraphRAGCLI:
             limit: Maximum number of results
             expand_graph: Whether to expand graph for context
             output_format: Output format ('text', 'json')
+            search_mode: Chunk search override ('vector', 'lexical', 'hybrid')
         """
         try:
             self.logger.info(f"Processing query: {query_text[:100]}...")
             
             # Perform retrieval
-            results = self.retriever.retrieve(query_text, limit, expand_graph)
+            results = self.retriever.retrieve(query_text, limit, expand_graph, search_mode)
             
             # Display results
             if output_format == "json":
@@ -225,6 +234,7 @@ Examples:
   %(prog)s query "What is machine learning?"
   %(prog)s query "Who wrote about GPT-4?" --limit 10 --no-expand
   %(prog)s query "AI ethics" --format json
+  %(prog)s query "401(k) rollover" --mode hybrid
   %(prog)s status
   %(prog)s --config custom_config.yaml query "test query"
         """
@@ -258,6 +268,12 @@ Examples:
         default="text",
         help="Output format (default: text)"
     )
+    query_parser.add_argument(
+        "--mode", "-m",
+        choices=list(SEARCH_MODES),
+        default=None,
+        help="Chunk search mode (default: retrieval.search_mode from config)"
+    )
     
     # Status command
     subparsers.add_parser("status", help="Show system status")
@@ -279,18 +295,24 @@ def main():
     cli.initialize()
     
     # Execute command
-    if args.command == "query":
-        cli.query(
-            query_text=args.text,
-            limit=args.limit,
-            expand_graph=not args.no_expand,
-            output_format=args.format
-        )
-    elif args.command == "status":
-        cli.status()
-    else:
-        parser.print_help()
-        sys.exit(1)
+    try:
+        if args.command == "query":
+            cli.query(
+                query_text=args.text,
+                limit=args.limit,
+                expand_graph=not args.no_expand,
+                output_format=args.format,
+                search_mode=args.mode
+            )
+        elif args.command == "status":
+            cli.status()
+        else:
+            parser.print_help()
+            sys.exit(1)
+    finally:
+        # Persist cached results for the next invocation
+        if cli.retriever is not None:
+            cli.retriever.close()
 
 
 if __name__ == "__main__":
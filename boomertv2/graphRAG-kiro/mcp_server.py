@@ -17,7 +17,10 @@ from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
-from modules.retrieval import get_graph_retriever
+from modules.retrieval import get_graph_retriever, SEARCH_MODES, RRF_K
+from modules.neo4j_client import ExpansionPolicy, FULLTEXT_INDEX_NAME
+from modules.retrieval_cache import RetrievalCache
+from modules.embedding import get_embedding_generator
 from modules.config import load_config
 from modules.exceptions import MCPServerError, ErrorCodes, GraphRAGException
 from modules.logging_config import setup_logging, get_logger, log_exception, get_execution_tracer
@@ -72,6 +75,12 @@ class GraphRAGMCPServer:
                                 "type": "boolean",
                                 "description": "Whether to expand graph for additional context (default: true)",
                                 "default": True
+                            },
+                            "search_mode": {
+                                "type": "string",
+                                "description": "Chunk search: vector similarity, lexical full-text, or hybrid "
+                                               "of both fused by rank (default: configured retrieval.search_mode)",
+                                "enum": list(SEARCH_MODES)
                             }
                         },
                         "required": ["query"]
@@ -115,6 +124,7 @@ class GraphRAGMCPServer:
             
             limit = arguments.get("limit", 5)
             expand_graph = arguments.get("expand_graph", True)
+            search_mode = arguments.get("search_mode")
             
             # Validate limit
             if not isinstance(limit, int) or limit < 1 or limit > 20:
@@ -124,6 +134,14 @@ class GraphRAGMCPServer:
                     {"provided_limit": limit}
                 )
             
+            # Validate search mode
+            if search_mode is not None and search_mode not in SEARCH_MODES:
+                raise MCPServerError(
+                    ErrorCodes.MCP_INVALID_PARAMETERS,
+                    f"Parameter 'search_mode' must be one of {list(SEARCH_MODES)}",
+                    {"provided_search_mode": search_mode}
+                )
+            
             self.logger.info(f"Processing graph_retrieve request: {query[:100]}...")
             
             # Ensure retriever is initialized
@@ -132,7 +150,8 @@ class GraphRAGMCPServer:
             
             # Perform retrieval
             self.tracer.log_trace_event(request_id, "performing_retrieval")
-            results = self.retriever.retrieve(query, limit, expand_graph)
+            # Run off the event loop so concurrent requests overlap and share embedding batches
+            results = await asyncio.to_thread(self.retriever.retrieve, query, limit, expand_graph, search_mode)
             
             # Format results for MCP response
             response_data = {
@@ -142,6 +161,7 @@ class GraphRAGMCPServer:
                 "system_info": {
                     "limit": limit,
                     "expand_graph": expand_graph,
+                    "search_mode": search_mode or self.retriever.search_mode,
                     "timestamp": self.tracer.traces[request_id]["start_timestamp"]
                 }
             }
@@ -152,7 +172,8 @@ class GraphRAGMCPServer:
             self.logger.info(f"Graph retrieval completed with {len(results)} results")
             self.tracer.end_trace(request_id, "completed", {
                 "results_count": len(results),
-                "query_length": len(query)
+                "query_length": len(query),
+                "response_chars": len(formatted_response)
             })
             
             return [TextContent(type="text", text=formatted_response)]
@@ -204,13 +225,29 @@ class GraphRAGMCPServer:
             # Load configuration
             self.config = load_config(self.config_path)
             neo4j_config = self.config.get("neo4j", {})
+            retrieval_config = self.config.get("retrieval", {})
+            embedding_config = self.config.get("embedding", {})
+            
+            # Configure the shared embedding generator before the retriever uses it
+            get_embedding_generator(
+                model_name=embedding_config.get("model_name", "all-MiniLM-L6-v2"),
+                cache_size=embedding_config.get("cache_size", 1024),
+                cache_ttl_seconds=embedding_config.get("cache_ttl_seconds", 3600),
+                batch_max_size=embedding_config.get("batch_max_size", 32),
+                batch_max_wait_ms=embedding_config.get("batch_max_wait_ms", 5)
+            )
             
             # Initialize retriever
             self.retriever = get_graph_retriever(
                 neo4j_uri=neo4j_config.get("uri", "bolt://localhost:7687"),
                 neo4j_username=neo4j_config.get("username", "neo4j"),
                 neo4j_password=neo4j_config.get("password", "password"),
-                neo4j_database=neo4j_config.get("database", "neo4j")
+                neo4j_database=neo4j_config.get("database", "neo4j"),
+                expansion_policy=ExpansionPolicy.from_config(retrieval_config.get("expansion")),
+                result_cache=RetrievalCache.from_config(retrieval_config.get("cache")),
+                search_mode=retrieval_config.get("search_mode", "vector"),
+                rrf_k=retrieval_config.get("rrf_k", RRF_K),
+                fulltext_index=retrieval_config.get("fulltext_index", FULLTEXT_INDEX_NAME)
             )
             
             # Test the system
@@ -253,7 +290,11 @@ class GraphRAGMCPServer:
         
         for i, result in enumerate(results, 1):
             formatted += f"## Result {i}\n\n"
-            formatted += f"**Relevance Score:** {result['score']:.4f}\n\n"
+            formatted += f"**Relevance Score:** {result['score']:.4f}\n"
+            if result.get("source_scores"):
+                matched = ", ".join(f"{source} {score:.4f}" for source, score in result["source_scores"].items())
+                formatted += f"**Matched By:** {matched}\n"
+            formatted += "\n"
             
             # Article and author info
             article = result.get("article", {})
@@ -271,11 +312,14 @@ class GraphRAGMCPServer:
             related_chunks = context.get("related_chunks", [])
             other_articles = context.get("other_articles", [])
             
+            related_total = context.get("related_chunks_total", len(related_chunks))
+            other_total = context.get("other_articles_total", len(other_articles))
+            
             if related_chunks:
-                formatted += f"**Related Content:** {len(related_chunks)} related chunks from the same article\n"
+                formatted += f"**Related Content:** {len(related_chunks)} of {related_total} related chunks from the same article\n"
             
             if other_articles:
-                formatted += f"**Other Works by Author:** {len(other_articles)} other articles\n"
+                formatted += f"**Other Works by Author:** {len(other_articles)} of {other_total} other articles\n"
             
             formatted += "\n---\n\n"
         
@@ -305,6 +349,10 @@ class GraphRAGMCPServer:
             )
             log_exception(self.logger, error)
             raise error
+        finally:
+            # Persist cached results so a restart starts warm
+            if self.retriever is not None:
+                self.retriever.close()
 
 
 async def main():
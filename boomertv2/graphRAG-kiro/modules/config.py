@@ -168,12 +168,32 @@ def get_default_config() -> Dict[str, Any]:
             "database": "neo4j"
         },
         "embedding": {
-            "model_name": "all-MiniLM-L6-v2"
+            "model_name": "all-MiniLM-L6-v2",
+            "cache_size": 1024,
+            "cache_ttl_seconds": 3600,
+            "batch_max_size": 32,
+            "batch_max_wait_ms": 5
         },
         "retrieval": {
             "default_limit": 5,
             "max_limit": 20,
-            "default_expand_graph": True
+            "default_expand_graph": True,
+            "search_mode": "vector",
+            "rrf_k": 60,
+            "fulltext_index": "chunk_text_fulltext",
+            "expansion": {
+                "max_related_chunks": 5,
+                "max_other_articles": 5,
+                "ranking": "chunk_order",
+                "text_mode": "truncate",
+                "max_text_chars": 300
+            },
+            "cache": {
+                "max_entries": 256,
+                "ttl_seconds": 3600,
+                "version_check_interval_seconds": 5,
+                "persist_path": None
+            }
         },
         "mcp": {
             "server_name": "graphrag-retrieval-agent",
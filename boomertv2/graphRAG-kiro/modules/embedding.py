@@ -6,8 +6,15 @@ sentence-transformers. It uses the "all-MiniLM-L6-v2" model for consistent
 embedding generation that matches the Neo4j vector index.
 """
 
+import hashlib
 import logging
-from typing import List, Dict, Any, Optional
+import queue
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from concurrent.futures import Future
+from typing import Callable, List, Dict, Any, Optional, Sequence, Tuple
 from sentence_transformers import SentenceTransformer
 import torch
 
@@ -15,20 +22,237 @@ from .exceptions import EmbeddingError, ErrorCodes
 from .logging_config import get_logger, log_exception
 
 
+# Same class as boomertv2/src/embedding_cache.py and mcp_playground; this
+# image builds from its own directory, so it keeps a copy.
+class QueryEmbeddingCache:
+    """Bounded LRU cache of query embeddings with a time-to-live."""
+    
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 3600.0):
+        """
+        Initialize the cache.
+        
+        Args:
+            max_entries: Maximum number of cached embeddings (0 disables the cache)
+            ttl_seconds: Seconds an entry stays valid (0 keeps entries until evicted)
+        """
+        self.max_entries = max(0, int(max_entries))
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        # Embeddings are stored as tuples so no caller can modify a cached value
+        self._entries: "OrderedDict[str, Tuple[Tuple[float, ...], float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "saved_encode_ms": 0.0}
+    
+    @staticmethod
+    def normalize(text: str) -> str:
+        """
+        Normalize a query so trivially different spellings share an entry.
+        
+        Args:
+            text: Query text
+        
+        Returns:
+            NFC-normalized text with whitespace collapsed
+        """
+        return " ".join(unicodedata.normalize("NFC", text).split())
+    
+    @classmethod
+    def make_key(cls, model_name: str, text: str) -> str:
+        """
+        Build the cache key for a query.
+        
+        Args:
+            model_name: Embedding model name
+            text: Query text
+        
+        Returns:
+            Hex sha256 digest of the model name and normalized text
+        """
+        return hashlib.sha256(f"{model_name}\x1f{cls.normalize(text)}".encode("utf-8")).hexdigest()
+    
+    def get(self, model_name: str, text: str) -> Optional[List[float]]:
+        """
+        Look up a query embedding.
+        
+        Args:
+            model_name: Embedding model name
+            text: Query text
+        
+        Returns:
+            Copy of the cached embedding, or None on a miss or expired entry
+        """
+        if not self.max_entries:
+            return None
+        
+        key = self.make_key(model_name, text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl_seconds and entry[1] <= time.monotonic():
+                del self._entries[key]
+                self.stats["expirations"] += 1
+                entry = None
+            
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            self.stats["saved_encode_ms"] += entry[2]
+        return list(entry[0])
+    
+    def put(self, model_name: str, text: str, embedding: Sequence[float], encode_ms: float = 0.0) -> None:
+        """
+        Store a query embedding, evicting the least recently used entries over the bound.
+        
+        Args:
+            model_name: Embedding model name
+            text: Query text
+            embedding: Embedding values
+            encode_ms: Time the encode took, credited as saved on every later hit
+        """
+        if not self.max_entries or not len(embedding):
+            return
+        
+        key = self.make_key(model_name, text)
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (tuple(embedding), expires_at, encode_ms)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+    
+    def clear(self) -> None:
+        """Drop every cached embedding."""
+        with self._lock:
+            self._entries.clear()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+        
+        Returns:
+            Hit/miss counters, hit rate, saved encode time and current size
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["saved_encode_ms"] = round(stats["saved_encode_ms"], 2)
+        stats["max_entries"] = self.max_entries
+        stats["ttl_seconds"] = self.ttl_seconds
+        return stats
+
+
+class EmbeddingBatcher:
+    """
+    Micro-batches concurrent encode requests.
+    
+    Callers block in submit() while a single worker thread collects requests
+    for up to max_wait_ms (or until max_batch_size is reached) and serves them
+    with one encode call, amortizing the per-call model overhead.
+    """
+    
+    def __init__(self, encode_batch: Callable[[List[str]], List[List[float]]],
+                 max_batch_size: int = 32, max_wait_ms: float = 5.0):
+        """
+        Initialize the batcher.
+        
+        Args:
+            encode_batch: Function encoding a list of texts in one call
+            max_batch_size: Maximum number of texts per encode call
+            max_wait_ms: Longest time a request waits for others to join its batch
+        """
+        self.encode_batch = encode_batch
+        self.max_batch_size = max(1, int(max_batch_size))
+        self.max_wait_seconds = max(0.0, float(max_wait_ms)) / 1000
+        self._queue: "queue.Queue[Tuple[str, Future]]" = queue.Queue()
+        self._worker: Optional[threading.Thread] = None
+        self._worker_lock = threading.Lock()
+        self.stats = {"requests": 0, "batches": 0, "largest_batch": 0}
+    
+    def submit_many(self, texts: List[str]) -> List[List[float]]:
+        """
+        Queue texts for encoding and wait for their embeddings.
+        
+        Args:
+            texts: Texts to encode
+            
+        Returns:
+            One embedding per text, in order
+        """
+        self._ensure_worker()
+        futures = []
+        for text in texts:
+            future: Future = Future()
+            self._queue.put((text, future))
+            futures.append(future)
+        return [future.result() for future in futures]
+    
+    def submit(self, text: str) -> List[float]:
+        """Queue one text for encoding and wait for its embedding."""
+        return self.submit_many([text])[0]
+    
+    def _ensure_worker(self) -> None:
+        with self._worker_lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(target=self._run, name="embedding-batcher", daemon=True)
+                self._worker.start()
+    
+    def _run(self) -> None:
+        while True:
+            batch = [self._queue.get()]
+            deadline = time.monotonic() + self.max_wait_seconds
+            while len(batch) < self.max_batch_size:
+                remaining = deadline - time.monotonic()
+                try:
+                    batch.append(self._queue.get(timeout=remaining) if remaining > 0 else self._queue.get_nowait())
+                except queue.Empty:
+                    break
+            
+            self.stats["requests"] += len(batch)
+            self.stats["batches"] += 1
+            self.stats["largest_batch"] = max(self.stats["largest_batch"], len(batch))
+            try:
+                embeddings = self.encode_batch([text for text, _ in batch])
+            except Exception as e:
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+            
+            for (_, future), embedding in zip(batch, embeddings):
+                future.set_result(embedding)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Return request/batch counters and the average batch size."""
+        stats = dict(self.stats)
+        stats["avg_batch_size"] = round(stats["requests"] / stats["batches"], 2) if stats["batches"] else 0.0
+        return stats
+
+
 class EmbeddingGenerator:
     """Handles text embedding generation using sentence-transformers."""
     
-    def __init__(self, model_name: str = "all-MiniLM-L6-v2"):
+    def __init__(self, model_name: str = "all-MiniLM-L6-v2", cache_size: int = 1024,
+                 cache_ttl_seconds: float = 3600.0, batch_max_size: int = 32,
+                 batch_max_wait_ms: float = 5.0):
         """
         Initialize the embedding generator.
         
         Args:
             model_name: Name of the sentence-transformer model to use
+            cache_size: Maximum number of query embeddings kept in memory (0 disables caching)
+            cache_ttl_seconds: Seconds a cached query embedding stays valid
+            batch_max_size: Maximum number of concurrent requests encoded together
+            batch_max_wait_ms: Longest time a request waits for others to join its batch
         """
         self.model_name = model_name
         self.model: Optional[SentenceTransformer] = None
         self.logger = get_logger("graphrag.embedding")
         self._model_info: Optional[Dict[str, Any]] = None
+        self.cache = QueryEmbeddingCache(cache_size, cache_ttl_seconds)
+        self.batcher = EmbeddingBatcher(self._encode_batch, batch_max_size, batch_max_wait_ms)
     
     def _load_model(self) -> None:
         """Load the sentence transformer model."""
@@ -73,6 +297,9 @@ class EmbeddingGenerator:
         """
         Generate embedding for the given text.
         
+        Repeated queries are served from the in-memory query embedding cache;
+        concurrent misses are micro-batched into a single encode call.
+        
         Args:
             text: Input text to generate embedding for
             
@@ -89,10 +316,16 @@ class EmbeddingGenerator:
                 {"text_length": len(text) if text else 0}
             )
         
+        cached = self.cache.get(self.model_name, text)
+        if cached is not None:
+            return cached
+        
         # Ensure model is loaded
         self._load_model()
         
         try:
+            start_time = time.perf_counter()
+            
             self.logger.debug(
                 f"Generating embedding for text",
                 extra={
@@ -101,16 +334,8 @@ class EmbeddingGenerator:
                 }
             )
             
-            # Generate embedding
-            embedding = self.model.encode(text, convert_to_tensor=False)
-            
-            # Convert to list of floats
-            if isinstance(embedding, torch.Tensor):
-                embedding = embedding.tolist()
-            elif hasattr(embedding, 'tolist'):
-                embedding = embedding.tolist()
-            else:
-                embedding = list(float(x) for x in embedding)
+            # Generate embedding (batched with any concurrent requests)
+            embedding = self.batcher.submit(text)
             
             self.logger.debug(
                 f"Embedding generated successfully",
@@ -120,6 +345,7 @@ class EmbeddingGenerator:
                 }
             )
             
+            self.cache.put(self.model_name, text, embedding, (time.perf_counter() - start_time) * 1000)
             return embedding
             
         except Exception as e:
@@ -136,6 +362,78 @@ class EmbeddingGenerator:
             log_exception(self.logger, error)
             raise error
     
+    def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for several texts, encoding the cache misses together.
+        
+        Args:
+            texts: Input texts to generate embeddings for
+            
+        Returns:
+            One embedding per input text, in order
+            
+        Raises:
+            EmbeddingError: If any text is empty or embedding generation fails
+        """
+        for text in texts:
+            if not text or not text.strip():
+                raise EmbeddingError(
+                    ErrorCodes.EMBEDDING_TEXT_ENCODING_ERROR,
+                    "Cannot generate embedding for empty or whitespace-only text",
+                    {"text_length": len(text) if text else 0, "batch_size": len(texts)}
+                )
+        
+        embeddings: List[Optional[List[float]]] = [self.cache.get(self.model_name, text) for text in texts]
+        missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+        if not missing:
+            return embeddings
+        
+        self._load_model()
+        
+        try:
+            start_time = time.perf_counter()
+            encoded = self.batcher.submit_many([texts[i] for i in missing])
+            encode_ms = (time.perf_counter() - start_time) * 1000 / len(missing)
+            for i, embedding in zip(missing, encoded):
+                embeddings[i] = embedding
+                self.cache.put(self.model_name, texts[i], embedding, encode_ms)
+            return embeddings
+            
+        except Exception as e:
+            error = EmbeddingError(
+                ErrorCodes.EMBEDDING_GENERATION_FAILED,
+                f"Failed to generate embeddings: {str(e)}",
+                {
+                    "batch_size": len(texts),
+                    "model_name": self.model_name,
+                    "error": str(e),
+                    "error_type": type(e).__name__
+                }
+            )
+            log_exception(self.logger, error)
+            raise error
+    
+    def _encode_batch(self, texts: List[str]) -> List[List[float]]:
+        """
+        Encode a batch of texts with one model call.
+        
+        Args:
+            texts: Texts to encode
+            
+        Returns:
+            List of embeddings as lists of floats
+        """
+        embeddings = self.model.encode(texts, convert_to_tensor=False, batch_size=len(texts))
+        
+        # Convert to lists of floats
+        results = []
+        for embedding in embeddings:
+            if isinstance(embedding, torch.Tensor) or hasattr(embedding, 'tolist'):
+                results.append(embedding.tolist())
+            else:
+                results.append(list(float(x) for x in embedding))
+        return results
+    
     def get_model_info(self) -> Dict[str, Any]:
         """
         Get information about the loaded model.
@@ -162,25 +460,44 @@ class EmbeddingGenerator:
     def is_model_loaded(self) -> bool:
         """Check if the model is currently loaded."""
         return self.model is not None
+    
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get query embedding cache statistics.
+        
+        Returns:
+            Dictionary with hit rate, saved encode time and cache size, plus batching counters
+        """
+        stats = self.cache.get_stats()
+        stats["batching"] = self.batcher.get_stats()
+        return stats
 
 
 # Global embedding generator instance
 _global_generator: Optional[EmbeddingGenerator] = None
 
 
-def get_embedding_generator(model_name: str = "all-MiniLM-L6-v2") -> EmbeddingGenerator:
+def get_embedding_generator(model_name: str = "all-MiniLM-L6-v2", cache_size: int = 1024,
+                            cache_ttl_seconds: float = 3600.0, batch_max_size: int = 32,
+                            batch_max_wait_ms: float = 5.0) -> EmbeddingGenerator:
     """
     Get the global embedding generator instance.
     
     Args:
         model_name: Name of the model to use (only used on first call)
+        cache_size: Query embedding cache size (only used on first call)
+        cache_ttl_seconds: Query embedding cache TTL (only used on first call)
+        batch_max_size: Maximum micro-batch size (only used on first call)
+        batch_max_wait_ms: Maximum micro-batch wait in milliseconds (only used on first call)
         
     Returns:
         EmbeddingGenerator instance
     """
     global _global_generator
     if _global_generator is None:
-        _global_generator = EmbeddingGenerator(model_name)
+        _global_generator = EmbeddingGenerator(
+            model_name, cache_size, cache_ttl_seconds, batch_max_size, batch_max_wait_ms
+        )
     return _global_generator
 
 
@@ -201,6 +518,23 @@ def generate_embedding(text: str) -> List[float]:
     return generator.generate_embedding(text)
 
 
+def generate_embeddings(texts: List[str]) -> List[List[float]]:
+    """
+    Generate embeddings for several texts using the global generator.
+    
+    Args:
+        texts: Input texts to generate embeddings for
+        
+    Returns:
+        One embedding per input text
+        
+    Raises:
+        EmbeddingError: If embedding generation fails
+    """
+    generator = get_embedding_generator()
+    return generator.generate_embeddings(texts)
+
+
 def get_model_info() -> Dict[str, Any]:
     """
     Get information about the current embedding model.
@@ -209,4 +543,15 @@ def get_model_info() -> Dict[str, Any]:
         Dictionary containing model information
     """
     generator = get_embedding_generator()
-    return generator.get_model_info()
\ No newline at end of file
+    return generator.get_model_info()
+
+
+def get_cache_stats() -> Dict[str, Any]:
+    """
+    Get query embedding cache statistics for the global generator.
+    
+    Returns:
+        Dictionary containing cache statistics
+    """
+    generator = get_embedding_generator()
+    return generator.get_cache_stats()
@@ -6,7 +6,9 @@ similarity searches using the chunk_embeddings index, and expand graph traversal
 to retrieve connected entities (authors, articles) using the official neo4j-graphrag library.
 """
 
+import json
 import logging
+import re
 from typing import List, Dict, Any, Optional, Tuple
 from contextlib import contextmanager
 import time
@@ -18,14 +20,166 @@ from neo4j_graphrag.retrievers import VectorRetriever, VectorCypherRetriever
 from neo4j_graphrag.embeddings import SentenceTransformerEmbeddings
 from neo4j_graphrag.generation import RagTemplate
 
-from .exceptions import Neo4jError, ErrorCodes
+from .exceptions import Neo4jError, ConfigurationError, ErrorCodes
 from .logging_config import get_logger, log_exception, get_execution_tracer
 
 
+# Full-text (BM25) index over chunk text created by the batch loader
+FULLTEXT_INDEX_NAME = "chunk_text_fulltext"
+_LUCENE_SPECIAL = re.compile(r'(&&|\|\||[+\-!(){}\[\]^"~*?:\\/])')
+
+
+# Cosine similarity of two chunk embeddings written out with reduce(), since
+# vector.similarity.cosine() needs Neo4j 5.18 and the compose files run 5.15.
+# Chunks without an embedding get null, which sorts after every score.
+_EMBEDDING_COSINE = """CASE WHEN related_chunk.embedding IS NULL OR chunk.embedding IS NULL THEN null ELSE
+                    reduce(dot = 0.0, i IN range(0, size(chunk.embedding) - 1) |
+                           dot + chunk.embedding[i] * related_chunk.embedding[i])
+                    / (sqrt(reduce(norm = 0.0, x IN chunk.embedding | norm + x * x))
+                       * sqrt(reduce(norm = 0.0, x IN related_chunk.embedding | norm + x * x)))
+                END"""
+
+
+class ExpansionPolicy:
+    """Controls how much context graph expansion returns per retrieved chunk."""
+    
+    # Sort keys for related chunks; lower sorts first
+    RANKINGS = {
+        "chunk_order": "abs(coalesce(related_chunk.chunk_order, 0) - coalesce(chunk.chunk_order, 0))",
+        "similarity": f"-({_EMBEDDING_COSINE})",
+        "none": "elementId(related_chunk)"
+    }
+    TEXT_MODES = ("full", "truncate", "id_only")
+    
+    def __init__(self, max_related_chunks: int = 5, max_other_articles: int = 5,
+                 ranking: str = "chunk_order", text_mode: str = "truncate",
+                 max_text_chars: int = 300):
+        """
+        Initialize expansion policy.
+        
+        Args:
+            max_related_chunks: Maximum related chunks from the same article per chunk
+            max_other_articles: Maximum other articles by the same author per chunk
+            ranking: How related chunks are ranked before the cap is applied
+                ("chunk_order" proximity, vector "similarity" or "none")
+            text_mode: Related chunk text handling ("full", "truncate" or "id_only")
+            max_text_chars: Characters kept per related chunk in "truncate" mode
+            
+        Raises:
+            ConfigurationError: If ranking or text_mode is not recognised
+        """
+        if ranking not in self.RANKINGS:
+            raise ConfigurationError(
+                ErrorCodes.CONFIG_VALIDATION_FAILED,
+                f"Unknown expansion ranking: {ranking}",
+                {"ranking": ranking, "allowed": list(self.RANKINGS)}
+            )
+        if text_mode not in self.TEXT_MODES:
+            raise ConfigurationError(
+                ErrorCodes.CONFIG_VALIDATION_FAILED,
+                f"Unknown expansion text mode: {text_mode}",
+                {"text_mode": text_mode, "allowed": list(self.TEXT_MODES)}
+            )
+        
+        self.max_related_chunks = max(0, int(max_related_chunks))
+        self.max_other_articles = max(0, int(max_other_articles))
+        self.ranking = ranking
+        self.text_mode = text_mode
+        self.max_text_chars = max(1, int(max_text_chars))
+    
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "ExpansionPolicy":
+        """
+        Build a policy from the retrieval.expansion configuration section.
+        
+        Args:
+            config: Expansion configuration (missing keys use defaults)
+            
+        Returns:
+            ExpansionPolicy instance
+        """
+        config = config or {}
+        keys = ("max_related_chunks", "max_other_articles", "ranking", "text_mode", "max_text_chars")
+        return cls(**{key: config[key] for key in keys if key in config})
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Return the policy as a dictionary for traces and stats."""
+        return {
+            "max_related_chunks": self.max_related_chunks,
+            "max_other_articles": self.max_other_articles,
+            "ranking": self.ranking,
+            "text_mode": self.text_mode,
+            "max_text_chars": self.max_text_chars
+        }
+    
+    def build_query(self) -> str:
+        """
+        Build the expansion Cypher query for this policy.
+        
+        Neighbours are ranked and collected as node references first, so only
+        the capped slice has its properties projected into the result.
+        
+        Returns:
+            Cypher query string taking $chunk_ids and the policy parameters
+        """
+        if self.text_mode == "full":
+            related_projection = "{id: elementId(c), text: c.text}"
+        elif self.text_mode == "truncate":
+            related_projection = "{id: elementId(c), text: left(c.text, $max_text_chars)}"
+        else:
+            related_projection = "{id: elementId(c)}"
+        
+        return f"""
+            UNWIND $chunk_ids as chunk_id
+            MATCH (chunk:Chunk)
+            WHERE elementId(chunk) = chunk_id
+            
+            // Get article and author relationships
+            OPTIONAL MATCH (article:Article)-[:HAS_CHUNK]->(chunk)
+            OPTIONAL MATCH (author:Author)-[:WROTE]->(article)
+            
+            // Get ranked related chunks from same article
+            CALL {{
+                WITH chunk, article
+                MATCH (article)-[:HAS_CHUNK]->(related_chunk:Chunk)
+                WHERE related_chunk <> chunk
+                WITH related_chunk, {self.RANKINGS[self.ranking]} AS rank
+                ORDER BY rank
+                WITH collect(related_chunk) AS ranked
+                RETURN size(ranked) AS related_total,
+                       [c IN ranked[..$max_related_chunks] | {related_projection}] AS related_chunks
+            }}
+            
+            // Get other articles by same author
+            CALL {{
+                WITH author, article
+                MATCH (author)-[:WROTE]->(other_article:Article)
+                WHERE other_article <> article
+                WITH other_article ORDER BY elementId(other_article)
+                WITH collect(other_article) AS ranked
+                RETURN size(ranked) AS other_total,
+                       [a IN ranked[..$max_other_articles] | {{id: elementId(a), title: a.title}}] AS other_articles
+            }}
+            
+            RETURN
+                elementId(chunk) as chunk_id,
+                chunk.text as chunk_text,
+                elementId(article) as article_id,
+                article.title as article_title,
+                elementId(author) as author_id,
+                author.name as author_name,
+                related_chunks,
+                related_total,
+                other_articles,
+                other_total
+            """
+
+
 class Neo4jClient:
     """Handles all Neo4j database operations for GraphRAG retrieval using neo4j-graphrag library."""
     
-    def __init__(self, uri: str, username: str, password: str, database: str = "neo4j"):
+    def __init__(self, uri: str, username: str, password: str, database: str = "neo4j",
+                 expansion_policy: Optional[ExpansionPolicy] = None):
         """
         Initialize Neo4j client with GraphRAG capabilities.
         
@@ -34,11 +188,13 @@ class Neo4jClient:
             username: Neo4j username
             password: Neo4j password
             database: Database name (default: "neo4j")
+            expansion_policy: Default policy for expand_graph
         """
         self.uri = uri
         self.username = username
         self.password = password
         self.database = database
+        self.expansion_policy = expansion_policy or ExpansionPolicy()
         self.driver: Optional[Driver] = None
         self.logger = get_logger("graphrag.neo4j")
         self.tracer = get_execution_tracer("graphrag.neo4j")
@@ -201,7 +357,7 @@ class Neo4jClient:
             OPTIONAL MATCH (article:Article)-[:HAS_CHUNK]->(node)
             OPTIONAL MATCH (author:Author)-[:WROTE]->(article)
             RETURN 
-                node.text as chunk_text,
+                coalesce(node.chunk_text, node.text) as chunk_text,
                 elementId(node) as chunk_id,
                 score,
                 article.title as article_title,
@@ -265,79 +421,146 @@ class Neo4jClient:
             self.tracer.end_trace(request_id, "failed", error=error)
             raise error
     
-    def expand_graph(self, chunk_ids: List[str]) -> List[Dict[str, Any]]:
+    def fulltext_search(self, query_text: str, limit: int = 5,
+                        index_name: str = FULLTEXT_INDEX_NAME) -> List[Dict[str, Any]]:
         """
-        Expand graph to retrieve connected entities for given chunk IDs.
+        Perform lexical (BM25) search using the chunk full-text index.
+        
+        Lucene operators in the query are escaped so the text is matched as plain terms.
         
         Args:
-            chunk_ids: List of chunk element IDs to expand from
+            query_text: Natural language query
+            limit: Maximum number of results to return
+            index_name: Name of the full-text index to query
             
         Returns:
-            List of dictionaries containing expanded graph information
+            List of dictionaries containing chunk information and BM25 scores
             
         Raises:
-            Neo4jError: If graph expansion fails
+            Neo4jError: If full-text search fails
         """
-        if not chunk_ids:
-            return []
-        
-        request_id = self.tracer.start_trace("expand_graph", {
-            "chunk_ids_count": len(chunk_ids)
+        request_id = self.tracer.start_trace("fulltext_search", {
+            "query_length": len(query_text),
+            "limit": limit
         })
         
         try:
-            self.logger.debug(f"Expanding graph for {len(chunk_ids)} chunks")
+            self.logger.debug(f"Performing full-text search with limit {limit}")
             
-            # Cypher query to expand graph relationships
+            # A title hit on an Article stands for each of its chunks, with the title's score
             query = """
-            UNWIND $chunk_ids as chunk_id
-            MATCH (chunk:Chunk)
-            WHERE elementId(chunk) = chunk_id
-            
-            // Get article and author relationships
+            CALL db.index.fulltext.queryNodes($index_name, $query_text, {limit: $limit})
+            YIELD node, score
+            OPTIONAL MATCH (node:Article)-[:HAS_CHUNK]->(article_chunk:Chunk)
+            WITH CASE WHEN node:Chunk THEN node ELSE article_chunk END AS chunk, score
+            WHERE chunk IS NOT NULL
+            WITH chunk, max(score) AS score
+            ORDER BY score DESC
+            LIMIT $limit
             OPTIONAL MATCH (article:Article)-[:HAS_CHUNK]->(chunk)
             OPTIONAL MATCH (author:Author)-[:WROTE]->(article)
-            
-            // Get related chunks from same article
-            OPTIONAL MATCH (article)-[:HAS_CHUNK]->(related_chunk:Chunk)
-            WHERE elementId(related_chunk) <> chunk_id
-            
-            // Get other articles by same author
-            OPTIONAL MATCH (author)-[:WROTE]->(other_article:Article)
-            WHERE elementId(other_article) <> elementId(article)
-            
-            RETURN DISTINCT
+            RETURN 
+                coalesce(chunk.chunk_text, chunk.text) as chunk_text,
                 elementId(chunk) as chunk_id,
-                chunk.text as chunk_text,
-                elementId(article) as article_id,
+                score,
                 article.title as article_title,
-                elementId(author) as author_id,
+                elementId(article) as article_id,
                 author.name as author_name,
-                collect(DISTINCT {
-                    id: elementId(related_chunk),
-                    text: related_chunk.text
-                }) as related_chunks,
-                collect(DISTINCT {
-                    id: elementId(other_article),
-                    title: other_article.title
-                }) as other_articles
+                elementId(author) as author_id
+            ORDER BY score DESC
             """
             
             with self.get_session() as session:
-                result = session.run(query, {"chunk_ids": chunk_ids})
+                result = session.run(query, {
+                    "index_name": index_name,
+                    "query_text": _LUCENE_SPECIAL.sub(r"\\\1", query_text.strip()),
+                    "limit": limit
+                })
+                
+                chunks = [{
+                    "chunk_id": record["chunk_id"],
+                    "chunk_text": record["chunk_text"],
+                    "score": record["score"],
+                    "article_id": record["article_id"],
+                    "article_title": record["article_title"],
+                    "author_id": record["author_id"],
+                    "author_name": record["author_name"]
+                } for record in result]
+                
+                self.logger.debug(f"Full-text search returned {len(chunks)} results")
+                self.tracer.end_trace(request_id, "completed", {
+                    "results_count": len(chunks),
+                    "top_score": chunks[0]["score"] if chunks else None
+                })
+                
+                return chunks
+                
+        except ClientError as e:
+            if "index" in str(e).lower() and index_name.lower() in str(e).lower():
+                error = Neo4jError(
+                    ErrorCodes.NEO4J_INDEX_NOT_FOUND,
+                    f"Full-text index '{index_name}' not found: {str(e)}",
+                    {"index_name": index_name, "error": str(e)}
+                )
+            else:
+                error = Neo4jError(
+                    ErrorCodes.NEO4J_QUERY_FAILED,
+                    f"Full-text search query failed: {str(e)}",
+                    {"query": "fulltext_search", "error": str(e)}
+                )
+            log_exception(self.logger, error)
+            self.tracer.end_trace(request_id, "failed", error=error)
+            raise error
+            
+        except Exception as e:
+            error = Neo4jError(
+                ErrorCodes.NEO4J_QUERY_FAILED,
+                f"Full-text search failed: {str(e)}",
+                {"query_length": len(query_text), "limit": limit, "error": str(e)}
+            )
+            log_exception(self.logger, error)
+            self.tracer.end_trace(request_id, "failed", error=error)
+            raise error
+    
+    def expand_graph(self, chunk_ids: List[str],
+                     policy: Optional[ExpansionPolicy] = None) -> List[Dict[str, Any]]:
+        """
+        Expand graph to retrieve connected entities for given chunk IDs.
+        
+        Args:
+            chunk_ids: List of chunk element IDs to expand from
+            policy: Fan-out caps, ranking and text mode (defaults to the client policy)
+            
+        Returns:
+            List of dictionaries containing expanded graph information; the
+            related_total/other_total fields give neighbour counts before capping
+            
+        Raises:
+            Neo4jError: If graph expansion fails
+        """
+        if not chunk_ids:
+            return []
+        
+        policy = policy or self.expansion_policy
+        request_id = self.tracer.start_trace("expand_graph", {
+            "chunk_ids_count": len(chunk_ids),
+            "policy": policy.to_dict()
+        })
+        
+        try:
+            self.logger.debug(f"Expanding graph for {len(chunk_ids)} chunks")
+            start_time = time.perf_counter()
+            
+            with self.get_session() as session:
+                result = session.run(policy.build_query(), {
+                    "chunk_ids": chunk_ids,
+                    "max_related_chunks": policy.max_related_chunks,
+                    "max_other_articles": policy.max_other_articles,
+                    "max_text_chars": policy.max_text_chars
+                })
                 
                 expanded_data = []
                 for record in result:
-                    # Filter out null entries from collections
-                    related_chunks = [
-                        chunk for chunk in record["related_chunks"] 
-                        if chunk["id"] is not None
-                    ]
-                    other_articles = [
-                        article for article in record["other_articles"]
-                        if article["id"] is not None
-                    ]
-                    
                     expansion_data = {
                         "chunk_id": record["chunk_id"],
                         "chunk_text": record["chunk_text"],
@@ -345,19 +568,32 @@ class Neo4jClient:
                         "article_title": record["article_title"],
                         "author_id": record["author_id"],
                         "author_name": record["author_name"],
-                        "related_chunks": related_chunks,
-                        "other_articles": other_articles
+                        "related_chunks": record["related_chunks"],
+                        "related_total": record["related_total"],
+                        "other_articles": record["other_articles"],
+                        "other_total": record["other_total"]
                     }
                     expanded_data.append(expansion_data)
-                
-                self.logger.debug(f"Graph expansion returned {len(expanded_data)} expanded entries")
-                self.tracer.end_trace(request_id, "completed", {
-                    "expanded_entries": len(expanded_data),
-                    "total_related_chunks": sum(len(entry["related_chunks"]) for entry in expanded_data),
-                    "total_other_articles": sum(len(entry["other_articles"]) for entry in expanded_data)
-                })
-                
-                return expanded_data
+            
+            expansion_ms = (time.perf_counter() - start_time) * 1000
+            payload_bytes = len(json.dumps(expanded_data, default=str).encode("utf-8"))
+            
+            self.logger.debug(f"Graph expansion returned {len(expanded_data)} expanded entries")
+            self.tracer.end_trace(request_id, "completed", {
+                "expanded_entries": len(expanded_data),
+                "total_related_chunks": sum(len(entry["related_chunks"]) for entry in expanded_data),
+                "total_other_articles": sum(len(entry["other_articles"]) for entry in expanded_data),
+                "related_chunks_dropped": sum(
+                    entry["related_total"] - len(entry["related_chunks"]) for entry in expanded_data
+                ),
+                "other_articles_dropped": sum(
+                    entry["other_total"] - len(entry["other_articles"]) for entry in expanded_data
+                ),
+                "payload_bytes": payload_bytes,
+                "expansion_ms": round(expansion_ms, 2)
+            })
+            
+            return expanded_data
                 
         except Exception as e:
             error = Neo4jError(
@@ -407,6 +643,19 @@ class Neo4jClient:
                 except:
                     health_info["indexes"]["chunk_embeddings"] = {"exists": False, "error": "Could not check index"}
                 
+                # Check full-text index used by lexical and hybrid search
+                try:
+                    index_result = session.run(
+                        "SHOW INDEXES YIELD name, type WHERE name = $name", {"name": FULLTEXT_INDEX_NAME}
+                    )
+                    index_record = index_result.single()
+                    health_info["indexes"]["chunk_fulltext"] = {
+                        "exists": index_record is not None,
+                        "type": index_record["type"] if index_record else None
+                    }
+                except:
+                    health_info["indexes"]["chunk_fulltext"] = {"exists": False, "error": "Could not check index"}
+                
                 # Get node counts
                 try:
                     counts_query = """
@@ -440,7 +689,8 @@ _global_client: Optional[Neo4jClient] = None
 
 
 def get_neo4j_client(uri: str = None, username: str = None, password: str = None, 
-                     database: str = "neo4j") -> Neo4jClient:
+                     database: str = "neo4j",
+                     expansion_policy: Optional[ExpansionPolicy] = None) -> Neo4jClient:
     """
     Get the global Neo4j client instance.
     
@@ -449,6 +699,7 @@ def get_neo4j_client(uri: str = None, username: str = None, password: str = None
         username: Neo4j username (only used on first call)
         password: Neo4j password (only used on first call)
         database: Database name (only used on first call)
+        expansion_policy: Default expansion policy (only used on first call)
         
     Returns:
         Neo4jClient instance
@@ -461,7 +712,7 @@ def get_neo4j_client(uri: str = None, username: str = None, password: str = None
                 "Neo4j connection parameters required for first initialization",
                 {"provided": {"uri": bool(uri), "username": bool(username), "password": bool(password)}}
             )
-        _global_client = Neo4jClient(uri, username, password, database)
+        _global_client = Neo4jClient(uri, username, password, database, expansion_policy)
     return _global_client
 
 
@@ -480,15 +731,31 @@ def vector_search(embedding: List[float], limit: int = 5) -> List[Dict[str, Any]
     return client.vector_search(embedding, limit)
 
 
-def expand_graph(chunk_ids: List[str]) -> List[Dict[str, Any]]:
+def fulltext_search(query_text: str, limit: int = 5) -> List[Dict[str, Any]]:
+    """
+    Perform full-text search using the global client.
+    
+    Args:
+        query_text: Natural language query
+        limit: Maximum number of results
+        
+    Returns:
+        List of search results
+    """
+    client = get_neo4j_client()
+    return client.fulltext_search(query_text, limit)
+
+
+def expand_graph(chunk_ids: List[str], policy: Optional[ExpansionPolicy] = None) -> List[Dict[str, Any]]:
     """
     Expand graph using the global client.
     
     Args:
         chunk_ids: List of chunk IDs to expand
+        policy: Optional expansion policy overriding the client default
         
     Returns:
         List of expanded graph data
     """
     client = get_neo4j_client()
-    return client.expand_graph(chunk_ids)
\ No newline at end of file
+    return client.expand_graph(chunk_ids, policy)
\ No newline at end of file
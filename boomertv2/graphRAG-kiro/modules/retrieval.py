@@ -3,24 +3,72 @@ Graph retrieval orchestration module for GraphRAG Retrieval Agent.
 
 This module coordinates embedding generation and Neo4j operations to provide
 comprehensive graph-based retrieval functionality. It combines vector similarity
-search with graph expansion to return contextually rich results.
+and full-text search with graph expansion to return contextually rich results.
 """
 
+import json
 import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional, Set
 from collections import defaultdict
 
-from .embedding import generate_embedding, get_model_info
-from .neo4j_client import get_neo4j_client
-from .exceptions import RetrievalError, ErrorCodes
+from .embedding import generate_embedding, get_model_info, get_cache_stats
+from .neo4j_client import get_neo4j_client, ExpansionPolicy, FULLTEXT_INDEX_NAME
+from .exceptions import RetrievalError, ConfigurationError, Neo4jError, ErrorCodes
 from .logging_config import get_logger, log_exception, get_execution_tracer
+from .retrieval_cache import RetrievalCache, GRAPH_VERSION_QUERY, GRAPH_VERSION_NAME
+
+
+SEARCH_MODES = ("vector", "lexical", "hybrid")
+# Reciprocal-rank fusion damping constant; larger values flatten the rank contribution
+RRF_K = 60
+# Each search returns limit * multiplier candidates before fusion
+HYBRID_CANDIDATE_MULTIPLIER = 2
+
+
+def _reciprocal_rank_fusion(ranked_lists: Dict[str, List[Dict[str, Any]]], limit: int,
+                            k: int = RRF_K) -> List[Dict[str, Any]]:
+    """
+    Fuse ranked chunk lists with reciprocal-rank fusion.
+    
+    Each chunk scores sum(1 / (k + rank)) over the lists it appears in, so chunks
+    ranked well by both searches rise to the top without calibrating cosine
+    similarity against BM25 scores.
+    
+    Args:
+        ranked_lists: Chunk lists keyed by search name, best match first
+        limit: Number of fused chunks to return
+        k: Damping constant
+        
+    Returns:
+        Fused chunks with score set to the fused score and the original
+        per-search scores under source_scores, best first
+    """
+    fused: Dict[str, Dict[str, Any]] = {}
+    for source, chunks in ranked_lists.items():
+        for rank, chunk in enumerate(chunks, 1):
+            entry = fused.get(chunk["chunk_id"])
+            if entry is None:
+                entry = fused[chunk["chunk_id"]] = dict(chunk, score=0.0, source_scores={})
+            entry["score"] += 1.0 / (k + rank)
+            entry["source_scores"][source] = chunk["score"]
+    
+    ordered = sorted(fused.values(), key=lambda entry: entry["score"], reverse=True)
+    for entry in ordered:
+        entry["score"] = round(entry["score"], 6)
+    return ordered[:limit]
 
 
 class GraphRetriever:
     """Orchestrates graph-based retrieval combining vector search and graph expansion."""
     
     def __init__(self, neo4j_uri: str = None, neo4j_username: str = None, 
-                 neo4j_password: str = None, neo4j_database: str = "neo4j"):
+                 neo4j_password: str = None, neo4j_database: str = "neo4j",
+                 expansion_policy: Optional[ExpansionPolicy] = None,
+                 result_cache: Optional[RetrievalCache] = None,
+                 search_mode: str = "vector", rrf_k: int = RRF_K,
+                 fulltext_index: str = FULLTEXT_INDEX_NAME):
         """
         Initialize graph retriever.
         
@@ -29,14 +77,31 @@ class GraphRetriever:
             neo4j_username: Neo4j username
             neo4j_password: Neo4j password
             neo4j_database: Neo4j database name
+            expansion_policy: Fan-out caps, ranking and text mode for graph expansion
+            result_cache: Cache of complete retrieval results (defaults to an in-memory cache)
+            search_mode: Default chunk search ("vector", "lexical" full-text or "hybrid" of both)
+            rrf_k: Reciprocal-rank fusion constant used in hybrid mode
+            fulltext_index: Full-text index queried in lexical and hybrid mode
+            
+        Raises:
+            ConfigurationError: If search_mode is not recognised
         """
         self.neo4j_uri = neo4j_uri
         self.neo4j_username = neo4j_username
         self.neo4j_password = neo4j_password
         self.neo4j_database = neo4j_database
+        self.expansion_policy = expansion_policy or ExpansionPolicy()
+        self.result_cache = result_cache or RetrievalCache()
+        if self.result_cache.version_loader is None:
+            self.result_cache.version_loader = self._read_graph_version
+        self.search_mode = self._resolve_search_mode(search_mode)
+        self.rrf_k = max(1, int(rrf_k))
+        self.fulltext_index = fulltext_index
         self.logger = get_logger("graphrag.retrieval")
         self.tracer = get_execution_tracer("graphrag.retrieval")
         self._neo4j_client = None
+        # Runs the vector half of hybrid searches alongside the full-text half
+        self._search_pool: Optional[ThreadPoolExecutor] = None
     
     @property
     def neo4j_client(self):
@@ -46,11 +111,13 @@ class GraphRetriever:
                 self.neo4j_uri, 
                 self.neo4j_username, 
                 self.neo4j_password, 
-                self.neo4j_database
+                self.neo4j_database,
+                self.expansion_policy
             )
         return self._neo4j_client
     
-    def retrieve(self, query: str, limit: int = 5, expand_graph: bool = True) -> List[Dict[str, Any]]:
+    def retrieve(self, query: str, limit: int = 5, expand_graph: bool = True,
+                 search_mode: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Perform comprehensive graph-based retrieval.
         
@@ -58,12 +125,14 @@ class GraphRetriever:
             query: Natural language query
             limit: Maximum number of initial chunks to retrieve
             expand_graph: Whether to expand graph for additional context
+            search_mode: Chunk search override ("vector", "lexical" or "hybrid")
             
         Returns:
             List of dictionaries containing chunks with contextual information
             
         Raises:
             RetrievalError: If retrieval process fails
+            ConfigurationError: If search_mode is not recognised
         """
         if not query or not query.strip():
             raise RetrievalError(
@@ -72,42 +141,61 @@ class GraphRetriever:
                 {"query_length": len(query) if query else 0}
             )
         
+        search_mode = self._resolve_search_mode(search_mode or self.search_mode)
+        
         request_id = self.tracer.start_trace("graph_retrieval", {
             "query_length": len(query),
             "limit": limit,
-            "expand_graph": expand_graph
+            "expand_graph": expand_graph,
+            "search_mode": search_mode
         })
         
         try:
             self.logger.info(f"Starting graph retrieval for query: {query[:100]}...")
             
-            # Step 1: Generate embedding for query
-            self.tracer.log_trace_event(request_id, "generating_embedding")
-            embedding = generate_embedding(query)
+            # Serve repeated questions from the cache until the graph is reloaded
+            cache_key = RetrievalCache.make_key(query, limit, expand_graph, json.dumps({
+                "expansion": self.expansion_policy.to_dict(),
+                "search_mode": search_mode
+            }, sort_keys=True))
+            cached_results = self.result_cache.get(cache_key)
+            if cached_results is not None:
+                self.logger.info(f"Retrieval served from cache with {len(cached_results)} results")
+                self.tracer.end_trace(request_id, "completed", {
+                    "results_count": len(cached_results),
+                    "cache_hit": True,
+                    "graph_version": self.result_cache.graph_version
+                })
+                return cached_results
             
-            self.logger.debug(f"Generated embedding with dimension {len(embedding)}")
+            retrieval_start = time.perf_counter()
             
-            # Step 2: Perform vector similarity search
-            self.tracer.log_trace_event(request_id, "vector_search")
-            chunks = self.neo4j_client.vector_search(embedding, limit)
+            # Steps 1-2: Find matching chunks by vector similarity, full-text or both
+            search_latency_ms: Dict[str, float] = {}
+            chunks = self._search_chunks(request_id, query, limit, search_mode, search_latency_ms)
             
             if not chunks:
                 self.logger.info("No chunks found for query")
+                self.result_cache.put(cache_key, [], (time.perf_counter() - retrieval_start) * 1000)
                 self.tracer.end_trace(request_id, "completed", {
                     "results_count": 0,
-                    "reason": "no_chunks_found"
+                    "reason": "no_chunks_found",
+                    "search_latency_ms": search_latency_ms
                 })
                 return []
             
-            self.logger.debug(f"Found {len(chunks)} chunks from vector search")
+            self.logger.debug(f"Found {len(chunks)} chunks from {search_mode} search")
             
             # Step 3: Expand graph if requested
+            expansion_ms = 0.0
             if expand_graph:
                 self.tracer.log_trace_event(request_id, "graph_expansion")
                 chunk_ids = [chunk["chunk_id"] for chunk in chunks]
-                expanded_data = self.neo4j_client.expand_graph(chunk_ids)
+                expansion_start = time.perf_counter()
+                expanded_data = self.neo4j_client.expand_graph(chunk_ids, self.expansion_policy)
+                expansion_ms = (time.perf_counter() - expansion_start) * 1000
                 
-                self.logger.debug(f"Expanded graph for {len(chunk_ids)} chunks")
+                self.logger.debug(f"Expanded graph for {len(chunk_ids)} chunks in {expansion_ms:.1f}ms")
                 
                 # Step 4: Combine results
                 self.tracer.log_trace_event(request_id, "combining_results")
@@ -117,11 +205,16 @@ class GraphRetriever:
                 combined_results = self._format_chunk_results(chunks)
             
             self.logger.info(f"Retrieval completed with {len(combined_results)} results")
+            self.result_cache.put(cache_key, combined_results, (time.perf_counter() - retrieval_start) * 1000)
             
             self.tracer.end_trace(request_id, "completed", {
                 "results_count": len(combined_results),
                 "chunks_found": len(chunks),
-                "graph_expanded": expand_graph
+                "graph_expanded": expand_graph,
+                "cache_hit": False,
+                "search_mode": search_mode,
+                "search_latency_ms": search_latency_ms,
+                "expansion_ms": round(expansion_ms, 2)
             })
             
             return combined_results
@@ -147,6 +240,101 @@ class GraphRetriever:
             self.tracer.end_trace(request_id, "failed", error=error)
             raise error
     
+    def _search_chunks(self, request_id: str, query: str, limit: int, search_mode: str,
+                       latency_ms: Dict[str, float]) -> List[Dict[str, Any]]:
+        """
+        Find the initial chunks for a query.
+        
+        Hybrid mode runs the vector search on the search pool while the full-text
+        search runs on the calling thread, then fuses both candidate lists. If the
+        full-text index is missing, hybrid mode falls back to the vector results.
+        
+        Args:
+            request_id: Trace request ID
+            query: Natural language query
+            limit: Maximum number of chunks to return
+            search_mode: "vector", "lexical" or "hybrid"
+            latency_ms: Filled with per-step latency in milliseconds
+            
+        Returns:
+            Chunks ordered best first
+        """
+        if search_mode == "vector":
+            return self._vector_search(request_id, query, limit, latency_ms)
+        if search_mode == "lexical":
+            return self._lexical_search(request_id, query, limit, latency_ms)
+        
+        candidates = limit * HYBRID_CANDIDATE_MULTIPLIER
+        if self._search_pool is None:
+            self._search_pool = ThreadPoolExecutor(thread_name_prefix="graphrag-hybrid")
+        vector_future = self._search_pool.submit(self._vector_search, request_id, query, candidates, latency_ms)
+        try:
+            lexical_chunks = self._lexical_search(request_id, query, candidates, latency_ms)
+        except Neo4jError as e:
+            if e.code != ErrorCodes.NEO4J_INDEX_NOT_FOUND:
+                vector_future.result()
+                raise
+            self.logger.warning(f"Full-text index unavailable, using vector results only: {e.message}")
+            lexical_chunks = []
+        vector_chunks = vector_future.result()
+        
+        self.tracer.log_trace_event(request_id, "fusing_results", {
+            "vector_candidates": len(vector_chunks),
+            "lexical_candidates": len(lexical_chunks)
+        })
+        fusion_start = time.perf_counter()
+        chunks = _reciprocal_rank_fusion({"vector": vector_chunks, "lexical": lexical_chunks}, limit, self.rrf_k)
+        latency_ms["fusion"] = round((time.perf_counter() - fusion_start) * 1000, 2)
+        return chunks
+    
+    def _vector_search(self, request_id: str, query: str, limit: int,
+                       latency_ms: Dict[str, float]) -> List[Dict[str, Any]]:
+        """Embed the query and run the vector similarity search, recording step latency."""
+        self.tracer.log_trace_event(request_id, "generating_embedding")
+        step_start = time.perf_counter()
+        embedding = generate_embedding(query)
+        latency_ms["embedding"] = round((time.perf_counter() - step_start) * 1000, 2)
+        
+        self.logger.debug(f"Generated embedding with dimension {len(embedding)}")
+        
+        self.tracer.log_trace_event(request_id, "vector_search")
+        step_start = time.perf_counter()
+        chunks = self.neo4j_client.vector_search(embedding, limit)
+        latency_ms["vector_search"] = round((time.perf_counter() - step_start) * 1000, 2)
+        return chunks
+    
+    def _lexical_search(self, request_id: str, query: str, limit: int,
+                        latency_ms: Dict[str, float]) -> List[Dict[str, Any]]:
+        """Run the full-text search, recording step latency."""
+        self.tracer.log_trace_event(request_id, "lexical_search")
+        step_start = time.perf_counter()
+        chunks = self.neo4j_client.fulltext_search(query, limit, self.fulltext_index)
+        latency_ms["lexical_search"] = round((time.perf_counter() - step_start) * 1000, 2)
+        return chunks
+    
+    @staticmethod
+    def _resolve_search_mode(search_mode: str) -> str:
+        """
+        Validate a search mode.
+        
+        Args:
+            search_mode: Requested search mode
+            
+        Returns:
+            Lower-cased search mode
+            
+        Raises:
+            ConfigurationError: If the mode is not one of SEARCH_MODES
+        """
+        mode = str(search_mode).lower()
+        if mode not in SEARCH_MODES:
+            raise ConfigurationError(
+                ErrorCodes.CONFIG_VALIDATION_FAILED,
+                f"Unknown search mode: {search_mode}",
+                {"search_mode": search_mode, "allowed": list(SEARCH_MODES)}
+            )
+        return mode
+    
     def _combine_results(self, chunks: List[Dict[str, Any]], 
                         expanded_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
@@ -186,12 +374,18 @@ class GraphRetriever:
                         "name": chunk.get("author_name")
                     }
                 }
+                if "source_scores" in chunk:
+                    result["source_scores"] = chunk["source_scores"]
                 
                 # Add expanded context if available
                 if expanded_info:
+                    related_chunks = expanded_info.get("related_chunks", [])
+                    other_articles = expanded_info.get("other_articles", [])
                     result["context"] = {
-                        "related_chunks": expanded_info.get("related_chunks", []),
-                        "other_articles": expanded_info.get("other_articles", [])
+                        "related_chunks": related_chunks,
+                        "other_articles": other_articles,
+                        "related_chunks_total": expanded_info.get("related_total", len(related_chunks)),
+                        "other_articles_total": expanded_info.get("other_total", len(other_articles))
                     }
                 else:
                     result["context"] = {
@@ -247,6 +441,8 @@ class GraphRetriever:
                     "other_articles": []
                 }
             }
+            if "source_scores" in chunk:
+                result["source_scores"] = chunk["source_scores"]
             formatted_results.append(result)
         
         # Sort by score (highest first)
@@ -272,8 +468,11 @@ class GraphRetriever:
                 "embedding_model": {
                     "name": model_info.get("model_name"),
                     "dimension": model_info.get("embedding_dimension"),
-                    "device": model_info.get("device")
+                    "device": model_info.get("device"),
+                    "query_cache": get_cache_stats()
                 },
+                "result_cache": self.result_cache.get_stats(),
+                "search_mode": self.search_mode,
                 "neo4j": {
                     "connection": health_info.get("connection", False),
                     "database": health_info.get("database"),
@@ -296,13 +495,38 @@ class GraphRetriever:
                 "system_ready": False
             }
 
+    
+    def _read_graph_version(self) -> Optional[int]:
+        """
+        Read the graph version marker written by the batch loader.
+        
+        Returns:
+            Current graph version, or None if no load has stamped one
+        """
+        with self.neo4j_client.get_session() as session:
+            record = session.run(GRAPH_VERSION_QUERY, {"name": GRAPH_VERSION_NAME}).single()
+            return record["version"] if record else None
+    
+    def close(self) -> None:
+        """Save the result cache, stop the search pool and close the Neo4j connection."""
+        self.result_cache.save()
+        if self._search_pool is not None:
+            self._search_pool.shutdown(wait=False)
+            self._search_pool = None
+        if self._neo4j_client is not None:
+            self._neo4j_client.close()
+
 
 # Global retriever instance
 _global_retriever: Optional[GraphRetriever] = None
 
 
 def get_graph_retriever(neo4j_uri: str = None, neo4j_username: str = None,
-                       neo4j_password: str = None, neo4j_database: str = "neo4j") -> GraphRetriever:
+                       neo4j_password: str = None, neo4j_database: str = "neo4j",
+                       expansion_policy: Optional[ExpansionPolicy] = None,
+                       result_cache: Optional[RetrievalCache] = None,
+                       search_mode: str = "vector", rrf_k: int = RRF_K,
+                       fulltext_index: str = FULLTEXT_INDEX_NAME) -> GraphRetriever:
     """
     Get the global graph retriever instance.
     
@@ -311,17 +535,24 @@ def get_graph_retriever(neo4j_uri: str = None, neo4j_username: str = None,
         neo4j_username: Neo4j username (only used on first call)
         neo4j_password: Neo4j password (only used on first call)
         neo4j_database: Neo4j database (only used on first call)
+        expansion_policy: Graph expansion policy (only used on first call)
+        result_cache: Retrieval result cache (only used on first call)
+        search_mode: Default chunk search mode (only used on first call)
+        rrf_k: Reciprocal-rank fusion constant (only used on first call)
+        fulltext_index: Full-text index name (only used on first call)
         
     Returns:
         GraphRetriever instance
     """
     global _global_retriever
     if _global_retriever is None:
-        _global_retriever = GraphRetriever(neo4j_uri, neo4j_username, neo4j_password, neo4j_database)
+        _global_retriever = GraphRetriever(neo4j_uri, neo4j_username, neo4j_password, neo4j_database,
+                                           expansion_policy, result_cache, search_mode, rrf_k, fulltext_index)
     return _global_retriever
 
 
-def retrieve(query: str, limit: int = 5, expand_graph: bool = True) -> List[Dict[str, Any]]:
+def retrieve(query: str, limit: int = 5, expand_graph: bool = True,
+             search_mode: Optional[str] = None) -> List[Dict[str, Any]]:
     """
     Perform graph-based retrieval using the global retriever.
     
@@ -329,6 +560,7 @@ def retrieve(query: str, limit: int = 5, expand_graph: bool = True) -> List[Dict
         query: Natural language query
         limit: Maximum number of results
         expand_graph: Whether to expand graph for context
+        search_mode: Chunk search override ("vector", "lexical" or "hybrid")
         
     Returns:
         List of retrieval results
@@ -337,7 +569,7 @@ def retrieve(query: str, limit: int = 5, expand_graph: bool = True) -> List[Dict
         RetrievalError: If retrieval fails
     """
     retriever = get_graph_retriever()
-    return retriever.retrieve(query, limit, expand_graph)
+    return retriever.retrieve(query, limit, expand_graph, search_mode)
 
 
 def get_system_stats() -> Dict[str, Any]:
@@ -0,0 +1,276 @@
+"""
+Retrieval result cache for GraphRAG Retrieval Agent.
+
+This module caches complete graph_retrieve results keyed on the normalized
+query and retrieval options. Entries are dropped whenever the graph version
+marker written by the batch loader changes, so repeated questions are served
+from memory until the graph is reloaded.
+
+graphRAG and graphRAG-kiro each build their image from their own directory,
+so both carry this module; keep the two copies identical.
+"""
+
+import copy
+import hashlib
+import json
+import os
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Callable
+
+from .logging_config import get_logger
+
+
+# Reads the version stamped by the batch loader; None when no load has run yet
+GRAPH_VERSION_QUERY = """
+OPTIONAL MATCH (v:GraphVersion {name: $name})
+RETURN v.version AS version
+"""
+GRAPH_VERSION_NAME = "graph"
+
+
+class RetrievalCache:
+    """Bounded LRU cache of retrieval results invalidated by graph version."""
+
+    def __init__(self, max_entries: int = 256, ttl_seconds: float = 3600.0,
+                 version_check_interval_seconds: float = 5.0,
+                 persist_path: Optional[str] = None, persist_interval_seconds: float = 30.0,
+                 version_loader: Optional[Callable[[], Optional[int]]] = None):
+        """
+        Initialize retrieval cache.
+
+        Args:
+            max_entries: Maximum number of cached results (0 disables the cache)
+            ttl_seconds: Seconds an entry stays valid (0 keeps entries until evicted or invalidated)
+            version_check_interval_seconds: Minimum seconds between graph version lookups
+            persist_path: Optional JSON file the cache is saved to and restored from
+            persist_interval_seconds: Minimum seconds between saves triggered by new entries
+            version_loader: Callable returning the current graph version
+        """
+        self.max_entries = max(0, int(max_entries))
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        self.version_check_interval_seconds = max(0.0, float(version_check_interval_seconds))
+        self.persist_path = persist_path
+        self.persist_interval_seconds = max(0.0, float(persist_interval_seconds))
+        self.version_loader = version_loader
+        self.logger = get_logger("graphrag.retrieval_cache")
+
+        self.graph_version: Optional[int] = None
+        self._last_version_check = float("-inf")
+        self._last_save = time.monotonic()
+        self._dirty = False
+        # key -> (results, expires_at wall-clock time, retrieval_ms)
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {
+            "hits": 0, "misses": 0, "evictions": 0, "expirations": 0,
+            "invalidations": 0, "version_checks": 0, "version_check_errors": 0,
+            "saved_ms": 0.0
+        }
+
+        if self.persist_path and self.max_entries:
+            self._load()
+
+    @classmethod
+    def from_config(cls, config: Optional[Dict[str, Any]]) -> "RetrievalCache":
+        """
+        Build a cache from the retrieval.cache configuration section.
+
+        Args:
+            config: Cache configuration (missing keys use defaults)
+
+        Returns:
+            RetrievalCache instance
+        """
+        config = config or {}
+        keys = ("max_entries", "ttl_seconds", "version_check_interval_seconds",
+                "persist_path", "persist_interval_seconds")
+        return cls(**{key: config[key] for key in keys if key in config})
+
+    @staticmethod
+    def make_key(query: str, limit: int, expand_graph: bool, namespace: str = "") -> str:
+        """
+        Build the cache key for a retrieval request.
+
+        Args:
+            query: Natural language query
+            limit: Maximum number of results
+            expand_graph: Whether graph expansion was requested
+            namespace: Retriever settings that change the result shape
+
+        Returns:
+            Hex sha256 digest of the normalized request
+        """
+        normalized = " ".join(unicodedata.normalize("NFC", query).casefold().split())
+        raw = f"{normalized}\x1f{int(limit)}\x1f{int(bool(expand_graph))}\x1f{namespace}"
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+    def refresh_version(self, force: bool = False) -> None:
+        """
+        Re-read the graph version and drop every entry if it changed.
+
+        The lookup is skipped when the last one was less than
+        version_check_interval_seconds ago, unless force is set.
+
+        Args:
+            force: Check the version even if the interval has not elapsed
+        """
+        if self.version_loader is None:
+            return
+
+        now = time.monotonic()
+        if not force and now - self._last_version_check < self.version_check_interval_seconds:
+            return
+        self._last_version_check = now
+
+        try:
+            version = self.version_loader()
+        except Exception as e:
+            # Keep serving; TTL still bounds staleness
+            self.stats["version_check_errors"] += 1
+            self.logger.warning(f"Failed to read graph version: {e}")
+            return
+
+        with self._lock:
+            self.stats["version_checks"] += 1
+            if version != self.graph_version:
+                if self._entries:
+                    self.logger.info(
+                        f"Graph version changed from {self.graph_version} to {version}, "
+                        f"dropping {len(self._entries)} cached results"
+                    )
+                    self.stats["invalidations"] += 1
+                    self._entries.clear()
+                    self._dirty = True
+                self.graph_version = version
+
+    def get(self, key: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Look up cached results.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Deep copy of the cached results, or None on a miss
+        """
+        if not self.max_entries:
+            return None
+
+        self.refresh_version()
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl_seconds and entry[1] <= time.time():
+                del self._entries[key]
+                self.stats["expirations"] += 1
+                self._dirty = True
+                entry = None
+
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            self.stats["saved_ms"] += entry[2]
+            results = entry[0]
+        # Copied outside the lock; callers may modify what they get back
+        return copy.deepcopy(results)
+
+    def put(self, key: str, results: List[Dict[str, Any]], retrieval_ms: float = 0.0) -> None:
+        """
+        Store results, evicting the least recently used entries over the bound.
+
+        Args:
+            key: Cache key from make_key
+            results: Retrieval results
+            retrieval_ms: Time the retrieval took, credited as saved on every later hit
+        """
+        if not self.max_entries:
+            return
+
+        results = copy.deepcopy(results)
+        expires_at = time.time() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (results, expires_at, retrieval_ms)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+            self._dirty = True
+
+        if self.persist_path and time.monotonic() - self._last_save >= self.persist_interval_seconds:
+            self.save()
+
+    def clear(self) -> None:
+        """Drop every cached result."""
+        with self._lock:
+            self._entries.clear()
+            self._dirty = True
+
+    def save(self) -> None:
+        """Write the cache to persist_path if it changed since the last save."""
+        if not self.persist_path or not self._dirty:
+            return
+
+        with self._lock:
+            snapshot = {
+                "graph_version": self.graph_version,
+                "entries": [[key, *entry] for key, entry in self._entries.items()]
+            }
+            self._dirty = False
+            self._last_save = time.monotonic()
+
+        try:
+            directory = os.path.dirname(self.persist_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            temp_path = f"{self.persist_path}.tmp"
+            with open(temp_path, "w") as f:
+                json.dump(snapshot, f, default=str)
+            os.replace(temp_path, self.persist_path)
+        except Exception as e:
+            self.logger.warning(f"Failed to save retrieval cache to {self.persist_path}: {e}")
+
+    def _load(self) -> None:
+        """Restore entries saved by a previous process, skipping expired ones."""
+        if not os.path.exists(self.persist_path):
+            return
+
+        try:
+            with open(self.persist_path) as f:
+                snapshot = json.load(f)
+
+            now = time.time()
+            for key, results, expires_at, retrieval_ms in snapshot.get("entries", [])[-self.max_entries:]:
+                if self.ttl_seconds and expires_at <= now:
+                    continue
+                self._entries[key] = (results, expires_at, retrieval_ms)
+
+            # Entries are only trusted until the first version check says otherwise
+            self.graph_version = snapshot.get("graph_version")
+            self.logger.info(f"Restored {len(self._entries)} cached results from {self.persist_path}")
+        except Exception as e:
+            self._entries.clear()
+            self.logger.warning(f"Failed to load retrieval cache from {self.persist_path}: {e}")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Hit/miss counters, hit rate, saved retrieval time, size and graph version
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["saved_ms"] = round(stats["saved_ms"], 2)
+        stats["max_entries"] = self.max_entries
+        stats["ttl_seconds"] = self.ttl_seconds
+        stats["graph_version"] = self.graph_version
+        stats["persist_path"] = self.persist_path
+        return stats
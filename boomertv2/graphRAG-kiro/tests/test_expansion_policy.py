@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the graph expansion policy.
+"""
+
+import re
+import sys
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+# Add parent directory to path for module imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.neo4j_client import ExpansionPolicy, Neo4jClient
+from modules.exceptions import ConfigurationError
+
+
+class TestExpansionPolicy(unittest.TestCase):
+
+    def test_every_ranking_builds_a_query(self):
+        """Test each ranking plugs its sort key into the related-chunk subquery."""
+        for ranking, sort_key in ExpansionPolicy.RANKINGS.items():
+            with self.subTest(ranking=ranking):
+                query = ExpansionPolicy(ranking=ranking).build_query()
+                self.assertIn(f"WITH related_chunk, {sort_key} AS rank", query)
+                self.assertIn("ORDER BY rank", query)
+
+    def test_similarity_ranking_runs_on_neo4j_5_15(self):
+        """Test the similarity ranking avoids vector.similarity.*, which needs Neo4j 5.18."""
+        query = ExpansionPolicy(ranking="similarity").build_query()
+
+        self.assertNotRegex(query, r"vector\.similarity\.")
+        self.assertIn("chunk.embedding[i] * related_chunk.embedding[i]", query)
+        self.assertEqual(query.count("sqrt(reduce("), 2)
+
+    def test_similarity_ranking_sorts_most_similar_first(self):
+        """Test the similarity sort key is the negated cosine and skips missing embeddings."""
+        sort_key = ExpansionPolicy.RANKINGS["similarity"]
+
+        self.assertTrue(sort_key.startswith("-("))
+        self.assertRegex(sort_key, r"related_chunk\.embedding IS NULL OR chunk\.embedding IS NULL THEN null")
+
+    def test_similarity_ranking_from_config(self):
+        """Test ranking: similarity is accepted from the expansion config section."""
+        policy = ExpansionPolicy.from_config({"ranking": "similarity", "max_related_chunks": 2})
+
+        self.assertEqual(policy.to_dict()["ranking"], "similarity")
+        self.assertEqual(policy.max_related_chunks, 2)
+
+    def test_unknown_ranking_is_rejected(self):
+        """Test an unknown ranking fails validation."""
+        with self.assertRaises(ConfigurationError):
+            ExpansionPolicy(ranking="vector_cosine")
+
+    def test_expand_graph_sends_similarity_query(self):
+        """Test expand_graph runs the similarity query with the policy's caps."""
+        client = Neo4jClient("bolt://localhost:7687", "neo4j", "password")
+        session = MagicMock()
+        session.run.return_value = [{
+            "chunk_id": "4:abc:1", "chunk_text": "text", "article_id": "4:abc:2",
+            "article_title": "Title", "author_id": None, "author_name": None,
+            "related_chunks": [{"id": "4:abc:3", "text": "related"}], "related_total": 3,
+            "other_articles": [], "other_total": 0
+        }]
+        client.connect = MagicMock()
+        client.driver = MagicMock()
+        client.driver.session.return_value = session
+        policy = ExpansionPolicy(ranking="similarity", max_related_chunks=1)
+
+        expanded = client.expand_graph(["4:abc:1"], policy)
+
+        query, parameters = session.run.call_args[0]
+        self.assertEqual(query, policy.build_query())
+        self.assertEqual(parameters["max_related_chunks"], 1)
+        self.assertEqual(expanded[0]["related_total"], 3)
+        self.assertFalse(re.search(r"vector\.similarity\.", query))
+
+
+if __name__ == "__main__":
+    unittest.main()
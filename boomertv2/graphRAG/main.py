@@ -14,6 +14,7 @@ from pathlib import Path
 from typing import Dict, Any, List
 
 from modules.retrieval import get_graph_retriever
+from modules.retrieval_cache import RetrievalCache
 from modules.config import load_config, create_default_config_file
 from modules.exceptions import GraphRAGException
 from modules.logging_config import setup_logging, get_logger, log_exception
@@ -55,11 +56,15 @@ class GraphRAGCLI:
             
             # Initialize retriever
             neo4j_config = self.config.get("neo4j", {})
+            retrieval_config = self.config.get("retrieval", {})
             self.retriever = get_graph_retriever(
                 neo4j_uri=neo4j_config.get("uri"),
                 neo4j_username=neo4j_config.get("username"),
                 neo4j_password=neo4j_config.get("password"),
-                neo4j_database=neo4j_config.get("database", "neo4j")
+                neo4j_database=neo4j_config.get("database", "neo4j"),
+                max_related_chunks=retrieval_config.get("max_related_chunks", 5),
+                max_other_articles=retrieval_config.get("max_other_articles", 5),
+                result_cache=RetrievalCache.from_config(retrieval_config.get("cache"))
             )
             
             self.logger.info("GraphRAG CLI initialized successfully")
@@ -279,18 +284,23 @@ def main():
     cli.initialize()
     
     # Execute command
-    if args.command == "query":
-        cli.query(
-            query_text=args.text,
-            limit=args.limit,
-            expand_graph=not args.no_expand,
-            output_format=args.format
-        )
-    elif args.command == "status":
-        cli.status()
-    else:
-        parser.print_help()
-        sys.exit(1)
+    try:
+        if args.command == "query":
+            cli.query(
+                query_text=args.text,
+                limit=args.limit,
+                expand_graph=not args.no_expand,
+                output_format=args.format
+            )
+        elif args.command == "status":
+            cli.status()
+        else:
+            parser.print_help()
+            sys.exit(1)
+    finally:
+        # Persist cached results for the next invocation
+        if cli.retriever is not None:
+            cli.retriever.close()
 
 
 if __name__ == "__main__":
@@ -18,6 +18,7 @@ from mcp.server.stdio import stdio_server
 from mcp.types import Tool, TextContent
 
 from modules.retrieval import get_graph_retriever
+from modules.retrieval_cache import RetrievalCache
 from modules.config import load_config
 from modules.exceptions import MCPServerError, ErrorCodes, GraphRAGException
 from modules.logging_config import setup_logging, get_logger, log_exception, get_execution_tracer
@@ -204,13 +205,17 @@ class GraphRAGMCPServer:
             # Load configuration
             self.config = load_config(self.config_path)
             neo4j_config = self.config.get("neo4j", {})
+            retrieval_config = self.config.get("retrieval", {})
             
             # Initialize retriever
             self.retriever = get_graph_retriever(
                 neo4j_uri=neo4j_config.get("uri", "bolt://localhost:7687"),
                 neo4j_username=neo4j_config.get("username", "neo4j"),
                 neo4j_password=neo4j_config.get("password", "password"),
-                neo4j_database=neo4j_config.get("database", "neo4j")
+                neo4j_database=neo4j_config.get("database", "neo4j"),
+                max_related_chunks=retrieval_config.get("max_related_chunks", 5),
+                max_other_articles=retrieval_config.get("max_other_articles", 5),
+                result_cache=RetrievalCache.from_config(retrieval_config.get("cache"))
             )
             
             # Test the system
@@ -305,6 +310,10 @@ class GraphRAGMCPServer:
             )
             log_exception(self.logger, error)
             raise error
+        finally:
+            # Persist cached results so a restart starts warm
+            if self.retriever is not None:
+                self.retriever.close()
 
 
 async def main():
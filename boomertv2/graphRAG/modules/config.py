@@ -173,7 +173,15 @@ def get_default_config() -> Dict[str, Any]:
         "retrieval": {
             "default_limit": 5,
             "max_limit": 20,
-            "default_expand_graph": True
+            "default_expand_graph": True,
+            "max_related_chunks": 5,
+            "max_other_articles": 5,
+            "cache": {
+                "max_entries": 256,
+                "ttl_seconds": 3600,
+                "version_check_interval_seconds": 5,
+                "persist_path": None
+            }
         },
         "mcp": {
             "server_name": "graphrag-retrieval-agent",
@@ -6,6 +6,7 @@ comprehensive graph-based retrieval functionality.
 """
 
 import logging
+import time
 from typing import List, Dict, Any, Optional
 from contextlib import contextmanager
 
@@ -15,13 +16,72 @@ from neo4j_graphrag.embeddings import SentenceTransformerEmbeddings
 
 from .exceptions import RetrievalError, ErrorCodes
 from .logging_config import get_logger, log_exception, get_execution_tracer
+from .retrieval_cache import RetrievalCache, GRAPH_VERSION_QUERY, GRAPH_VERSION_NAME
+
+
+# Per-chunk fan-out caps for graph expansion
+DEFAULT_MAX_RELATED_CHUNKS = 5
+DEFAULT_MAX_OTHER_ARTICLES = 5
+
+# Resolves context for every retrieved chunk in one round trip. The related
+# chunk and other article lists are built in separate subqueries so they are
+# limited before collection instead of multiplying against each other.
+EXPAND_CONTEXT_QUERY = """
+UNWIND $chunk_ids AS chunk_id
+MATCH (chunk:Chunk)
+WHERE elementId(chunk) = chunk_id
+
+// Get article and author relationships
+OPTIONAL MATCH (article:Article)-[:HAS_CHUNK]->(chunk)
+OPTIONAL MATCH (author:Author)-[:WROTE]->(article)
+
+// Get related chunks from same article
+CALL {
+    WITH chunk, article
+    MATCH (article)-[:HAS_CHUNK]->(related_chunk:Chunk)
+    WHERE related_chunk <> chunk
+    WITH related_chunk
+    ORDER BY elementId(related_chunk)
+    LIMIT $max_related_chunks
+    RETURN collect({
+        id: elementId(related_chunk),
+        text: related_chunk.text
+    }) AS related_chunks
+}
+
+// Get other articles by same author
+CALL {
+    WITH author, article
+    MATCH (author)-[:WROTE]->(other_article:Article)
+    WHERE other_article <> article
+    WITH other_article
+    ORDER BY elementId(other_article)
+    LIMIT $max_other_articles
+    RETURN collect({
+        id: elementId(other_article),
+        title: other_article.title
+    }) AS other_articles
+}
+
+RETURN
+    chunk_id,
+    elementId(article) AS article_id,
+    article.title AS article_title,
+    elementId(author) AS author_id,
+    author.name AS author_name,
+    related_chunks,
+    other_articles
+"""
 
 
 class GraphRetriever:
     """Orchestrates graph-based retrieval using neo4j-graphrag library."""
     
     def __init__(self, neo4j_uri: str = None, neo4j_username: str = None, 
-                 neo4j_password: str = None, neo4j_database: str = "neo4j"):
+                 neo4j_password: str = None, neo4j_database: str = "neo4j",
+                 max_related_chunks: int = DEFAULT_MAX_RELATED_CHUNKS,
+                 max_other_articles: int = DEFAULT_MAX_OTHER_ARTICLES,
+                 result_cache: Optional[RetrievalCache] = None):
         """
         Initialize graph retriever.
         
@@ -30,11 +90,19 @@ class GraphRetriever:
             neo4j_username: Neo4j username
             neo4j_password: Neo4j password
             neo4j_database: Neo4j database name
+            max_related_chunks: Maximum related chunks returned per retrieved chunk
+            max_other_articles: Maximum other articles by the same author returned per retrieved chunk
+            result_cache: Cache of complete retrieval results (defaults to an in-memory cache)
         """
         self.neo4j_uri = neo4j_uri
         self.neo4j_username = neo4j_username
         self.neo4j_password = neo4j_password
         self.neo4j_database = neo4j_database
+        self.max_related_chunks = max(0, int(max_related_chunks))
+        self.max_other_articles = max(0, int(max_other_articles))
+        self.result_cache = result_cache or RetrievalCache()
+        if self.result_cache.version_loader is None:
+            self.result_cache.version_loader = self._read_graph_version
         self.logger = get_logger("graphrag.retrieval")
         self.tracer = get_execution_tracer("graphrag.retrieval")
         
@@ -129,34 +197,63 @@ class GraphRetriever:
             # Initialize GraphRAG if not already done
             self._initialize_graphrag()
             
+            # Serve repeated questions from the cache until the graph is reloaded
+            cache_key = RetrievalCache.make_key(
+                query, limit, expand_graph, f"{self.max_related_chunks}:{self.max_other_articles}"
+            )
+            cached_results = self.result_cache.get(cache_key)
+            if cached_results is not None:
+                self.logger.info(f"Retrieval served from cache with {len(cached_results)} results")
+                self.tracer.end_trace(request_id, "completed", {
+                    "results_count": len(cached_results),
+                    "cache_hit": True,
+                    "graph_version": self.result_cache.graph_version
+                })
+                return cached_results
+            
             # Step 1: Use VectorRetriever to retrieve documents
             self.tracer.log_trace_event(request_id, "graphrag_retrieval")
+            retrieval_start = time.perf_counter()
             documents = self.vector_retriever.get_relevant_documents(query, k=limit)
+            retrieval_ms = (time.perf_counter() - retrieval_start) * 1000
             
             if not documents:
                 self.logger.info("No documents found for query")
+                self.result_cache.put(cache_key, [], retrieval_ms)
                 self.tracer.end_trace(request_id, "completed", {
                     "results_count": 0,
-                    "reason": "no_documents_found"
+                    "reason": "no_documents_found",
+                    "retrieval_ms": round(retrieval_ms, 2)
                 })
                 return []
             
             self.logger.debug(f"Found {len(documents)} documents from GraphRAG")
             
             # Step 2: Expand graph if requested
+            expansion_ms = 0.0
             if expand_graph:
                 self.tracer.log_trace_event(request_id, "graph_expansion")
+                expansion_start = time.perf_counter()
                 results = self._expand_and_format_results(documents, query)
+                expansion_ms = (time.perf_counter() - expansion_start) * 1000
+                self.tracer.log_trace_event(request_id, "graph_expansion_completed", {
+                    "expansion_ms": round(expansion_ms, 2),
+                    "chunks_expanded": len(results)
+                })
             else:
                 # Use documents as-is without expansion
                 results = self._format_document_results(documents)
             
             self.logger.info(f"Retrieval completed with {len(results)} results")
+            self.result_cache.put(cache_key, results, retrieval_ms + expansion_ms)
             
             self.tracer.end_trace(request_id, "completed", {
                 "results_count": len(results),
                 "documents_found": len(documents),
-                "graph_expanded": expand_graph
+                "graph_expanded": expand_graph,
+                "cache_hit": False,
+                "retrieval_ms": round(retrieval_ms, 2),
+                "expansion_ms": round(expansion_ms, 2)
             })
             
             return results
@@ -196,16 +293,14 @@ class GraphRetriever:
         try:
             results = []
             
-            for doc in documents:
+            # Resolve context for all retrieved chunks in a single query
+            chunk_ids = [doc.metadata.get("chunk_id", "unknown") for doc in documents]
+            contexts = self._get_context_for_chunks(chunk_ids)
+            
+            for doc, chunk_id in zip(documents, chunk_ids):
                 # Extract basic information from document
                 chunk_text = doc.page_content
-                metadata = doc.metadata
-                
-                # Get chunk ID from metadata
-                chunk_id = metadata.get("chunk_id", "unknown")
-                
-                # Query for additional context using Cypher
-                context_data = self._get_context_for_chunk(chunk_id)
+                context_data = contexts.get(chunk_id, {})
                 
                 result = {
                     "chunk_id": chunk_id,
@@ -267,65 +362,32 @@ class GraphRetriever:
         
         return formatted_results
     
-    def _get_context_for_chunk(self, chunk_id: str) -> Dict[str, Any]:
+    def _get_context_for_chunks(self, chunk_ids: List[str]) -> Dict[str, Dict[str, Any]]:
         """
-        Get contextual information for a chunk using Cypher queries.
+        Get contextual information for several chunks with one Cypher query.
         
         Args:
-            chunk_id: Chunk ID to get context for
+            chunk_ids: Chunk IDs to get context for
             
         Returns:
-            Dictionary containing contextual information
+            Dictionary mapping chunk ID to its contextual information; chunks
+            that were not found are omitted
         """
+        unique_ids = [chunk_id for chunk_id in dict.fromkeys(chunk_ids) if chunk_id != "unknown"]
+        if not unique_ids:
+            return {}
+        
         try:
             with self.driver.session(database=self.neo4j_database) as session:
-                # Query for article and author information
-                query = """
-                MATCH (chunk:Chunk)
-                WHERE elementId(chunk) = $chunk_id
-                
-                // Get article and author relationships
-                OPTIONAL MATCH (article:Article)-[:HAS_CHUNK]->(chunk)
-                OPTIONAL MATCH (author:Author)-[:WROTE]->(article)
-                
-                // Get related chunks from same article
-                OPTIONAL MATCH (article)-[:HAS_CHUNK]->(related_chunk:Chunk)
-                WHERE elementId(related_chunk) <> $chunk_id
-                
-                // Get other articles by same author
-                OPTIONAL MATCH (author)-[:WROTE]->(other_article:Article)
-                WHERE elementId(other_article) <> elementId(article)
-                
-                RETURN 
-                    elementId(article) as article_id,
-                    article.title as article_title,
-                    elementId(author) as author_id,
-                    author.name as author_name,
-                    collect(DISTINCT {
-                        id: elementId(related_chunk),
-                        text: related_chunk.text
-                    }) as related_chunks,
-                    collect(DISTINCT {
-                        id: elementId(other_article),
-                        title: other_article.title
-                    }) as other_articles
-                """
-                
-                result = session.run(query, {"chunk_id": chunk_id})
-                record = result.single()
+                result = session.run(EXPAND_CONTEXT_QUERY, {
+                    "chunk_ids": unique_ids,
+                    "max_related_chunks": self.max_related_chunks,
+                    "max_other_articles": self.max_other_articles
+                })
                 
-                if record:
-                    # Filter out null entries
-                    related_chunks = [
-                        chunk for chunk in record["related_chunks"] 
-                        if chunk["id"] is not None
-                    ]
-                    other_articles = [
-                        article for article in record["other_articles"]
-                        if article["id"] is not None
-                    ]
-                    
-                    return {
+                contexts = {}
+                for record in result:
+                    contexts[record["chunk_id"]] = {
                         "article": {
                             "id": record["article_id"],
                             "title": record["article_title"]
@@ -334,25 +396,15 @@ class GraphRetriever:
                             "id": record["author_id"],
                             "name": record["author_name"]
                         },
-                        "related_chunks": related_chunks,
-                        "other_articles": other_articles
+                        "related_chunks": record["related_chunks"],
+                        "other_articles": record["other_articles"]
                     }
                 
-                return {
-                    "article": {},
-                    "author": {},
-                    "related_chunks": [],
-                    "other_articles": []
-                }
+                return contexts
                 
         except Exception as e:
-            self.logger.warning(f"Failed to get context for chunk {chunk_id}: {e}")
-            return {
-                "article": {},
-                "author": {},
-                "related_chunks": [],
-                "other_articles": []
-            }
+            self.logger.warning(f"Failed to get context for {len(unique_ids)} chunks: {e}")
+            return {}
     
     def get_retrieval_stats(self) -> Dict[str, Any]:
         """
@@ -379,6 +431,7 @@ class GraphRetriever:
             stats = {
                 "embedding_model": model_info,
                 "neo4j": health_info,
+                "result_cache": self.result_cache.get_stats(),
                 "system_ready": (
                     health_info.get("connection", False) and
                     health_info.get("indexes", {}).get("chunk_embeddings", {}).get("exists", False)
@@ -458,8 +511,23 @@ class GraphRetriever:
         except Exception as e:
             return {"connection": False, "error": str(e)}
     
+    def _read_graph_version(self) -> Optional[int]:
+        """
+        Read the graph version marker written by the batch loader.
+        
+        Returns:
+            Current graph version, or None if no load has stamped one
+        """
+        if self.driver is None:
+            return None
+        
+        with self.driver.session(database=self.neo4j_database) as session:
+            record = session.run(GRAPH_VERSION_QUERY, {"name": GRAPH_VERSION_NAME}).single()
+            return record["version"] if record else None
+    
     def close(self) -> None:
-        """Close the Neo4j connection."""
+        """Save the result cache and close the Neo4j connection."""
+        self.result_cache.save()
         if self.driver:
             self.logger.info("Closing Neo4j connection")
             self.driver.close()
@@ -471,7 +539,10 @@ _global_retriever: Optional[GraphRetriever] = None
 
 
 def get_graph_retriever(neo4j_uri: str = None, neo4j_username: str = None,
-                       neo4j_password: str = None, neo4j_database: str = "neo4j") -> GraphRetriever:
+                       neo4j_password: str = None, neo4j_database: str = "neo4j",
+                       max_related_chunks: int = DEFAULT_MAX_RELATED_CHUNKS,
+                       max_other_articles: int = DEFAULT_MAX_OTHER_ARTICLES,
+                       result_cache: Optional[RetrievalCache] = None) -> GraphRetriever:
     """
     Get the global graph retriever instance.
     
@@ -480,13 +551,17 @@ def get_graph_retriever(neo4j_uri: str = None, neo4j_username: str = None,
         neo4j_username: Neo4j username (only used on first call)
         neo4j_password: Neo4j password (only used on first call)
         neo4j_database: Neo4j database (only used on first call)
+        max_related_chunks: Related chunk cap per result (only used on first call)
+        max_other_articles: Other article cap per result (only used on first call)
+        result_cache: Retrieval result cache (only used on first call)
         
     Returns:
         GraphRetriever instance
     """
     global _global_retriever
     if _global_retriever is None:
-        _global_retriever = GraphRetriever(neo4j_uri, neo4j_username, neo4j_password, neo4j_database)
+        _global_retriever = GraphRetriever(neo4j_uri, neo4j_username, neo4j_password, neo4j_database,
+                                           max_related_chunks, max_other_articles, result_cache)
     return _global_retriever
 
 
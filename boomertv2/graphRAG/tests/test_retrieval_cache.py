@@ -0,0 +1,161 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the retrieval result cache.
+"""
+
+import sys
+import time
+import unittest
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+# Add parent directory to path for module imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from modules.retrieval_cache import RetrievalCache
+
+
+class TestRetrievalCache(unittest.TestCase):
+
+    def setUp(self):
+        """Give every cache a graph version and clock the test can move."""
+        self.version = None
+        self.offset = 0.0
+        # The cache reads both clocks; shift them together
+        clock = MagicMock()
+        clock.time.side_effect = lambda: time.time() + self.offset
+        clock.monotonic.side_effect = lambda: time.monotonic() + self.offset
+        patcher = patch("modules.retrieval_cache.time", clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def make_cache(self, **kwargs):
+        return RetrievalCache(version_check_interval_seconds=0,
+                              version_loader=lambda: self.version, **kwargs)
+
+    @staticmethod
+    def key(query, limit=5, expand_graph=True):
+        return RetrievalCache.make_key(query, limit, expand_graph)
+
+    def test_hit_on_normalized_query(self):
+        """Test a repeated query is served from the cache despite case and spacing."""
+        cache = self.make_cache()
+        cache.put(self.key("What is machine learning?"), [{"chunk_id": "chunk_1"}], retrieval_ms=40)
+
+        cached = cache.get(self.key("  what is MACHINE   learning?"))
+
+        stats = cache.get_stats()
+        self.assertEqual(cached, [{"chunk_id": "chunk_1"}])
+        self.assertEqual((stats["hits"], stats["misses"], stats["entries"]), (1, 0, 1))
+        self.assertEqual(stats["saved_ms"], 40.0)
+        self.assertEqual(stats["hit_rate"], 1.0)
+
+    def test_miss_on_different_query_or_options(self):
+        """Test other queries, limits and expansion settings miss."""
+        cache = self.make_cache()
+        cache.put(self.key("What is machine learning?"), [{"chunk_id": "chunk_1"}])
+
+        self.assertIsNone(cache.get(self.key("What is deep learning?")))
+        self.assertIsNone(cache.get(self.key("What is machine learning?", limit=10)))
+        self.assertIsNone(cache.get(self.key("What is machine learning?", expand_graph=False)))
+        self.assertEqual(cache.get_stats()["misses"], 3)
+
+    def test_entries_expire_after_ttl(self):
+        """Test an entry older than ttl_seconds is dropped."""
+        cache = self.make_cache(ttl_seconds=60)
+        key = self.key("What is machine learning?")
+        cache.put(key, [{"chunk_id": "chunk_1"}])
+
+        self.offset = 30
+        self.assertEqual(cache.get(key), [{"chunk_id": "chunk_1"}])
+        self.offset = 61
+        self.assertIsNone(cache.get(key))
+
+        stats = cache.get_stats()
+        self.assertEqual((stats["hits"], stats["misses"], stats["expirations"], stats["entries"]), (1, 1, 1, 0))
+
+    def test_graph_version_bump_drops_every_entry(self):
+        """Test a new graph version from the batch loader invalidates the cache."""
+        self.version = 1
+        cache = self.make_cache()
+        key = self.key("What is machine learning?")
+        self.assertIsNone(cache.get(key))
+        cache.put(key, [{"chunk_id": "chunk_1"}])
+        cache.put(self.key("other"), [{"chunk_id": "chunk_2"}])
+        self.assertEqual(cache.get(key), [{"chunk_id": "chunk_1"}])
+
+        self.version = 2
+        self.assertIsNone(cache.get(key))
+
+        stats = cache.get_stats()
+        self.assertEqual(stats["invalidations"], 1)
+        self.assertEqual(stats["graph_version"], 2)
+        self.assertEqual(stats["entries"], 0)
+
+    def test_version_is_rechecked_only_after_the_interval(self):
+        """Test the graph version lookup is rate limited."""
+        loader = MagicMock(return_value=1)
+        cache = RetrievalCache(version_check_interval_seconds=5, version_loader=loader)
+        key = self.key("What is machine learning?")
+        cache.get(key)
+        cache.put(key, [{"chunk_id": "chunk_1"}])
+
+        loader.return_value = 2
+        self.assertEqual(cache.get(key), [{"chunk_id": "chunk_1"}])
+        self.offset = 6
+        self.assertIsNone(cache.get(key))
+        self.assertEqual(loader.call_count, 2)
+
+    def test_version_lookup_failure_keeps_entries(self):
+        """Test a failed version lookup keeps serving cached results."""
+        loader = MagicMock(return_value=1)
+        cache = RetrievalCache(version_check_interval_seconds=0, version_loader=loader)
+        key = self.key("What is machine learning?")
+        cache.get(key)
+        cache.put(key, [{"chunk_id": "chunk_1"}])
+
+        loader.side_effect = RuntimeError("neo4j unavailable")
+
+        self.assertEqual(cache.get(key), [{"chunk_id": "chunk_1"}])
+        self.assertEqual(cache.get_stats()["version_check_errors"], 1)
+
+    def test_lru_bound_evicts_least_recently_used(self):
+        """Test the cache stays within max_entries by evicting the oldest entry."""
+        cache = self.make_cache(max_entries=2)
+        cache.put(self.key("first"), [{"chunk_id": "chunk_1"}])
+        cache.put(self.key("second"), [{"chunk_id": "chunk_2"}])
+        cache.get(self.key("first"))
+
+        cache.put(self.key("third"), [{"chunk_id": "chunk_3"}])
+
+        self.assertIsNone(cache.get(self.key("second")))
+        self.assertEqual(cache.get(self.key("first")), [{"chunk_id": "chunk_1"}])
+        self.assertEqual(cache.get(self.key("third")), [{"chunk_id": "chunk_3"}])
+        stats = cache.get_stats()
+        self.assertEqual((stats["evictions"], stats["entries"]), (1, 2))
+
+    def test_zero_max_entries_disables_cache(self):
+        """Test max_entries=0 never stores or counts lookups."""
+        cache = self.make_cache(max_entries=0)
+        cache.put(self.key("first"), [{"chunk_id": "chunk_1"}])
+
+        self.assertIsNone(cache.get(self.key("first")))
+        self.assertEqual(cache.get_stats()["entries"], 0)
+
+    def test_cached_results_cannot_be_modified_by_callers(self):
+        """Test neither the stored list nor returned results alias the cached entry."""
+        cache = self.make_cache()
+        key = self.key("What is machine learning?")
+        results = [{"chunk_id": "chunk_1", "related_chunks": [{"chunk_id": "chunk_2"}]}]
+        cache.put(key, results)
+        results[0]["chunk_id"] = "changed after put"
+
+        first = cache.get(key)
+        first[0]["related_chunks"].append({"chunk_id": "injected"})
+        first.append({"chunk_id": "extra"})
+
+        self.assertEqual(cache.get(key), [{"chunk_id": "chunk_1", "related_chunks": [{"chunk_id": "chunk_2"}]}])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+Benchmark embedding storage precisions.
+
+Reports the memory one batch of chunk embeddings takes as Python float lists
+and as float32/float16/int8 arrays, and the recall@k of cosine search over
+float16/int8 embeddings relative to float32.
+
+Usage:
+    python scripts/benchmark_embedding_precision.py
+    python scripts/benchmark_embedding_precision.py --embeddings output/data/embeddings_output.json
+"""
+
+import argparse
+import json
+import os
+import sys
+
+import numpy as np
+
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.embedding_cache import STORAGE_DTYPES, quantize_embeddings, dequantize_embeddings
+
+
+def load_embeddings(path, count, dimension, seed):
+    """Load embeddings from an embeddings_output.json file, or generate clustered random ones."""
+    if path:
+        with open(path, 'r') as f:
+            data = json.load(f)
+        return np.asarray([chunk['embedding'] for chunk in data['chunks']], dtype=np.float32)
+
+    # Clustered vectors resemble sentence embeddings better than uniform noise
+    rng = np.random.default_rng(seed)
+    centers = rng.standard_normal((max(1, count // 50), dimension)).astype(np.float32)
+    labels = rng.integers(0, len(centers), count)
+    return centers[labels] + 0.3 * rng.standard_normal((count, dimension)).astype(np.float32)
+
+
+def list_bytes(matrix):
+    """Approximate memory of the same embeddings held as lists of Python floats."""
+    rows = matrix.tolist()
+    return sum(sys.getsizeof(row) + sum(sys.getsizeof(value) for value in row) for row in rows)
+
+
+def top_k(matrix, queries, k):
+    """Indexes of the k most cosine-similar rows per query."""
+    normalized = matrix / np.maximum(np.linalg.norm(matrix, axis=1, keepdims=True), 1e-12)
+    scores = queries @ normalized.T
+    return np.argsort(-scores, axis=1)[:, :k]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark float32/float16/int8 chunk embedding storage")
+    parser.add_argument("--embeddings", help="embeddings_output.json to benchmark instead of synthetic vectors")
+    parser.add_argument("--count", type=int, default=20000, help="Number of synthetic embeddings")
+    parser.add_argument("--dimension", type=int, default=384, help="Synthetic embedding dimension")
+    parser.add_argument("--batch-size", type=int, default=500, help="Chunks per batch for the memory figures")
+    parser.add_argument("--queries", type=int, default=200, help="Number of recall queries")
+    parser.add_argument("--k", type=int, default=10, help="Recall cut-off")
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    embeddings = load_embeddings(args.embeddings, args.count, args.dimension, args.seed)
+    count, dimension = embeddings.shape
+    print(f"Embeddings: {count} x {dimension}")
+
+    batch = embeddings[:args.batch_size]
+    print(f"\nMemory per batch of {len(batch)} chunks:")
+    print(f"  {'python lists':<14}{list_bytes(batch) / 1024:>12.1f} KiB")
+    for dtype in STORAGE_DTYPES:
+        values, scales = quantize_embeddings(batch, dtype)
+        size = values.nbytes + (scales.nbytes if scales is not None else 0)
+        print(f"  {dtype:<14}{size / 1024:>12.1f} KiB")
+    print(f"  Neo4j stores {dimension * 8} bytes per list embedding (float64), "
+          f"{dimension * 4} per float32 vector property")
+
+    rng = np.random.default_rng(args.seed + 1)
+    queries = embeddings[rng.choice(count, min(args.queries, count), replace=False)]
+    queries = queries + 0.1 * rng.standard_normal(queries.shape).astype(np.float32)
+    queries /= np.linalg.norm(queries, axis=1, keepdims=True)
+    truth = top_k(embeddings, queries, args.k)
+
+    print(f"\nRecall@{args.k} against float32 ({len(queries)} queries):")
+    for dtype in STORAGE_DTYPES:
+        restored = dequantize_embeddings(*quantize_embeddings(embeddings, dtype))
+        found = top_k(restored, queries, args.k)
+        recall = np.mean([len(set(a) & set(b)) / args.k for a, b in zip(truth, found)])
+        print(f"  {dtype:<14}{recall:>8.4f}")
+
+
+if __name__ == "__main__":
+    main()
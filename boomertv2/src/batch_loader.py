@@ -8,18 +8,23 @@ Usage:
 """
 
 import sys
+import asyncio
+import hashlib
 import logging
 import json
 import os
-import uuid
+import queue
+import tempfile
+import threading
+import time
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Callable
 import argparse
 from pathlib import Path
 from neo4j import GraphDatabase
+import numpy as np
 import openai
 from sentence_transformers import SentenceTransformer
-import psycopg2
 import yaml
 
 # Import the parent classes
@@ -29,9 +34,11 @@ try:
         ErrorCodes as BaseErrorCodes,
         load_config,
         parse_postgres_config,
-        get_query_from_config
+        get_query_from_config,
+        PostgresConnectionPool
     )
     from .neo4j_data_loader import Neo4jDataLoader, Neo4jLoaderErrorCodes
+    from .embedding_cache import EmbeddingCache, STORAGE_DTYPES
 except ImportError:
     # Fallback for direct execution
     from postgres_query_runner import (
@@ -39,9 +46,11 @@ except ImportError:
         ErrorCodes as BaseErrorCodes,
         load_config,
         parse_postgres_config,
-        get_query_from_config
+        get_query_from_config,
+        PostgresConnectionPool
     )
     from neo4j_data_loader import Neo4jDataLoader, Neo4jLoaderErrorCodes
+    from embedding_cache import EmbeddingCache, STORAGE_DTYPES
 
 # Import MCP clients (available globally)
 try:
@@ -74,12 +83,51 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 logger.info(f"Logging to file: {log_filepath}")
 
+# Node labels and relationship types tracked in before/after graph statistics
+GRAPH_NODE_LABELS = ["Article", "Website", "Author", "Chunk", "Tag"]
+GRAPH_RELATIONSHIP_TYPES = ["HAS_CHUNK", "PUBLISHED_ON", "WRITTEN_BY", "TAGGED_WITH"]
+
+# Marker node whose version readers use to invalidate cached retrieval results
+GRAPH_VERSION_NAME = "graph"
+
+# ID property per label for nodes whose IDs are tracked for scoped integrity checks
+TOUCHED_ID_PROPERTIES = {"Article": "id", "Chunk": "chunk_id"}
+
+# Touched IDs sent per integrity-check round-trip
+INTEGRITY_CHECK_ID_CHUNK_SIZE = 10000
+
+# Vector index dimension used when the embedding model cannot report its own
+DEFAULT_EMBEDDING_DIMENSION = 384
+
+# How vector properties are stored in Neo4j: plain float lists (stored as float64)
+# or float32 vector properties written with db.create.setNodeVectorProperty
+NEO4J_VECTOR_DTYPES = ("float64", "float32")
+
+# Upper bounds (seconds) and labels for the LLM chunking latency histogram
+LLM_LATENCY_BUCKETS = [
+    (0.5, "le_0.5s"),
+    (1.0, "le_1s"),
+    (2.0, "le_2s"),
+    (5.0, "le_5s"),
+    (10.0, "le_10s"),
+    (30.0, "le_30s"),
+    (float("inf"), "gt_30s")
+]
+
+
+def _as_list(value: Any) -> Any:
+    """Convert a NumPy array to a plain list for the Bolt driver or JSON; other values pass through."""
+    return value.tolist() if isinstance(value, np.ndarray) else value
+
+
 # Extended error codes for batch loading
 class BatchLoaderErrorCodes:
     BATCH_CONFIG_ERROR = "ERR_B001"
     BATCH_PROCESSING_ERROR = "ERR_B002"
     STATUS_UPDATE_ERROR = "ERR_B003"
     BATCH_SIZE_ERROR = "ERR_B004"
+    GRAPH_VERSION_ERROR = "ERR_B005"
+    CHUNK_HOOK_ERROR = "ERR_B006"
 
 
 class BatchNeo4jLoader(Neo4jDataLoader):
@@ -95,6 +143,56 @@ class BatchNeo4jLoader(Neo4jDataLoader):
         super().__init__()
         self.batch_size = 10  # Default batch size
         
+        # Batch read settings
+        self.pagination_mode = "offset"  # 'offset' or 'keyset'
+        self.keyset_column = "id"
+        self.cursor_itersize = 1000
+        self.record_count_mode = "exact"  # 'exact' or 'estimate'
+        self.last_seen_key = None
+        self.last_fetched_count = 0
+        
+        # Pipelined execution settings
+        self.pipeline_enabled = False
+        self.pipeline_embed_workers = 2
+        self.pipeline_writer_workers = 2
+        self.pipeline_queue_size = 4
+        
+        # PostgreSQL connection pool and status acknowledgement settings
+        self.pg_pool = None
+        self.pg_pool_min_connections = 2
+        self.pg_pool_max_connections = 4
+        self.status_coalesce_batches = 1
+        self._pending_status_acks: List[Tuple[int, int, List[int]]] = []
+        self.status_update_metrics = {"statements": 0, "rows": 0, "total_ms": 0.0, "max_ms": 0.0}
+        
+        # Graph statistics and integrity check settings
+        self.statistics_source = "count_store"  # 'count_store' or 'apoc'
+        self.integrity_check_scope = "full"  # 'full', 'touched' or 'off'
+        self.async_integrity_checks = False
+        self.touched_ids = {label: set() for label in TOUCHED_ID_PROPERTIES}
+        self.adhoc_thread = None
+        
+        # Embedding model and content-hash embedding cache
+        self.embedding_model_name = 'all-MiniLM-L6-v2'
+        self.embedding_cache = None
+        self.embedding_dimension = None
+        self.cache_dtype = "float32"
+        self.neo4j_vector_dtype = "float64"
+        self.incremental_chunks = False
+        
+        # Callbacks fed with each written batch's chunk records (e.g. the chunk export)
+        self.chunk_hooks: List[Callable[[List[Dict[str, Any]]], None]] = []
+        self.chunk_export_path = None
+        self._chunk_export_lock = threading.Lock()
+        
+        # LLM chunking settings (overridden from chunking_config)
+        self.llm_chunk_model = "gpt-3.5-turbo"
+        self.llm_concurrency = 4
+        self.llm_timeout_seconds = 30.0
+        self.llm_max_retries = 2
+        self.llm_backoff_seconds = 1.0
+        self.llm_cache_dir = "output/cache/llm_chunks"
+        
         # Initialize MCP clients
         self.mcp_cypher_client = None
         self.mcp_vector_client = None
@@ -122,7 +220,17 @@ class BatchNeo4jLoader(Neo4jDataLoader):
             "completed_batches": 0,
             "failed_batches": 0,
             "total_records_processed": 0,
-            "batch_errors": []
+            "batch_errors": [],
+            "node_write_throughput": {},
+            "embedding_cache": {},
+            "postgres": {}
+        }
+        
+        # Pipeline stage throughput and queue depth metrics
+        self.pipeline_metrics = {
+            "stages": {},
+            "queues": {},
+            "wall_seconds": 0.0
         }
         
         # Current run metrics (what was created in this run)
@@ -132,8 +240,18 @@ class BatchNeo4jLoader(Neo4jDataLoader):
             "nodes_failed": {},
             "relationships_failed": {},
             "chunks_created": 0,
+            "chunks_unchanged": 0,
+            "chunks_deleted": 0,
             "embeddings_generated": 0,
             "total_records_processed": 0,
+            "llm_chunking": {
+                "requests": 0,
+                "cache_hits": 0,
+                "retries": 0,
+                "timeouts": 0,
+                "fallbacks": 0,
+                "latency_histogram": {label: 0 for _, label in LLM_LATENCY_BUCKETS}
+            },
             "errors": []
         }
         
@@ -160,12 +278,8 @@ class BatchNeo4jLoader(Neo4jDataLoader):
         }
         
         # Adhoc tests for data integrity
-        self.adhoc_tests = {
-            "orphan_nodes": {},
-            "orphan_relationships": {},
-            "data_integrity_issues": [],
-            "test_results": {}
-        }
+        self.adhoc_tests = self._new_adhoc_tests()
+        self._metrics_snapshot = None
         
         self.cypher_usage = {}
         logger.info("Batch Neo4j Data Loader initialized")
@@ -174,34 +288,39 @@ class BatchNeo4jLoader(Neo4jDataLoader):
         """
         Get current node and relationship counts from Neo4j.
         
+        All counts come back from a single round-trip. Each branch is a plain
+        label or relationship-type count, which Neo4j answers from its count
+        store without scanning the graph.
+        
         Returns:
             Dictionary with node and relationship counts
         """
         try:
+            if self.statistics_source == 'apoc':
+                try:
+                    return self._get_neo4j_counts_from_apoc()
+                except Exception as e:
+                    logger.warning(f"apoc.meta.stats unavailable, using count store queries: {str(e)}")
+            
             counts = {
-                "nodes_existing_count": {},
-                "relationships_existing_count": {}
+                "nodes_existing_count": {label: 0 for label in GRAPH_NODE_LABELS},
+                "relationships_existing_count": {rel_type: 0 for rel_type in GRAPH_RELATIONSHIP_TYPES}
             }
             
-            # Get node counts
-            node_labels = ["Article", "Website", "Author", "Chunk", "Tag"]
-            for label in node_labels:
-                cypher = f"MATCH (n:{label}) RETURN count(n) as count"
-                result = self.execute_cypher_query(cypher, {})
-                if result and "records" in result and len(result["records"]) > 0:
-                    counts["nodes_existing_count"][label] = result["records"][0]["count"]
-                else:
-                    counts["nodes_existing_count"][label] = 0
-            
-            # Get relationship counts
-            rel_types = ["HAS_CHUNK", "PUBLISHED_ON", "WRITTEN_BY", "TAGGED_WITH"]
-            for rel_type in rel_types:
-                cypher = f"MATCH ()-[r:{rel_type}]->() RETURN count(r) as count"
-                result = self.execute_cypher_query(cypher, {})
-                if result and "records" in result and len(result["records"]) > 0:
-                    counts["relationships_existing_count"][rel_type] = result["records"][0]["count"]
-                else:
-                    counts["relationships_existing_count"][rel_type] = 0
+            branches = [
+                f"MATCH (n:{label}) RETURN 'node' AS kind, '{label}' AS name, count(n) AS count"
+                for label in GRAPH_NODE_LABELS
+            ] + [
+                f"MATCH ()-[r:{rel_type}]->() RETURN 'relationship' AS kind, '{rel_type}' AS name, count(r) AS count"
+                for rel_type in GRAPH_RELATIONSHIP_TYPES
+            ]
+            cypher = "\nUNION ALL\n".join(branches)
+            self._record_cypher("statistics", "graph_counts", cypher)
+            result = self.execute_cypher_query(cypher, {})
+            
+            for row in result.get("records", []):
+                bucket = "nodes_existing_count" if row["kind"] == 'node' else "relationships_existing_count"
+                counts[bucket][row["name"]] = row["count"]
             
             return counts
             
@@ -212,6 +331,19 @@ class BatchNeo4jLoader(Neo4jDataLoader):
                 "relationships_existing_count": {}
             }
     
+    def _get_neo4j_counts_from_apoc(self) -> Dict[str, Dict[str, int]]:
+        """Read node and relationship counts from apoc.meta.stats (count store backed)."""
+        cypher = "CALL apoc.meta.stats() YIELD labels, relTypesCount RETURN labels, relTypesCount"
+        self._record_cypher("statistics", "apoc_meta_stats", cypher)
+        result = self.execute_cypher_query(cypher, {})
+        row = result["records"][0]
+        return {
+            "nodes_existing_count": {label: row["labels"].get(label, 0) for label in GRAPH_NODE_LABELS},
+            "relationships_existing_count": {
+                rel_type: row["relTypesCount"].get(rel_type, 0) for rel_type in GRAPH_RELATIONSHIP_TYPES
+            }
+        }
+    
     def calculate_actual_changes(self) -> None:
         """
         Calculate the actual changes made during this run by comparing before and after metrics.
@@ -220,14 +352,14 @@ class BatchNeo4jLoader(Neo4jDataLoader):
         try:
             # Calculate actual node changes
             actual_nodes_created = {}
-            for node_label in ['Article', 'Website', 'Author', 'Chunk', 'Tag']:
+            for node_label in GRAPH_NODE_LABELS:
                 before_count = self.before_metrics.get("nodes_existing_count", {}).get(node_label, 0)
                 after_count = self.after_metrics.get("nodes_existing_count", {}).get(node_label, 0)
                 actual_nodes_created[node_label] = after_count - before_count
             
             # Calculate actual relationship changes
             actual_relationships_created = {}
-            for rel_type in ['HAS_CHUNK', 'PUBLISHED_ON', 'WRITTEN_BY', 'TAGGED_WITH']:
+            for rel_type in GRAPH_RELATIONSHIP_TYPES:
                 before_count = self.before_metrics.get("relationships_existing_count", {}).get(rel_type, 0)
                 after_count = self.after_metrics.get("relationships_existing_count", {}).get(rel_type, 0)
                 actual_relationships_created[rel_type] = after_count - before_count
@@ -246,183 +378,341 @@ class BatchNeo4jLoader(Neo4jDataLoader):
             logger.error(f"Error calculating actual changes: {str(e)}")
             # Keep existing load_metrics if calculation fails
     
+    def record_touched_ids(self, data_records: List[Dict[str, Any]], chunk_records: List[Dict[str, Any]]) -> None:
+        """
+        Remember the Article and Chunk IDs written in this run for scoped integrity checks.
+        
+        Args:
+            data_records: Records written as Article nodes
+            chunk_records: Chunk records written or confirmed unchanged
+        """
+        with self._metrics_lock:
+            self.touched_ids["Article"].update(
+                record['id'] for record in data_records if record.get('id') is not None
+            )
+            self.touched_ids["Chunk"].update(
+                chunk['chunk_id'] for chunk in chunk_records if chunk.get('chunk_id')
+            )
+    
+    def _new_adhoc_tests(self) -> Dict[str, Any]:
+        """Empty adhoc test results."""
+        return {
+            "orphan_nodes": {},
+            "data_integrity_issues": [],
+            "test_results": {}
+        }
+    
+    def _integrity_check_labels(self, labels: List[str]) -> List[str]:
+        """Labels to check: all of them in full mode, only labels with touched IDs otherwise."""
+        if self.integrity_check_scope == 'full':
+            return labels
+        return [label for label in labels if self.touched_ids.get(label)]
+    
+    def _integrity_check_rounds(self, labels: List[str]) -> List[Dict[str, Optional[List[Any]]]]:
+        """
+        Split the nodes to check into round-trips.
+        
+        In full mode there is one round matching every node of each label. In
+        touched mode each label's IDs are sent in chunks of
+        INTEGRITY_CHECK_ID_CHUNK_SIZE, so no single UNWIND parameter grows with
+        the size of the run.
+        
+        Returns:
+            One dictionary per round mapping label to its ID chunk (None in full mode)
+        """
+        labels = self._integrity_check_labels(labels)
+        if self.integrity_check_scope == 'full':
+            return [{label: None for label in labels}] if labels else []
+        
+        chunks = {}
+        for label in labels:
+            ids = sorted(self.touched_ids[label], key=str)
+            chunks[label] = [
+                ids[start:start + INTEGRITY_CHECK_ID_CHUNK_SIZE]
+                for start in range(0, len(ids), INTEGRITY_CHECK_ID_CHUNK_SIZE)
+            ]
+        rounds = max((len(label_chunks) for label_chunks in chunks.values()), default=0)
+        return [
+            {label: label_chunks[i] for label, label_chunks in chunks.items() if i < len(label_chunks)}
+            for i in range(rounds)
+        ]
+    
+    def _match_checked_nodes(self, label: str, ids: Optional[List[Any]],
+                             variable: str = "n") -> Tuple[str, Dict[str, Any]]:
+        """Build the MATCH clause and parameters selecting the nodes of a label to check."""
+        if ids is None:
+            return f"MATCH ({variable}:{label})", {}
+        id_property = TOUCHED_ID_PROPERTIES[label]
+        param_name = f"{label.lower()}_ids"
+        clause = f"UNWIND ${param_name} AS node_id MATCH ({variable}:{label} {{{id_property}: node_id}})"
+        return clause, {param_name: ids}
+    
     def run_adhoc_tests(self) -> None:
         """
         Run adhoc tests to check data integrity and identify issues.
-        """
-        logger.info("Running adhoc tests for data integrity...")
+        
+        With integrity_checks set to 'touched' only the Article and Chunk nodes
+        written in this run are checked, so the cost follows the size of the
+        run rather than the size of the graph. Results are collected in a new
+        dictionary and swapped into adhoc_tests when the checks finish, so a
+        concurrent metrics write never sees them half-built.
+        """
+        results = self._new_adhoc_tests()
+        if self.integrity_check_scope == 'off':
+            logger.info("Adhoc tests disabled")
+            results["status"] = "skipped"
+            with self._metrics_lock:
+                self.adhoc_tests = results
+            return
+        
+        logger.info(f"Running adhoc tests for data integrity (scope: {self.integrity_check_scope})...")
+        results["scope"] = self.integrity_check_scope
+        start_time = time.perf_counter()
         
         try:
             # Test 1: Check for orphan nodes (nodes without relationships)
-            self.check_orphan_nodes()
+            self.check_orphan_nodes(results)
             
-            # Test 2: Check for orphan relationships (relationships pointing to non-existent nodes)
-            self.check_orphan_relationships()
+            # Test 2: Check for data consistency issues
+            self.check_data_consistency(results)
             
-            # Test 3: Check for data consistency issues
-            self.check_data_consistency()
-            
-            # Test 4: Check for duplicate nodes
-            self.check_duplicate_nodes()
+            # Test 3: Check for duplicate nodes
+            self.check_duplicate_nodes(results)
             
             logger.info("Adhoc tests completed")
             
         except Exception as e:
             logger.error(f"Error running adhoc tests: {str(e)}")
-            self.adhoc_tests["data_integrity_issues"].append(f"Test execution error: {str(e)}")
+            results["data_integrity_issues"].append(f"Test execution error: {str(e)}")
+        
+        results["duration_seconds"] = round(time.perf_counter() - start_time, 3)
+        results["status"] = "completed"
+        with self._metrics_lock:
+            self.adhoc_tests = results
+    
+    def start_adhoc_tests_async(self, metrics_file: str) -> threading.Thread:
+        """
+        Run the adhoc tests on a background thread and update the metrics file when they finish.
+        
+        Call after write_batch_metrics: the thread only replaces the adhoc_tests
+        section of the metrics last written, and takes over closing the Neo4j
+        driver.
+        
+        Args:
+            metrics_file: Path to metrics output file
+            
+        Returns:
+            The started thread
+        """
+        with self._metrics_lock:
+            self.adhoc_tests = dict(self._new_adhoc_tests(), status="running")
+        
+        def _run() -> None:
+            try:
+                self.run_adhoc_tests()
+                self.write_adhoc_test_metrics(metrics_file)
+            finally:
+                if self.neo4j_driver:
+                    self.neo4j_driver.close()
+                    logger.info("Neo4j connection closed after adhoc tests")
+        
+        self.adhoc_thread = threading.Thread(target=_run, name="batch-adhoc-tests")
+        self.adhoc_thread.start()
+        logger.info("Adhoc tests started in the background")
+        return self.adhoc_thread
+    
+    def wait_for_adhoc_tests(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for background adhoc tests to finish.
+        
+        Args:
+            timeout: Seconds to wait, or None to wait indefinitely
+            
+        Returns:
+            True if no background tests are still running
+        """
+        if self.adhoc_thread:
+            self.adhoc_thread.join(timeout)
+            return not self.adhoc_thread.is_alive()
+        return True
     
-    def check_orphan_nodes(self) -> None:
+    def check_orphan_nodes(self, results: Optional[Dict[str, Any]] = None) -> None:
         """
         Check for orphan nodes (nodes without any relationships).
+        
+        Args:
+            results: Adhoc test results to fill in (defaults to adhoc_tests)
         """
+        results = self.adhoc_tests if results is None else results
         try:
-            node_labels = ["Article", "Website", "Author", "Chunk", "Tag"]
-            
-            for label in node_labels:
-                # Find nodes without any relationships
-                cypher = f"""
-                MATCH (n:{label})
-                WHERE NOT EXISTS((n)-[]-())
-                RETURN count(n) as orphan_count
-                """
-                result = self.execute_cypher_query(cypher, {})
+            rounds = self._integrity_check_rounds(GRAPH_NODE_LABELS)
+            orphan_counts = {}
+            for label_ids in rounds:
+                # One round-trip for every label
+                branches = []
+                parameters = {}
+                for label, ids in label_ids.items():
+                    match_clause, match_params = self._match_checked_nodes(label, ids)
+                    branches.append(
+                        f"{match_clause} WHERE NOT EXISTS {{ (n)--() }} "
+                        f"RETURN '{label}' AS label, count(n) AS orphan_count"
+                    )
+                    parameters.update(match_params)
+                cypher = "\nUNION ALL\n".join(branches)
+                self._record_cypher("adhoc_tests", "orphan_nodes", cypher)
+                result = self.execute_cypher_query(cypher, parameters)
+                for row in result.get("records", []):
+                    orphan_counts[row["label"]] = orphan_counts.get(row["label"], 0) + row["orphan_count"]
+            
+            for label, orphan_count in orphan_counts.items():
+                results["orphan_nodes"][label] = orphan_count
                 
-                if result and "records" in result and len(result["records"]) > 0:
-                    orphan_count = result["records"][0]["orphan_count"]
-                    self.adhoc_tests["orphan_nodes"][label] = orphan_count
+                if orphan_count > 0:
+                    logger.warning(f"Found {orphan_count} orphan {label} nodes")
                     
-                    if orphan_count > 0:
-                        logger.warning(f"Found {orphan_count} orphan {label} nodes")
-                        
-                        # Get details of orphan nodes (first 5 for logging)
+                    # Get details of orphan nodes (first 5 for logging)
+                    orphan_details = []
+                    for label_ids in rounds:
+                        if label not in label_ids or len(orphan_details) >= 5:
+                            continue
+                        match_clause, match_params = self._match_checked_nodes(label, label_ids[label])
                         detail_cypher = f"""
-                        MATCH (n:{label})
-                        WHERE NOT EXISTS((n)-[]-())
-                        RETURN n LIMIT 5
+                        {match_clause}
+                        WHERE NOT EXISTS {{ (n)--() }}
+                        RETURN n LIMIT {5 - len(orphan_details)}
                         """
-                        detail_result = self.execute_cypher_query(detail_cypher, {})
+                        detail_result = self.execute_cypher_query(detail_cypher, match_params)
                         
                         if detail_result and "records" in detail_result:
-                            orphan_details = []
                             for node in detail_result["records"]:
                                 if 'n' in node:
-                                    node_data = dict(node['n'])
-                                    orphan_details.append(node_data)
-                            
-                            self.adhoc_tests["test_results"][f"{label}_orphan_details"] = orphan_details
-                else:
-                    self.adhoc_tests["orphan_nodes"][label] = 0
-                    
-        except Exception as e:
-            logger.error(f"Error checking orphan nodes: {str(e)}")
-            self.adhoc_tests["data_integrity_issues"].append(f"Orphan node check error: {str(e)}")
-    
-    def check_orphan_relationships(self) -> None:
-        """
-        Check for orphan relationships (relationships pointing to non-existent nodes).
-        """
-        try:
-            rel_types = ["HAS_CHUNK", "PUBLISHED_ON", "WRITTEN_BY", "TAGGED_WITH"]
-            
-            for rel_type in rel_types:
-                # Find relationships where start or end node doesn't exist
-                cypher = f"""
-                MATCH ()-[r:{rel_type}]->()
-                WHERE NOT EXISTS((r)-[:{rel_type}]-())
-                RETURN count(r) as orphan_rel_count
-                """
-                result = self.execute_cypher_query(cypher, {})
-                
-                if result and "records" in result and len(result["records"]) > 0:
-                    orphan_count = result["records"][0]["orphan_rel_count"]
-                    self.adhoc_tests["orphan_relationships"][rel_type] = orphan_count
+                                    orphan_details.append(dict(node['n']))
                     
-                    if orphan_count > 0:
-                        logger.warning(f"Found {orphan_count} orphan {rel_type} relationships")
-                else:
-                    self.adhoc_tests["orphan_relationships"][rel_type] = 0
+                    results["test_results"][f"{label}_orphan_details"] = orphan_details
                     
         except Exception as e:
-            logger.error(f"Error checking orphan relationships: {str(e)}")
-            self.adhoc_tests["data_integrity_issues"].append(f"Orphan relationship check error: {str(e)}")
+            logger.error(f"Error checking orphan nodes: {str(e)}")
+            results["data_integrity_issues"].append(f"Orphan node check error: {str(e)}")
     
-    def check_data_consistency(self) -> None:
+    def check_data_consistency(self, results: Optional[Dict[str, Any]] = None) -> None:
         """
         Check for data consistency issues.
+        
+        Args:
+            results: Adhoc test results to fill in (defaults to adhoc_tests)
         """
+        results = self.adhoc_tests if results is None else results
         try:
-            # Check 1: Articles without content
-            cypher = """
-            MATCH (a:Article)
-            WHERE a.content IS NULL OR a.content = ""
-            RETURN count(a) as empty_content_count
-            """
-            result = self.execute_cypher_query(cypher, {})
-            if result and "records" in result and len(result["records"]) > 0:
-                empty_count = result["records"][0]["empty_content_count"]
-                if empty_count > 0:
-                    self.adhoc_tests["data_integrity_issues"].append(f"Found {empty_count} articles without content")
-            
-            # Check 2: Chunks without embeddings
-            cypher = """
-            MATCH (c:Chunk)
-            WHERE c.embedding IS NULL
-            RETURN count(c) as no_embedding_count
-            """
-            result = self.execute_cypher_query(cypher, {})
-            if result and "records" in result and len(result["records"]) > 0:
-                no_embedding_count = result["records"][0]["no_embedding_count"]
-                if no_embedding_count > 0:
-                    self.adhoc_tests["data_integrity_issues"].append(f"Found {no_embedding_count} chunks without embeddings")
-            
-            # Check 3: Articles without chunks
-            cypher = """
-            MATCH (a:Article)
-            WHERE NOT EXISTS((a)-[:HAS_CHUNK]->())
-            RETURN count(a) as no_chunks_count
-            """
-            result = self.execute_cypher_query(cypher, {})
-            if result and "records" in result and len(result["records"]) > 0:
-                no_chunks_count = result["records"][0]["no_chunks_count"]
-                if no_chunks_count > 0:
-                    self.adhoc_tests["data_integrity_issues"].append(f"Found {no_chunks_count} articles without chunks")
+            issue_counts = {}
+            for label_ids in self._integrity_check_rounds(["Article", "Chunk"]):
+                branches = []
+                parameters = {}
+                
+                # Articles without content or without chunks
+                if "Article" in label_ids:
+                    match_clause, match_params = self._match_checked_nodes("Article", label_ids["Article"], "a")
+                    branches.append(f"""
+                    {match_clause}
+                    WITH sum(CASE WHEN a.content IS NULL OR a.content = "" THEN 1 ELSE 0 END) AS empty_content_count,
+                         sum(CASE WHEN NOT EXISTS {{ (a)-[:HAS_CHUNK]->() }} THEN 1 ELSE 0 END) AS no_chunks_count
+                    UNWIND [['empty_content', empty_content_count], ['no_chunks', no_chunks_count]] AS issue
+                    RETURN issue[0] AS issue, issue[1] AS count
+                    """)
+                    parameters.update(match_params)
+                
+                # Chunks without embeddings
+                if "Chunk" in label_ids:
+                    match_clause, match_params = self._match_checked_nodes("Chunk", label_ids["Chunk"], "c")
+                    branches.append(f"""
+                    {match_clause}
+                    RETURN 'no_embedding' AS issue, sum(CASE WHEN c.embedding IS NULL THEN 1 ELSE 0 END) AS count
+                    """)
+                    parameters.update(match_params)
+                
+                cypher = "\nUNION ALL\n".join(branches)
+                self._record_cypher("adhoc_tests", "data_consistency", cypher)
+                result = self.execute_cypher_query(cypher, parameters)
+                for row in result.get("records", []):
+                    issue_counts[row["issue"]] = issue_counts.get(row["issue"], 0) + (row["count"] or 0)
+            
+            messages = {
+                "empty_content": "articles without content",
+                "no_chunks": "articles without chunks",
+                "no_embedding": "chunks without embeddings"
+            }
+            for issue, count in issue_counts.items():
+                if count > 0:
+                    results["data_integrity_issues"].append(f"Found {count} {messages[issue]}")
                     
         except Exception as e:
             logger.error(f"Error checking data consistency: {str(e)}")
-            self.adhoc_tests["data_integrity_issues"].append(f"Data consistency check error: {str(e)}")
+            results["data_integrity_issues"].append(f"Data consistency check error: {str(e)}")
     
-    def check_duplicate_nodes(self) -> None:
+    def check_duplicate_nodes(self, results: Optional[Dict[str, Any]] = None) -> None:
         """
         Check for duplicate nodes based on unique properties.
+        
+        Args:
+            results: Adhoc test results to fill in (defaults to adhoc_tests)
         """
+        results = self.adhoc_tests if results is None else results
         try:
-            # Check for duplicate articles by URL
-            cypher = """
-            MATCH (a:Article)
-            WITH a.url as url, count(a) as count
-            WHERE count > 1
-            RETURN url, count
-            """
-            result = self.execute_cypher_query(cypher, {})
-            if result and "records" in result and len(result["records"]) > 0:
-                duplicate_articles = len(result["records"])
-                self.adhoc_tests["data_integrity_issues"].append(f"Found {duplicate_articles} duplicate article URLs")
-            
-            # Check for duplicate websites by domain
-            cypher = """
-            MATCH (w:Website)
-            WITH w.domain as domain, count(w) as count
-            WHERE count > 1
-            RETURN domain, count
-            """
-            result = self.execute_cypher_query(cypher, {})
-            if result and "records" in result and len(result["records"]) > 0:
-                duplicate_websites = len(result["records"])
-                self.adhoc_tests["data_integrity_issues"].append(f"Found {duplicate_websites} duplicate website domains")
+            duplicate_urls = set()
+            duplicate_domains = set()
+            for label_ids in self._integrity_check_rounds(["Article"]):
+                if self.integrity_check_scope == 'full':
+                    article_cypher = """
+                    MATCH (a:Article)
+                    WITH a.url as url, count(a) as count
+                    WHERE count > 1
+                    RETURN url, count
+                    """
+                    website_cypher = """
+                    MATCH (w:Website)
+                    WITH w.domain as domain, count(w) as count
+                    WHERE count > 1
+                    RETURN domain, count
+                    """
+                    parameters = {}
+                else:
+                    # Only look up the URLs and domains of the articles written in this run
+                    match_clause, parameters = self._match_checked_nodes("Article", label_ids["Article"], "a")
+                    article_cypher = f"""
+                    {match_clause}
+                    WITH collect(DISTINCT a.url) AS urls
+                    MATCH (b:Article) WHERE b.url IN urls
+                    WITH b.url as url, count(b) as count
+                    WHERE count > 1
+                    RETURN url, count
+                    """
+                    website_cypher = f"""
+                    {match_clause}
+                    MATCH (a)-[:PUBLISHED_ON]->(site:Website)
+                    WITH collect(DISTINCT site.domain) AS domains
+                    MATCH (w:Website) WHERE w.domain IN domains
+                    WITH w.domain as domain, count(w) as count
+                    WHERE count > 1
+                    RETURN domain, count
+                    """
+                
+                # Check for duplicate articles by URL
+                self._record_cypher("adhoc_tests", "duplicate_articles", article_cypher)
+                result = self.execute_cypher_query(article_cypher, parameters)
+                duplicate_urls.update(row["url"] for row in result.get("records", []))
+                
+                # Check for duplicate websites by domain
+                self._record_cypher("adhoc_tests", "duplicate_websites", website_cypher)
+                result = self.execute_cypher_query(website_cypher, parameters)
+                duplicate_domains.update(row["domain"] for row in result.get("records", []))
+            
+            if duplicate_urls:
+                results["data_integrity_issues"].append(f"Found {len(duplicate_urls)} duplicate article URLs")
+            if duplicate_domains:
+                results["data_integrity_issues"].append(f"Found {len(duplicate_domains)} duplicate website domains")
                 
         except Exception as e:
             logger.error(f"Error checking duplicate nodes: {str(e)}")
-            self.adhoc_tests["data_integrity_issues"].append(f"Duplicate node check error: {str(e)}")
+            results["data_integrity_issues"].append(f"Duplicate node check error: {str(e)}")
     
     def get_batch_config(self, config: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -436,7 +726,89 @@ class BatchNeo4jLoader(Neo4jDataLoader):
         """
         batch_config = config.get('batch_config', {})
         self.batch_size = batch_config.get('batch_size', 10)
+        self.bulk_write = batch_config.get('bulk_write', False)
+        self.write_sub_batch_size = max(1, int(batch_config.get('write_sub_batch_size', 500)))
+        self.pagination_mode = batch_config.get('pagination', 'offset')
+        self.keyset_column = batch_config.get('keyset_column', 'id')
+        self.cursor_itersize = int(batch_config.get('cursor_itersize', 1000))
+        self.record_count_mode = batch_config.get('record_count', 'exact')
+        
+        if self.pagination_mode not in ('offset', 'keyset'):
+            raise Exception(f"{BatchLoaderErrorCodes.BATCH_CONFIG_ERROR}: Unknown pagination mode: {self.pagination_mode}")
+        if not str(self.keyset_column).isidentifier():
+            raise Exception(f"{BatchLoaderErrorCodes.BATCH_CONFIG_ERROR}: Invalid keyset column: {self.keyset_column}")
+        if self.record_count_mode not in ('exact', 'estimate'):
+            raise Exception(f"{BatchLoaderErrorCodes.BATCH_CONFIG_ERROR}: Unknown record count mode: {self.record_count_mode}")
+        
+        self.statistics_source = batch_config.get('statistics_source', 'count_store')
+        self.integrity_check_scope = batch_config.get('integrity_checks', 'full')
+        self.async_integrity_checks = batch_config.get('async_integrity_checks', False)
+        if self.statistics_source not in ('count_store', 'apoc'):
+            raise Exception(f"{BatchLoaderErrorCodes.BATCH_CONFIG_ERROR}: Unknown statistics source: {self.statistics_source}")
+        if self.integrity_check_scope not in ('full', 'touched', 'off'):
+            raise Exception(f"{BatchLoaderErrorCodes.BATCH_CONFIG_ERROR}: Unknown integrity check scope: {self.integrity_check_scope}")
+        
+        pipeline_config = batch_config.get('pipeline', {})
+        self.pipeline_enabled = pipeline_config.get('enabled', False)
+        self.pipeline_embed_workers = max(1, int(pipeline_config.get('embed_workers', 2)))
+        self.pipeline_writer_workers = max(1, int(pipeline_config.get('writer_workers', 2)))
+        self.pipeline_queue_size = max(1, int(pipeline_config.get('queue_size', 4)))
+        if self.pipeline_enabled and not self.bulk_write:
+            # Pipeline writers rely on the set-based writers' thread-safe metric updates
+            logger.info("Pipelined execution enabled, turning on bulk writes")
+            self.bulk_write = True
+        
+        self.incremental_chunks = batch_config.get('incremental_chunks', False)
+        
+        export_config = batch_config.get('chunk_export', {})
+        if export_config.get('enabled', False) and self.chunk_export_path is None:
+            self.chunk_export_path = export_config.get('path', 'output/chunk_export.jsonl')
+            self.add_chunk_hook(self.export_chunks)
+        
+        pool_config = batch_config.get('postgres_pool', {})
+        self.pg_pool_max_connections = max(1, int(pool_config.get('max_connections', self.pg_pool_max_connections)))
+        self.pg_pool_min_connections = min(
+            max(0, int(pool_config.get('min_connections', self.pg_pool_min_connections))), self.pg_pool_max_connections
+        )
+        self.status_coalesce_batches = max(1, int(batch_config.get('status_coalesce_batches', 1)))
+        self.configure_neo4j_performance(batch_config)
+        
+        storage_config = batch_config.get('embedding_storage', {})
+        self.cache_dtype = storage_config.get('cache_dtype', 'float32')
+        self.neo4j_vector_dtype = storage_config.get('neo4j_dtype', 'float64')
+        if self.cache_dtype not in STORAGE_DTYPES:
+            raise Exception(f"{BatchLoaderErrorCodes.BATCH_CONFIG_ERROR}: Unknown embedding cache dtype: {self.cache_dtype}")
+        if self.neo4j_vector_dtype not in NEO4J_VECTOR_DTYPES:
+            raise Exception(f"{BatchLoaderErrorCodes.BATCH_CONFIG_ERROR}: Unknown Neo4j vector dtype: {self.neo4j_vector_dtype}")
+        
+        cache_config = batch_config.get('embedding_cache', {})
+        if cache_config.get('enabled', False) and self.embedding_cache is None:
+            try:
+                self.embedding_cache = EmbeddingCache(
+                    cache_config.get('path', 'output/cache/embeddings.sqlite'),
+                    cache_config.get('max_entries', 500000),
+                    self.cache_dtype
+                )
+            except Exception as e:
+                # The cache only saves work, so run without it rather than failing the load
+                logger.warning(f"Embedding cache disabled: {str(e)}")
+                self.embedding_cache = None
+        
         logger.info(f"Batch size configured: {self.batch_size}")
+        if self.pipeline_enabled:
+            logger.info(f"Pipelined execution: {self.pipeline_embed_workers} embed workers, "
+                        f"{self.pipeline_writer_workers} writer workers, queue size {self.pipeline_queue_size}")
+        logger.info(f"Pagination mode: {self.pagination_mode}, record count mode: {self.record_count_mode}")
+        if self.bulk_write:
+            logger.info(f"Bulk UNWIND writes enabled with sub-batch size: {self.write_sub_batch_size}")
+        if self.incremental_chunks:
+            logger.info("Incremental re-chunking enabled")
+        if self.chunk_export_path:
+            logger.info(f"Exporting written chunks to {self.chunk_export_path}")
+        if self.cache_dtype != 'float32' or self.neo4j_vector_dtype != 'float64':
+            logger.info(f"Embedding storage: cache {self.cache_dtype}, Neo4j {self.neo4j_vector_dtype}")
+        if self.neo4j_driver_options():
+            logger.info(f"Neo4j driver options: {self.neo4j_driver_options()}")
         return batch_config
     
     def initialize_neo4j_connection(self, config: Dict[str, Any]) -> None:
@@ -464,7 +836,8 @@ class BatchNeo4jLoader(Neo4jDataLoader):
             uri = f"neo4j://{neo4j_config['host']}:{neo4j_config['port']}"
             self.neo4j_driver = GraphDatabase.driver(
                 uri, 
-                auth=(neo4j_config['user'], neo4j_config['password'])
+                auth=(neo4j_config['user'], neo4j_config['password']),
+                **self.neo4j_driver_options()
             )
             
             # Test connection
@@ -483,14 +856,37 @@ class BatchNeo4jLoader(Neo4jDataLoader):
         logger.info("Initializing embedding model")
         
         try:
-            self.embedding_model = SentenceTransformer('all-MiniLM-L6-v2')
+            self.embedding_model = SentenceTransformer(self.embedding_model_name)
             logger.info("Embedding model initialized successfully")
         except Exception as e:
             error_msg = f"{Neo4jLoaderErrorCodes.EMBEDDING_ERROR}: Failed to initialize embedding model: {str(e)}"
             logger.error(error_msg)
             raise Exception(error_msg) from e
     
-    def chunk_text_content(self, text: str, chunk_size: int = 512, overlap: int = 50, use_llm: bool = True) -> List[Dict[str, Any]]:
+    def get_embedding_dimension(self) -> int:
+        """
+        Get the embedding model's output dimension, used to size the chunk vector index.
+        
+        Returns:
+            Embedding dimension (DEFAULT_EMBEDDING_DIMENSION if the model cannot be loaded)
+        """
+        if self.embedding_dimension:
+            return self.embedding_dimension
+        
+        try:
+            if not self.embedding_model:
+                self.initialize_embedding_model()
+            dimension = self.embedding_model.get_sentence_embedding_dimension()
+            if not dimension:
+                dimension = len(self.embedding_model.encode(["dimension probe"], show_progress_bar=False)[0])
+            self.embedding_dimension = int(dimension)
+            return self.embedding_dimension
+        except Exception as e:
+            logger.warning(f"Could not determine embedding dimension, assuming {DEFAULT_EMBEDDING_DIMENSION}: {str(e)}")
+            return DEFAULT_EMBEDDING_DIMENSION
+    
+    def chunk_text_content(self, text: str, chunk_size: int = 512, overlap: int = 50, use_llm: bool = True,
+                           source_id: Any = None) -> List[Dict[str, Any]]:
         """
         Chunk text content for vector embeddings using LLM-based intelligent chunking.
         
@@ -499,6 +895,7 @@ class BatchNeo4jLoader(Neo4jDataLoader):
             chunk_size: Size of each chunk in characters
             overlap: Overlap between chunks
             use_llm: Whether to use LLM for intelligent chunking
+            source_id: ID of the source record, used to derive chunk IDs
             
         Returns:
             List of chunk dictionaries with chunk_id, chunk_text, and position
@@ -516,6 +913,10 @@ class BatchNeo4jLoader(Neo4jDataLoader):
             else:
                 chunks = self._chunk_simple(text, chunk_size, overlap)
             
+            if source_id is not None:
+                for chunk in chunks:
+                    chunk['chunk_id'] = self.make_chunk_id(source_id, chunk['chunk_order'], chunk['chunk_text'])
+            
             logger.info(f"Created {len(chunks)} chunks from text")
             return chunks
             
@@ -536,49 +937,176 @@ class BatchNeo4jLoader(Neo4jDataLoader):
             List of chunk dictionaries
         """
         logger.info("Using LLM-based intelligent text chunking")
+        return self.chunk_texts_with_llm([text], target_chunk_size)[text]
+    
+    def configure_llm_chunking(self, chunking_config: Dict[str, Any]) -> None:
+        """
+        Read LLM chunking settings from the chunking_config section.
         
-        try:
-            # Check if OpenAI API key is available
+        Args:
+            chunking_config: chunking_config dictionary from the config file
+        """
+        self.llm_chunk_model = chunking_config.get('llm_model', self.llm_chunk_model)
+        self.llm_concurrency = max(1, int(chunking_config.get('llm_concurrency', self.llm_concurrency)))
+        self.llm_timeout_seconds = float(chunking_config.get('llm_timeout_seconds', self.llm_timeout_seconds))
+        self.llm_max_retries = max(0, int(chunking_config.get('llm_max_retries', self.llm_max_retries)))
+        self.llm_backoff_seconds = float(chunking_config.get('llm_backoff_seconds', self.llm_backoff_seconds))
+        self.llm_cache_dir = chunking_config.get('llm_cache_dir', self.llm_cache_dir)
+    
+    def chunk_texts_with_llm(self, texts: List[str], target_chunk_size: int) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Chunk several texts with the LLM concurrently.
+        
+        Requests run under an llm_concurrency limit with retry and exponential
+        backoff. Responses are memoized on disk by text hash and chunk size, and a
+        text whose request times out or keeps failing falls back to simple chunking.
+        
+        Args:
+            texts: Texts to chunk
+            target_chunk_size: Target size for each chunk
+            
+        Returns:
+            Dictionary of text -> list of chunk dictionaries
+        """
+        unique_texts = list(dict.fromkeys(texts))
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        pending = []
+        for text in unique_texts:
+            cached = self._load_llm_chunk_memo(text, target_chunk_size)
+            if cached is not None:
+                results[text] = self._build_chunks(cached, 'llm')
+                self._update_llm_metric("cache_hits")
+            else:
+                pending.append(text)
+        
+        if pending:
             if not os.getenv('OPENAI_API_KEY'):
                 logger.warning("OPENAI_API_KEY environment variable not set, falling back to simple chunking")
-                return self._chunk_simple(text, target_chunk_size, target_chunk_size // 10)
-            
-            # Use OpenAI for intelligent chunking
-            import openai
-            
-            prompt = f"""
+                for text in pending:
+                    results[text] = self._chunk_simple(text, target_chunk_size, target_chunk_size // 10)
+            else:
+                results.update(asyncio.run(self._chunk_texts_with_llm_async(pending, target_chunk_size)))
+        
+        return results
+    
+    async def _chunk_texts_with_llm_async(self, texts: List[str], target_chunk_size: int) -> Dict[str, List[Dict[str, Any]]]:
+        """Fan out LLM chunk requests for texts under the concurrency limit."""
+        client = openai.AsyncOpenAI(api_key=os.getenv('OPENAI_API_KEY'))
+        semaphore = asyncio.Semaphore(self.llm_concurrency)
+        try:
+            chunk_lists = await asyncio.gather(
+                *[self._chunk_one_with_llm_async(client, semaphore, text, target_chunk_size) for text in texts]
+            )
+        finally:
+            await client.close()
+        return dict(zip(texts, chunk_lists))
+    
+    async def _chunk_one_with_llm_async(self, client: Any, semaphore: asyncio.Semaphore,
+                                        text: str, target_chunk_size: int) -> List[Dict[str, Any]]:
+        """Chunk one text with the LLM, retrying with backoff and falling back to simple chunking."""
+        prompt = f"""
             Please split the following text into chunks of approximately {target_chunk_size} characters each. 
             Each chunk should be semantically meaningful and complete. Return only the chunks, one per line.
             
             Text to chunk:
             {text}
             """
+        
+        for attempt in range(self.llm_max_retries + 1):
+            if attempt:
+                self._update_llm_metric("retries")
+                await asyncio.sleep(self.llm_backoff_seconds * (2 ** (attempt - 1)))
             
-            response = openai.ChatCompletion.create(
-                model="gpt-3.5-turbo",
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=4000,
-                temperature=0.1
-            )
+            start_time = time.perf_counter()
+            try:
+                async with semaphore:
+                    self._update_llm_metric("requests")
+                    response = await asyncio.wait_for(
+                        client.chat.completions.create(
+                            model=self.llm_chunk_model,
+                            messages=[{"role": "user", "content": prompt}],
+                            max_tokens=4000,
+                            temperature=0.1
+                        ),
+                        timeout=self.llm_timeout_seconds
+                    )
+                self._observe_llm_latency(time.perf_counter() - start_time)
+            except asyncio.TimeoutError:
+                self._observe_llm_latency(time.perf_counter() - start_time)
+                self._update_llm_metric("timeouts")
+                logger.warning(f"LLM chunking attempt {attempt + 1} timed out after {self.llm_timeout_seconds}s")
+                continue
+            except Exception as e:
+                self._observe_llm_latency(time.perf_counter() - start_time)
+                logger.warning(f"LLM chunking attempt {attempt + 1} failed: {str(e)}")
+                continue
             
-            chunks_text = response.choices[0].message.content.strip()
+            chunks_text = (response.choices[0].message.content or "").strip()
             chunk_lines = [line.strip() for line in chunks_text.split('\n') if line.strip()]
-            
-            chunks = []
-            for i, chunk_text in enumerate(chunk_lines):
-                chunk = {
-                    'chunk_id': f"chunk_{uuid.uuid4().hex[:8]}",
-                    'chunk_text': chunk_text,
-                    'chunk_position': i,
-                    'chunk_order': i
-                }
-                chunks.append(chunk)
-            
-            return chunks
-            
+            if chunk_lines:
+                self._save_llm_chunk_memo(text, target_chunk_size, chunk_lines)
+                return self._build_chunks(chunk_lines, 'llm')
+            logger.warning("LLM returned no chunks")
+        
+        self._update_llm_metric("fallbacks")
+        return self._chunk_simple(text, target_chunk_size, target_chunk_size // 10)
+    
+    def _build_chunks(self, chunk_texts: List[str], method: str) -> List[Dict[str, Any]]:
+        """Build chunk dictionaries from an ordered list of chunk texts."""
+        return [
+            {
+                'chunk_id': self.make_chunk_id(None, i, chunk_text),
+                'chunk_text': chunk_text,
+                'chunk_position': i,
+                'chunk_order': i,
+                'chunking_method': method
+            }
+            for i, chunk_text in enumerate(chunk_texts)
+        ]
+    
+    def _llm_chunk_memo_path(self, text: str, target_chunk_size: int) -> str:
+        """Path of the on-disk memo for a text and chunk size."""
+        text_hash = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        # Model names such as "org/model" are not safe path components
+        model_hash = hashlib.sha256(self.llm_chunk_model.encode('utf-8')).hexdigest()[:16]
+        return os.path.join(self.llm_cache_dir, f"{text_hash}_{target_chunk_size}_{model_hash}.json")
+    
+    def _load_llm_chunk_memo(self, text: str, target_chunk_size: int) -> Optional[List[str]]:
+        """Load memoized LLM chunk texts, or None if there is no usable memo."""
+        path = self._llm_chunk_memo_path(text, target_chunk_size)
+        if not os.path.exists(path):
+            return None
+        try:
+            with open(path, 'r') as f:
+                return json.load(f)["chunks"]
+        except Exception as e:
+            logger.warning(f"Ignoring unreadable LLM chunk memo {path}: {str(e)}")
+            return None
+    
+    def _save_llm_chunk_memo(self, text: str, target_chunk_size: int, chunk_texts: List[str]) -> None:
+        """Memoize LLM chunk texts on disk; failures only cost a future cache miss."""
+        path = self._llm_chunk_memo_path(text, target_chunk_size)
+        try:
+            os.makedirs(self.llm_cache_dir, exist_ok=True)
+            temp_path = f"{path}.{threading.get_ident()}.tmp"
+            with open(temp_path, 'w') as f:
+                json.dump({"chunk_size": target_chunk_size, "chunks": chunk_texts}, f)
+            os.replace(temp_path, path)
         except Exception as e:
-            logger.warning(f"LLM chunking failed: {str(e)}, falling back to simple chunking")
-            return self._chunk_simple(text, target_chunk_size, target_chunk_size // 10)
+            logger.warning(f"Failed to write LLM chunk memo {path}: {str(e)}")
+    
+    def _update_llm_metric(self, counter: str, count: int = 1) -> None:
+        """Increment an LLM chunking counter in load_metrics."""
+        with self._metrics_lock:
+            self.load_metrics["llm_chunking"][counter] += count
+    
+    def _observe_llm_latency(self, seconds: float) -> None:
+        """Add an LLM request latency to the load_metrics histogram."""
+        for upper_bound, label in LLM_LATENCY_BUCKETS:
+            if seconds <= upper_bound:
+                with self._metrics_lock:
+                    self.load_metrics["llm_chunking"]["latency_histogram"][label] += 1
+                return
     
     def _chunk_simple(self, text: str, chunk_size: int, overlap: int) -> List[Dict[str, Any]]:
         """
@@ -600,7 +1128,7 @@ class BatchNeo4jLoader(Neo4jDataLoader):
             chunk_text = text[start:end]
             
             chunk = {
-                'chunk_id': f"chunk_{uuid.uuid4().hex[:8]}",
+                'chunk_id': self.make_chunk_id(None, len(chunks), chunk_text),
                 'chunk_text': chunk_text,
                 'chunk_position': len(chunks),
                 'chunk_order': len(chunks)
@@ -616,36 +1144,144 @@ class BatchNeo4jLoader(Neo4jDataLoader):
     def _record_cypher(self, category: str, name: str, cypher: str) -> None:
         """Record cypher usage for metrics."""
         key = (category, name, cypher)
-        self.cypher_usage[key] = self.cypher_usage.get(key, 0) + 1
+        with self._metrics_lock:
+            self.cypher_usage[key] = self.cypher_usage.get(key, 0) + 1
+    
+    def get_stored_chunk_ids(self, source_ids: List[Any]) -> Dict[Any, set]:
+        """
+        Get the chunk IDs already stored in Neo4j for a set of source records.
+        
+        Args:
+            source_ids: IDs of the source records
+            
+        Returns:
+            Dictionary of source_id -> set of chunk IDs (empty if the lookup fails)
+        """
+        if not source_ids:
+            return {}
+        
+        cypher = """
+        MATCH (c:Chunk) WHERE c.source_id IN $source_ids
+        RETURN c.source_id AS source_id, collect(c.chunk_id) AS chunk_ids
+        """
+        try:
+            self._record_cypher("chunks", "stored_chunk_ids", cypher)
+            result = self.execute_cypher_query(cypher, {'source_ids': source_ids})
+            return {row['source_id']: set(row['chunk_ids']) for row in result["records"]}
+        except Exception as e:
+            # Without the stored set every chunk is treated as new, which is safe but slower
+            logger.warning(f"Could not read stored chunks, re-chunking in full: {str(e)}")
+            return {}
+    
+    def ensure_chunk_source_index(self) -> None:
+        """Index Chunk.source_id, which incremental re-chunking looks chunks up by."""
+        cypher = "CREATE INDEX chunk_source_id IF NOT EXISTS FOR (c:Chunk) ON (c.source_id)"
+        try:
+            self._record_cypher('schema', "INDEX Chunk.source_id", cypher)
+            self.execute_cypher_query(cypher)
+        except Exception as e:
+            logger.warning(f"Failed to create index 'Chunk.source_id': {str(e)}")
+    
+    def delete_stale_chunks(self, chunk_records: List[Dict[str, Any]], source_ids: Optional[List[Any]] = None) -> int:
+        """
+        Delete stored chunks that are no longer produced for their source record.
+        
+        Args:
+            chunk_records: Current chunk records (new and unchanged) for the batch
+            source_ids: Every source record that was chunked in the batch, including
+                records whose text is now empty and produced no chunks (all their
+                stored chunks are deleted)
+            
+        Returns:
+            Number of chunk nodes deleted
+        """
+        current_ids: Dict[Any, List[str]] = {source_id: [] for source_id in source_ids or []}
+        for chunk in chunk_records:
+            current_ids.setdefault(chunk.get('source_id'), []).append(chunk['chunk_id'])
+        articles = [
+            {'source_id': source_id, 'chunk_ids': chunk_ids}
+            for source_id, chunk_ids in current_ids.items() if source_id is not None
+        ]
+        if not articles:
+            return 0
+        
+        cypher = """
+        UNWIND $articles AS article
+        MATCH (c:Chunk {source_id: article.source_id})
+        WHERE NOT c.chunk_id IN article.chunk_ids
+        DETACH DELETE c
+        """
+        try:
+            self._record_cypher("chunks", "delete_stale_chunks", cypher)
+            summary = self.execute_write_transaction(cypher, {'articles': articles})
+            deleted = self._summary_count(summary, 'nodes_deleted')
+            with self._metrics_lock:
+                self.load_metrics["chunks_deleted"] += deleted
+            if deleted:
+                logger.info(f"Deleted {deleted} stale chunks")
+            return deleted
+        except Exception as e:
+            error_msg = f"{Neo4jLoaderErrorCodes.NEO4J_EXECUTION_ERROR}: Failed to delete stale chunks: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg) from e
     
-    def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+    def generate_embeddings(self, texts: List[str], cache_namespace: str = "") -> np.ndarray:
         """
         Generate embeddings for a list of texts.
         
+        When the embedding cache is enabled, texts already embedded with the same
+        model and chunking parameters are served from the cache and only the
+        misses are encoded. Embeddings stay in one float32 array until they are
+        written to Neo4j.
+        
         Args:
             texts: List of text strings
+            cache_namespace: Chunking parameters the texts were produced with
             
         Returns:
-            List of embedding vectors
+            float32 array of shape (len(texts), dimension)
         """
         logger.info(f"Generating embeddings for {len(texts)} texts")
         
         try:
-            if not self.embedding_model:
-                self.initialize_embedding_model()
-            
-            # Generate embeddings in batches
-            embeddings = []
-            batch_size = 32
-            
-            for i in range(0, len(texts), batch_size):
-                batch_texts = texts[i:i + batch_size]
-                batch_embeddings = self.embedding_model.encode(batch_texts, show_progress_bar=True)
-                embeddings.extend(batch_embeddings.tolist())
-            
-            self.load_metrics["embeddings_generated"] += len(embeddings)
-            logger.info(f"Generated {len(embeddings)} embeddings")
-            return embeddings
+            embeddings: List[Optional[np.ndarray]] = [None] * len(texts)
+            cache_keys = []
+            if self.embedding_cache:
+                cache_keys = [
+                    EmbeddingCache.make_key(self.embedding_model_name, cache_namespace, text) for text in texts
+                ]
+                cached = self.embedding_cache.get_many(cache_keys)
+                for i, cache_key in enumerate(cache_keys):
+                    if cache_key in cached:
+                        embeddings[i] = cached[cache_key]
+            
+            missing = [i for i, embedding in enumerate(embeddings) if embedding is None]
+            if missing:
+                if not self.embedding_model:
+                    self.initialize_embedding_model()
+                
+                # Generate embeddings in batches
+                batch_size = 32
+                for start in range(0, len(missing), batch_size):
+                    batch_indexes = missing[start:start + batch_size]
+                    batch_texts = [texts[i] for i in batch_indexes]
+                    batch_embeddings = np.asarray(
+                        self.embedding_model.encode(batch_texts, show_progress_bar=True), dtype=np.float32
+                    )
+                    for i, embedding in zip(batch_indexes, batch_embeddings):
+                        embeddings[i] = embedding
+                
+                if self.embedding_cache:
+                    self.embedding_cache.put_many({cache_keys[i]: embeddings[i] for i in missing})
+            
+            with self._metrics_lock:
+                self.load_metrics["embeddings_generated"] += len(missing)
+            logger.info(f"Generated {len(missing)} embeddings ({len(texts) - len(missing)} from cache)")
+            if not embeddings:
+                return np.empty((0, self.embedding_dimension or 0), dtype=np.float32)
+            matrix = np.vstack(embeddings).astype(np.float32, copy=False)
+            self.embedding_dimension = self.embedding_dimension or int(matrix.shape[1])
+            return matrix
             
         except Exception as e:
             error_msg = f"{Neo4jLoaderErrorCodes.EMBEDDING_ERROR}: Error generating embeddings: {str(e)}"
@@ -676,6 +1312,44 @@ class BatchNeo4jLoader(Neo4jDataLoader):
             logger.error(error_msg)
             raise Exception(error_msg) from e
     
+    def get_chunk_content_property(self, data_records: List[Dict[str, Any]], model: Dict[str, Any]) -> Optional[str]:
+        """
+        Find the record field that is chunked and embedded.
+        
+        Args:
+            data_records: List of data records from PostgreSQL
+            model: Neo4j model configuration
+            
+        Returns:
+            Field name, or None if the model has no vector property or no content field was found
+        """
+        vector_properties = []
+        content_property = None
+        
+        for node in model.get('nodes', []):
+            # Check if this node has chunking enabled
+            if node.get('chunking_enabled', False):
+                content_property = node.get('source_content_field')
+                logger.info(f"Found chunking node: {node.get('label')} with source field: {content_property}")
+            
+            # Find vector properties
+            for prop in node.get('properties', []):
+                if prop.get('type') == 'vector':
+                    vector_properties.append(prop)
+        
+        # If no chunking node found, look for content fields in data
+        if not content_property and data_records:
+            sample_record = data_records[0]
+            for field_name in ['content', 'text', 'description', 'summary', 'meta_description']:
+                if field_name in sample_record and sample_record[field_name]:
+                    content_property = field_name
+                    logger.info(f"Using field '{field_name}' as content source")
+                    break
+        
+        if not vector_properties:
+            return None
+        return content_property
+    
     def process_vector_embeddings(self, data_records: List[Dict[str, Any]], model: Dict[str, Any], config: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """
         Process vector embeddings for data records.
@@ -692,73 +1366,84 @@ class BatchNeo4jLoader(Neo4jDataLoader):
         try:
             chunk_records = []
             
-            # Find vector properties and chunking configuration in the model
-            vector_properties = []
-            content_property = None
-            chunking_node = None
-            
-            for node in model.get('nodes', []):
-                # Check if this node has chunking enabled
-                if node.get('chunking_enabled', False):
-                    chunking_node = node
-                    content_property = node.get('source_content_field')
-                    logger.info(f"Found chunking node: {node.get('label')} with source field: {content_property}")
-                
-                # Find vector properties
-                for prop in node.get('properties', []):
-                    if prop.get('type') == 'vector':
-                        vector_properties.append(prop)
-            
-            # If no chunking node found, look for content fields in data
-            if not content_property and data_records:
-                sample_record = data_records[0]
-                for field_name in ['content', 'text', 'description', 'summary', 'meta_description']:
-                    if field_name in sample_record and sample_record[field_name]:
-                        content_property = field_name
-                        logger.info(f"Using field '{field_name}' as content source")
-                        break
-            
-            if not vector_properties or not content_property:
-                logger.info(f"No vector properties ({len(vector_properties)}) or content property ({content_property}) found, skipping embedding processing")
+            content_property = self.get_chunk_content_property(data_records, model)
+            if not content_property:
+                logger.info("No vector properties or content property found, skipping embedding processing")
                 return []
             
+            # Chunks already stored per record, used to skip unchanged chunks
+            stored_chunk_ids = {}
+            if self.incremental_chunks:
+                stored_chunk_ids = self.get_stored_chunk_ids(
+                    [record.get('id') for record in data_records if record.get('id') is not None]
+                )
+            
+            # Get chunking configuration
+            chunk_size = 512
+            chunk_overlap = 50
+            use_llm_chunking = True
+            
+            if config:
+                chunking_config = config.get('chunking_config', {})
+                chunk_size = chunking_config.get('default_chunk_size', 512)
+                chunk_overlap = chunking_config.get('default_chunk_overlap', 50)
+                use_llm_chunking = chunking_config.get('use_llm_chunking', True)
+                self.configure_llm_chunking(chunking_config)
+            
+            # Chunk all long texts with the LLM concurrently instead of one round-trip per record
+            llm_chunks = {}
+            if use_llm_chunking:
+                long_texts = [
+                    record.get(content_property) for record in data_records
+                    if record.get(content_property) and len(record.get(content_property)) > 1000
+                ]
+                if long_texts:
+                    llm_chunks = self.chunk_texts_with_llm(long_texts, chunk_size)
+            
             # Process each record
             for record in data_records:
                 content_text = record.get(content_property, '')
                 if content_text and len(content_text.strip()) > 0:
-                    # Get chunking configuration
-                    chunk_size = 512
-                    chunk_overlap = 50
-                    use_llm_chunking = True
-                    
-                    if config:
-                        chunking_config = config.get('chunking_config', {})
-                        chunk_size = chunking_config.get('default_chunk_size', 512)
-                        chunk_overlap = chunking_config.get('default_chunk_overlap', 50)
-                        use_llm_chunking = chunking_config.get('use_llm_chunking', True)
-                    
                     # Chunk the content
-                    chunks = self.chunk_text_content(content_text, chunk_size, chunk_overlap, use_llm_chunking)
+                    if content_text in llm_chunks:
+                        chunks = [
+                            dict(chunk, chunk_id=self.make_chunk_id(record.get('id'), chunk['chunk_order'], chunk['chunk_text']))
+                            for chunk in llm_chunks[content_text]
+                        ]
+                    else:
+                        chunks = self.chunk_text_content(content_text, chunk_size, chunk_overlap, use_llm_chunking,
+                                                         source_id=record.get('id'))
                     
                     if chunks:
-                        # Generate embeddings for chunks
-                        chunk_texts = [chunk['chunk_text'] for chunk in chunks]
-                        embeddings = self.generate_embeddings(chunk_texts)
+                        # Unchanged chunks keep their stored node and embedding
+                        existing_ids = stored_chunk_ids.get(record.get('id'), set())
+                        new_chunks = [chunk for chunk in chunks if chunk['chunk_id'] not in existing_ids]
+                        
+                        # Generate embeddings for new chunks
+                        chunk_texts = [chunk['chunk_text'] for chunk in new_chunks]
+                        cache_namespace = f"size={chunk_size};overlap={chunk_overlap};llm={use_llm_chunking}"
+                        embeddings = self.generate_embeddings(chunk_texts, cache_namespace) if chunk_texts else []
+                        new_embeddings = {chunk['chunk_id']: embeddings[i] for i, chunk in enumerate(new_chunks)}
                         
                         # Create chunk records
-                        for i, chunk in enumerate(chunks):
+                        for chunk in chunks:
                             chunk_record = {
                                 'chunk_id': chunk['chunk_id'],
                                 'chunk_text': chunk['chunk_text'],
                                 'chunk_position': chunk['chunk_position'],
                                 'chunk_order': chunk['chunk_order'],
-                                'embedding': embeddings[i],
                                 'source_id': record.get('id'),  # Link back to original content
                                 'source_record': record
                             }
+                            if chunk['chunk_id'] in new_embeddings:
+                                chunk_record['embedding'] = new_embeddings[chunk['chunk_id']]
+                            else:
+                                chunk_record['unchanged'] = True
                             chunk_records.append(chunk_record)
                             
-                        self.load_metrics["chunks_created"] += len(chunks)
+                        with self._metrics_lock:
+                            self.load_metrics["chunks_created"] += len(new_chunks)
+                            self.load_metrics["chunks_unchanged"] += len(chunks) - len(new_chunks)
             
             logger.info(f"Processed {len(chunk_records)} chunk records with embeddings")
             return chunk_records
@@ -778,6 +1463,10 @@ class BatchNeo4jLoader(Neo4jDataLoader):
         """
         logger.info(f"Loading {len(data_records)} records to Neo4j nodes")
         
+        if self.bulk_write:
+            self.load_nodes_bulk(data_records, model)
+            return
+        
         try:
             for node_config in model.get('nodes', []):
                 node_label = node_config.get('label')
@@ -798,22 +1487,20 @@ class BatchNeo4jLoader(Neo4jDataLoader):
                             continue
                         
                         # Build properties
-                        properties = {}
-                        for prop_config in node_config.get('properties', []):
-                            prop_name = prop_config.get('name')
-                            if prop_name in record:
-                                properties[prop_name] = record[prop_name]
+                        properties, vectors = self.build_node_properties(node_config, record)
                         
                         # Create node
                         cypher = f"""
                         MERGE (n:{node_label} {{{node_id_property}: $id}})
                         SET n += $properties
+                        {self._vector_property_clause(vectors, '$vectors')}
                         """
                         
-                        self.execute_cypher_query(cypher, {
+                        self.execute_cypher_write(cypher, {
                             'id': node_id_value,
-                            'properties': properties
-                        })
+                            'properties': properties,
+                            'vectors': vectors
+                        }, 'nodes', node_label)
                         
                         created_count += 1
                         
@@ -844,7 +1531,149 @@ class BatchNeo4jLoader(Neo4jDataLoader):
             logger.error(error_msg)
             raise Exception(error_msg) from e
     
-    def load_relationships_to_neo4j(self, data_records: List[Dict[str, Any]], model: Dict[str, Any]) -> None:
+    def load_nodes_bulk(self, data_records: List[Dict[str, Any]], model: Dict[str, Any]) -> None:
+        """
+        Load nodes with one UNWIND statement per label per sub-batch.
+        
+        Records are grouped per label and sent as a single parameter list, so a
+        batch costs one round-trip per label per sub-batch instead of one per record.
+        
+        Args:
+            data_records: List of data records
+            model: Neo4j model configuration
+        """
+        try:
+            for node_config in model.get('nodes', []):
+                node_label = node_config.get('label')
+                node_id_property = node_config.get('node_id_property')
+                
+                if not node_label or not node_id_property:
+                    continue
+                
+                # Group rows for this label
+                rows = []
+                row_records = []
+                vector_names = set()
+                for record in data_records:
+                    node_id_value = record.get(node_id_property)
+                    if not node_id_value:
+                        continue
+                    
+                    properties, vectors = self.build_node_properties(node_config, record)
+                    vector_names.update(vectors)
+                    
+                    rows.append({'id': node_id_value, 'properties': properties, 'vectors': vectors})
+                    row_records.append(record)
+                
+                if not rows:
+                    continue
+                
+                cypher = f"""
+                UNWIND $rows AS row
+                MERGE (n:{node_label} {{{node_id_property}: row.id}})
+                SET n += row.properties
+                {self._vector_property_clause(sorted(vector_names), 'row.vectors', 'n, row')}
+                """
+                
+                start_time = time.perf_counter()
+                totals = self.write_unwind_batches(
+                    'nodes', node_label,
+                    lambda batch: [(cypher, {'rows': batch})],
+                    rows,
+                    on_row_failure=lambda i, err: self._on_node_row_failure(
+                        node_label, row_records[i], err, node_id_property
+                    )
+                )
+                created_count = totals["rows_written"]
+                failed_count = totals["rows_failed"]
+                
+                self._update_node_write_throughput(node_label, len(rows), time.perf_counter() - start_time)
+                
+                # Update metrics (accumulate instead of overwrite)
+                self._accumulate_load_metric("nodes_created", node_label, created_count)
+                if failed_count > 0:
+                    self._accumulate_load_metric("nodes_failed", node_label, failed_count)
+                
+                logger.info(f"Bulk loaded {created_count} {node_label} nodes ({failed_count} failed)")
+                
+        except Exception as e:
+            error_msg = f"{Neo4jLoaderErrorCodes.NEO4J_EXECUTION_ERROR}: Error bulk loading nodes: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg) from e
+    
+    def build_node_properties(self, node_config: Dict[str, Any],
+                              record: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, List[float]]]:
+        """
+        Build the Bolt parameters for one node from its record.
+        
+        NumPy embeddings are converted to plain lists here, at the Bolt boundary,
+        since the driver cannot pack arrays. With neo4j_dtype float32, 'vector'
+        properties are returned separately so they can be stored as float32
+        vector properties instead of float64 lists.
+        
+        Args:
+            node_config: Node configuration from the model
+            record: Data record
+            
+        Returns:
+            Tuple of (regular properties, vector properties)
+        """
+        properties = {}
+        vectors = {}
+        for prop_config in node_config.get('properties', []):
+            prop_name = prop_config.get('name')
+            if prop_name not in record:
+                continue
+            value = _as_list(record[prop_name])
+            if (self.neo4j_vector_dtype == 'float32' and prop_config.get('type') == 'vector'
+                    and value is not None):
+                vectors[prop_name] = value
+            else:
+                properties[prop_name] = value
+        return properties, vectors
+    
+    @staticmethod
+    def _vector_property_clause(vector_names, vectors_expr: str, imports: str = "n") -> str:
+        """Cypher storing each named vector property on n as float32, skipping rows without one."""
+        return "\n".join(
+            f"CALL {{ WITH {imports} WITH {imports} WHERE {vectors_expr}.{name} IS NOT NULL "
+            f"CALL db.create.setNodeVectorProperty(n, '{name}', {vectors_expr}.{name}) }}"
+            for name in vector_names
+        )
+    
+    def _on_node_row_failure(self, node_label: str, record: Dict[str, Any], error: str, node_id_property: str) -> None:
+        """Attribute a failed bulk node row to its source record."""
+        self.track_node_failure(
+            node_label=node_label,
+            node_data=record,
+            error=error,
+            postgres_column=node_id_property
+        )
+        logger.warning(f"Failed to create {node_label} node: {error}")
+    
+    def _on_relationship_row_failure(self, relationship_type: str, source_data: Dict[str, Any],
+                                     target_data: Dict[str, Any], error: str) -> None:
+        """Attribute a failed bulk relationship row through the failure tracker."""
+        self.track_relationship_failure(
+            relationship_type=relationship_type,
+            source_data=source_data,
+            target_data=target_data,
+            error=error
+        )
+        logger.warning(f"Failed to create {relationship_type} relationship: {error}")
+    
+    def _update_node_write_throughput(self, node_label: str, row_count: int, elapsed: float) -> None:
+        """Accumulate rows/sec metrics for bulk node writes per label."""
+        with self._metrics_lock:
+            throughput = self.batch_metrics["node_write_throughput"].setdefault(
+                node_label, {"rows": 0, "seconds": 0.0, "rows_per_sec": 0.0}
+            )
+            throughput["rows"] += row_count
+            throughput["seconds"] += elapsed
+            if throughput["seconds"] > 0:
+                throughput["rows_per_sec"] = round(throughput["rows"] / throughput["seconds"], 2)
+    
+    def load_relationships_to_neo4j(self, data_records: List[Dict[str, Any]], model: Dict[str, Any]) -> None:
         """
         Load relationships to Neo4j based on model configuration.
         
@@ -854,6 +1683,10 @@ class BatchNeo4jLoader(Neo4jDataLoader):
         """
         logger.info(f"Loading relationships for {len(data_records)} records")
         
+        if self.bulk_write:
+            self.load_relationships_bulk(data_records, model)
+            return
+        
         try:
             for rel_config in model.get('relationships', []):
                 rel_type = rel_config.get('type')
@@ -887,10 +1720,10 @@ class BatchNeo4jLoader(Neo4jDataLoader):
                         MERGE (start)-[r:{rel_type}]->(end)
                         """
                         
-                        self.execute_cypher_query(cypher, {
+                        self.execute_cypher_write(cypher, {
                             'start_value': start_value,
                             'end_value': end_value
-                        })
+                        }, 'relationships', rel_type)
                         
                         created_count += 1
                         
@@ -930,6 +1763,10 @@ class BatchNeo4jLoader(Neo4jDataLoader):
         """
         logger.info(f"Loading chunk relationships for {len(chunk_records)} chunks")
         
+        if self.bulk_write:
+            self.load_chunk_relationships_bulk(chunk_records, article_id_field='source_id')
+            return
+        
         try:
             created_count = 0
             failed_count = 0
@@ -950,11 +1787,11 @@ class BatchNeo4jLoader(Neo4jDataLoader):
                     SET r.chunk_order = $chunk_order
                     """
                     
-                    self.execute_cypher_query(cypher, {
+                    self.execute_cypher_write(cypher, {
                         'article_id': article_id,
                         'chunk_id': chunk_id,
                         'chunk_order': chunk_order
-                    })
+                    }, 'relationships', 'HAS_CHUNK')
                     
                     created_count += 1
                     
@@ -987,6 +1824,10 @@ class BatchNeo4jLoader(Neo4jDataLoader):
         """
         logger.info("Loading tag nodes and relationships")
         
+        if self.bulk_write:
+            self.load_tag_nodes_and_relationships_bulk(data_records)
+            return
+        
         try:
             created_tags = 0
             created_relationships = 0
@@ -1006,7 +1847,7 @@ class BatchNeo4jLoader(Neo4jDataLoader):
                         cypher = """
                         MERGE (t:Tag {tag_name: $tag_name})
                         """
-                        self.execute_cypher_query(cypher, {'tag_name': tag})
+                        self.execute_cypher_write(cypher, {'tag_name': tag}, 'nodes', 'Tag')
                         created_tags += 1
                         
                         # Create relationship
@@ -1017,10 +1858,10 @@ class BatchNeo4jLoader(Neo4jDataLoader):
                             MATCH (t:Tag {tag_name: $tag_name})
                             MERGE (a)-[r:TAGGED_WITH]->(t)
                             """
-                            self.execute_cypher_query(cypher, {
+                            self.execute_cypher_write(cypher, {
                                 'article_id': article_id,
                                 'tag_name': tag
-                            })
+                            }, 'relationships', 'TAGGED_WITH')
                             created_relationships += 1
                             
                     except Exception as e:
@@ -1050,6 +1891,10 @@ class BatchNeo4jLoader(Neo4jDataLoader):
         """
         logger.info("Loading WRITTEN_BY relationships")
         
+        if self.bulk_write:
+            self.load_written_by_relationships_bulk(data_records)
+            return
+        
         try:
             created_count = 0
             failed_count = 0
@@ -1066,7 +1911,7 @@ class BatchNeo4jLoader(Neo4jDataLoader):
                     cypher = """
                     MERGE (a:Author {name: $author_name})
                     """
-                    self.execute_cypher_query(cypher, {'author_name': author})
+                    self.execute_cypher_write(cypher, {'author_name': author}, 'nodes', 'Author')
                     
                     # Create relationship
                     cypher = """
@@ -1074,10 +1919,10 @@ class BatchNeo4jLoader(Neo4jDataLoader):
                     MATCH (author:Author {name: $author_name})
                     MERGE (article)-[r:WRITTEN_BY]->(author)
                     """
-                    self.execute_cypher_query(cypher, {
+                    self.execute_cypher_write(cypher, {
                         'article_id': article_id,
                         'author_name': author
-                    })
+                    }, 'relationships', 'WRITTEN_BY')
                     
                     created_count += 1
                     
@@ -1192,10 +2037,106 @@ class BatchNeo4jLoader(Neo4jDataLoader):
         logger.info(f"Batch query: {batch_query}")
         return batch_query
     
+    def get_keyset_batch_query(self, base_query: str, last_seen_key: Any, limit: int) -> Tuple[str, List[Any]]:
+        """
+        Wrap the base query for keyset pagination on the configured key column.
+        
+        Unlike LIMIT/OFFSET, each batch starts directly after the last key seen, so
+        Postgres does not rescan earlier rows and rows marked done by
+        update_status_neo4j cannot shift later rows out of the window.
+        
+        Args:
+            base_query: Original SQL query
+            last_seen_key: Highest key value of the previous batch (None for the first batch)
+            limit: Number of records to fetch
+            
+        Returns:
+            Tuple of (SQL query, query parameters)
+        """
+        query = base_query.strip()
+        if query.endswith(';'):
+            query = query[:-1]
+        
+        key = self.keyset_column
+        if last_seen_key is None:
+            batch_query = f"SELECT * FROM ({query}) AS keyset_subquery ORDER BY {key} LIMIT %s"
+            params = [limit]
+        else:
+            batch_query = f"SELECT * FROM ({query}) AS keyset_subquery WHERE {key} > %s ORDER BY {key} LIMIT %s"
+            params = [last_seen_key, limit]
+        
+        logger.info(f"Keyset batch query: {batch_query} (after {key}={last_seen_key})")
+        return batch_query, params
+    
+    def fetch_batch_records(self, db_config: Dict[str, str], base_query: str, offset: int,
+                            batch_num: int) -> Tuple[List[Tuple], List[str]]:
+        """
+        Fetch one batch of rows from PostgreSQL.
+        
+        In keyset mode the rows are streamed through a named (server-side) cursor
+        and ``last_seen_key`` is advanced to the highest key in the batch.
+        
+        Args:
+            db_config: PostgreSQL database configuration
+            base_query: Base SQL query
+            offset: Offset for this batch (offset mode only)
+            batch_num: Batch number, used to name the server-side cursor
+            
+        Returns:
+            Tuple of (rows, column names)
+        """
+        if self.pagination_mode != 'keyset':
+            batch_query = self.get_batch_query(base_query, offset, self.batch_size)
+            with self.pg_connection(db_config) as connection:
+                with connection.cursor() as cursor:
+                    cursor.execute(batch_query)
+                    results = cursor.fetchall()
+                    column_names = [desc[0] for desc in cursor.description]
+            return results, column_names
+        
+        batch_query, params = self.get_keyset_batch_query(base_query, self.last_seen_key, self.batch_size)
+        with self.pg_connection(db_config) as connection:
+            with connection.cursor(name=f"batch_loader_batch_{batch_num}") as cursor:
+                cursor.itersize = self.cursor_itersize
+                cursor.execute(batch_query, params)
+                results = [row for row in cursor]
+                column_names = [desc[0] for desc in cursor.description] if cursor.description else []
+        
+        if results:
+            # Without the key in the rows the next batch would start from the beginning again
+            if self.keyset_column not in column_names:
+                raise Exception(
+                    f"{BatchLoaderErrorCodes.BATCH_CONFIG_ERROR}: Keyset column '{self.keyset_column}' "
+                    f"is not selected by the query (columns: {', '.join(column_names)})"
+                )
+            key_index = column_names.index(self.keyset_column)
+            self.last_seen_key = results[-1][key_index]
+        return results, column_names
+    
+    def pg_connection(self, db_config: Dict[str, str]):
+        """
+        Check a connection out of the loader's PostgreSQL pool, opening the pool on first use.
+        
+        Args:
+            db_config: PostgreSQL database configuration
+            
+        Returns:
+            Context manager yielding a psycopg2 connection
+        """
+        with self._metrics_lock:
+            if self.pg_pool is None:
+                self.pg_pool = PostgresConnectionPool(
+                    db_config, self.pg_pool_min_connections, self.pg_pool_max_connections
+                )
+        return self.pg_pool.connection()
+    
     def update_status_neo4j(self, db_config: Dict[str, str], record_ids: List[int], status: bool = True) -> bool:
         """
         Update the status_neo4j field for processed records.
         
+        The IDs are sent as a single array parameter and joined with unnest, so
+        the statement text and plan do not depend on the number of records.
+        
         Args:
             db_config: PostgreSQL database configuration
             record_ids: List of record IDs to update
@@ -1208,42 +2149,51 @@ class BatchNeo4jLoader(Neo4jDataLoader):
             logger.warning("No record IDs provided for status update")
             return True
         
+        start_time = time.perf_counter()
         try:
-            with psycopg2.connect(**db_config) as connection:
+            with self.pg_connection(db_config) as connection:
                 with connection.cursor() as cursor:
-                    # Create placeholders for the IN clause
-                    placeholders = ','.join(['%s'] * len(record_ids))
-                    update_query = f"""
-                        UPDATE structured_content 
-                        SET status_neo4j = %s 
-                        WHERE id IN ({placeholders})
+                    update_query = """
+                        UPDATE structured_content AS sc
+                        SET status_neo4j = %s
+                        FROM unnest(%s::bigint[]) AS acked(id)
+                        WHERE sc.id = acked.id
                     """
                     
                     # Execute the update
-                    cursor.execute(update_query, [status] + record_ids)
+                    cursor.execute(update_query, (status, list(record_ids)))
                     connection.commit()
-                    
-                    logger.info(f"Updated status_neo4j to {status} for {len(record_ids)} records")
-                    return True
+            
+            elapsed_ms = (time.perf_counter() - start_time) * 1000
+            with self._metrics_lock:
+                self.status_update_metrics["statements"] += 1
+                self.status_update_metrics["rows"] += len(record_ids)
+                self.status_update_metrics["total_ms"] += elapsed_ms
+                self.status_update_metrics["max_ms"] = max(self.status_update_metrics["max_ms"], elapsed_ms)
+            
+            logger.info(f"Updated status_neo4j to {status} for {len(record_ids)} records in {elapsed_ms:.1f}ms")
+            return True
                     
         except Exception as e:
             error_msg = f"{BatchLoaderErrorCodes.STATUS_UPDATE_ERROR}: Failed to update status_neo4j: {str(e)}"
             logger.error(error_msg)
             return False
     
-    def get_total_record_count(self, db_config: Dict[str, str], base_query: str) -> int:
+    def get_total_record_count(self, db_config: Dict[str, str], base_query: str, mode: str = "exact") -> int:
         """
         Get the total number of records to process.
         
         Args:
             db_config: PostgreSQL database configuration
             base_query: Base SQL query
+            mode: 'exact' runs COUNT(*) over the query, 'estimate' reads the
+                planner's row estimate from EXPLAIN without scanning the table
             
         Returns:
-            Total number of records
+            Total number of records (an approximation in estimate mode)
         """
         try:
-            with psycopg2.connect(**db_config) as connection:
+            with self.pg_connection(db_config) as connection:
                 with connection.cursor() as cursor:
                     # Create a count query from the base query
                     # Remove semicolon if present
@@ -1251,6 +2201,15 @@ class BatchNeo4jLoader(Neo4jDataLoader):
                     if clean_query.endswith(';'):
                         clean_query = clean_query[:-1]
                     
+                    if mode == "estimate":
+                        cursor.execute(f"EXPLAIN (FORMAT JSON) {clean_query}")
+                        plan = cursor.fetchone()[0]
+                        if isinstance(plan, str):
+                            plan = json.loads(plan)
+                        count = max(0, int(plan[0]["Plan"]["Plan Rows"]))
+                        logger.info(f"Estimated records to process: {count}")
+                        return count
+                    
                     count_query = f"SELECT COUNT(*) FROM ({clean_query}) AS count_subquery"
                     logger.info(f"Count query: {count_query}")
                     cursor.execute(count_query)
@@ -1262,6 +2221,169 @@ class BatchNeo4jLoader(Neo4jDataLoader):
             logger.error(f"Failed to get total record count: {str(e)}")
             return 0
     
+    def records_from_rows(self, results: List[Tuple], column_names: List[str]) -> Tuple[List[Dict[str, Any]], List[int]]:
+        """
+        Convert fetched rows to record dictionaries.
+        
+        Args:
+            results: Rows returned by PostgreSQL
+            column_names: Column names for the rows
+            
+        Returns:
+            Tuple of (data_records, record_ids)
+        """
+        data_records = []
+        record_ids = []
+        for row in results:
+            record = {}
+            for i, value in enumerate(row):
+                if i < len(column_names):
+                    record[column_names[i]] = value
+            data_records.append(record)
+            if 'id' in record:
+                record_ids.append(record['id'])
+        return data_records, record_ids
+    
+    def write_batch_to_neo4j(self, data_records: List[Dict[str, Any]], chunk_records: List[Dict[str, Any]],
+                             model: Dict[str, Any], batch_num: int) -> None:
+        """
+        Write one batch of records and their chunks to Neo4j.
+        
+        Args:
+            data_records: List of data records
+            chunk_records: List of chunk records with embeddings
+            model: Neo4j model configuration
+            batch_num: Batch number for logging
+        """
+        # Row-by-row writes share one session and a small number of transactions
+        with self.write_scope():
+            # Load nodes to Neo4j
+            self.load_nodes_to_neo4j(data_records, model)
+        
+            # Load chunk nodes if we have embeddings; unchanged chunks are already in the graph
+            new_chunk_records = [chunk for chunk in chunk_records if not chunk.get('unchanged')]
+            if new_chunk_records:
+                chunk_model = {
+                    "nodes": [{
+                        "label": "Chunk", 
+                        "node_id_property": "chunk_id", 
+                        "properties": [
+                            {"name": "chunk_id", "type": "string", "unique": True},
+                            {"name": "chunk_text", "type": "text"},
+                            {"name": "chunk_position", "type": "integer"},
+                            {"name": "chunk_order", "type": "integer"},
+                            {"name": "source_id", "type": "string"},
+                            {"name": "embedding", "type": "vector",
+                             "vector_dimension": self.embedding_dimension or DEFAULT_EMBEDDING_DIMENSION,
+                             "vector_similarity": "cosine"}
+                        ]
+                    }]
+                }
+                logger.info(f"Batch {batch_num}: Loading {len(new_chunk_records)} chunk nodes to Neo4j")
+                self.load_nodes_to_neo4j(new_chunk_records, chunk_model)
+                self.load_chunk_relationships(new_chunk_records)
+        
+            # Drop chunks that no longer exist in the re-chunked content, including every
+            # chunk of a record whose content is now empty
+            if self.incremental_chunks:
+                content_property = self.get_chunk_content_property(data_records, model)
+                if content_property:
+                    chunked_ids = [record.get('id') for record in data_records if content_property in record]
+                    self.delete_stale_chunks(chunk_records, chunked_ids)
+        
+            # Load relationships to Neo4j
+            self.load_relationships_to_neo4j(data_records, model)
+        
+            # Create derived entities/relationships
+            self.load_tag_nodes_and_relationships(data_records)
+            self.load_written_by_relationships(data_records)
+        
+        self.record_touched_ids(data_records, chunk_records)
+        self.run_chunk_hooks(chunk_records)
+    
+    def add_chunk_hook(self, hook: Callable[[List[Dict[str, Any]]], None]) -> None:
+        """
+        Register a callback run with each batch's chunk records after the batch is written.
+        
+        Hooks receive every current chunk of the batch's records; new chunks carry
+        an 'embedding', chunks already in the graph are flagged 'unchanged'. With
+        pipelined writes, hooks may be called from several writer threads at once.
+        
+        Args:
+            hook: Callable taking the list of chunk records
+        """
+        self.chunk_hooks.append(hook)
+    
+    def run_chunk_hooks(self, chunk_records: List[Dict[str, Any]]) -> None:
+        """
+        Run the registered chunk hooks; a failing hook is logged and does not fail the batch.
+        
+        Args:
+            chunk_records: Chunk records written for the batch
+        """
+        if not chunk_records:
+            return
+        for hook in self.chunk_hooks:
+            try:
+                hook(chunk_records)
+            except Exception as e:
+                logger.warning(f"{BatchLoaderErrorCodes.CHUNK_HOOK_ERROR}: Chunk hook "
+                               f"{getattr(hook, '__name__', hook)} failed: {str(e)}")
+                with self._metrics_lock:
+                    self.batch_metrics["chunk_hook_errors"] = self.batch_metrics.get("chunk_hook_errors", 0) + 1
+    
+    def export_chunks(self, chunk_records: List[Dict[str, Any]]) -> int:
+        """
+        Append a batch's chunks to the JSONL chunk export.
+        
+        Each line covers one source record: its source_id, title and url, and the
+        newly embedded chunks. With incremental re-chunking the line also lists
+        all current chunk_ids, so consumers such as an offline ANN index can drop
+        the chunks deleted from the graph.
+        
+        Args:
+            chunk_records: Chunk records written for the batch
+            
+        Returns:
+            Number of lines appended
+        """
+        by_source: Dict[Any, List[Dict[str, Any]]] = {}
+        for chunk in chunk_records:
+            by_source.setdefault(chunk.get('source_id'), []).append(chunk)
+        
+        lines = []
+        for source_id, chunks in by_source.items():
+            new_chunks = [chunk for chunk in chunks if chunk.get('embedding') is not None]
+            if not new_chunks and not self.incremental_chunks:
+                continue
+            source_record = chunks[0].get('source_record') or {}
+            entry = {
+                'source_id': source_id,
+                'title': source_record.get('title'),
+                'url': source_record.get('url'),
+                'chunks': [
+                    {
+                        'chunk_id': chunk['chunk_id'],
+                        'chunk_text': chunk['chunk_text'],
+                        'chunk_order': chunk.get('chunk_order'),
+                        'embedding': _as_list(chunk['embedding'])
+                    }
+                    for chunk in new_chunks
+                ]
+            }
+            if self.incremental_chunks:
+                entry['chunk_ids'] = [chunk['chunk_id'] for chunk in chunks]
+            lines.append(json.dumps(entry, default=str) + "\n")
+        
+        if lines:
+            directory = os.path.dirname(self.chunk_export_path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            # Whole lines per write so readers never see interleaved batches
+            with self._chunk_export_lock, open(self.chunk_export_path, 'a') as f:
+                f.write("".join(lines))
+        return len(lines)
+    
     def process_batch(self, config: Dict[str, Any], model: Dict[str, Any], 
                      db_config: Dict[str, str], base_query: str, 
                      offset: int, batch_num: int) -> Tuple[bool, List[int]]:
@@ -1280,68 +2402,27 @@ class BatchNeo4jLoader(Neo4jDataLoader):
             Tuple of (success, record_ids)
         """
         logger.info(f"Processing batch {batch_num} (offset: {offset}, limit: {self.batch_size})")
+        self.last_fetched_count = 0
         
         try:
-            # Get batch query
-            batch_query = self.get_batch_query(base_query, offset, self.batch_size)
-            
-            # Execute batch query
-            with psycopg2.connect(**db_config) as connection:
-                with connection.cursor() as cursor:
-                    cursor.execute(batch_query)
-                    results = cursor.fetchall()
-                    column_names = [desc[0] for desc in cursor.description]
+            # Fetch batch records
+            results, column_names = self.fetch_batch_records(db_config, base_query, offset, batch_num)
+            self.last_fetched_count = len(results)
             
             if not results:
                 logger.info(f"Batch {batch_num}: No records found")
                 return True, []
             
             # Convert results to dictionaries
-            data_records = []
-            record_ids = []
-            for row in results:
-                record = {}
-                for i, value in enumerate(row):
-                    if i < len(column_names):
-                        record[column_names[i]] = value
-                data_records.append(record)
-                if 'id' in record:
-                    record_ids.append(record['id'])
+            data_records, record_ids = self.records_from_rows(results, column_names)
             
             logger.info(f"Batch {batch_num}: Processing {len(data_records)} records")
             
             # Process vector embeddings if needed
             chunk_records = self.process_vector_embeddings(data_records, model, config)
             
-            # Load nodes to Neo4j
-            self.load_nodes_to_neo4j(data_records, model)
-            
-            # Load chunk nodes if we have embeddings
-            if chunk_records:
-                chunk_model = {
-                    "nodes": [{
-                        "label": "Chunk", 
-                        "node_id_property": "chunk_id", 
-                        "properties": [
-                            {"name": "chunk_id", "type": "string", "unique": True},
-                            {"name": "chunk_text", "type": "text"},
-                            {"name": "chunk_position", "type": "integer"},
-                            {"name": "chunk_order", "type": "integer"},
-                            {"name": "source_id", "type": "string"},
-                            {"name": "embedding", "type": "vector", "vector_dimension": 384, "vector_similarity": "cosine"}
-                        ]
-                    }]
-                }
-                logger.info(f"Batch {batch_num}: Loading {len(chunk_records)} chunk nodes to Neo4j")
-                self.load_nodes_to_neo4j(chunk_records, chunk_model)
-                self.load_chunk_relationships(chunk_records)
-            
-            # Load relationships to Neo4j
-            self.load_relationships_to_neo4j(data_records, model)
-            
-            # Create derived entities/relationships
-            self.load_tag_nodes_and_relationships(data_records)
-            self.load_written_by_relationships(data_records)
+            # Load nodes, chunks and relationships to Neo4j
+            self.write_batch_to_neo4j(data_records, chunk_records, model, batch_num)
             
             # Update status_neo4j for this batch
             if record_ids:
@@ -1354,14 +2435,341 @@ class BatchNeo4jLoader(Neo4jDataLoader):
             return True, record_ids
             
         except Exception as e:
-            error_msg = f"{BatchLoaderErrorCodes.BATCH_PROCESSING_ERROR}: Batch {batch_num} failed: {str(e)}"
-            logger.error(error_msg)
+            self._record_batch_error(batch_num, offset, e)
+            return False, []
+    
+    def _record_batch_error(self, batch_num: int, offset: int, error: Exception) -> None:
+        """Log a batch processing error and add it to the batch metrics."""
+        error_msg = f"{BatchLoaderErrorCodes.BATCH_PROCESSING_ERROR}: Batch {batch_num} failed: {str(error)}"
+        logger.error(error_msg)
+        with self._metrics_lock:
             self.batch_metrics["batch_errors"].append({
                 "batch_num": batch_num,
                 "offset": offset,
-                "error": str(e)
+                "error": str(error)
             })
-            return False, []
+    
+    def run_sequential_batches(self, config: Dict[str, Any], model: Dict[str, Any],
+                               db_config: Dict[str, str], base_query: str, total_batches: int) -> None:
+        """
+        Process batches one after another.
+        
+        Args:
+            config: Configuration dictionary
+            model: Neo4j model configuration
+            db_config: PostgreSQL database configuration
+            base_query: Base SQL query
+            total_batches: Expected number of batches (exact in offset mode)
+        """
+        batch_num = 0
+        while True:
+            batch_num += 1
+            if self.pagination_mode == 'offset' and batch_num > total_batches:
+                break
+            offset = (batch_num - 1) * self.batch_size
+            
+            try:
+                success, record_ids = self.process_batch(
+                    config, model, db_config, base_query, offset, batch_num
+                )
+                
+                # Keyset pagination ends on the first empty batch
+                if success and self.pagination_mode == 'keyset' and self.last_fetched_count == 0:
+                    batch_num -= 1
+                    break
+                
+                if success:
+                    self.batch_metrics["completed_batches"] += 1
+                    self.load_metrics["total_records_processed"] += len(record_ids)
+                else:
+                    self.batch_metrics["failed_batches"] += 1
+                    self.track_batch_failure(batch_num, offset, self.batch_size, "Batch processing failed", record_ids)
+                    logger.error(f"Batch {batch_num} failed, but continuing with next batch")
+                    
+            except Exception as e:
+                self.batch_metrics["failed_batches"] += 1
+                self.track_batch_failure(batch_num, offset, self.batch_size, str(e), [])
+                logger.error(f"Batch {batch_num} failed with exception: {str(e)}")
+            
+            # A keyset batch that could not be read cannot advance the key, so stop here
+            if self.pagination_mode == 'keyset' and self.last_fetched_count == 0:
+                break
+            
+            # Log progress
+            expected_batches = max(total_batches, batch_num)
+            progress = (batch_num / expected_batches) * 100
+            logger.info(f"Progress: {progress:.1f}% ({batch_num}/{expected_batches} batches completed)")
+        
+        if self.pagination_mode == 'keyset':
+            self.batch_metrics["total_batches"] = batch_num
+    
+    def _record_stage_timing(self, stage: str, records: int, elapsed: float) -> None:
+        """Accumulate per-stage throughput for the pipelined loader."""
+        with self._metrics_lock:
+            stats = self.pipeline_metrics["stages"].setdefault(
+                stage, {"batches": 0, "records": 0, "busy_seconds": 0.0, "records_per_sec": 0.0}
+            )
+            stats["batches"] += 1
+            stats["records"] += records
+            stats["busy_seconds"] += elapsed
+            if stats["busy_seconds"] > 0:
+                stats["records_per_sec"] = round(stats["records"] / stats["busy_seconds"], 2)
+    
+    def _put_with_depth(self, queue_name: str, work_queue: "queue.Queue", item: Any) -> None:
+        """Put an item on a bounded stage queue, blocking for backpressure and sampling its depth."""
+        start_time = time.perf_counter()
+        work_queue.put(item)
+        blocked = time.perf_counter() - start_time
+        depth = work_queue.qsize()
+        with self._metrics_lock:
+            stats = self.pipeline_metrics["queues"].setdefault(
+                queue_name, {"max_depth": 0, "avg_depth": 0.0, "samples": 0, "blocked_seconds": 0.0}
+            )
+            stats["max_depth"] = max(stats["max_depth"], depth)
+            stats["avg_depth"] = round((stats["avg_depth"] * stats["samples"] + depth) / (stats["samples"] + 1), 2)
+            stats["samples"] += 1
+            stats["blocked_seconds"] += blocked
+    
+    def run_pipelined_batches(self, config: Dict[str, Any], model: Dict[str, Any],
+                              db_config: Dict[str, str], base_query: str, total_batches: int) -> None:
+        """
+        Process batches with overlapping fetch, embed and write stages.
+        
+        A single fetch thread reads batches from PostgreSQL, a pool of embed
+        workers chunks and encodes them, and a pool of writer workers loads them
+        into Neo4j, each on its own session. Stages are connected by bounded
+        queues, so a slow stage applies backpressure to the ones before it.
+        status_neo4j is committed strictly in batch order: a batch is only marked
+        done once every earlier batch has finished.
+        
+        Args:
+            config: Configuration dictionary
+            model: Neo4j model configuration
+            db_config: PostgreSQL database configuration
+            base_query: Base SQL query
+            total_batches: Expected number of batches (exact in offset mode)
+        """
+        embed_workers = self.pipeline_embed_workers
+        writer_workers = self.pipeline_writer_workers
+        fetch_queue = queue.Queue(maxsize=self.pipeline_queue_size)
+        write_queue = queue.Queue(maxsize=self.pipeline_queue_size)
+        
+        commit_lock = threading.Lock()
+        pending_results: Dict[int, Tuple[int, bool, List[int], Optional[str]]] = {}
+        next_commit = [1]
+        embed_finished = [0]
+        fetched_batches = [0]
+        
+        # Load the model once up front rather than racing to load it in every embed worker
+        if not self.embedding_model and any(
+            prop.get('type') == 'vector'
+            for node in model.get('nodes', []) for prop in node.get('properties', [])
+        ):
+            self.initialize_embedding_model()
+        
+        # Concurrent writers MERGE the same Tag/Author nodes; without uniqueness
+        # constraints two transactions can each create one, so fall back to one writer
+        if writer_workers > 1 and not self.ensure_shared_node_constraints(model):
+            logger.warning("Shared node constraints unavailable, running the pipeline with a single writer")
+            writer_workers = 1
+        
+        def complete(batch_num: int, offset: int, success: bool, record_ids: List[int], error: Optional[str]) -> None:
+            # Never raises: a stage thread that died here would leave the threads feeding
+            # it blocked on a full queue and the load would hang on join()
+            with commit_lock:
+                pending_results[batch_num] = (offset, success, record_ids, error)
+                while next_commit[0] in pending_results:
+                    commit_num = next_commit[0]
+                    next_commit[0] += 1
+                    commit_offset, _, commit_ids, _ = pending_results[commit_num]
+                    try:
+                        self._commit_batch_result(db_config, commit_num, *pending_results.pop(commit_num))
+                    except Exception as e:
+                        logger.error(f"{BatchLoaderErrorCodes.STATUS_UPDATE_ERROR}: Batch {commit_num}: "
+                                     f"Failed to commit result: {str(e)}")
+                        self._record_batch_error(commit_num, commit_offset, e)
+                        with self._metrics_lock:
+                            self.batch_metrics["failed_batches"] += 1
+        
+        def fetch_stage() -> None:
+            batch_num = 0
+            try:
+                while True:
+                    batch_num += 1
+                    if self.pagination_mode == 'offset' and batch_num > total_batches:
+                        break
+                    offset = (batch_num - 1) * self.batch_size
+                    start_time = time.perf_counter()
+                    try:
+                        results, column_names = self.fetch_batch_records(db_config, base_query, offset, batch_num)
+                    except Exception as e:
+                        self._record_batch_error(batch_num, offset, e)
+                        fetched_batches[0] = batch_num
+                        complete(batch_num, offset, False, [], str(e))
+                        if self.pagination_mode == 'keyset':
+                            break
+                        continue
+                    if not results:
+                        if self.pagination_mode == 'keyset':
+                            break
+                        fetched_batches[0] = batch_num
+                        complete(batch_num, offset, True, [], None)
+                        continue
+                    
+                    fetched_batches[0] = batch_num
+                    try:
+                        data_records, record_ids = self.records_from_rows(results, column_names)
+                    except Exception as e:
+                        self._record_batch_error(batch_num, offset, e)
+                        complete(batch_num, offset, False, [], str(e))
+                        continue
+                    self._record_stage_timing("fetch", len(data_records), time.perf_counter() - start_time)
+                    self._put_with_depth("fetch_queue", fetch_queue, (batch_num, offset, data_records, record_ids))
+            finally:
+                for _ in range(embed_workers):
+                    fetch_queue.put(None)
+        
+        def embed_stage() -> None:
+            try:
+                while True:
+                    item = fetch_queue.get()
+                    if item is None:
+                        break
+                    batch_num, offset, data_records, record_ids = item
+                    start_time = time.perf_counter()
+                    try:
+                        chunk_records = self.process_vector_embeddings(data_records, model, config)
+                        self._record_stage_timing("embed", len(data_records), time.perf_counter() - start_time)
+                    except Exception as e:
+                        self._record_batch_error(batch_num, offset, e)
+                        complete(batch_num, offset, False, record_ids, str(e))
+                        continue
+                    self._put_with_depth("write_queue", write_queue, (batch_num, offset, data_records, record_ids, chunk_records))
+            finally:
+                with commit_lock:
+                    embed_finished[0] += 1
+                    last_worker = embed_finished[0] == embed_workers
+                if last_worker:
+                    for _ in range(writer_workers):
+                        write_queue.put(None)
+        
+        def write_stage() -> None:
+            while True:
+                item = write_queue.get()
+                if item is None:
+                    break
+                batch_num, offset, data_records, record_ids, chunk_records = item
+                start_time = time.perf_counter()
+                try:
+                    self.write_batch_to_neo4j(data_records, chunk_records, model, batch_num)
+                    self._record_stage_timing("write", len(data_records), time.perf_counter() - start_time)
+                except Exception as e:
+                    self._record_batch_error(batch_num, offset, e)
+                    complete(batch_num, offset, False, record_ids, str(e))
+                    continue
+                complete(batch_num, offset, True, record_ids, None)
+        
+        logger.info(f"Starting pipelined load with {embed_workers} embed and {writer_workers} writer workers")
+        wall_start = time.perf_counter()
+        threads = [threading.Thread(target=fetch_stage, name="batch-fetch", daemon=True)]
+        threads += [threading.Thread(target=embed_stage, name=f"batch-embed-{i}", daemon=True) for i in range(embed_workers)]
+        threads += [threading.Thread(target=write_stage, name=f"batch-write-{i}", daemon=True) for i in range(writer_workers)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        
+        try:
+            self.flush_status_acks(db_config)
+        except Exception as e:
+            logger.error(f"{BatchLoaderErrorCodes.STATUS_UPDATE_ERROR}: Failed to flush status updates: {str(e)}")
+        self.pipeline_metrics["wall_seconds"] = round(time.perf_counter() - wall_start, 3)
+        if self.pagination_mode == 'keyset':
+            self.batch_metrics["total_batches"] = fetched_batches[0]
+        logger.info(f"Pipelined load finished in {self.pipeline_metrics['wall_seconds']}s")
+    
+    def ensure_shared_node_constraints(self, model: Dict[str, Any]) -> bool:
+        """
+        Create uniqueness constraints for nodes MERGEd by more than one batch.
+        
+        Covers Tag.tag_name, Author.name and every model node merged on its
+        node_id_property. With a constraint in place Neo4j serializes concurrent
+        MERGEs of the same key instead of creating duplicates.
+        
+        Args:
+            model: Neo4j model configuration
+            
+        Returns:
+            True if every constraint exists, False if any could not be created
+            (for example because duplicates are already present)
+        """
+        keys = {('Tag', 'tag_name'), ('Author', 'name')}
+        keys.update(
+            (node['label'], node['node_id_property'])
+            for node in model.get('nodes', []) if node.get('label') and node.get('node_id_property')
+        )
+        
+        all_created = True
+        for label, property_name in sorted(keys):
+            cypher = (f"CREATE CONSTRAINT {label.lower()}_{property_name}_unique IF NOT EXISTS "
+                      f"FOR (n:{label}) REQUIRE n.{property_name} IS UNIQUE")
+            try:
+                self._record_cypher('schema', f"CONSTRAINT {label}.{property_name}", cypher)
+                self.execute_cypher_query(cypher)
+            except Exception as e:
+                logger.warning(f"Failed to create constraint '{label}.{property_name}': {str(e)}")
+                all_created = False
+        return all_created
+    
+    def _commit_batch_result(self, db_config: Dict[str, str], batch_num: int, offset: int,
+                             success: bool, record_ids: List[int], error: Optional[str]) -> None:
+        """Update status_neo4j and batch metrics for a finished batch (called in batch order)."""
+        if success and record_ids:
+            # Acknowledgements are coalesced so several batches share one status update
+            self._pending_status_acks.append((batch_num, offset, record_ids))
+            if len(self._pending_status_acks) >= self.status_coalesce_batches:
+                self.flush_status_acks(db_config)
+            return
+        
+        if success:
+            self.batch_metrics["completed_batches"] += 1
+            self.load_metrics["total_records_processed"] += len(record_ids)
+            logger.info(f"Batch {batch_num}: Completed successfully")
+        else:
+            self.batch_metrics["failed_batches"] += 1
+            self.track_batch_failure(batch_num, offset, self.batch_size, error or "Batch processing failed", record_ids)
+        
+        logger.info(f"Progress: {batch_num} batches committed ({self.batch_metrics['total_batches']} expected)")
+    
+    def flush_status_acks(self, db_config: Dict[str, str]) -> None:
+        """
+        Mark every acknowledged batch as loaded with one status_neo4j update.
+        
+        Args:
+            db_config: PostgreSQL database configuration
+        """
+        pending = self._pending_status_acks
+        self._pending_status_acks = []
+        if not pending:
+            return
+        
+        record_ids = [record_id for _, _, batch_ids in pending for record_id in batch_ids]
+        start_time = time.perf_counter()
+        updated = self.update_status_neo4j(db_config, record_ids, True)
+        if updated:
+            self._record_stage_timing("status", len(record_ids), time.perf_counter() - start_time)
+        
+        for batch_num, offset, batch_ids in pending:
+            if updated:
+                self.batch_metrics["completed_batches"] += 1
+                self.load_metrics["total_records_processed"] += len(batch_ids)
+                logger.info(f"Batch {batch_num}: Completed successfully")
+            else:
+                logger.error(f"Batch {batch_num}: Failed to update status_neo4j")
+                self.batch_metrics["failed_batches"] += 1
+                self.track_batch_failure(batch_num, offset, self.batch_size, "Failed to update status_neo4j", batch_ids)
+        
+        logger.info(f"Progress: {pending[-1][0]} batches committed ({self.batch_metrics['total_batches']} expected)")
     
     def load_data_in_batches(self, config_path: str, model_path: str, metrics_file: str) -> None:
         """
@@ -1397,10 +2805,12 @@ class BatchNeo4jLoader(Neo4jDataLoader):
             self.source_metrics["records_pulled"] = 0  # Will be updated after count
             
             # Get total record count
-            total_records = self.get_total_record_count(db_config, base_query)
+            total_records = self.get_total_record_count(db_config, base_query, self.record_count_mode)
             self.source_metrics["records_pulled"] = total_records
+            self.source_metrics["record_count_mode"] = self.record_count_mode
             
-            if total_records == 0:
+            # Keyset pagination runs until a batch comes back empty, so an estimate of 0 is not final
+            if total_records == 0 and not (self.pagination_mode == 'keyset' and self.record_count_mode == 'estimate'):
                 logger.info("No records to process")
                 return
             
@@ -1416,35 +2826,23 @@ class BatchNeo4jLoader(Neo4jDataLoader):
             # Initialize Neo4j connection
             self.initialize_neo4j_connection(config)
             
+            # Constraints, full-text indexes (lexical/hybrid retrieval) and the chunk vector
+            # index, sized to the embedding model rather than the model file's dimension
+            vector_dim = self.get_embedding_dimension() if self._has_chunk_vector_index(model) else None
+            self.apply_schema_from_model(model, vector_dimension_override=vector_dim)
+            if self.incremental_chunks:
+                self.ensure_chunk_source_index()
+            
             # Get before run metrics (existing counts in Neo4j)
             logger.info("Getting existing Neo4j counts before run...")
             self.before_metrics = self.get_neo4j_counts()
             
             # Process batches
-            for batch_num in range(1, total_batches + 1):
-                offset = (batch_num - 1) * self.batch_size
-                
-                try:
-                    success, record_ids = self.process_batch(
-                        config, model, db_config, base_query, offset, batch_num
-                    )
-                    
-                    if success:
-                        self.batch_metrics["completed_batches"] += 1
-                        self.load_metrics["total_records_processed"] += len(record_ids)
-                    else:
-                        self.batch_metrics["failed_batches"] += 1
-                        self.track_batch_failure(batch_num, offset, self.batch_size, "Batch processing failed", record_ids)
-                        logger.error(f"Batch {batch_num} failed, but continuing with next batch")
-                        
-                except Exception as e:
-                    self.batch_metrics["failed_batches"] += 1
-                    self.track_batch_failure(batch_num, offset, self.batch_size, str(e), [])
-                    logger.error(f"Batch {batch_num} failed with exception: {str(e)}")
-                
-                # Log progress
-                progress = (batch_num / total_batches) * 100
-                logger.info(f"Progress: {progress:.1f}% ({batch_num}/{total_batches} batches completed)")
+            self.last_seen_key = None
+            if self.pipeline_enabled:
+                self.run_pipelined_batches(config, model, db_config, base_query, total_batches)
+            else:
+                self.run_sequential_batches(config, model, db_config, base_query, total_batches)
             
             # Get after run metrics (total counts in Neo4j after run)
             logger.info("Getting final Neo4j counts after run...")
@@ -1453,11 +2851,21 @@ class BatchNeo4jLoader(Neo4jDataLoader):
             # Calculate actual changes (difference between before and after)
             self.calculate_actual_changes()
             
+            # Let retrieval caches know the graph changed
+            self.bump_graph_version()
+            
             # Run adhoc tests for data integrity
-            self.run_adhoc_tests()
+            run_checks_async = self.async_integrity_checks and self.integrity_check_scope != 'off'
+            if run_checks_async:
+                with self._metrics_lock:
+                    self.adhoc_tests = dict(self._new_adhoc_tests(), status="running")
+            else:
+                self.run_adhoc_tests()
             
-            # Write final metrics
+            # Write final metrics; background checks rewrite their section when they finish
             self.write_batch_metrics(metrics_file)
+            if run_checks_async:
+                self.start_adhoc_tests_async(metrics_file)
             
             # Write failure report if there are any failures
             if any(len(failures) > 0 for failures in self.failure_tracker.values()):
@@ -1476,9 +2884,61 @@ class BatchNeo4jLoader(Neo4jDataLoader):
                 pass
             raise
         finally:
-            if self.neo4j_driver:
+            # Background adhoc tests close the driver themselves when they finish
+            if self.neo4j_driver and not (self.adhoc_thread and self.adhoc_thread.is_alive()):
                 self.neo4j_driver.close()
                 logger.info("Neo4j connection closed")
+            if self.embedding_cache:
+                self.embedding_cache.close()
+                self.embedding_cache = None
+            if self.pg_pool:
+                self.pg_pool.close()
+                self.pg_pool = None
+            self.close_mcp_clients()
+    
+    @staticmethod
+    def _has_chunk_vector_index(model: Dict[str, Any]) -> bool:
+        """Whether the model defines the Chunk.embedding vector index."""
+        return any(
+            str(index.get('type', '')).upper() == 'VECTOR' and index.get('node_label') == 'Chunk'
+            and index.get('property') == 'embedding'
+            for index in model.get('indexes', [])
+        )
+    
+    def bump_graph_version(self) -> Optional[int]:
+        """
+        Increment the graph version marker read by retrieval caches.
+        
+        A failure is logged but does not fail the load; readers fall back to
+        their cache TTL.
+        
+        Returns:
+            New graph version, or None if the marker could not be updated
+        """
+        cypher = """
+        MERGE (v:GraphVersion {name: $name})
+        SET v.version = coalesce(v.version, 0) + 1,
+            v.updated_at = datetime()
+        RETURN v.version AS version
+        """
+        try:
+            result = self.execute_cypher_query(cypher, {"name": GRAPH_VERSION_NAME})
+            version = result["records"][0]["version"]
+            self.batch_metrics["graph_version"] = version
+            logger.info(f"Graph version bumped to {version}")
+            return version
+        except Exception as e:
+            logger.warning(f"{BatchLoaderErrorCodes.GRAPH_VERSION_ERROR}: Failed to bump graph version: {str(e)}")
+            return None
+    
+    def close_mcp_clients(self) -> None:
+        """Stop the MCP server processes started by this loader's clients."""
+        for client in (self.mcp_cypher_client, self.mcp_vector_client):
+            if client:
+                try:
+                    client.close()
+                except Exception as e:
+                    logger.warning(f"Failed to stop MCP server {client.server_name}: {str(e)}")
     
     def track_batch_failure(self, batch_num: int, offset: int, limit: int, error: str, record_ids: List[int] = None) -> None:
         """
@@ -1629,14 +3089,31 @@ class BatchNeo4jLoader(Neo4jDataLoader):
             metrics_file: Path to metrics output file
         """
         try:
+            if self.embedding_cache:
+                self.batch_metrics["embedding_cache"] = self.embedding_cache.get_stats()
+            if self.pg_pool:
+                status_stats = dict(self.status_update_metrics)
+                status_stats["avg_ms"] = (
+                    round(status_stats["total_ms"] / status_stats["statements"], 2) if status_stats["statements"] else 0.0
+                )
+                self.batch_metrics["postgres"] = {"pool": self.pg_pool.get_stats(), "status_updates": status_stats}
+            mcp_stats = [client.get_stats() for client in (self.mcp_cypher_client, self.mcp_vector_client) if client]
+            mcp_stats = [stats for stats in mcp_stats if stats["calls"]]
+            if mcp_stats:
+                self.batch_metrics["mcp_clients"] = mcp_stats
+            
             metrics = {
                 "source_metrics": self.source_metrics,
                 "batch_metrics": self.batch_metrics,
                 "load_metrics": self.load_metrics,
                 "before_metrics": self.before_metrics,
                 "after_metrics": self.after_metrics,
-                "adhoc_tests": self.adhoc_tests,
+                "adhoc_tests": None,
+                "pipeline_metrics": self.pipeline_metrics,
                 "cypher_usage": dict(self.cypher_usage),
+                "cypher_latency": {
+                    f"{category}:{name}": stats for (category, name), stats in self.cypher_latency.items()
+                },
                 "failure_summary": {
                     "total_batch_failures": len(self.failure_tracker["batch_failures"]),
                     "total_record_failures": len(self.failure_tracker["record_failures"]),
@@ -1647,14 +3124,62 @@ class BatchNeo4jLoader(Neo4jDataLoader):
                 "timestamp": datetime.now().isoformat()
             }
             
-            with open(metrics_file, 'w') as f:
-                json.dump(metrics, f, indent=2, default=str)
+            # Background adhoc tests may rewrite the same file
+            with self._metrics_lock:
+                metrics["adhoc_tests"] = self.adhoc_tests
+                self._write_metrics_file(metrics_file, metrics)
             
             logger.info(f"Batch metrics written to {metrics_file}")
             
         except Exception as e:
             error_msg = f"{BatchLoaderErrorCodes.BATCH_CONFIG_ERROR}: Failed to write batch metrics: {str(e)}"
             logger.error(error_msg)
+    
+    def write_adhoc_test_metrics(self, metrics_file: str) -> None:
+        """
+        Rewrite the metrics file with the current adhoc test results.
+        
+        Only the adhoc_tests section of the metrics last written by
+        write_batch_metrics is replaced, so background checks never read pools
+        or caches the main thread has already closed.
+        
+        Args:
+            metrics_file: Path to metrics output file
+        """
+        try:
+            with self._metrics_lock:
+                if self._metrics_snapshot is None:
+                    logger.warning("No batch metrics written yet, adhoc test results left in memory")
+                    return
+                metrics = dict(self._metrics_snapshot, adhoc_tests=self.adhoc_tests,
+                               timestamp=datetime.now().isoformat())
+                self._write_metrics_file(metrics_file, metrics)
+            
+            logger.info(f"Adhoc test results written to {metrics_file}")
+            
+        except Exception as e:
+            error_msg = f"{BatchLoaderErrorCodes.BATCH_CONFIG_ERROR}: Failed to write adhoc test metrics: {str(e)}"
+            logger.error(error_msg)
+    
+    def _write_metrics_file(self, metrics_file: str, metrics: Dict[str, Any]) -> None:
+        """
+        Atomically replace the metrics file and remember what was written.
+        
+        The JSON goes to a temporary file in the same directory first, so a
+        reader never sees a partly written file. Call with _metrics_lock held.
+        """
+        payload = json.dumps(metrics, indent=2, default=str)
+        directory = os.path.dirname(os.path.abspath(metrics_file))
+        fd, temp_path = tempfile.mkstemp(dir=directory, prefix=".metrics-", suffix=".tmp")
+        try:
+            with os.fdopen(fd, 'w') as f:
+                f.write(payload)
+            os.replace(temp_path, metrics_file)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+        self._metrics_snapshot = json.loads(payload)
 
 
 def main():
@@ -4,11 +4,18 @@ boomer-vector-embedding-creator
 A custom MCP server that exposes a tool to generate vector embeddings
 for a given input string using SentenceTransformer('all-MiniLM-L6-v2').
 
+Concurrent requests are micro-batched: they are collected for a few
+milliseconds (or until a batch is full) and encoded with a single
+model.encode call.
+
 This server communicates over stdio per the Model Context Protocol (MCP).
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, List
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Tuple
 
 from sentence_transformers import SentenceTransformer
 
@@ -31,6 +38,10 @@ logger = logging.getLogger("boomer-vector-embedding-creator")
 SERVER_NAME = "boomer-vector-embedding-creator"
 _embedding_model: SentenceTransformer | None = None
 
+# Micro-batching settings
+MAX_BATCH_SIZE = int(os.getenv("EMBEDDING_MAX_BATCH_SIZE", "64"))
+MAX_BATCH_WAIT_MS = float(os.getenv("EMBEDDING_MAX_BATCH_WAIT_MS", "5"))
+
 
 def _get_embedding_model() -> SentenceTransformer:
     global _embedding_model
@@ -41,6 +52,82 @@ def _get_embedding_model() -> SentenceTransformer:
     return _embedding_model
 
 
+def _encode_batch(texts: List[str]) -> List[List[float]]:
+    """Encode a batch of texts with one model call (blocking)."""
+    model = _get_embedding_model()
+    embeddings = model.encode(texts, convert_to_tensor=False, batch_size=len(texts))
+    return [embedding.tolist() if hasattr(embedding, "tolist") else list(embedding) for embedding in embeddings]
+
+
+class _EmbeddingBatcher:
+    """Collects concurrent encode requests and serves them with a single encode call per batch."""
+
+    def __init__(self, max_batch_size: int, max_wait_ms: float):
+        self.max_batch_size = max(1, max_batch_size)
+        self.max_wait_seconds = max(0.0, max_wait_ms) / 1000
+        # One encode at a time; requests arriving meanwhile form the next batch
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="embedding-batch")
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self.stats = {"requests": 0, "batches": 0, "largest_batch": 0}
+
+    def _ensure_worker(self) -> asyncio.Queue:
+        loop = asyncio.get_running_loop()
+        if self._loop is not loop or self._worker is None or self._worker.done():
+            self._loop = loop
+            self._queue = asyncio.Queue()
+            self._worker = loop.create_task(self._run())
+        return self._queue
+
+    async def encode(self, texts: List[str]) -> List[List[float]]:
+        """Queue texts for encoding and wait for their embeddings."""
+        queue = self._ensure_worker()
+        loop = asyncio.get_running_loop()
+        futures = []
+        for text in texts:
+            future = loop.create_future()
+            queue.put_nowait((text, future))
+            futures.append(future)
+        self.stats["requests"] += len(texts)
+        return list(await asyncio.gather(*futures))
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        while True:
+            batch: List[Tuple[str, asyncio.Future]] = [await self._queue.get()]
+            deadline = loop.time() + self.max_wait_seconds
+            while len(batch) < self.max_batch_size:
+                if not self._queue.empty():
+                    batch.append(self._queue.get_nowait())
+                    continue
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    batch.append(await asyncio.wait_for(self._queue.get(), remaining))
+                except asyncio.TimeoutError:
+                    break
+
+            self.stats["batches"] += 1
+            self.stats["largest_batch"] = max(self.stats["largest_batch"], len(batch))
+            try:
+                embeddings = await loop.run_in_executor(self._executor, _encode_batch, [text for text, _ in batch])
+            except Exception as e:
+                logger.error(f"Batch encode of {len(batch)} texts failed: {e}")
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), embedding in zip(batch, embeddings):
+                if not future.done():
+                    future.set_result(embedding)
+
+
+_batcher = _EmbeddingBatcher(MAX_BATCH_SIZE, MAX_BATCH_WAIT_MS)
+
+
 mcp = FastMCP(SERVER_NAME)
 
 
@@ -62,13 +149,7 @@ async def create_embedding(text: str) -> Dict[str, Any]:
             "error": "Input text is empty",
         }
 
-    model = _get_embedding_model()
-    embedding = model.encode([text], convert_to_tensor=False)[0]
-
-    if hasattr(embedding, "tolist"):
-        embedding_list: List[float] = embedding.tolist()
-    else:
-        embedding_list = list(embedding)
+    embedding_list = (await _batcher.encode([text]))[0]
 
     return {
         "embedding": embedding_list,
@@ -77,6 +158,38 @@ async def create_embedding(text: str) -> Dict[str, Any]:
     }
 
 
+@mcp.tool()
+async def create_embeddings(texts: List[str]) -> Dict[str, Any]:
+    """Create vector embeddings for a list of texts in one call.
+
+    Args:
+        texts: The input texts to embed
+
+    Returns:
+        A dictionary containing one embedding per input text (empty for empty
+        texts, whose positions are listed in empty_indices) and metadata.
+    """
+    texts = texts or []
+    empty_indices = [i for i, text in enumerate(texts) if text is None or len(text.strip()) == 0]
+    empty = set(empty_indices)
+    non_empty = [text for i, text in enumerate(texts) if i not in empty]
+
+    encoded = iter(await _batcher.encode(non_empty)) if non_empty else iter([])
+    embeddings: List[List[float]] = [[] if i in empty else next(encoded) for i in range(len(texts))]
+    dimension = next((len(embedding) for embedding in embeddings if embedding), 0)
+
+    result: Dict[str, Any] = {
+        "embeddings": embeddings,
+        "model": "all-MiniLM-L6-v2",
+        "dimension": dimension,
+        "count": len(texts),
+    }
+    if empty_indices:
+        result["empty_indices"] = empty_indices
+        result["error"] = f"{len(empty_indices)} input texts are empty"
+    return result
+
+
 if __name__ == "__main__":
     logger.info("Starting MCP stdio server: %s", SERVER_NAME)
     mcp.run(transport="stdio") 
\ No newline at end of file
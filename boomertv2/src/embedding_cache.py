@@ -0,0 +1,419 @@
+#!/usr/bin/env python3
+"""
+Embedding Cache
+Persistent, size-bounded cache of chunk embeddings keyed by content hash, and an
+in-memory LRU cache of query embeddings.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+class EmbeddingCacheErrorCodes:
+    CACHE_OPEN_ERROR = "ERR_C001"
+    CACHE_READ_ERROR = "ERR_C002"
+    CACHE_WRITE_ERROR = "ERR_C003"
+
+
+# Storage precisions; int8 rows carry one float32 scale ahead of the codes
+STORAGE_DTYPES = ("float32", "float16", "int8")
+
+
+def hit_rate(stats: Dict[str, Any]) -> float:
+    """Return hits / (hits + misses) rounded to four places, or 0.0 before any lookup."""
+    lookups = stats["hits"] + stats["misses"]
+    return round(stats["hits"] / lookups, 4) if lookups else 0.0
+
+
+def quantize_embeddings(matrix: np.ndarray, dtype: str) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Convert a float32 embedding matrix to a storage precision.
+
+    Args:
+        matrix: Array of shape (n, dimension)
+        dtype: One of STORAGE_DTYPES
+
+    Returns:
+        Tuple of (values, per-row scales); scales is None unless dtype is int8
+    """
+    matrix = np.asarray(matrix, dtype=np.float32)
+    if dtype == "float32":
+        return matrix, None
+    if dtype == "float16":
+        return matrix.astype(np.float16), None
+    if dtype == "int8":
+        scales = np.abs(matrix).max(axis=1) / 127.0
+        scales[scales == 0] = 1.0
+        codes = np.clip(np.rint(matrix / scales[:, None]), -127, 127).astype(np.int8)
+        return codes, scales.astype(np.float32)
+    raise ValueError(f"Unknown embedding storage dtype '{dtype}', expected one of {STORAGE_DTYPES}")
+
+
+def dequantize_embeddings(values: np.ndarray, scales: Optional[np.ndarray] = None) -> np.ndarray:
+    """
+    Convert stored embeddings back to a float32 matrix.
+
+    Args:
+        values: Array returned by quantize_embeddings
+        scales: Per-row scales for int8 values
+
+    Returns:
+        float32 array of the same shape
+    """
+    matrix = np.asarray(values).astype(np.float32)
+    if scales is not None:
+        matrix *= np.asarray(scales, dtype=np.float32)[:, None]
+    return matrix
+
+
+def _encode_row(vector: np.ndarray, dtype: str) -> bytes:
+    """Serialize one float32 vector in the given storage precision."""
+    values, scales = quantize_embeddings(vector.reshape(1, -1), dtype)
+    if scales is None:
+        return values.tobytes()
+    return scales.tobytes() + values.tobytes()
+
+
+def _decode_row(blob: bytes, dtype: str) -> np.ndarray:
+    """Deserialize one vector written by _encode_row."""
+    if dtype == "int8":
+        scale = np.frombuffer(blob[:4], dtype=np.float32)
+        return dequantize_embeddings(np.frombuffer(blob[4:], dtype=np.int8).reshape(1, -1), scale)[0]
+    return np.frombuffer(blob, dtype=np.dtype(dtype)).astype(np.float32)
+
+
+class EmbeddingCache:
+    """
+    SQLite-backed embedding cache with LRU eviction.
+
+    Entries are keyed by sha256(model name, chunking parameters, chunk text), so
+    an unchanged chunk costs a primary-key lookup instead of a model forward pass.
+    Vectors are stored as raw float32, float16 or scaled int8 bytes; each row
+    records its own precision, so changing dtype does not invalidate old entries.
+    """
+
+    def __init__(self, path: str, max_entries: int = 500000, dtype: str = "float32"):
+        """
+        Open (or create) the cache database.
+
+        Args:
+            path: Path to the SQLite file
+            max_entries: Maximum number of entries kept before evicting the least recently used
+            dtype: Precision new entries are stored in (float32, float16 or int8)
+        """
+        if dtype not in STORAGE_DTYPES:
+            error_msg = (f"{EmbeddingCacheErrorCodes.CACHE_OPEN_ERROR}: Unknown embedding cache dtype '{dtype}', "
+                         f"expected one of {STORAGE_DTYPES}")
+            logger.error(error_msg)
+            raise Exception(error_msg)
+
+        self.path = path
+        self.dtype = dtype
+        self.max_entries = max(1, int(max_entries))
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "writes": 0, "evictions": 0, "errors": 0}
+
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            self._conn = sqlite3.connect(path, check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS embeddings ("
+                "cache_key TEXT PRIMARY KEY, dimension INTEGER NOT NULL, "
+                "vector BLOB NOT NULL, last_used REAL NOT NULL, dtype TEXT NOT NULL DEFAULT 'float32')"
+            )
+            columns = [row[1] for row in self._conn.execute("PRAGMA table_info(embeddings)")]
+            if "dtype" not in columns:
+                # Caches created before quantized storage only hold float32 rows
+                self._conn.execute("ALTER TABLE embeddings ADD COLUMN dtype TEXT NOT NULL DEFAULT 'float32'")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_embeddings_last_used ON embeddings(last_used)")
+            self._conn.commit()
+            # Counted once here and kept up to date by put_many/_evict_locked, so writes never scan the table
+            self._entry_count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        except Exception as e:
+            error_msg = f"{EmbeddingCacheErrorCodes.CACHE_OPEN_ERROR}: Failed to open embedding cache {path}: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg) from e
+
+        logger.info(f"Embedding cache opened at {path} ({self.entry_count()} entries, "
+                    f"max {self.max_entries}, {self.dtype})")
+
+    @staticmethod
+    def make_key(model_name: str, namespace: str, text: str) -> str:
+        """
+        Build the cache key for a chunk.
+
+        Args:
+            model_name: Embedding model name
+            namespace: Chunking parameters the text was produced with
+            text: Chunk text
+
+        Returns:
+            Hex sha256 digest identifying the entry
+        """
+        text_hash = hashlib.sha256(text.encode('utf-8')).hexdigest()
+        return hashlib.sha256(f"{model_name}\x1f{namespace}\x1f{text_hash}".encode('utf-8')).hexdigest()
+
+    def get_many(self, keys: Sequence[str]) -> Dict[str, np.ndarray]:
+        """
+        Look up several keys at once and refresh their LRU timestamp.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Dictionary of key -> float32 embedding for the keys that were found
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        found: Dict[str, np.ndarray] = {}
+        if not unique_keys:
+            return found
+
+        with self._lock:
+            try:
+                for start in range(0, len(unique_keys), 500):
+                    chunk = unique_keys[start:start + 500]
+                    placeholders = ",".join("?" * len(chunk))
+                    rows = self._conn.execute(
+                        f"SELECT cache_key, vector, dtype FROM embeddings WHERE cache_key IN ({placeholders})", chunk
+                    ).fetchall()
+                    for cache_key, blob, dtype in rows:
+                        found[cache_key] = _decode_row(blob, dtype)
+                if found:
+                    now = time.time()
+                    self._conn.executemany(
+                        "UPDATE embeddings SET last_used = ? WHERE cache_key = ?",
+                        [(now, cache_key) for cache_key in found]
+                    )
+                    self._conn.commit()
+            except Exception as e:
+                self.stats["errors"] += 1
+                logger.warning(f"{EmbeddingCacheErrorCodes.CACHE_READ_ERROR}: Embedding cache lookup failed: {str(e)}")
+                found = {}
+
+            self.stats["hits"] += sum(1 for key in keys if key in found)
+            self.stats["misses"] += sum(1 for key in keys if key not in found)
+        return found
+
+    def put_many(self, entries: Dict[str, Sequence[float]]) -> None:
+        """
+        Store embeddings and evict the least recently used entries over the size bound.
+
+        Args:
+            entries: Dictionary of key -> embedding, stored in the cache's dtype
+        """
+        if not entries:
+            return
+
+        now = time.time()
+        rows = []
+        for cache_key, vector in entries.items():
+            array = np.asarray(vector, dtype=np.float32)
+            rows.append((cache_key, int(array.shape[0]), _encode_row(array, self.dtype), now, self.dtype))
+
+        with self._lock:
+            try:
+                # Replaced keys do not grow the table; primary-key lookups find them cheaply
+                existing = self._count_existing_locked(list(entries))
+                self._conn.executemany(
+                    "INSERT OR REPLACE INTO embeddings (cache_key, dimension, vector, last_used, dtype) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    rows
+                )
+                self.stats["writes"] += len(rows)
+                self._entry_count += len(rows) - existing
+                self._evict_locked()
+                self._conn.commit()
+            except Exception as e:
+                self._resync_count_locked()
+                self.stats["errors"] += 1
+                logger.warning(f"{EmbeddingCacheErrorCodes.CACHE_WRITE_ERROR}: Embedding cache write failed: {str(e)}")
+
+    def _resync_count_locked(self) -> None:
+        """Roll back a failed write and re-read the row count (caller holds the lock)."""
+        try:
+            self._conn.rollback()
+            self._entry_count = self._conn.execute("SELECT COUNT(*) FROM embeddings").fetchone()[0]
+        except Exception:
+            pass
+
+    def _count_existing_locked(self, keys: Sequence[str]) -> int:
+        """Count how many of the keys are already stored (caller holds the lock)."""
+        existing = 0
+        for start in range(0, len(keys), 500):
+            chunk = keys[start:start + 500]
+            placeholders = ",".join("?" * len(chunk))
+            existing += self._conn.execute(
+                f"SELECT COUNT(*) FROM embeddings WHERE cache_key IN ({placeholders})", chunk
+            ).fetchone()[0]
+        return existing
+
+    def _evict_locked(self) -> None:
+        """Delete the oldest entries beyond max_entries (caller holds the lock)."""
+        overflow = self._entry_count - self.max_entries
+        if overflow > 0:
+            deleted = self._conn.execute(
+                "DELETE FROM embeddings WHERE cache_key IN "
+                "(SELECT cache_key FROM embeddings ORDER BY last_used ASC LIMIT ?)",
+                (overflow,)
+            ).rowcount
+            self._entry_count -= deleted
+            self.stats["evictions"] += deleted
+
+    def entry_count(self) -> int:
+        """Return the number of cached embeddings."""
+        with self._lock:
+            return self._entry_count
+
+    def get_stats(self) -> Dict[str, float]:
+        """Return hit/miss counters plus the current size and hit rate."""
+        with self._lock:
+            stats = dict(self.stats)
+        stats["hit_rate"] = hit_rate(stats)
+        stats["entries"] = self.entry_count()
+        stats["dtype"] = self.dtype
+        return stats
+
+    def close(self) -> None:
+        """Close the underlying database."""
+        with self._lock:
+            try:
+                self._conn.close()
+            except Exception:
+                pass
+
+
+# mcp_playground and graphRAG-kiro ship their own copy of this class for their
+# images; keep all three behaving the same.
+class QueryEmbeddingCache:
+    """Bounded LRU cache of query embeddings with a time-to-live."""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 3600.0):
+        """
+        Initialize the cache.
+
+        Args:
+            max_entries: Maximum number of cached embeddings (0 disables the cache)
+            ttl_seconds: Seconds an entry stays valid (0 keeps entries until evicted)
+        """
+        self.max_entries = max(0, int(max_entries))
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        # Embeddings are stored as tuples so no caller can modify a cached value
+        self._entries: "OrderedDict[str, Tuple[Tuple[float, ...], float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "saved_encode_ms": 0.0}
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """
+        Normalize a query so trivially different spellings share an entry.
+
+        Args:
+            text: Query text
+
+        Returns:
+            NFC-normalized text with whitespace collapsed
+        """
+        return " ".join(unicodedata.normalize("NFC", text).split())
+
+    @classmethod
+    def make_key(cls, model_name: str, text: str) -> str:
+        """
+        Build the cache key for a query.
+
+        Args:
+            model_name: Embedding model name
+            text: Query text
+
+        Returns:
+            Hex sha256 digest of the model name and normalized text
+        """
+        return hashlib.sha256(f"{model_name}\x1f{cls.normalize(text)}".encode("utf-8")).hexdigest()
+
+    def get(self, model_name: str, text: str) -> Optional[List[float]]:
+        """
+        Look up a query embedding.
+
+        Args:
+            model_name: Embedding model name
+            text: Query text
+
+        Returns:
+            Copy of the cached embedding, or None on a miss or expired entry
+        """
+        if not self.max_entries:
+            return None
+
+        key = self.make_key(model_name, text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl_seconds and entry[1] <= time.monotonic():
+                del self._entries[key]
+                self.stats["expirations"] += 1
+                entry = None
+
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            self.stats["saved_encode_ms"] += entry[2]
+        return list(entry[0])
+
+    def put(self, model_name: str, text: str, embedding: Sequence[float], encode_ms: float = 0.0) -> None:
+        """
+        Store a query embedding, evicting the least recently used entries over the bound.
+
+        Args:
+            model_name: Embedding model name
+            text: Query text
+            embedding: Embedding values
+            encode_ms: Time the encode took, credited as saved on every later hit
+        """
+        if not self.max_entries or not len(embedding):
+            return
+
+        key = self.make_key(model_name, text)
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (tuple(embedding), expires_at, encode_ms)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def clear(self) -> None:
+        """Drop every cached embedding."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Hit/miss counters, hit rate, saved encode time and current size
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            stats["entries"] = len(self._entries)
+        stats["hit_rate"] = hit_rate(stats)
+        stats["saved_encode_ms"] = round(stats["saved_encode_ms"], 2)
+        stats["max_entries"] = self.max_entries
+        stats["ttl_seconds"] = self.ttl_seconds
+        return stats
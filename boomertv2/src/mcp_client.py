@@ -7,16 +7,35 @@ Provides integration with MCP (Model Context Protocol) servers for Cypher query
 import logging
 import json
 import subprocess
-import tempfile
+import threading
+import time
 import os
+from collections import deque
+from concurrent.futures import Future, TimeoutError as FutureTimeoutError
 from typing import Dict, Any, Optional
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+MCP_PROTOCOL_VERSION = "2024-11-05"
+LATENCY_SAMPLE_SIZE = 1000
+
+
+class MCPClientErrorCodes:
+    SERVER_START_ERROR = "ERR_M001"
+    REQUEST_TIMEOUT = "ERR_M002"
+    SERVER_ERROR = "ERR_M003"
+    SESSION_CLOSED = "ERR_M004"
+
+
 class MCPClient:
     """
     MCP Client for connecting to MCP servers.
+    
+    The configured server is started once and kept running. Requests are sent
+    as newline-delimited JSON-RPC over its stdio with unique request IDs, so
+    calls from several threads are pipelined over the same session. A server
+    that exits or stops answering health checks is restarted on the next call.
     """
     
     def __init__(self, server_config: Dict[str, Any]):
@@ -31,7 +50,305 @@ class MCPClient:
         self.command = server_config.get('command', '')
         self.args = server_config.get('args', [])
         self.env = server_config.get('env', {})
+        self.request_timeout = float(server_config.get('request_timeout', 30))
+        self.startup_timeout = float(server_config.get('startup_timeout', 60))
+        self.health_check_interval = float(server_config.get('health_check_interval', 30))
+        self.max_restarts = int(server_config.get('max_restarts', 3))
+        
+        self._process: Optional[subprocess.Popen] = None
+        self._reader: Optional[threading.Thread] = None
+        self._closed = threading.Event()
+        self._pending: Dict[int, Future] = {}
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._session_lock = threading.Lock()
+        self._last_response = 0.0
+        self._consecutive_restarts = 0
+        self.server_info: Dict[str, Any] = {}
+        
+        self.stats: Dict[str, Any] = {"starts": 0, "restarts": 0, "calls": {}}
+        self._latency_samples: Dict[str, deque] = {}
+    
+    def _start_session(self) -> None:
+        """Start the server process and perform the MCP initialize handshake (caller holds _session_lock)."""
+        env = dict(os.environ)
+        env.update(self.env)
+        try:
+            self._process = subprocess.Popen(
+                [self.command] + self.args,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+                text=True,
+                bufsize=1,
+                env=env
+            )
+        except Exception as e:
+            error_msg = f"{MCPClientErrorCodes.SERVER_START_ERROR}: Failed to start MCP server {self.server_name}: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg) from e
+        
+        self._closed = threading.Event()
+        self._reader = threading.Thread(
+            target=self._read_responses, args=(self._process, self._closed), name=f"mcp-{self.server_name}-reader", daemon=True
+        )
+        self._reader.start()
+        self.stats["starts"] += 1
+        
+        try:
+            result = self._send_request("initialize", {
+                "protocolVersion": MCP_PROTOCOL_VERSION,
+                "capabilities": {},
+                "clientInfo": {"name": "boomer-batch-loader", "version": "1.0.0"}
+            }, self.startup_timeout)
+            self.server_info = result.get("serverInfo", {})
+            self._send_message({"jsonrpc": "2.0", "method": "notifications/initialized"})
+        except Exception as e:
+            self._stop_process()
+            error_msg = f"{MCPClientErrorCodes.SERVER_START_ERROR}: MCP server {self.server_name} failed to initialize: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg) from e
+        
+        logger.info(f"MCP server {self.server_name} started (pid {self._process.pid})")
+    
+    def _ensure_session(self) -> None:
+        """Start the server on first use and restart it if it has exited or stopped responding."""
+        with self._session_lock:
+            if self._process is not None and self._process.poll() is None and not self._closed.is_set():
+                return
+            
+            if self._process is not None:
+                self._restart_session(f"exited (code {self._process.returncode})")
+            else:
+                self._start_session()
+    
+    def _restart_session(self, reason: str) -> None:
+        """Restart the server, giving up after max_restarts restarts in a row (caller holds _session_lock)."""
+        if self._consecutive_restarts >= self.max_restarts:
+            raise Exception(
+                f"{MCPClientErrorCodes.SESSION_CLOSED}: MCP server {self.server_name} "
+                f"{reason} and was restarted {self._consecutive_restarts} times in a row"
+            )
+        logger.warning(f"MCP server {self.server_name} {reason}; restarting")
+        self._stop_process()
+        self._consecutive_restarts += 1
+        self.stats["restarts"] += 1
+        self._start_session()
+    
+    def _read_responses(self, process: subprocess.Popen, closed: threading.Event) -> None:
+        """Dispatch responses from the server's stdout to the waiting requests by ID."""
+        for line in process.stdout:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                message = json.loads(line)
+            except json.JSONDecodeError:
+                logger.debug(f"Ignoring non-JSON output from {self.server_name}: {line[:200]}")
+                continue
+            
+            # Notifications and server-initiated requests carry no pending ID
+            with self._lock:
+                future = self._pending.pop(message.get("id"), None) if "method" not in message else None
+            if future is None:
+                continue
+            
+            self._last_response = time.monotonic()
+            if "error" in message:
+                error = message["error"]
+                future.set_exception(Exception(
+                    f"{MCPClientErrorCodes.SERVER_ERROR}: {error.get('message', 'MCP server error')} (code {error.get('code')})"
+                ))
+            else:
+                future.set_result(message.get("result", {}))
+        
+        # stdout closed: the server is gone, fail everything still waiting on it
+        closed.set()
+        with self._lock:
+            pending = list(self._pending.values())
+            self._pending.clear()
+        for future in pending:
+            if not future.done():
+                future.set_exception(Exception(
+                    f"{MCPClientErrorCodes.SESSION_CLOSED}: MCP server {self.server_name} closed the session"
+                ))
+    
+    def _send_message(self, message: Dict[str, Any]) -> None:
+        """Write one JSON-RPC message to the server's stdin."""
+        with self._write_lock:
+            self._process.stdin.write(json.dumps(message) + "\n")
+            self._process.stdin.flush()
+    
+    def _send_request(self, method: str, params: Dict[str, Any], timeout: float) -> Dict[str, Any]:
+        """Send a JSON-RPC request and wait for the response with the same ID."""
+        future: Future = Future()
+        with self._lock:
+            self._next_id += 1
+            request_id = self._next_id
+            self._pending[request_id] = future
+        
+        try:
+            self._send_message({"jsonrpc": "2.0", "id": request_id, "method": method, "params": params})
+            return future.result(timeout=timeout)
+        except FutureTimeoutError as e:
+            raise Exception(
+                f"{MCPClientErrorCodes.REQUEST_TIMEOUT}: {method} on {self.server_name} timed out after {timeout}s"
+            ) from e
+        except (BrokenPipeError, OSError, ValueError) as e:
+            raise Exception(
+                f"{MCPClientErrorCodes.SESSION_CLOSED}: MCP server {self.server_name} is not accepting requests: {str(e)}"
+            ) from e
+        finally:
+            with self._lock:
+                self._pending.pop(request_id, None)
+    
+    def request(self, method: str, params: Optional[Dict[str, Any]] = None,
+                timeout: Optional[float] = None, stat_name: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Send a JSON-RPC request over the persistent session.
+        
+        Args:
+            method: JSON-RPC method name
+            params: Request parameters
+            timeout: Seconds to wait for the response (defaults to request_timeout)
+            stat_name: Key the call's latency is recorded under (defaults to the method)
+            
+        Returns:
+            The response's result object
+        """
+        self._ensure_session()
+        start_time = time.perf_counter()
+        success = False
+        try:
+            result = self._send_request(method, params or {}, timeout or self.request_timeout)
+            success = True
+            self._consecutive_restarts = 0
+            return result
+        finally:
+            self._record_latency(stat_name or method, (time.perf_counter() - start_time) * 1000, success)
+    
+    def call_tool(self, tool_name: str, arguments: Dict[str, Any], timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Call an MCP tool.
+        
+        Args:
+            tool_name: Name of the tool
+            arguments: Tool arguments
+            timeout: Seconds to wait for the result
+            
+        Returns:
+            The tool result (content list and isError flag)
+        """
+        return self.request(
+            "tools/call", {"name": tool_name, "arguments": arguments}, timeout, stat_name=f"tools/call:{tool_name}"
+        )
+    
+    def health_check(self) -> bool:
+        """
+        Ping the server, restarting it if it has exited or does not answer.
+        
+        Returns:
+            True if the server answered the ping
+        """
+        try:
+            self.request("ping", timeout=min(self.request_timeout, 10))
+            return True
+        except Exception as e:
+            logger.warning(f"MCP server {self.server_name} failed health check: {str(e)}")
+            try:
+                with self._session_lock:
+                    self._restart_session("failed its health check")
+            except Exception as restart_error:
+                logger.error(str(restart_error))
+                return False
+            try:
+                self.request("ping", timeout=min(self.request_timeout, 10))
+                return True
+            except Exception as retry_error:
+                logger.error(f"MCP server {self.server_name} still unhealthy after restart: {str(retry_error)}")
+                return False
+    
+    def _ensure_healthy(self) -> None:
+        """Run a health check when the session has been idle longer than health_check_interval."""
+        idle = time.monotonic() - self._last_response
+        if self._process is not None and self.health_check_interval and idle > self.health_check_interval:
+            self.health_check()
+    
+    def _record_latency(self, name: str, elapsed_ms: float, success: bool) -> None:
+        """Accumulate per-call latency statistics."""
+        with self._lock:
+            call_stats = self.stats["calls"].setdefault(
+                name, {"count": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0}
+            )
+            call_stats["count"] += 1
+            if not success:
+                call_stats["errors"] += 1
+            call_stats["total_ms"] += elapsed_ms
+            call_stats["max_ms"] = max(call_stats["max_ms"], elapsed_ms)
+            self._latency_samples.setdefault(name, deque(maxlen=LATENCY_SAMPLE_SIZE)).append(elapsed_ms)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get session and per-call latency statistics.
         
+        Returns:
+            Dictionary with start/restart counts and, per call type, count, errors,
+            average, p50, p95 and max latency in milliseconds
+        """
+        with self._lock:
+            calls = {}
+            for name, call_stats in self.stats["calls"].items():
+                samples = sorted(self._latency_samples.get(name, []))
+                calls[name] = {
+                    "count": call_stats["count"],
+                    "errors": call_stats["errors"],
+                    "avg_ms": round(call_stats["total_ms"] / call_stats["count"], 2),
+                    "p50_ms": round(samples[int(0.5 * (len(samples) - 1))], 2) if samples else 0.0,
+                    "p95_ms": round(samples[int(0.95 * (len(samples) - 1))], 2) if samples else 0.0,
+                    "max_ms": round(call_stats["max_ms"], 2)
+                }
+            return {
+                "server": self.server_name,
+                "running": self._process is not None and self._process.poll() is None and not self._closed.is_set(),
+                "starts": self.stats["starts"],
+                "restarts": self.stats["restarts"],
+                "calls": calls
+            }
+    
+    def _stop_process(self) -> None:
+        """Terminate the server process (caller holds _session_lock)."""
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            if process.stdin:
+                process.stdin.close()
+            process.terminate()
+            process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            process.kill()
+        except Exception as e:
+            logger.debug(f"Error stopping MCP server {self.server_name}: {str(e)}")
+        if self._reader is not None:
+            self._reader.join(timeout=5)
+            self._reader = None
+    
+    def close(self) -> None:
+        """Stop the server process."""
+        with self._session_lock:
+            if self._process is not None:
+                logger.info(f"Stopping MCP server {self.server_name}")
+            self._stop_process()
+    
+    @staticmethod
+    def _tool_text(result: Dict[str, Any]) -> str:
+        """Return the text of the first content item of a tool result, raising if the tool failed."""
+        text = (result.get('content') or [{}])[0].get('text', '')
+        if result.get('isError'):
+            raise Exception(f"{MCPClientErrorCodes.SERVER_ERROR}: {text}")
+        return text
+    
     def call_mcp_cypher_server(self, query_request: str) -> str:
         """
         Call MCP Cypher server to generate Cypher queries.
@@ -44,49 +361,11 @@ class MCPClient:
         """
         try:
             logger.info(f"Calling MCP Cypher server: {self.server_name}")
-            
-            # Create temporary file for request
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.json', delete=False) as temp_file:
-                request_data = {
-                    "method": "tools/call",
-                    "params": {
-                        "name": "write_cypher",
-                        "arguments": {
-                            "query": query_request
-                        }
-                    }
-                }
-                json.dump(request_data, temp_file, indent=2)
-                temp_file_path = temp_file.name
-            
-            try:
-                # Execute MCP server command
-                result = subprocess.run(
-                    [self.command] + self.args,
-                    input=json.dumps(request_data),
-                    text=True,
-                    capture_output=True,
-                    env=self.env,
-                    timeout=30
-                )
-                
-                if result.returncode == 0:
-                    response = json.loads(result.stdout)
-                    cypher_query = response.get('result', {}).get('content', [{}])[0].get('text', '')
-                    logger.info("MCP Cypher server call successful")
-                    return cypher_query
-                else:
-                    logger.error(f"MCP server error: {result.stderr}")
-                    return self._generate_fallback_cypher(query_request)
-                    
-            finally:
-                # Clean up temporary file
-                if os.path.exists(temp_file_path):
-                    os.unlink(temp_file_path)
-                    
-        except subprocess.TimeoutExpired:
-            logger.error("MCP server call timed out")
-            return self._generate_fallback_cypher(query_request)
+            self._ensure_healthy()
+            result = self.call_tool("write_cypher", {"query": query_request})
+            cypher_query = self._tool_text(result)
+            logger.info("MCP Cypher server call successful")
+            return cypher_query
         except Exception as e:
             logger.error(f"Error calling MCP server: {str(e)}")
             return self._generate_fallback_cypher(query_request)
@@ -104,36 +383,11 @@ class MCPClient:
         """
         try:
             logger.info(f"Calling MCP Vector Search server: {self.server_name}")
-            
-            request_data = {
-                "method": "tools/call",
-                "params": {
-                    "name": "vector_search",
-                    "arguments": {
-                        "question": question,
-                        "top_k": top_k
-                    }
-                }
-            }
-            
-            result = subprocess.run(
-                [self.command] + self.args,
-                input=json.dumps(request_data),
-                text=True,
-                capture_output=True,
-                env=self.env,
-                timeout=30
-            )
-            
-            if result.returncode == 0:
-                response = json.loads(result.stdout)
-                cypher_query = response.get('result', {}).get('content', [{}])[0].get('text', '')
-                logger.info("MCP Vector Search call successful")
-                return cypher_query
-            else:
-                logger.error(f"MCP Vector Search error: {result.stderr}")
-                return self._generate_fallback_vector_search(question, top_k)
-                
+            self._ensure_healthy()
+            result = self.call_tool("vector_search", {"question": question, "top_k": top_k})
+            cypher_query = self._tool_text(result)
+            logger.info("MCP Vector Search call successful")
+            return cypher_query
         except Exception as e:
             logger.error(f"Error calling MCP Vector Search: {str(e)}")
             return self._generate_fallback_vector_search(question, top_k)
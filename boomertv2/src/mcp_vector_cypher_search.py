@@ -6,7 +6,8 @@ A custom MCP server that combines vector similarity search with Cypher query gen
 This server:
 1. Analyzes questions to determine if they need vector search (contains "Article" or no label)
 2. Generates embeddings for vector search queries
-3. Searches Neo4j for similar chunks using vector similarity
+3. Searches Neo4j for similar chunks using vector similarity, full-text (BM25) search,
+   or both fused with reciprocal-rank fusion (hybrid mode)
 4. Generates Cypher queries for detailed data retrieval
 5. Returns both chunk results and Cypher query results separately
 
@@ -19,9 +20,13 @@ import re
 from typing import Dict, Any, List, Optional, Tuple
 import asyncio
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
 
 from sentence_transformers import SentenceTransformer
-from neo4j import GraphDatabase
+from neo4j import AsyncGraphDatabase
 
 try:
     # MCP Python SDK (FastMCP)
@@ -31,6 +36,12 @@ except Exception as e:  # pragma: no cover
         "mcp package is required. Install with `pip install mcp`."
     ) from e
 
+try:
+    from .embedding_cache import QueryEmbeddingCache
+except ImportError:
+    # Fallback for direct execution
+    from embedding_cache import QueryEmbeddingCache
+
 
 logging.basicConfig(
     level=logging.INFO,
@@ -42,6 +53,8 @@ logger = logging.getLogger("mcp-vector-cypher-search")
 SERVER_NAME = "mcp-vector-cypher-search"
 _embedding_model: SentenceTransformer | None = None
 _neo4j_driver = None
+_embedding_executor: ThreadPoolExecutor | None = None
+_embedding_model_lock = threading.Lock()
 
 
 # Configuration - these should be loaded from environment or config
@@ -50,29 +63,64 @@ NEO4J_USER = "neo4j"
 NEO4J_PASSWORD = "password123"
 VECTOR_INDEX_NAME = "chunk_embeddings"
 SIMILARITY_THRESHOLD = 0.8
+EMBEDDING_WORKERS = 2
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+EMBEDDING_CACHE_SIZE = 1024
+EMBEDDING_CACHE_TTL_SECONDS = 3600
 TOP_K_CHUNKS = 5
+FULLTEXT_INDEX_NAME = "chunk_text_fulltext"
+SEARCH_MODE = "auto"  # auto | vector | lexical | hybrid
+SEARCH_MODES = ("auto", "vector", "lexical", "hybrid")
+RRF_K = 60  # Reciprocal-rank fusion damping constant
+HYBRID_CANDIDATE_MULTIPLIER = 2  # Each hybrid branch fetches top_k * multiplier candidates
+BENCHMARK_QUERIES_PATH = str(Path(__file__).resolve().parent.parent / "config" / "search_benchmark_queries.json")
+
+# Lucene query syntax characters escaped so questions are searched as plain text
+_LUCENE_SPECIAL = re.compile(r'(&&|\|\||[+\-!(){}\[\]^"~*?:\\/])')
+
+
+_query_embedding_cache = QueryEmbeddingCache(EMBEDDING_CACHE_SIZE, EMBEDDING_CACHE_TTL_SECONDS)
 
 
 def _get_embedding_model() -> SentenceTransformer:
     """Get or initialize the embedding model."""
     global _embedding_model
-    if _embedding_model is None:
-        logger.info("Loading SentenceTransformer model: all-MiniLM-L6-v2")
-        _embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
-        logger.info("SentenceTransformer model loaded")
+    # Executor threads may request the model concurrently; load it only once
+    with _embedding_model_lock:
+        if _embedding_model is None:
+            logger.info(f"Loading SentenceTransformer model: {EMBEDDING_MODEL_NAME}")
+            _embedding_model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+            logger.info("SentenceTransformer model loaded")
     return _embedding_model
 
 
 def _get_neo4j_driver():
-    """Get or initialize Neo4j driver."""
+    """Get or initialize the async Neo4j driver."""
     global _neo4j_driver
     if _neo4j_driver is None:
         logger.info(f"Connecting to Neo4j at {NEO4J_URI}")
-        _neo4j_driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD))
+        _neo4j_driver = AsyncGraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD))
         logger.info("Neo4j driver initialized")
     return _neo4j_driver
 
 
+def _get_embedding_executor() -> ThreadPoolExecutor:
+    """Get or initialize the bounded executor that runs SentenceTransformer.encode."""
+    global _embedding_executor
+    if _embedding_executor is None:
+        _embedding_executor = ThreadPoolExecutor(max_workers=EMBEDDING_WORKERS, thread_name_prefix="embedding")
+    return _embedding_executor
+
+
+async def _timed(step_latency_ms: Dict[str, float], step: str, awaitable):
+    """Await a step and record its latency in milliseconds."""
+    start = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        step_latency_ms[step] = round((time.perf_counter() - start) * 1000, 2)
+
+
 def _should_use_vector_search(question: str) -> bool:
     """
     Determine if the question should use vector search.
@@ -101,11 +149,8 @@ def _should_use_vector_search(question: str) -> bool:
     return False
 
 
-async def _create_embedding(text: str) -> List[float]:
-    """Create embedding for the given text."""
-    if not text or not text.strip():
-        return []
-    
+def _encode_text(text: str) -> List[float]:
+    """Encode text with the embedding model (blocking; runs on the embedding executor)."""
     model = _get_embedding_model()
     embedding = model.encode([text], convert_to_tensor=False)[0]
     
@@ -115,6 +160,22 @@ async def _create_embedding(text: str) -> List[float]:
         return list(embedding)
 
 
+async def _create_embedding(text: str, use_cache: bool = True) -> List[float]:
+    """Create embedding for the given text, serving repeated questions from the query cache."""
+    if not text or not text.strip():
+        return []
+    
+    cached = _query_embedding_cache.get(EMBEDDING_MODEL_NAME, text) if use_cache else None
+    if cached is not None:
+        return cached
+    
+    start = time.perf_counter()
+    loop = asyncio.get_running_loop()
+    embedding = await loop.run_in_executor(_get_embedding_executor(), _encode_text, text)
+    _query_embedding_cache.put(EMBEDDING_MODEL_NAME, text, embedding, (time.perf_counter() - start) * 1000)
+    return embedding
+
+
 async def _search_similar_chunks(query_embedding: List[float], top_k: int = TOP_K_CHUNKS) -> List[Dict[str, Any]]:
     """
     Search for similar chunks in Neo4j using vector similarity.
@@ -136,7 +197,8 @@ async def _search_similar_chunks(query_embedding: List[float], top_k: int = TOP_
     CALL db.index.vector.queryNodes('{VECTOR_INDEX_NAME}', $top_k, $query_vector)
     YIELD node, score
     WHERE score >= $threshold
-    RETURN node.content as content, 
+    RETURN elementId(node) as node_id,
+           node.content as content, 
            node.chunk_id as chunk_id,
            node.source_id as source_id,
            node.title as title,
@@ -146,8 +208,8 @@ async def _search_similar_chunks(query_embedding: List[float], top_k: int = TOP_
     """
     
     try:
-        with driver.session() as session:
-            result = session.run(
+        async with driver.session() as session:
+            result = await session.run(
                 cypher_query,
                 query_vector=query_embedding,
                 top_k=top_k,
@@ -155,8 +217,9 @@ async def _search_similar_chunks(query_embedding: List[float], top_k: int = TOP_
             )
             
             chunks = []
-            for record in result:
+            async for record in result:
                 chunks.append({
+                    "node_id": record["node_id"],
                     "content": record["content"],
                     "chunk_id": record["chunk_id"],
                     "source_id": record["source_id"],
@@ -173,6 +236,160 @@ async def _search_similar_chunks(query_embedding: List[float], top_k: int = TOP_
         return []
 
 
+def _escape_lucene(text: str) -> str:
+    """Escape Lucene query syntax so the text is matched as plain terms."""
+    return _LUCENE_SPECIAL.sub(r"\\\1", text)
+
+
+async def _search_fulltext_chunks(question: str, top_k: int = TOP_K_CHUNKS) -> List[Dict[str, Any]]:
+    """
+    Search chunks and article titles lexically using the Neo4j full-text (BM25) index.
+    
+    Args:
+        question: The search question
+        top_k: Number of top matching nodes to return
+        
+    Returns:
+        List of matching chunks with their content, metadata and lexical score
+    """
+    query_text = _escape_lucene(question.strip())
+    if not query_text:
+        return []
+    
+    driver = _get_neo4j_driver()
+    
+    # A title hit on an Article stands for each of its chunks, with the title's score
+    cypher_query = """
+    CALL db.index.fulltext.queryNodes($index_name, $query_text, {limit: $top_k})
+    YIELD node, score
+    OPTIONAL MATCH (node:Article)-[:HAS_CHUNK]->(article_chunk:Chunk)
+    WITH CASE WHEN node:Chunk THEN node ELSE article_chunk END AS chunk, score
+    WHERE chunk IS NOT NULL
+    WITH chunk, max(score) AS score
+    RETURN elementId(chunk) as node_id,
+           coalesce(chunk.chunk_text, chunk.content) as content,
+           chunk.chunk_id as chunk_id,
+           chunk.source_id as source_id,
+           chunk.title as title,
+           chunk.url as url,
+           score
+    ORDER BY score DESC
+    LIMIT $top_k
+    """
+    
+    try:
+        async with driver.session() as session:
+            result = await session.run(
+                cypher_query,
+                index_name=FULLTEXT_INDEX_NAME,
+                query_text=query_text,
+                top_k=top_k
+            )
+            
+            chunks = []
+            async for record in result:
+                chunks.append({
+                    "node_id": record["node_id"],
+                    "content": record["content"],
+                    "chunk_id": record["chunk_id"],
+                    "source_id": record["source_id"],
+                    "title": record["title"],
+                    "url": record["url"],
+                    "lexical_score": record["score"]
+                })
+            
+            logger.info(f"Found {len(chunks)} full-text matches")
+            return chunks
+            
+    except Exception as e:
+        logger.error(f"Error searching full-text index: {e}")
+        return []
+
+
+def _reciprocal_rank_fusion(ranked_lists: Dict[str, List[Dict[str, Any]]], top_k: int,
+                            k: int = RRF_K) -> List[Dict[str, Any]]:
+    """
+    Fuse ranked result lists with reciprocal-rank fusion.
+    
+    Each result scores sum(1 / (k + rank)) over the lists it appears in, so
+    items ranked well by both searches rise to the top without having to
+    calibrate cosine similarity against BM25 scores.
+    
+    Args:
+        ranked_lists: Result lists keyed by source name, best match first
+        top_k: Number of fused results to return
+        k: Damping constant; larger values flatten the rank contribution
+        
+    Returns:
+        Fused results with rrf_score and matched_by, best first
+    """
+    fused: Dict[str, Dict[str, Any]] = {}
+    for source, results in ranked_lists.items():
+        for rank, item in enumerate(results, 1):
+            key = item.get("node_id") or item.get("chunk_id")
+            entry = fused.get(key)
+            if entry is None:
+                entry = fused[key] = dict(item, rrf_score=0.0, matched_by=[])
+            else:
+                for field, value in item.items():
+                    if entry.get(field) is None:
+                        entry[field] = value
+            entry["rrf_score"] += 1.0 / (k + rank)
+            entry["matched_by"].append(source)
+    
+    ordered = sorted(fused.values(), key=lambda entry: entry["rrf_score"], reverse=True)
+    for entry in ordered:
+        entry["rrf_score"] = round(entry["rrf_score"], 6)
+    return ordered[:top_k]
+
+
+def _resolve_search_mode(question: str, search_mode: Optional[str]) -> str:
+    """Map the requested mode to the strategy used: vector, lexical, hybrid or direct_cypher."""
+    mode = (search_mode or SEARCH_MODE).lower()
+    if mode not in SEARCH_MODES:
+        raise ValueError(f"Unknown search_mode '{search_mode}', expected one of {list(SEARCH_MODES)}")
+    if mode == "auto":
+        return "vector" if _should_use_vector_search(question) else "direct_cypher"
+    return mode
+
+
+async def _retrieve_chunks(question: str, mode: str, top_k: int, step_latency_ms: Dict[str, float],
+                           use_cache: bool = True) -> Tuple[List[float], List[Dict[str, Any]]]:
+    """
+    Retrieve chunks for a question with the given strategy.
+    
+    Args:
+        question: The search question
+        mode: "vector", "lexical" or "hybrid"
+        top_k: Number of chunks to return
+        step_latency_ms: Per-step latency is recorded here
+        use_cache: Whether the query embedding cache may be used
+        
+    Returns:
+        Tuple of (query embedding, chunks); the embedding is empty in lexical mode
+    """
+    async def run_vector(limit: int) -> Tuple[List[float], List[Dict[str, Any]]]:
+        embedding = await _timed(step_latency_ms, "embedding", _create_embedding(question, use_cache))
+        found = await _timed(step_latency_ms, "vector_search", _search_similar_chunks(embedding, limit))
+        return embedding, found
+    
+    async def run_lexical(limit: int) -> List[Dict[str, Any]]:
+        return await _timed(step_latency_ms, "lexical_search", _search_fulltext_chunks(question, limit))
+    
+    if mode == "vector":
+        return await run_vector(top_k)
+    if mode == "lexical":
+        return [], await run_lexical(top_k)
+    
+    # Hybrid: both searches run concurrently, then their rankings are fused
+    candidates = top_k * HYBRID_CANDIDATE_MULTIPLIER
+    (embedding, vector_chunks), lexical_chunks = await asyncio.gather(run_vector(candidates), run_lexical(candidates))
+    fusion_start = time.perf_counter()
+    fused = _reciprocal_rank_fusion({"vector": vector_chunks, "lexical": lexical_chunks}, top_k)
+    step_latency_ms["fusion"] = round((time.perf_counter() - fusion_start) * 1000, 2)
+    return embedding, fused
+
+
 async def _call_mcp_neo4j_cypher(question: str) -> str:
     """
     Call the external mcp-neo4j-cypher service to generate Cypher query.
@@ -233,11 +450,11 @@ async def _execute_cypher_query(cypher_query: str) -> List[Dict[str, Any]]:
     driver = _get_neo4j_driver()
     
     try:
-        with driver.session() as session:
-            result = session.run(cypher_query)
+        async with driver.session() as session:
+            result = await session.run(cypher_query)
             
             records = []
-            for record in result:
+            async for record in result:
                 records.append(dict(record))
             
             logger.info(f"Cypher query returned {len(records)} records")
@@ -252,25 +469,28 @@ mcp = FastMCP(SERVER_NAME)
 
 
 @mcp.tool()
-async def vector_cypher_search(question: str) -> Dict[str, Any]:
+async def vector_cypher_search(question: str, search_mode: Optional[str] = None) -> Dict[str, Any]:
     """
     Perform intelligent search combining vector similarity and Cypher queries.
     
     This tool analyzes the question and:
     1. If it contains "Article" or no specific labels, performs vector search for similar chunks
+       (or lexical/hybrid search when requested)
     2. Generates appropriate Cypher queries for detailed data retrieval
     3. Returns both chunk results and Cypher query results separately
     
     Args:
         question: The search question or query
+        search_mode: "auto" (default heuristic), "vector", "lexical" (full-text BM25)
+            or "hybrid" (vector and lexical fused with reciprocal-rank fusion)
         
     Returns:
         Dictionary containing:
-        - search_type: "vector" or "direct_cypher"
+        - search_type: "vector", "lexical", "hybrid" or "direct_cypher"
         - chunks: List of similar chunks (if vector search was used)
         - cypher_query: The generated Cypher query
         - cypher_results: Results from executing the Cypher query
-        - metadata: Additional information about the search
+        - metadata: Additional information about the search, including per-step latency (step_latency_ms)
     """
     if not question or not question.strip():
         return {
@@ -285,40 +505,56 @@ async def vector_cypher_search(question: str) -> Dict[str, Any]:
     logger.info(f"Processing question: {question}")
     
     # Determine search strategy
-    use_vector_search = _should_use_vector_search(question)
-    search_type = "vector" if use_vector_search else "direct_cypher"
+    try:
+        search_type = _resolve_search_mode(question, search_mode)
+    except ValueError as e:
+        return {
+            "search_type": "error",
+            "error": str(e),
+            "chunks": [],
+            "cypher_query": "",
+            "cypher_results": [],
+            "metadata": {}
+        }
+    use_vector_search = search_type in ("vector", "hybrid")
+    use_chunk_search = search_type != "direct_cypher"
     
     chunks = []
     cypher_results = []
     cypher_query = ""
+    query_embedding: List[float] = []
+    step_latency_ms: Dict[str, float] = {}
+    started = time.perf_counter()
+    
+    async def run_chunk_search() -> Tuple[List[float], List[Dict[str, Any]]]:
+        # Steps 1-2: Embed the question (off the event loop) and/or search the full-text index
+        return await _retrieve_chunks(question, search_type, TOP_K_CHUNKS, step_latency_ms)
+    
+    async def run_cypher() -> Tuple[str, List[Dict[str, Any]]]:
+        # Step 3: Generate Cypher query for detailed retrieval
+        query = await _timed(step_latency_ms, "cypher_generation", _call_mcp_neo4j_cypher(question))
+        
+        # Step 4: Execute Cypher query
+        results = []
+        if query:
+            results = await _timed(step_latency_ms, "cypher_execution", _execute_cypher_query(query))
+        return query, results
     
     try:
-        if use_vector_search:
-            logger.info("Using vector search strategy")
-            
-            # Step 1: Create embedding for the question
-            query_embedding = await _create_embedding(question)
+        if use_chunk_search:
+            logger.info(f"Using {search_type} search strategy")
             
-            # Step 2: Search for similar chunks
-            chunks = await _search_similar_chunks(query_embedding)
-            
-            # Step 3: Generate Cypher query for detailed retrieval
-            # Modify question to be more specific based on found chunks
-            if chunks:
-                chunk_ids = [chunk["chunk_id"] for chunk in chunks[:3]]  # Use top 3 chunks
-                enhanced_question = f"{question} (related to chunks: {', '.join(chunk_ids)})"
-                cypher_query = await _call_mcp_neo4j_cypher(enhanced_question)
-            else:
-                cypher_query = await _call_mcp_neo4j_cypher(question)
+            # Chunk search and Cypher generation/execution are independent, so run them concurrently
+            (query_embedding, chunks), (cypher_query, cypher_results) = await asyncio.gather(
+                run_chunk_search(), run_cypher()
+            )
         else:
             logger.info("Using direct Cypher strategy")
             
             # Direct Cypher query generation
-            cypher_query = await _call_mcp_neo4j_cypher(question)
+            cypher_query, cypher_results = await run_cypher()
         
-        # Step 4: Execute Cypher query
-        if cypher_query:
-            cypher_results = await _execute_cypher_query(cypher_query)
+        step_latency_ms["total"] = round((time.perf_counter() - started) * 1000, 2)
         
         # Prepare response
         response = {
@@ -330,8 +566,11 @@ async def vector_cypher_search(question: str) -> Dict[str, Any]:
                 "question": question,
                 "chunks_found": len(chunks),
                 "cypher_records": len(cypher_results),
+                "search_mode": search_mode or SEARCH_MODE,
                 "vector_search_used": use_vector_search,
-                "embedding_dimension": len(await _create_embedding(question)) if use_vector_search else 0
+                "lexical_search_used": search_type in ("lexical", "hybrid"),
+                "embedding_dimension": len(query_embedding),
+                "step_latency_ms": step_latency_ms
             }
         }
         
@@ -348,7 +587,8 @@ async def vector_cypher_search(question: str) -> Dict[str, Any]:
             "cypher_results": cypher_results,
             "metadata": {
                 "question": question,
-                "error_occurred": True
+                "error_occurred": True,
+                "step_latency_ms": step_latency_ms
             }
         }
 
@@ -357,7 +597,9 @@ async def vector_cypher_search(question: str) -> Dict[str, Any]:
 async def configure_search_parameters(
     similarity_threshold: Optional[float] = None,
     top_k_chunks: Optional[int] = None,
-    vector_index_name: Optional[str] = None
+    vector_index_name: Optional[str] = None,
+    search_mode: Optional[str] = None,
+    fulltext_index_name: Optional[str] = None
 ) -> Dict[str, Any]:
     """
     Configure search parameters for the vector Cypher search.
@@ -366,11 +608,13 @@ async def configure_search_parameters(
         similarity_threshold: Minimum similarity score for chunk matching (0.0-1.0)
         top_k_chunks: Maximum number of chunks to return
         vector_index_name: Name of the vector index to use
+        search_mode: Default search mode ("auto", "vector", "lexical" or "hybrid")
+        fulltext_index_name: Name of the full-text index used by lexical and hybrid search
         
     Returns:
-        Current configuration settings
+        Current configuration settings and query embedding cache statistics
     """
-    global SIMILARITY_THRESHOLD, TOP_K_CHUNKS, VECTOR_INDEX_NAME
+    global SIMILARITY_THRESHOLD, TOP_K_CHUNKS, VECTOR_INDEX_NAME, SEARCH_MODE, FULLTEXT_INDEX_NAME
     
     if similarity_threshold is not None:
         if 0.0 <= similarity_threshold <= 1.0:
@@ -390,14 +634,119 @@ async def configure_search_parameters(
         VECTOR_INDEX_NAME = vector_index_name
         logger.info(f"Updated vector index name to {vector_index_name}")
     
+    if search_mode is not None:
+        if search_mode.lower() in SEARCH_MODES:
+            SEARCH_MODE = search_mode.lower()
+            logger.info(f"Updated search mode to {SEARCH_MODE}")
+        else:
+            logger.warning(f"Invalid search mode {search_mode}, keeping current value")
+    
+    if fulltext_index_name is not None:
+        FULLTEXT_INDEX_NAME = fulltext_index_name
+        logger.info(f"Updated full-text index name to {fulltext_index_name}")
+    
     return {
         "similarity_threshold": SIMILARITY_THRESHOLD,
         "top_k_chunks": TOP_K_CHUNKS,
         "vector_index_name": VECTOR_INDEX_NAME,
-        "neo4j_uri": NEO4J_URI
+        "fulltext_index_name": FULLTEXT_INDEX_NAME,
+        "search_mode": SEARCH_MODE,
+        "neo4j_uri": NEO4J_URI,
+        "embedding_cache": _query_embedding_cache.get_stats()
     }
 
 
+
+def _percentile(values: List[float], fraction: float) -> float:
+    """Return the nearest-rank percentile of a list of values."""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))
+    return round(ordered[index], 2)
+
+
+@mcp.tool()
+async def benchmark_search_modes(
+    queries_path: Optional[str] = None,
+    modes: Optional[List[str]] = None,
+    top_k: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    Benchmark retrieval latency and recall per search mode against a fixed query set.
+    
+    The query set is a JSON file of {"queries": [{"question": ..., "expected_chunk_ids": [...],
+    "expected_titles": [...]}]}. Queries without expected results are scored against the
+    pool of everything any mode returned for them. Embeddings are computed fresh (the
+    query cache is bypassed) so vector and hybrid latency include model encoding.
+    
+    Args:
+        queries_path: Path to the query set (defaults to config/search_benchmark_queries.json)
+        modes: Modes to compare (defaults to vector, lexical and hybrid)
+        top_k: Number of chunks retrieved per query (defaults to top_k_chunks)
+        
+    Returns:
+        Per-mode latency percentiles, mean recall and empty-result counts
+    """
+    path = queries_path or BENCHMARK_QUERIES_PATH
+    modes = [mode.lower() for mode in (modes or ["vector", "lexical", "hybrid"])]
+    top_k = top_k or TOP_K_CHUNKS
+    
+    invalid = [mode for mode in modes if mode not in SEARCH_MODES or mode == "auto"]
+    if invalid:
+        return {"error": f"Unknown benchmark modes {invalid}, expected vector, lexical or hybrid"}
+    
+    try:
+        with open(path) as f:
+            queries = json.load(f).get("queries", [])
+    except Exception as e:
+        return {"error": f"Failed to load benchmark queries from {path}: {e}"}
+    
+    # Warm up the model and Neo4j caches so the first timed query is not an outlier
+    if queries:
+        for mode in modes:
+            await _retrieve_chunks(queries[0]["question"], mode, top_k, {}, use_cache=False)
+    
+    runs: Dict[str, List[Dict[str, Any]]] = {mode: [] for mode in modes}
+    for query in queries:
+        for mode in modes:
+            step_latency_ms: Dict[str, float] = {}
+            start = time.perf_counter()
+            _, chunks = await _retrieve_chunks(query["question"], mode, top_k, step_latency_ms, use_cache=False)
+            runs[mode].append({
+                "latency_ms": (time.perf_counter() - start) * 1000,
+                "found": {str(chunk.get("chunk_id")) for chunk in chunks if chunk.get("chunk_id") is not None}
+                         | {f"title:{chunk.get('title')}" for chunk in chunks if chunk.get("title")}
+            })
+    
+    results: Dict[str, Any] = {}
+    for mode in modes:
+        recalls = []
+        for index, query in enumerate(queries):
+            expected = {str(chunk_id) for chunk_id in query.get("expected_chunk_ids", [])} \
+                | {f"title:{title}" for title in query.get("expected_titles", [])}
+            if not expected:
+                # Unlabelled query: pool every mode's results as the reference set
+                expected = set().union(*(runs[other][index]["found"] for other in modes))
+            if expected:
+                recalls.append(len(runs[mode][index]["found"] & expected) / len(expected))
+        
+        latencies = [run["latency_ms"] for run in runs[mode]]
+        results[mode] = {
+            "queries": len(latencies),
+            "latency_ms": {
+                "mean": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+                "p50": _percentile(latencies, 0.5),
+                "p95": _percentile(latencies, 0.95),
+                "max": round(max(latencies), 2) if latencies else 0.0
+            },
+            "mean_recall": round(sum(recalls) / len(recalls), 4) if recalls else None,
+            "empty_results": sum(1 for run in runs[mode] if not run["found"])
+        }
+    
+    return {"queries_path": path, "top_k": top_k, "modes": results}
+
+
 if __name__ == "__main__":
     logger.info("Starting MCP stdio server: %s", SERVER_NAME)
     mcp.run(transport="stdio")
\ No newline at end of file
@@ -8,14 +8,17 @@ Usage:
 """
 
 import sys
+import hashlib
 import logging
 import json
 import subprocess
 import tempfile
 import os
-import uuid
+import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
+from typing import Dict, List, Any, Optional, Tuple, Callable
 import argparse
 from pathlib import Path
 from neo4j import GraphDatabase
@@ -48,6 +51,19 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Upper bounds (milliseconds) and labels for the per-statement Cypher latency histograms
+CYPHER_LATENCY_BUCKETS_MS = [
+    (1, "le_1ms"),
+    (5, "le_5ms"),
+    (10, "le_10ms"),
+    (25, "le_25ms"),
+    (50, "le_50ms"),
+    (100, "le_100ms"),
+    (250, "le_250ms"),
+    (1000, "le_1s"),
+    (float("inf"), "gt_1s")
+]
+
 # Extended error codes for Neo4j data loading
 class Neo4jLoaderErrorCodes:
     NEO4J_CONNECTION_ERROR = "ERR_L001"
@@ -89,6 +105,20 @@ class Neo4jDataLoader(PostgresQueryRunner):
         self.cypher_usage: Dict[Tuple[str, str, str], int] = {}
         # Store Postgres records without the 'content' field for metrics
         self.postgres_records_wo_content: List[Dict[str, Any]] = []
+        # Set-based (UNWIND) write settings
+        self.bulk_write = False
+        self.write_sub_batch_size = 500
+        # Guards metric counters that may be updated from pipeline worker threads
+        self._metrics_lock = threading.RLock()
+        # Driver pool sizing and write-scope settings
+        self.neo4j_pool_size: Optional[int] = None
+        self.neo4j_fetch_size: Optional[int] = None
+        self.write_scope_max_statements = 1000
+        # Per-thread session/transaction used by write_scope()
+        self._write_scope = threading.local()
+        # Per-statement latency histograms
+        # Key: (category, name) -> {"count", "total_ms", "max_ms", "histogram"}
+        self.cypher_latency: Dict[Tuple[str, str], Dict[str, Any]] = {}
         logger.info("Neo4j Data Loader initialized")
     
     def load_neo4j_model(self, model_path: str) -> Dict[str, Any]:
@@ -136,7 +166,8 @@ class Neo4jDataLoader(PostgresQueryRunner):
             uri = f"bolt://{neo4j_config['host']}:{neo4j_config['port']}"
             self.neo4j_driver = GraphDatabase.driver(
                 uri,
-                auth=(neo4j_config['user'], neo4j_config['password'])
+                auth=(neo4j_config['user'], neo4j_config['password']),
+                **self.neo4j_driver_options()
             )
             
             # Test connection
@@ -163,7 +194,28 @@ class Neo4jDataLoader(PostgresQueryRunner):
             logger.error(error_msg)
             raise Exception(error_msg) from e
     
-    def chunk_text_content(self, text: str, chunk_size: int = 512, overlap: int = 50, use_llm: bool = True) -> List[Dict[str, Any]]:
+    @staticmethod
+    def make_chunk_id(source_id: Any, chunk_order: int, chunk_text: str) -> str:
+        """
+        Build a content-addressed chunk ID.
+        
+        The same article, position and text always produce the same ID, so
+        reloading unchanged content MERGEs onto the existing Chunk nodes.
+        
+        Args:
+            source_id: ID of the record the chunk came from (None if unknown)
+            chunk_order: Position of the chunk within the record
+            chunk_text: Chunk text
+            
+        Returns:
+            Chunk ID string
+        """
+        text_hash = hashlib.sha256(chunk_text.encode('utf-8')).hexdigest()
+        digest = hashlib.sha256(f"{source_id}:{chunk_order}:{text_hash}".encode('utf-8')).hexdigest()
+        return f"chunk_{digest[:24]}"
+    
+    def chunk_text_content(self, text: str, chunk_size: int = 512, overlap: int = 50, use_llm: bool = True,
+                           source_id: Any = None) -> List[Dict[str, Any]]:
         """
         Chunk text content for vector embeddings using LLM-based intelligent chunking.
         
@@ -172,6 +224,7 @@ class Neo4jDataLoader(PostgresQueryRunner):
             chunk_size: Size of each chunk in characters
             overlap: Overlap between chunks
             use_llm: Whether to use LLM for intelligent chunking
+            source_id: ID of the source record, used to derive chunk IDs
             
         Returns:
             List of chunk dictionaries with chunk_id, chunk_text, and position
@@ -189,6 +242,10 @@ class Neo4jDataLoader(PostgresQueryRunner):
             else:
                 chunks = self._chunk_simple(text, chunk_size, overlap)
             
+            if source_id is not None:
+                for chunk in chunks:
+                    chunk['chunk_id'] = self.make_chunk_id(source_id, chunk['chunk_order'], chunk['chunk_text'])
+            
             logger.info(f"Created {len(chunks)} chunks from text")
             return chunks
             
@@ -262,7 +319,7 @@ class Neo4jDataLoader(PostgresQueryRunner):
                         continue
                     
                     if chunk_text:
-                        chunk_id = str(uuid.uuid4())
+                        chunk_id = self.make_chunk_id(None, i, chunk_text)
                         chunks.append({
                             'chunk_id': chunk_id,
                             'chunk_text': chunk_text,
@@ -313,7 +370,7 @@ class Neo4jDataLoader(PostgresQueryRunner):
             
             chunk_text = text[start:end].strip()
             if chunk_text:
-                chunk_id = str(uuid.uuid4())
+                chunk_id = self.make_chunk_id(None, len(chunks), chunk_text)
                 chunks.append({
                     'chunk_id': chunk_id,
                     'chunk_text': chunk_text,
@@ -330,7 +387,8 @@ class Neo4jDataLoader(PostgresQueryRunner):
     def _record_cypher(self, category: str, name: str, cypher: str) -> None:
         """Record a cypher template and increment execution count for metrics."""
         key = (category, name, cypher.strip())
-        self.cypher_usage[key] = self.cypher_usage.get(key, 0) + 1
+        with self._metrics_lock:
+            self.cypher_usage[key] = self.cypher_usage.get(key, 0) + 1
 
     def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
         """
@@ -467,6 +525,296 @@ class Neo4jDataLoader(PostgresQueryRunner):
             error_msg = f"{Neo4jLoaderErrorCodes.NEO4J_EXECUTION_ERROR}: Error executing Cypher query: {str(e)}"
             logger.error(error_msg)
             raise Exception(error_msg) from e
+
+    def configure_neo4j_performance(self, performance_config: Dict[str, Any]) -> None:
+        """
+        Read driver pool sizing and write-scope settings.
+        
+        Args:
+            performance_config: Performance section of the loader configuration
+        """
+        pool_size = performance_config.get('max_connection_pool_size', performance_config.get('connection_pool_size'))
+        fetch_size = performance_config.get('fetch_size')
+        self.neo4j_pool_size = int(pool_size) if pool_size else None
+        self.neo4j_fetch_size = int(fetch_size) if fetch_size else None
+        self.write_scope_max_statements = max(
+            1, int(performance_config.get('write_transaction_max_statements', self.write_scope_max_statements))
+        )
+    
+    def neo4j_driver_options(self) -> Dict[str, Any]:
+        """Return the configured keyword options for GraphDatabase.driver."""
+        options = {}
+        if self.neo4j_pool_size:
+            options['max_connection_pool_size'] = self.neo4j_pool_size
+        if self.neo4j_fetch_size:
+            options['fetch_size'] = self.neo4j_fetch_size
+        return options
+    
+    @contextmanager
+    def write_scope(self):
+        """
+        Run the writes issued by this thread inside a reused session and explicit transaction.
+        
+        execute_cypher_write calls made inside the scope share one session and
+        are committed together every write_scope_max_statements statements and
+        when the scope exits. Nested scopes reuse the outer one.
+        Neo4j rejects further statements in a transaction after one fails, so a
+        failed statement rolls the transaction back and replays and commits the
+        statements that succeeded before it; callers can keep counting per-row
+        failures.
+        """
+        if getattr(self._write_scope, 'state', None) is not None or not self.neo4j_driver:
+            # Without a driver each write fails on its own, as it would outside a scope
+            yield
+            return
+        
+        state = {"session": self.neo4j_driver.session(), "tx": None, "pending": []}
+        self._write_scope.state = state
+        try:
+            yield
+            self._commit_write_scope(state)
+        except Exception:
+            self._rollback_write_scope(state)
+            raise
+        finally:
+            self._write_scope.state = None
+            state["session"].close()
+    
+    def _commit_write_scope(self, state: Dict[str, Any]) -> None:
+        """Commit the open write-scope transaction, if any."""
+        if state["tx"] is not None:
+            state["tx"].commit()
+            state["tx"] = None
+            state["pending"] = []
+    
+    def _rollback_write_scope(self, state: Dict[str, Any]) -> None:
+        """Roll back the open write-scope transaction, if any."""
+        tx = state["tx"]
+        state["tx"] = None
+        state["pending"] = []
+        if tx is not None:
+            try:
+                tx.rollback()
+            except Exception as e:
+                logger.warning(f"Write scope rollback failed: {str(e)}")
+    
+    def _run_in_write_scope(self, state: Dict[str, Any], cypher: str, parameters: Dict[str, Any]) -> Any:
+        """Run one statement in the write-scope transaction and return its summary."""
+        if state["tx"] is None:
+            state["tx"] = state["session"].begin_transaction()
+        try:
+            summary = state["tx"].run(cypher, parameters).consume()
+        except Exception as e:
+            # Replay the statements that succeeded before the failed one
+            pending = state["pending"]
+            self._rollback_write_scope(state)
+            try:
+                self._replay_write_statements(state["session"], pending)
+            except Exception as replay_error:
+                raise e from replay_error
+            raise
+        
+        state["pending"].append((cypher, parameters))
+        if len(state["pending"]) >= self.write_scope_max_statements:
+            self._commit_write_scope(state)
+        return summary
+    
+    def _replay_write_statements(self, session: Any, statements: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """
+        Re-apply statements lost to a rollback and commit them.
+        
+        The replay is committed straight away so later failures in the scope
+        never replay the same statements again. If the replay itself fails it
+        is bisected, so only a statement that now fails on its own is dropped.
+        """
+        if not statements:
+            return
+        
+        tx = session.begin_transaction()
+        try:
+            for pending_cypher, pending_parameters in statements:
+                tx.run(pending_cypher, pending_parameters).consume()
+            tx.commit()
+            return
+        except Exception as e:
+            try:
+                tx.rollback()
+            except Exception as rollback_error:
+                logger.warning(f"Write scope rollback failed: {str(rollback_error)}")
+            if len(statements) == 1:
+                logger.error(f"{Neo4jLoaderErrorCodes.NEO4J_EXECUTION_ERROR}: Replayed write dropped: {str(e)}")
+                return
+        
+        middle = len(statements) // 2
+        self._replay_write_statements(session, statements[:middle])
+        self._replay_write_statements(session, statements[middle:])
+    
+    def execute_cypher_write(self, cypher: str, parameters: Dict[str, Any] = None,
+                             category: str = "writes", name: str = "statement") -> Dict[str, Any]:
+        """
+        Execute a write statement without materializing result records.
+        
+        Inside write_scope() the statement joins the scope's transaction;
+        otherwise it runs in its own managed write transaction.
+        
+        Args:
+            cypher: Cypher statement
+            parameters: Statement parameters
+            category: Cypher usage category for latency metrics
+            name: Label or relationship type for latency metrics
+            
+        Returns:
+            Dictionary with an empty records list and the summary counters
+        """
+        if not self.neo4j_driver:
+            raise Exception("Neo4j connection not established")
+        
+        start_time = time.perf_counter()
+        try:
+            state = getattr(self._write_scope, 'state', None)
+            if state is not None:
+                summary = self._run_in_write_scope(state, cypher, parameters or {})
+            else:
+                summary = self.execute_write_transaction(cypher, parameters)
+        except Exception as e:
+            error_msg = f"{Neo4jLoaderErrorCodes.NEO4J_EXECUTION_ERROR}: Error executing Cypher write: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg) from e
+        finally:
+            self._observe_cypher_latency(category, name, time.perf_counter() - start_time)
+        
+        return {
+            "records": [],
+            "summary": {
+                "nodes_created": self._summary_count(summary, 'nodes_created'),
+                "relationships_created": self._summary_count(summary, 'relationships_created'),
+                "properties_set": self._summary_count(summary, 'properties_set'),
+                "labels_added": self._summary_count(summary, 'labels_added')
+            }
+        }
+    
+    def _observe_cypher_latency(self, category: str, name: str, seconds: float) -> None:
+        """Add a statement latency to the (category, name) histogram."""
+        elapsed_ms = seconds * 1000
+        with self._metrics_lock:
+            stats = self.cypher_latency.setdefault((category, name), {
+                "count": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "histogram": {label: 0 for _, label in CYPHER_LATENCY_BUCKETS_MS}
+            })
+            stats["count"] += 1
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
+            for upper_bound, label in CYPHER_LATENCY_BUCKETS_MS:
+                if elapsed_ms <= upper_bound:
+                    stats["histogram"][label] += 1
+                    break
+    
+    def execute_write_statements(self, statements: List[Tuple[str, Dict[str, Any]]]) -> List[Any]:
+        """
+        Execute several write statements inside a single managed write transaction.
+        
+        The driver retries the transaction on transient errors; if any statement
+        fails the whole transaction is rolled back.
+        
+        Args:
+            statements: List of (cypher, parameters) tuples
+            
+        Returns:
+            List of result summaries, one per statement
+        """
+        if not self.neo4j_driver:
+            raise Exception("Neo4j connection not established")
+        
+        # Earlier scoped writes must be visible to this separate transaction
+        state = getattr(self._write_scope, 'state', None)
+        if state is not None:
+            self._commit_write_scope(state)
+        
+        def _work(tx):
+            return [tx.run(cypher, parameters or {}).consume() for cypher, parameters in statements]
+        
+        with self.neo4j_driver.session() as session:
+            return session.execute_write(_work)
+
+    def execute_write_transaction(self, cypher: str, parameters: Dict[str, Any] = None) -> Any:
+        """Execute a single write statement inside one managed write transaction."""
+        return self.execute_write_statements([(cypher, parameters)])[0]
+
+    @staticmethod
+    def _summary_count(summary: Any, counter_name: str) -> int:
+        """Read a counter from a result summary, tolerating missing counters."""
+        value = getattr(getattr(summary, 'counters', None), counter_name, 0)
+        return value if isinstance(value, int) else 0
+
+    @staticmethod
+    def _dedupe_rows(rows: List[Dict[str, Any]], key_fields: List[str]) -> List[Dict[str, Any]]:
+        """Drop rows whose key fields repeat an earlier row, keeping first-seen order."""
+        seen = set()
+        unique_rows = []
+        for row in rows:
+            key = tuple(repr(row.get(field)) for field in key_fields)
+            if key in seen:
+                continue
+            seen.add(key)
+            unique_rows.append(row)
+        return unique_rows
+
+    def write_unwind_batches(self, category: str, name: str,
+                             build_statements: Callable[[List[Dict[str, Any]]], List[Tuple[str, Dict[str, Any]]]],
+                             rows: List[Dict[str, Any]],
+                             on_row_failure: Optional[Callable[[int, str], None]] = None) -> Dict[str, int]:
+        """
+        Write rows in sub-batches of UNWIND statements, one write transaction per sub-batch.
+        
+        A failing sub-batch is bisected until the failing rows are isolated, so
+        per-row failures can still be attributed through ``on_row_failure``.
+        
+        Args:
+            category: Cypher usage category ('nodes' or 'relationships')
+            name: Label or relationship type for metrics
+            build_statements: Builds the (cypher, parameters) statements for a sub-batch of rows
+            rows: Parameter rows
+            on_row_failure: Called with (row index, error) for each row that could not be written
+            
+        Returns:
+            Dictionary with rows_written, rows_failed, nodes_created and relationships_created
+        """
+        totals = {"rows_written": 0, "rows_failed": 0, "nodes_created": 0, "relationships_created": 0}
+        sub_batch_size = max(1, self.write_sub_batch_size)
+        for start in range(0, len(rows), sub_batch_size):
+            end = min(start + sub_batch_size, len(rows))
+            self._write_unwind_slice(category, name, build_statements, rows, start, end, on_row_failure, totals)
+        return totals
+
+    def _write_unwind_slice(self, category: str, name: str,
+                            build_statements: Callable[[List[Dict[str, Any]]], List[Tuple[str, Dict[str, Any]]]],
+                            rows: List[Dict[str, Any]], start: int, end: int,
+                            on_row_failure: Optional[Callable[[int, str], None]],
+                            totals: Dict[str, int]) -> None:
+        """Write rows[start:end] in one transaction, bisecting on failure."""
+        statements = build_statements(rows[start:end])
+        start_time = time.perf_counter()
+        try:
+            summaries = self.execute_write_statements(statements)
+            self._observe_cypher_latency(category, name, time.perf_counter() - start_time)
+            for cypher, _ in statements:
+                self._record_cypher(category, name, cypher)
+            totals["rows_written"] += end - start
+            for summary in summaries:
+                totals["nodes_created"] += self._summary_count(summary, 'nodes_created')
+                totals["relationships_created"] += self._summary_count(summary, 'relationships_created')
+        except Exception as e:
+            if end - start == 1:
+                totals["rows_failed"] += 1
+                if on_row_failure:
+                    on_row_failure(start, str(e))
+                return
+            # The failed transaction was rolled back, so both halves can be retried safely
+            mid = (start + end) // 2
+            self._write_unwind_slice(category, name, build_statements, rows, start, mid, on_row_failure, totals)
+            self._write_unwind_slice(category, name, build_statements, rows, mid, end, on_row_failure, totals)
  
     def process_vector_embeddings(self, data_records: List[Dict[str, Any]], model: Dict[str, Any], config: Dict[str, Any] = None) -> List[Dict[str, Any]]:
         """
@@ -531,7 +879,8 @@ class Neo4jDataLoader(PostgresQueryRunner):
                         use_llm_chunking = embedding_config.get('use_llm_chunking', True)
                     
                     # Chunk the content
-                    chunks = self.chunk_text_content(content_text, chunk_size, chunk_overlap, use_llm_chunking)
+                    chunks = self.chunk_text_content(content_text, chunk_size, chunk_overlap, use_llm_chunking,
+                                                     source_id=record.get('id'))
                     
                     if chunks:
                         # Generate embeddings for chunks
@@ -645,7 +994,7 @@ class Neo4jDataLoader(PostgresQueryRunner):
                             """
                             params = {"name": author_value}
                             self._record_cypher('nodes', 'Author', cypher)
-                            result = self.execute_cypher_query(cypher, params)
+                            result = self.execute_cypher_write(cypher, params, 'nodes', 'Author')
                             nodes_created += result['summary']['nodes_created']
                             continue
 
@@ -682,7 +1031,7 @@ class Neo4jDataLoader(PostgresQueryRunner):
                             }
                             
                             self._record_cypher('nodes', node_label, cypher)
-                            result = self.execute_cypher_query(cypher, parameters)
+                            result = self.execute_cypher_write(cypher, parameters, 'nodes', node_label)
                             nodes_created += result['summary']['nodes_created']
                         
                     except Exception as e:
@@ -711,6 +1060,10 @@ class Neo4jDataLoader(PostgresQueryRunner):
         """
         logger.info("Loading relationships to Neo4j")
         
+        if self.bulk_write:
+            self.load_relationships_bulk(data_records, model)
+            return
+        
         try:
             for rel_config in model.get('relationships', []):
                 rel_type = rel_config['type']
@@ -755,7 +1108,7 @@ class Neo4jDataLoader(PostgresQueryRunner):
                             }
                             
                             self._record_cypher('relationships', rel_type, cypher)
-                            result = self.execute_cypher_query(cypher, parameters)
+                            result = self.execute_cypher_write(cypher, parameters, 'relationships', rel_type)
                             relationships_created += result['summary']['relationships_created']
                     
                     except Exception as e:
@@ -778,6 +1131,9 @@ class Neo4jDataLoader(PostgresQueryRunner):
         """Create HAS_CHUNK relationships between Article and Chunk nodes using chunk metadata."""
         if not chunk_records:
             return
+        if self.bulk_write:
+            self.load_chunk_relationships_bulk(chunk_records)
+            return
         logger.info("Creating HAS_CHUNK relationships from chunk records")
         try:
             rel_type = 'HAS_CHUNK'
@@ -798,7 +1154,7 @@ class Neo4jDataLoader(PostgresQueryRunner):
                         'chunk_position': rec.get('chunk_position'),
                     }
                     self._record_cypher('relationships', 'HAS_CHUNK', cypher)
-                    result = self.execute_cypher_query(cypher, params)
+                    result = self.execute_cypher_write(cypher, params, 'relationships', 'HAS_CHUNK')
                     relationships_created += result['summary']['relationships_created']
                 except Exception as e:
                     relationships_failed += 1
@@ -817,6 +1173,9 @@ class Neo4jDataLoader(PostgresQueryRunner):
 
     def load_tag_nodes_and_relationships(self, data_records: List[Dict[str, Any]]) -> None:
         """Create Tag nodes from 'tags' array and TAGGED_WITH relationships to Article."""
+        if self.bulk_write:
+            self.load_tag_nodes_and_relationships_bulk(data_records)
+            return
         logger.info("Creating Tag nodes and TAGGED_WITH relationships")
         try:
             nodes_created = 0
@@ -842,7 +1201,7 @@ class Neo4jDataLoader(PostgresQueryRunner):
                         MERGE (t:Tag {tag_name: $tag_name})
                         """
                         self._record_cypher('nodes', 'Tag', cy_node)
-                        res_node = self.execute_cypher_query(cy_node, {"tag_name": tag_name})
+                        res_node = self.execute_cypher_write(cy_node, {"tag_name": tag_name}, 'nodes', 'Tag')
                         nodes_created += res_node['summary']['nodes_created']
 
                         cy_rel = """
@@ -851,7 +1210,8 @@ class Neo4jDataLoader(PostgresQueryRunner):
                         MERGE (a)-[r:TAGGED_WITH]->(t)
                         """
                         self._record_cypher('relationships', 'TAGGED_WITH', cy_rel)
-                        res_rel = self.execute_cypher_query(cy_rel, {"article_id": article_id, "tag_name": tag_name})
+                        res_rel = self.execute_cypher_write(cy_rel, {"article_id": article_id, "tag_name": tag_name},
+                                                            'relationships', 'TAGGED_WITH')
                         rels_created += res_rel['summary']['relationships_created']
                     except Exception as e:
                         # track failure
@@ -878,6 +1238,9 @@ class Neo4jDataLoader(PostgresQueryRunner):
 
     def load_written_by_relationships(self, data_records: List[Dict[str, Any]]) -> None:
         """Create WRITTEN_BY relationships using record['author'] to Author{name} and Article{id}."""
+        if self.bulk_write:
+            self.load_written_by_relationships_bulk(data_records)
+            return
         logger.info("Creating WRITTEN_BY relationships")
         try:
             created = 0
@@ -897,7 +1260,7 @@ class Neo4jDataLoader(PostgresQueryRunner):
                     """
                     params = {"article_id": article_id, "author": author, "publish_date": publish_date}
                     self._record_cypher('relationships', 'WRITTEN_BY', cy)
-                    res = self.execute_cypher_query(cy, params)
+                    res = self.execute_cypher_write(cy, params, 'relationships', 'WRITTEN_BY')
                     created += res['summary']['relationships_created']
                 except Exception as e:
                     failed += 1
@@ -914,6 +1277,265 @@ class Neo4jDataLoader(PostgresQueryRunner):
             logger.error(error_msg)
             raise Exception(error_msg) from e
  
+    def _accumulate_load_metric(self, bucket: str, key: str, count: int) -> None:
+        """Add a count to a per-label/per-type load metric."""
+        with self._metrics_lock:
+            self.load_metrics[bucket].setdefault(key, 0)
+            self.load_metrics[bucket][key] += count
+
+    def _on_relationship_row_failure(self, relationship_type: str, source_data: Dict[str, Any],
+                                     target_data: Dict[str, Any], error: str) -> None:
+        """Record a relationship row that could not be written by the set-based loader."""
+        err = f"Failed to create {relationship_type} relationship {source_data} -> {target_data}: {error}"
+        logger.error(err)
+        self.load_metrics["errors"].append(err)
+
+    @staticmethod
+    def _normalize_tags(tags_value: Any) -> List[str]:
+        """Normalize a 'tags' value (comma-separated string or list) to a list of tag names."""
+        if isinstance(tags_value, str):
+            return [t.strip() for t in tags_value.split(',') if t.strip()]
+        if isinstance(tags_value, list):
+            return [str(t).strip() for t in tags_value if str(t).strip()]
+        return []
+
+    def load_relationships_bulk(self, data_records: List[Dict[str, Any]], model: Dict[str, Any]) -> None:
+        """
+        Load model relationships with one UNWIND statement per relationship type per sub-batch.
+        
+        (start, end) pairs are deduplicated per batch before being sent to Neo4j.
+        Relationships involving Chunk nodes are handled by load_chunk_relationships.
+        
+        Args:
+            data_records: List of data records from PostgreSQL
+            model: Neo4j model configuration
+        """
+        logger.info(f"Bulk loading relationships for {len(data_records)} records")
+        
+        try:
+            for rel_config in model.get('relationships', []):
+                rel_type = rel_config.get('type')
+                start_node = rel_config.get('start_node')
+                end_node = rel_config.get('end_node')
+                start_property = rel_config.get('start_property')
+                end_property = rel_config.get('end_property')
+                
+                if not all([rel_type, start_node, end_node, start_property, end_property]):
+                    continue
+                if rel_type == 'HAS_CHUNK' or 'Chunk' in [start_node, end_node]:
+                    continue
+                
+                rows = []
+                for record in data_records:
+                    start_value = record.get(start_property)
+                    end_value = record.get(end_property)
+                    if start_value is None or end_value is None:
+                        continue
+                    rel_properties = {}
+                    for prop in rel_config.get('properties', []):
+                        prop_name = prop['name']
+                        if prop_name in record and record[prop_name] is not None:
+                            rel_properties[prop_name] = record[prop_name]
+                    rows.append({'start': start_value, 'end': end_value, 'properties': rel_properties})
+                
+                rows = self._dedupe_rows(rows, ['start', 'end'])
+                if not rows:
+                    continue
+                
+                cypher = f"""
+                UNWIND $rows AS row
+                MATCH (start:{start_node} {{{start_property}: row.start}})
+                MATCH (end:{end_node} {{{end_property}: row.end}})
+                MERGE (start)-[r:{rel_type}]->(end)
+                SET r += row.properties
+                """
+                
+                totals = self.write_unwind_batches(
+                    'relationships', rel_type,
+                    lambda batch: [(cypher, {'rows': batch})],
+                    rows,
+                    on_row_failure=lambda i, err: self._on_relationship_row_failure(
+                        rel_type, {start_property: rows[i]['start']}, {end_property: rows[i]['end']}, err
+                    )
+                )
+                
+                self._accumulate_load_metric("relationships_created", rel_type, totals["relationships_created"])
+                self._accumulate_load_metric("relationships_failed", rel_type, totals["rows_failed"])
+                logger.info(f"Completed {rel_type} relationships: {totals['relationships_created']} created from {len(rows)} unique pairs, {totals['rows_failed']} failed")
+                
+        except Exception as e:
+            error_msg = f"{Neo4jLoaderErrorCodes.NEO4J_EXECUTION_ERROR}: Error bulk loading relationships: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg) from e
+
+    def load_chunk_relationships_bulk(self, chunk_records: List[Dict[str, Any]], article_id_field: str = 'content_id') -> None:
+        """
+        Create HAS_CHUNK relationships with one UNWIND statement per sub-batch.
+        
+        Args:
+            chunk_records: List of chunk records
+            article_id_field: Chunk record field holding the parent Article id
+        """
+        logger.info(f"Bulk creating HAS_CHUNK relationships for {len(chunk_records)} chunks")
+        
+        try:
+            rows = []
+            for rec in chunk_records:
+                article_id = rec.get(article_id_field)
+                chunk_id = rec.get('chunk_id')
+                if not article_id or not chunk_id:
+                    continue
+                rows.append({'article_id': article_id, 'chunk_id': chunk_id, 'chunk_order': rec.get('chunk_order', 0)})
+            
+            rows = self._dedupe_rows(rows, ['article_id', 'chunk_id'])
+            if not rows:
+                return
+            
+            cypher = """
+            UNWIND $rows AS row
+            MATCH (start:Article {id: row.article_id})
+            MATCH (end:Chunk {chunk_id: row.chunk_id})
+            MERGE (start)-[r:HAS_CHUNK]->(end)
+            SET r.chunk_order = row.chunk_order
+            """
+            
+            totals = self.write_unwind_batches(
+                'relationships', 'HAS_CHUNK',
+                lambda batch: [(cypher, {'rows': batch})],
+                rows,
+                on_row_failure=lambda i, err: self._on_relationship_row_failure(
+                    'HAS_CHUNK', {'id': rows[i]['article_id']}, {'chunk_id': rows[i]['chunk_id']}, err
+                )
+            )
+            
+            self._accumulate_load_metric("relationships_created", 'HAS_CHUNK', totals["relationships_created"])
+            self._accumulate_load_metric("relationships_failed", 'HAS_CHUNK', totals["rows_failed"])
+            logger.info(f"Completed HAS_CHUNK relationships: {totals['relationships_created']} created, {totals['rows_failed']} failed")
+            
+        except Exception as e:
+            error_msg = f"{Neo4jLoaderErrorCodes.NEO4J_EXECUTION_ERROR}: Error bulk loading HAS_CHUNK relationships: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg) from e
+
+    def load_tag_nodes_and_relationships_bulk(self, data_records: List[Dict[str, Any]]) -> None:
+        """
+        Create Tag nodes and TAGGED_WITH relationships set-based.
+        
+        Each sub-batch MERGEs its distinct tag names once and then writes all of its
+        (article, tag) pairs with a single UNWIND, both in the same transaction.
+        
+        Args:
+            data_records: List of data records
+        """
+        logger.info("Bulk creating Tag nodes and TAGGED_WITH relationships")
+        
+        try:
+            rows = []
+            for rec in data_records:
+                article_id = rec.get('id')
+                if not article_id:
+                    continue
+                for tag_name in self._normalize_tags(rec.get('tags')):
+                    rows.append({'article_id': article_id, 'tag_name': tag_name})
+            
+            rows = self._dedupe_rows(rows, ['article_id', 'tag_name'])
+            if not rows:
+                return
+            
+            cy_node = """
+            UNWIND $tags AS tag_name
+            MERGE (t:Tag {tag_name: tag_name})
+            """
+            cy_rel = """
+            UNWIND $rows AS row
+            MATCH (a:Article {id: row.article_id})
+            MATCH (t:Tag {tag_name: row.tag_name})
+            MERGE (a)-[r:TAGGED_WITH]->(t)
+            """
+            
+            def build_statements(batch):
+                tags = list(dict.fromkeys(row['tag_name'] for row in batch))
+                return [(cy_node, {'tags': tags}), (cy_rel, {'rows': batch})]
+            
+            totals = self.write_unwind_batches(
+                'relationships', 'TAGGED_WITH',
+                build_statements,
+                rows,
+                on_row_failure=lambda i, err: self._on_relationship_row_failure(
+                    'TAGGED_WITH', {'id': rows[i]['article_id']}, {'tag_name': rows[i]['tag_name']}, err
+                )
+            )
+            
+            self._accumulate_load_metric("nodes_created", 'Tag', totals["nodes_created"])
+            self._accumulate_load_metric("relationships_created", 'TAGGED_WITH', totals["relationships_created"])
+            self._accumulate_load_metric("relationships_failed", 'TAGGED_WITH', totals["rows_failed"])
+            logger.info(f"Completed Tag nodes and TAGGED_WITH: {totals['nodes_created']} tags, {totals['relationships_created']} relationships created")
+            
+        except Exception as e:
+            error_msg = f"{Neo4jLoaderErrorCodes.NEO4J_EXECUTION_ERROR}: Error bulk loading tags: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg) from e
+
+    def load_written_by_relationships_bulk(self, data_records: List[Dict[str, Any]]) -> None:
+        """
+        Create Author nodes and WRITTEN_BY relationships set-based.
+        
+        Each sub-batch MERGEs its distinct authors once and then writes all of its
+        (article, author) pairs with a single UNWIND, both in the same transaction.
+        
+        Args:
+            data_records: List of data records
+        """
+        logger.info("Bulk creating WRITTEN_BY relationships")
+        
+        try:
+            rows = []
+            for rec in data_records:
+                author = rec.get('author')
+                article_id = rec.get('id')
+                if not author or not article_id:
+                    continue
+                rows.append({'article_id': article_id, 'author': author, 'publish_date': rec.get('publish_date')})
+            
+            rows = self._dedupe_rows(rows, ['article_id', 'author'])
+            if not rows:
+                return
+            
+            cy_node = """
+            UNWIND $authors AS author_name
+            MERGE (auth:Author {name: author_name})
+            """
+            cy_rel = """
+            UNWIND $rows AS row
+            MATCH (a:Article {id: row.article_id})
+            MATCH (auth:Author {name: row.author})
+            MERGE (a)-[r:WRITTEN_BY]->(auth)
+            SET r.publish_date = row.publish_date
+            """
+            
+            def build_statements(batch):
+                authors = list(dict.fromkeys(row['author'] for row in batch))
+                return [(cy_node, {'authors': authors}), (cy_rel, {'rows': batch})]
+            
+            totals = self.write_unwind_batches(
+                'relationships', 'WRITTEN_BY',
+                build_statements,
+                rows,
+                on_row_failure=lambda i, err: self._on_relationship_row_failure(
+                    'WRITTEN_BY', {'id': rows[i]['article_id']}, {'name': rows[i]['author']}, err
+                )
+            )
+            
+            self._accumulate_load_metric("nodes_created", 'Author', totals["nodes_created"])
+            self._accumulate_load_metric("relationships_created", 'WRITTEN_BY', totals["relationships_created"])
+            self._accumulate_load_metric("relationships_failed", 'WRITTEN_BY', totals["rows_failed"])
+            logger.info(f"Completed WRITTEN_BY relationships: {totals['relationships_created']} created, {totals['rows_failed']} failed")
+            
+        except Exception as e:
+            error_msg = f"{Neo4jLoaderErrorCodes.NEO4J_EXECUTION_ERROR}: Error bulk loading WRITTEN_BY relationships: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg) from e
+
     def write_load_metrics(self, metrics_file: str) -> None:
         """
         Write load metrics to file.
@@ -985,6 +1607,16 @@ class Neo4jDataLoader(PostgresQueryRunner):
                         file.write(f"[{category}] {name} (executed {count}x)\n")
                         file.write(cypher_text.strip() + "\n\n")
 
+                # Cypher latency per statement category
+                if self.cypher_latency:
+                    file.write(f"\nCYPHER LATENCY:\n")
+                    file.write("-" * 15 + "\n")
+                    for (category, name), stats in sorted(self.cypher_latency.items()):
+                        avg_ms = stats["total_ms"] / stats["count"] if stats["count"] else 0.0
+                        buckets = ", ".join(f"{label}={count}" for label, count in stats["histogram"].items() if count)
+                        file.write(f"[{category}] {name}: {stats['count']} statements, avg {avg_ms:.2f}ms, "
+                                   f"max {stats['max_ms']:.2f}ms ({buckets})\n")
+
                 # Postgres records (excluding 'content')
                 if self.postgres_records_wo_content:
                     file.write(f"\nPOSTGRES RECORDS (excluding 'content'):\n")
@@ -1023,6 +1655,12 @@ class Neo4jDataLoader(PostgresQueryRunner):
             config = load_config(config_path)
             model = self.load_neo4j_model(model_path)
             
+            # Set-based write settings
+            performance_config = config.get('neo4j_load_config', {}).get('performance', {})
+            self.bulk_write = performance_config.get('bulk_write', False)
+            self.write_sub_batch_size = performance_config.get('write_sub_batch_size', self.write_sub_batch_size)
+            self.configure_neo4j_performance(performance_config)
+            
             # Parse database configurations
             if 'database' not in config:
                 raise Exception(f"{BaseErrorCodes.MISSING_DB_CONFIG}: Database configuration not found")
@@ -1090,37 +1728,39 @@ class Neo4jDataLoader(PostgresQueryRunner):
             # Process vector embeddings if needed
             chunk_records = self.process_vector_embeddings(data_records, model, config)
             
-            # Load nodes to Neo4j
-            self.load_nodes_to_neo4j(data_records, model)
-            
-            # Load chunk nodes if we have embeddings
-            if chunk_records:
-                chunk_model = {
-                    "nodes": [{
-                        "label": "Chunk", 
-                        "node_id_property": "chunk_id", 
-                        "properties": [
-                            {"name": "chunk_id", "type": "string", "unique": True},
-                            {"name": "chunk_text", "type": "text"},
-                            {"name": "chunk_position", "type": "integer"},
-                            {"name": "chunk_order", "type": "integer"},
-                            {"name": "content_id", "type": "string"},
-                            {"name": "embedding", "type": "vector", "vector_dimension": 384, "vector_similarity": "cosine"}
-                        ]
-                    }]
-                }
-                logger.info(f"Loading {len(chunk_records)} chunk nodes to Neo4j")
-                self.load_nodes_to_neo4j(chunk_records, chunk_model)
+            # Run the row-by-row writes on one session in a small number of transactions
+            with self.write_scope():
+                # Load nodes to Neo4j
+                self.load_nodes_to_neo4j(data_records, model)
+            
+                # Load chunk nodes if we have embeddings
+                if chunk_records:
+                    chunk_model = {
+                        "nodes": [{
+                            "label": "Chunk", 
+                            "node_id_property": "chunk_id", 
+                            "properties": [
+                                {"name": "chunk_id", "type": "string", "unique": True},
+                                {"name": "chunk_text", "type": "text"},
+                                {"name": "chunk_position", "type": "integer"},
+                                {"name": "chunk_order", "type": "integer"},
+                                {"name": "content_id", "type": "string"},
+                                {"name": "embedding", "type": "vector", "vector_dimension": 384, "vector_similarity": "cosine"}
+                            ]
+                        }]
+                    }
+                    logger.info(f"Loading {len(chunk_records)} chunk nodes to Neo4j")
+                    self.load_nodes_to_neo4j(chunk_records, chunk_model)
 
-                # Create HAS_CHUNK relationships between Article and Chunk
-                self.load_chunk_relationships(chunk_records)
+                    # Create HAS_CHUNK relationships between Article and Chunk
+                    self.load_chunk_relationships(chunk_records)
  
-            # Load relationships to Neo4j
-            self.load_relationships_to_neo4j(data_records, model)
+                # Load relationships to Neo4j
+                self.load_relationships_to_neo4j(data_records, model)
 
-            # Create derived entities/relationships not covered properly by the model
-            self.load_tag_nodes_and_relationships(data_records)
-            self.load_written_by_relationships(data_records)
+                # Create derived entities/relationships not covered properly by the model
+                self.load_tag_nodes_and_relationships(data_records)
+                self.load_written_by_relationships(data_records)
  
             # Write metrics
             self.write_load_metrics(metrics_file)
@@ -331,6 +331,10 @@ class Neo4jModelGenerator(PostgresQueryRunner):
                         kwargs['vector_dimension'] = index_config['vector_dimension']
                     if 'vector_similarity' in index_config:
                         kwargs['vector_similarity'] = index_config['vector_similarity']
+                    # Full-text indexes may span several labels and properties
+                    for key in ('index_name', 'node_labels', 'properties'):
+                        if key in index_config:
+                            kwargs[key] = index_config[key]
                     
                     index = self._create_index(
                         index_config['node_label'], 
@@ -449,6 +453,24 @@ class Neo4jModelGenerator(PostgresQueryRunner):
                 "vector_similarity": vector_similarity,
                 "cypher": cypher
             }
+        elif index_type_upper == "FULLTEXT":
+            # Lucene index for lexical (BM25) search, optionally over several labels/properties
+            node_labels = kwargs.get('node_labels') or [node_label]
+            properties = kwargs.get('properties') or [property_name]
+            index_name = kwargs.get('index_name') or f"{node_label.lower()}_{property_name}_fulltext"
+            label_expr = "|".join(node_labels)
+            property_expr = ", ".join(f"n.{prop}" for prop in properties)
+            cypher = f"CREATE FULLTEXT INDEX {index_name} IF NOT EXISTS FOR (n:{label_expr}) ON EACH [{property_expr}]"
+            
+            return {
+                "type": index_type_upper,
+                "node_label": node_label,
+                "property": property_name,
+                "index_name": index_name,
+                "node_labels": node_labels,
+                "properties": properties,
+                "cypher": cypher
+            }
         elif index_type_upper in ["RANGE", "POINT"]:
             cypher = f"CREATE INDEX {node_label.lower()}_{property_name}_{index_type.lower()} IF NOT EXISTS FOR (n:{node_label}) ON (n.{property_name})"
         else:
@@ -11,7 +11,9 @@ import sys
 import logging
 import yaml
 import psycopg2
+import psycopg2.pool
 import csv
+import threading
 from typing import Dict, List, Tuple, Any, Optional
 from pathlib import Path
 import argparse
@@ -251,6 +253,118 @@ def get_query_from_config(config: Dict[str, Any], query_name: str) -> str:
         raise Exception(error_msg) from e
 
 
+class _CountingConnectionPool(psycopg2.pool.ThreadedConnectionPool):
+    """ThreadedConnectionPool that counts the physical connections it opens."""
+    
+    def __init__(self, minconn: int, maxconn: int, *args, **kwargs):
+        self.connections_opened = 0
+        super().__init__(minconn, maxconn, *args, **kwargs)
+    
+    def _connect(self, key=None):
+        self.connections_opened += 1
+        return super()._connect(key)
+
+
+class PostgresConnectionPool:
+    """
+    Thread-safe pool of persistent PostgreSQL connections.
+    
+    Connections are opened lazily up to max_connections; min_connections of
+    them are kept open between checkouts, the rest are closed when returned.
+    Checkouts beyond max_connections wait for a connection to be returned
+    instead of failing with PoolError.
+    """
+    
+    def __init__(self, db_config: Dict[str, str], min_connections: int = 1, max_connections: int = 4):
+        """
+        Open the pool.
+        
+        Args:
+            db_config: Database configuration dictionary
+            min_connections: Connections kept open while idle
+            max_connections: Maximum concurrent connections
+        """
+        self.max_connections = max(1, int(max_connections))
+        self.min_connections = min(max(0, int(min_connections)), self.max_connections)
+        self._lock = threading.Lock()
+        self._slots = threading.BoundedSemaphore(self.max_connections)
+        self.stats = {"checkouts": 0, "in_use": 0, "max_in_use": 0, "waits": 0}
+        
+        try:
+            logger.info(f"Opening PostgreSQL pool to {db_config.get('host')}:{db_config.get('port')} "
+                        f"({self.min_connections}-{self.max_connections} connections)")
+            self._pool = _CountingConnectionPool(
+                self.min_connections,
+                self.max_connections,
+                **db_config
+            )
+        except Exception as e:
+            error_msg = f"{ErrorCodes.DB_CONNECTION_ERROR}: Failed to open PostgreSQL pool: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg) from e
+    
+    @contextmanager
+    def connection(self):
+        """
+        Check a connection out of the pool.
+        
+        Yields:
+            psycopg2 connection object; an open transaction is rolled back on return
+        """
+        # ThreadedConnectionPool raises PoolError when exhausted, so wait for a free slot first
+        if not self._slots.acquire(blocking=False):
+            with self._lock:
+                self.stats["waits"] += 1
+            self._slots.acquire()
+        
+        try:
+            connection = self._pool.getconn()
+        except psycopg2.Error as e:
+            self._slots.release()
+            error_msg = f"{ErrorCodes.DB_CONNECTION_ERROR}: PostgreSQL connection error: {str(e)}"
+            logger.error(error_msg)
+            raise Exception(error_msg) from e
+        
+        with self._lock:
+            self.stats["checkouts"] += 1
+            self.stats["in_use"] += 1
+            self.stats["max_in_use"] = max(self.stats["max_in_use"], self.stats["in_use"])
+        
+        broken = False
+        try:
+            yield connection
+        except psycopg2.OperationalError:
+            # The server connection is gone; do not hand it out again
+            broken = True
+            raise
+        finally:
+            with self._lock:
+                self.stats["in_use"] -= 1
+            if not broken:
+                try:
+                    connection.rollback()
+                except Exception:
+                    broken = True
+            try:
+                self._pool.putconn(connection, close=broken)
+            finally:
+                self._slots.release()
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Return checkout counters and the number of physical connections opened."""
+        with self._lock:
+            stats = dict(self.stats)
+        stats["connections_opened"] = self._pool.connections_opened
+        stats["max_connections"] = self.max_connections
+        return stats
+    
+    def close(self) -> None:
+        """Close every connection in the pool."""
+        if not self._pool.closed:
+            self._pool.closeall()
+            logger.info("PostgreSQL pool closed")
+
+
 class PostgresQueryRunner:
     """PostgreSQL Query Runner class for executing queries and saving results."""
     
@@ -64,9 +64,6 @@ def test_comprehensive_metrics():
     loader.adhoc_tests["orphan_nodes"]["Website"] = 0
     loader.adhoc_tests["orphan_nodes"]["Chunk"] = 0
     loader.adhoc_tests["orphan_nodes"]["Tag"] = 0
-    loader.adhoc_tests["orphan_relationships"]["HAS_CHUNK"] = 0
-    loader.adhoc_tests["orphan_relationships"]["PUBLISHED_ON"] = 0
-    loader.adhoc_tests["orphan_relationships"]["TAGGED_WITH"] = 0
     loader.adhoc_tests["data_integrity_issues"] = []
     loader.adhoc_tests["test_results"] = {}
     
@@ -0,0 +1,67 @@
+#!/usr/bin/env python3
+"""
+Minimal stdio MCP server used by the MCPClient tests.
+
+Tools:
+    write_cypher  - echoes the query back as a Cypher comment
+    slow          - answers after `seconds`, so later requests overtake it
+    crash         - exits the process without answering
+    fail          - returns an isError tool result
+    mute          - stops answering pings, as a hung server would
+"""
+
+import json
+import sys
+import threading
+import time
+
+write_lock = threading.Lock()
+muted = threading.Event()
+
+
+def send(message):
+    with write_lock:
+        sys.stdout.write(json.dumps(message) + "\n")
+        sys.stdout.flush()
+
+
+def handle(message):
+    method = message.get("method")
+    request_id = message.get("id")
+    if method == "initialize":
+        send({"jsonrpc": "2.0", "id": request_id, "result": {
+            "protocolVersion": "2024-11-05", "capabilities": {"tools": {}},
+            "serverInfo": {"name": "stub-mcp", "version": "0.0.1"}
+        }})
+    elif method == "ping":
+        if muted.is_set():
+            return
+        send({"jsonrpc": "2.0", "id": request_id, "result": {}})
+    elif method == "tools/call":
+        name = message["params"]["name"]
+        arguments = message["params"].get("arguments", {})
+        if name == "crash":
+            sys.stdout.flush()
+            import os
+            os._exit(1)
+        if name == "mute":
+            muted.set()
+            text = "muted"
+        elif name == "slow":
+            time.sleep(arguments.get("seconds", 0.5))
+            text = f"slow:{arguments.get('tag')}"
+        elif name == "fail":
+            send({"jsonrpc": "2.0", "id": request_id, "result": {
+                "content": [{"type": "text", "text": "tool failed"}], "isError": True
+            }})
+            return
+        else:
+            text = f"// {arguments.get('query')}"
+        send({"jsonrpc": "2.0", "id": request_id, "result": {"content": [{"type": "text", "text": text}]}})
+    elif request_id is not None:
+        send({"jsonrpc": "2.0", "id": request_id, "error": {"code": -32601, "message": f"Unknown method {method}"}})
+
+
+for line in sys.stdin:
+    if line.strip():
+        threading.Thread(target=handle, args=(json.loads(line),), daemon=True).start()
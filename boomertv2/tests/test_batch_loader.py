@@ -0,0 +1,1049 @@
+#!/usr/bin/env python3
+"""
+Unit tests for Batch Neo4j Data Loader
+"""
+
+import asyncio
+import json
+import shutil
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch, MagicMock
+import os
+import sys
+
+import numpy as np
+
+# Add parent directory to path to import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from src.batch_loader import BatchNeo4jLoader, BatchLoaderErrorCodes
+from src.embedding_cache import EmbeddingCache
+
+
+class TestBatchNeo4jLoaderBulkWrites(unittest.TestCase):
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.loader = BatchNeo4jLoader()
+        self.loader.neo4j_driver = MagicMock()
+        self.loader.bulk_write = True
+        self.loader.write_sub_batch_size = 2
+
+        self.model = {
+            "nodes": [
+                {
+                    "label": "Article",
+                    "node_id_property": "url",
+                    "properties": [
+                        {"name": "url", "type": "string"},
+                        {"name": "title", "type": "string"}
+                    ]
+                }
+            ]
+        }
+
+        self.records = [
+            {"id": i, "url": f"https://example.com/{i}", "title": f"Title {i}"}
+            for i in range(5)
+        ]
+
+    def test_get_batch_config_bulk_settings(self):
+        """Test bulk write settings are read from batch_config."""
+        loader = BatchNeo4jLoader()
+        loader.get_batch_config({"batch_config": {"batch_size": 20, "bulk_write": True, "write_sub_batch_size": 250}})
+
+        self.assertEqual(loader.batch_size, 20)
+        self.assertTrue(loader.bulk_write)
+        self.assertEqual(loader.write_sub_batch_size, 250)
+
+    def test_load_nodes_bulk_groups_rows_into_sub_batches(self):
+        """Test nodes are written with one UNWIND statement per sub-batch."""
+        with patch.object(self.loader, 'execute_write_statements') as mock_write:
+            self.loader.load_nodes_to_neo4j(self.records, self.model)
+
+        self.assertEqual(mock_write.call_count, 3)
+        cypher, params = mock_write.call_args_list[0][0][0][0]
+        self.assertIn("UNWIND $rows AS row", cypher)
+        self.assertIn("MERGE (n:Article {url: row.id})", cypher)
+        self.assertEqual(len(params['rows']), 2)
+        self.assertEqual(params['rows'][0]['id'], "https://example.com/0")
+        self.assertEqual(self.loader.load_metrics["nodes_created"]["Article"], 5)
+
+        throughput = self.loader.batch_metrics["node_write_throughput"]["Article"]
+        self.assertEqual(throughput["rows"], 5)
+        self.assertIn("rows_per_sec", throughput)
+
+    def test_load_nodes_bulk_bisects_failed_sub_batch(self):
+        """Test a failing row is isolated and tracked while the rest are written."""
+        bad_url = "https://example.com/3"
+
+        def fake_write(statements):
+            for cypher, params in statements:
+                if any(row['id'] == bad_url for row in params['rows']):
+                    raise Exception("constraint violation")
+            return [MagicMock() for _ in statements]
+
+        self.loader.write_sub_batch_size = 5
+        with patch.object(self.loader, 'execute_write_statements', side_effect=fake_write):
+            self.loader.load_nodes_to_neo4j(self.records, self.model)
+
+        self.assertEqual(self.loader.load_metrics["nodes_created"]["Article"], 4)
+        self.assertEqual(self.loader.load_metrics["nodes_failed"]["Article"], 1)
+        node_failures = self.loader.failure_tracker["node_failures"]
+        self.assertEqual(len(node_failures), 1)
+        self.assertEqual(node_failures[0]["node_data"]["url"], bad_url)
+        self.assertEqual(node_failures[0]["postgres_column"], "url")
+
+    def test_load_nodes_bulk_skips_records_without_id(self):
+        """Test records without a node ID are not sent."""
+        records = self.records[:2] + [{"id": 99, "title": "No URL"}]
+        with patch.object(self.loader, 'execute_write_statements') as mock_write:
+            self.loader.load_nodes_to_neo4j(records, self.model)
+
+        self.assertEqual(mock_write.call_count, 1)
+        self.assertEqual(self.loader.load_metrics["nodes_created"]["Article"], 2)
+
+    def test_load_nodes_bulk_writes_float32_vector_properties(self):
+        """Test NumPy embeddings become lists at the Bolt boundary and use setNodeVectorProperty."""
+        self.loader.neo4j_vector_dtype = "float32"
+        model = {"nodes": [{
+            "label": "Chunk", "node_id_property": "chunk_id",
+            "properties": [{"name": "chunk_id", "type": "string"}, {"name": "embedding", "type": "vector"}]
+        }]}
+        records = [{"chunk_id": "c1", "embedding": np.array([0.5, 0.25], dtype=np.float32)}]
+        with patch.object(self.loader, 'execute_write_statements') as mock_write:
+            self.loader.load_nodes_to_neo4j(records, model)
+
+        cypher, params = mock_write.call_args[0][0][0]
+        self.assertIn("CALL db.create.setNodeVectorProperty(n, 'embedding', row.vectors.embedding)", cypher)
+        self.assertEqual(params['rows'][0]['properties'], {"chunk_id": "c1"})
+        self.assertEqual(params['rows'][0]['vectors'], {"embedding": [0.5, 0.25]})
+        self.assertIsInstance(params['rows'][0]['vectors']['embedding'], list)
+
+
+class TestBatchNeo4jLoaderBulkRelationships(unittest.TestCase):
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.loader = BatchNeo4jLoader()
+        self.loader.neo4j_driver = MagicMock()
+        self.loader.bulk_write = True
+        self.loader.write_sub_batch_size = 100
+
+        self.records = [
+            {"id": 1, "url": "https://a.com/1", "domain": "a.com", "author": "Jane", "tags": "health, money"},
+            {"id": 2, "url": "https://a.com/2", "domain": "a.com", "author": "Jane", "tags": ["money", "travel"]},
+            {"id": 2, "url": "https://a.com/2", "domain": "a.com", "author": "Jane", "tags": ["money"]},
+        ]
+
+    def test_relationships_are_deduplicated_and_written_once_per_type(self):
+        """Test duplicate (start, end) pairs collapse into one UNWIND statement."""
+        model = {
+            "relationships": [
+                {"type": "PUBLISHED_ON", "start_node": "Article", "end_node": "Website",
+                 "start_property": "url", "end_property": "domain"},
+                {"type": "HAS_CHUNK", "start_node": "Article", "end_node": "Chunk",
+                 "start_property": "url", "end_property": "source_id"}
+            ]
+        }
+        with patch.object(self.loader, 'execute_write_statements') as mock_write:
+            self.loader.load_relationships_to_neo4j(self.records, model)
+
+        self.assertEqual(mock_write.call_count, 1)
+        statements = mock_write.call_args[0][0]
+        self.assertEqual(len(statements), 1)
+        cypher, params = statements[0]
+        self.assertIn("MERGE (start)-[r:PUBLISHED_ON]->(end)", cypher)
+        self.assertEqual(len(params['rows']), 2)
+
+    def test_tags_fold_node_creation_into_relationship_transaction(self):
+        """Test Tag MERGE and TAGGED_WITH share one transaction with distinct tags."""
+        with patch.object(self.loader, 'execute_write_statements') as mock_write:
+            self.loader.load_tag_nodes_and_relationships(self.records)
+
+        self.assertEqual(mock_write.call_count, 1)
+        (node_cypher, node_params), (rel_cypher, rel_params) = mock_write.call_args[0][0]
+        self.assertIn("MERGE (t:Tag {tag_name: tag_name})", node_cypher)
+        self.assertEqual(node_params['tags'], ["health", "money", "travel"])
+        self.assertIn("MERGE (a)-[r:TAGGED_WITH]->(t)", rel_cypher)
+        self.assertEqual(len(rel_params['rows']), 4)
+
+    def test_written_by_merges_each_author_once(self):
+        """Test authors are deduplicated per batch."""
+        with patch.object(self.loader, 'execute_write_statements') as mock_write:
+            self.loader.load_written_by_relationships(self.records)
+
+        (node_cypher, node_params), (rel_cypher, rel_params) = mock_write.call_args[0][0]
+        self.assertEqual(node_params['authors'], ["Jane"])
+        self.assertEqual(len(rel_params['rows']), 2)
+
+    def test_chunk_relationships_use_source_id(self):
+        """Test HAS_CHUNK rows are keyed on the batch loader's source_id field."""
+        chunks = [
+            {"chunk_id": "c1", "source_id": 1, "chunk_order": 0},
+            {"chunk_id": "c2", "source_id": 1, "chunk_order": 1},
+        ]
+        with patch.object(self.loader, 'execute_write_statements') as mock_write:
+            self.loader.load_chunk_relationships(chunks)
+
+        cypher, params = mock_write.call_args[0][0][0]
+        self.assertIn("MERGE (start)-[r:HAS_CHUNK]->(end)", cypher)
+        self.assertEqual([row['article_id'] for row in params['rows']], [1, 1])
+
+    def test_failed_relationship_row_is_tracked(self):
+        """Test a failing relationship row is isolated and tracked."""
+        def fake_write(statements):
+            for cypher, params in statements:
+                if any(row.get('author') == "Jane" and row.get('article_id') == 2 for row in params.get('rows', [])):
+                    raise Exception("write failed")
+            return [MagicMock() for _ in statements]
+
+        with patch.object(self.loader, 'execute_write_statements', side_effect=fake_write):
+            self.loader.load_written_by_relationships(self.records)
+
+        failures = self.loader.failure_tracker["relationship_failures"]
+        self.assertEqual(len(failures), 1)
+        self.assertEqual(failures[0]["source_data"], {"id": 2})
+        self.assertEqual(self.loader.load_metrics["relationships_failed"]["WRITTEN_BY"], 1)
+
+
+
+class TestBatchNeo4jLoaderKeysetPagination(unittest.TestCase):
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.loader = BatchNeo4jLoader()
+        self.loader.get_batch_config({"batch_config": {"batch_size": 2, "pagination": "keyset"}})
+        self.db_config = {"host": "localhost", "port": "5432"}
+
+    def test_get_keyset_batch_query_first_and_next_batch(self):
+        """Test keyset query wraps the base query and seeks past the last key."""
+        query, params = self.loader.get_keyset_batch_query("SELECT * FROM structured_content;", None, 2)
+        self.assertEqual(query, "SELECT * FROM (SELECT * FROM structured_content) AS keyset_subquery ORDER BY id LIMIT %s")
+        self.assertEqual(params, [2])
+
+        query, params = self.loader.get_keyset_batch_query("SELECT * FROM structured_content", 42, 2)
+        self.assertIn("WHERE id > %s ORDER BY id LIMIT %s", query)
+        self.assertNotIn("OFFSET", query)
+        self.assertEqual(params, [42, 2])
+
+    def test_invalid_batch_config_raises(self):
+        """Test unknown pagination modes and unsafe key columns are rejected."""
+        with self.assertRaises(Exception):
+            self.loader.get_batch_config({"batch_config": {"pagination": "cursor"}})
+        with self.assertRaises(Exception):
+            self.loader.get_batch_config({"batch_config": {"pagination": "keyset", "keyset_column": "id; DROP TABLE x"}})
+
+    @patch('psycopg2.connect')
+    def test_fetch_batch_records_uses_named_cursor_and_advances_key(self, mock_connect):
+        """Test keyset fetches stream through a server-side cursor."""
+        mock_cursor = MagicMock()
+        mock_cursor.__iter__.return_value = iter([(7, "a"), (9, "b")])
+        mock_cursor.description = [("id",), ("title",)]
+        mock_connection = mock_connect.return_value
+        mock_connection.cursor.return_value.__enter__.return_value = mock_cursor
+
+        results, columns = self.loader.fetch_batch_records(self.db_config, "SELECT * FROM t", 0, 3)
+
+        mock_connection.cursor.assert_called_once_with(name="batch_loader_batch_3")
+        self.assertEqual(mock_cursor.itersize, 1000)
+        self.assertEqual(columns, ["id", "title"])
+        self.assertEqual(len(results), 2)
+        self.assertEqual(self.loader.last_seen_key, 9)
+
+    @patch('psycopg2.connect')
+    def test_fetch_batch_records_requires_selected_keyset_column(self, mock_connect):
+        """Test a query that does not select the key column is rejected instead of re-reading page one."""
+        mock_cursor = MagicMock()
+        mock_cursor.__iter__.return_value = iter([("a",), ("b",)])
+        mock_cursor.description = [("title",)]
+        mock_connect.return_value.cursor.return_value.__enter__.return_value = mock_cursor
+
+        with self.assertRaises(Exception) as context:
+            self.loader.fetch_batch_records(self.db_config, "SELECT title FROM t", 0, 1)
+
+        self.assertIn(BatchLoaderErrorCodes.BATCH_CONFIG_ERROR, str(context.exception))
+        self.assertIsNone(self.loader.last_seen_key)
+
+    @patch('psycopg2.connect')
+    def test_get_total_record_count_estimate_uses_explain(self, mock_connect):
+        """Test estimate mode reads the planner row estimate instead of counting."""
+        mock_cursor = MagicMock()
+        mock_cursor.fetchone.return_value = ([{"Plan": {"Plan Rows": 12345}}],)
+        mock_connect.return_value.cursor.return_value.__enter__.return_value = mock_cursor
+
+        count = self.loader.get_total_record_count(self.db_config, "SELECT * FROM t;", "estimate")
+
+        self.assertEqual(count, 12345)
+        executed = mock_cursor.execute.call_args[0][0]
+        self.assertTrue(executed.startswith("EXPLAIN (FORMAT JSON) SELECT * FROM t"))
+        self.assertNotIn("COUNT", executed)
+
+    def test_load_data_in_batches_keyset_stops_on_empty_batch(self):
+        """Test keyset runs until a batch comes back empty, regardless of the estimate."""
+        fetched = [2, 2, 1, 0]
+
+        def fake_process_batch(config, model, db_config, base_query, offset, batch_num):
+            self.loader.last_fetched_count = fetched[batch_num - 1]
+            return True, list(range(fetched[batch_num - 1]))
+
+        config = {
+            "database": {"postgres": "host: localhost\nport: 5432\ndatabase: db\nuser: u\npassword: p"},
+            "queries": {"trending": "SELECT * FROM structured_content"},
+            "batch_config": {"batch_size": 2, "pagination": "keyset", "record_count": "estimate"}
+        }
+        with patch('src.batch_loader.load_config', return_value=config), \
+             patch.object(self.loader, 'get_total_record_count', return_value=0), \
+             patch.object(self.loader, 'load_neo4j_model', return_value={}), \
+             patch.object(self.loader, 'initialize_neo4j_connection'), \
+             patch.object(self.loader, 'get_neo4j_counts', return_value={}), \
+             patch.object(self.loader, 'run_adhoc_tests'), \
+             patch.object(self.loader, 'write_batch_metrics'), \
+             patch.object(self.loader, 'process_batch', side_effect=fake_process_batch) as mock_process:
+            self.loader.load_data_in_batches("config.yml", "model.json", "metrics.json")
+
+        self.assertEqual(mock_process.call_count, 4)
+        self.assertEqual(self.loader.batch_metrics["total_batches"], 3)
+        self.assertEqual(self.loader.batch_metrics["completed_batches"], 3)
+        self.assertEqual(self.loader.load_metrics["total_records_processed"], 5)
+
+
+class TestBatchNeo4jLoaderPipeline(unittest.TestCase):
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.loader = BatchNeo4jLoader()
+        self.loader.get_batch_config({"batch_config": {
+            "batch_size": 2,
+            "pipeline": {"enabled": True, "embed_workers": 2, "writer_workers": 3, "queue_size": 1}
+        }})
+        self.db_config = {"host": "localhost"}
+        self.rows = {1: [(1,), (2,)], 2: [(3,), (4,)], 3: [(5,), (6,)], 4: [(7,)]}
+        patcher = patch.object(self.loader, 'ensure_shared_node_constraints', return_value=True)
+        self.mock_constraints = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def fake_fetch(self, db_config, base_query, offset, batch_num):
+        return self.rows.get(batch_num, []), ["id"]
+
+    def test_pipeline_config_forces_bulk_write(self):
+        """Test the pipeline settings are read and bulk writes are switched on."""
+        self.assertTrue(self.loader.pipeline_enabled)
+        self.assertTrue(self.loader.bulk_write)
+        self.assertEqual(self.loader.pipeline_writer_workers, 3)
+        self.assertEqual(self.loader.pipeline_queue_size, 1)
+
+    def test_status_is_committed_in_batch_order(self):
+        """Test status_neo4j updates follow batch order even when writes finish out of order."""
+        committed = []
+
+        def slow_first_write(data_records, chunk_records, model, batch_num):
+            if batch_num == 1:
+                time.sleep(0.2)
+
+        with patch.object(self.loader, 'fetch_batch_records', side_effect=self.fake_fetch), \
+             patch.object(self.loader, 'process_vector_embeddings', return_value=[]), \
+             patch.object(self.loader, 'write_batch_to_neo4j', side_effect=slow_first_write), \
+             patch.object(self.loader, 'update_status_neo4j',
+                          side_effect=lambda db, ids, status: committed.append(list(ids)) or True):
+            self.loader.run_pipelined_batches({}, {"nodes": []}, self.db_config, "SELECT 1", 4)
+
+        self.assertEqual(committed, [[1, 2], [3, 4], [5, 6], [7]])
+        self.assertEqual(self.loader.batch_metrics["completed_batches"], 4)
+        self.assertEqual(self.loader.load_metrics["total_records_processed"], 7)
+        stages = self.loader.pipeline_metrics["stages"]
+        self.assertEqual(stages["write"]["records"], 7)
+        self.assertEqual(stages["fetch"]["batches"], 4)
+        self.assertLessEqual(self.loader.pipeline_metrics["queues"]["fetch_queue"]["max_depth"], 1)
+
+    def test_failed_write_is_not_committed(self):
+        """Test a failed batch is tracked and its status is left unset."""
+        committed = []
+
+        def failing_write(data_records, chunk_records, model, batch_num):
+            if batch_num == 2:
+                raise Exception("write failed")
+
+        with patch.object(self.loader, 'fetch_batch_records', side_effect=self.fake_fetch), \
+             patch.object(self.loader, 'process_vector_embeddings', return_value=[]), \
+             patch.object(self.loader, 'write_batch_to_neo4j', side_effect=failing_write), \
+             patch.object(self.loader, 'update_status_neo4j',
+                          side_effect=lambda db, ids, status: committed.append(list(ids)) or True):
+            self.loader.run_pipelined_batches({}, {"nodes": []}, self.db_config, "SELECT 1", 4)
+
+        self.assertEqual(committed, [[1, 2], [5, 6], [7]])
+        self.assertEqual(self.loader.batch_metrics["failed_batches"], 1)
+        self.assertEqual(self.loader.batch_metrics["batch_errors"][0]["batch_num"], 2)
+        self.assertEqual(self.loader.failure_tracker["batch_failures"][0]["record_ids"], [3, 4])
+
+    def test_commit_error_does_not_hang_the_pipeline(self):
+        """Test an exception while committing one batch is recorded and the other batches still finish."""
+        committed = []
+
+        def failing_status_update(db, ids, status):
+            if ids == [3, 4]:
+                raise Exception("connection lost")
+            committed.append(list(ids))
+            return True
+
+        with patch.object(self.loader, 'fetch_batch_records', side_effect=self.fake_fetch), \
+             patch.object(self.loader, 'process_vector_embeddings', return_value=[]), \
+             patch.object(self.loader, 'write_batch_to_neo4j'), \
+             patch.object(self.loader, 'update_status_neo4j', side_effect=failing_status_update):
+            runner = threading.Thread(target=self.loader.run_pipelined_batches,
+                                      args=({}, {"nodes": []}, self.db_config, "SELECT 1", 4), daemon=True)
+            runner.start()
+            runner.join(timeout=10)
+
+        self.assertFalse(runner.is_alive())
+        self.assertEqual(committed, [[1, 2], [5, 6], [7]])
+        self.assertEqual(self.loader.batch_metrics["completed_batches"], 3)
+        self.assertEqual(self.loader.batch_metrics["failed_batches"], 1)
+        self.assertEqual(self.loader.batch_metrics["batch_errors"][0]["batch_num"], 2)
+
+    def test_missing_constraints_fall_back_to_one_writer(self):
+        """Test concurrent writers are only used when the shared node constraints exist."""
+        self.mock_constraints.return_value = False
+        writers = set()
+
+        with patch.object(self.loader, 'fetch_batch_records', side_effect=self.fake_fetch), \
+             patch.object(self.loader, 'process_vector_embeddings', return_value=[]), \
+             patch.object(self.loader, 'write_batch_to_neo4j',
+                          side_effect=lambda *args: writers.add(threading.current_thread().name)), \
+             patch.object(self.loader, 'update_status_neo4j', return_value=True):
+            self.loader.run_pipelined_batches({}, {"nodes": []}, self.db_config, "SELECT 1", 4)
+
+        self.assertEqual(writers, {"batch-write-0"})
+        self.assertEqual(self.loader.batch_metrics["completed_batches"], 4)
+
+    def test_shared_node_constraints_cover_tags_authors_and_model_ids(self):
+        """Test uniqueness constraints are created for every node key MERGEd across batches."""
+        loader = BatchNeo4jLoader()
+        model = {"nodes": [{"label": "Article", "node_id_property": "id"}, {"label": "Chunk"}]}
+        with patch.object(loader, 'execute_cypher_query') as mock_query:
+            self.assertTrue(loader.ensure_shared_node_constraints(model))
+
+        statements = [call.args[0] for call in mock_query.call_args_list]
+        self.assertEqual(statements, [
+            "CREATE CONSTRAINT article_id_unique IF NOT EXISTS FOR (n:Article) REQUIRE n.id IS UNIQUE",
+            "CREATE CONSTRAINT author_name_unique IF NOT EXISTS FOR (n:Author) REQUIRE n.name IS UNIQUE",
+            "CREATE CONSTRAINT tag_tag_name_unique IF NOT EXISTS FOR (n:Tag) REQUIRE n.tag_name IS UNIQUE"
+        ])
+
+        with patch.object(loader, 'execute_cypher_query', side_effect=Exception("duplicates exist")):
+            self.assertFalse(loader.ensure_shared_node_constraints(model))
+
+
+class TestBatchNeo4jLoaderPostgresPool(unittest.TestCase):
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.loader = BatchNeo4jLoader()
+        self.loader.get_batch_config({"batch_config": {
+            "batch_size": 2,
+            "postgres_pool": {"min_connections": 1, "max_connections": 2},
+            "status_coalesce_batches": 2
+        }})
+        self.db_config = {"host": "localhost"}
+
+    def tearDown(self):
+        if self.loader.pg_pool:
+            self.loader.pg_pool.close()
+
+    @patch('src.postgres_query_runner.psycopg2.connect')
+    def test_status_update_uses_unnest_and_reuses_connection(self, mock_connect):
+        """Test status updates send one array parameter and share a pooled connection."""
+        mock_cursor = MagicMock()
+        mock_connect.return_value.closed = 0
+        mock_connect.return_value.cursor.return_value.__enter__.return_value = mock_cursor
+
+        self.assertTrue(self.loader.update_status_neo4j(self.db_config, [1, 2, 3], True))
+        self.assertTrue(self.loader.update_status_neo4j(self.db_config, [4], True))
+
+        query, params = mock_cursor.execute.call_args_list[0][0]
+        self.assertIn("unnest(%s::bigint[])", query)
+        self.assertNotIn("IN (", query)
+        self.assertEqual(params, (True, [1, 2, 3]))
+        self.assertEqual(mock_connect.call_count, 1)
+        self.assertEqual(mock_connect.return_value.commit.call_count, 2)
+        self.assertEqual(self.loader.status_update_metrics["statements"], 2)
+        self.assertEqual(self.loader.status_update_metrics["rows"], 4)
+        self.assertEqual(self.loader.pg_pool.get_stats()["connections_opened"], 1)
+
+    @patch('src.postgres_query_runner.psycopg2.connect')
+    def test_exhausted_pool_waits_for_a_connection(self, mock_connect):
+        """Test a checkout beyond max_connections blocks until one is returned."""
+        mock_connect.side_effect = lambda *args, **kwargs: MagicMock(closed=0)
+        first = self.loader.pg_connection(self.db_config)
+        second = self.loader.pg_connection(self.db_config)
+        first.__enter__()
+        second.__enter__()
+
+        checked_out = threading.Event()
+        def third_checkout():
+            with self.loader.pg_connection(self.db_config):
+                checked_out.set()
+        waiter = threading.Thread(target=third_checkout)
+        waiter.start()
+
+        self.assertFalse(checked_out.wait(0.2))
+        first.__exit__(None, None, None)
+        self.assertTrue(checked_out.wait(5))
+        waiter.join(5)
+        second.__exit__(None, None, None)
+
+        stats = self.loader.pg_pool.get_stats()
+        self.assertEqual(stats["waits"], 1)
+        self.assertEqual(stats["max_in_use"], 2)
+        self.assertEqual(stats["in_use"], 0)
+
+    @patch('src.postgres_query_runner.psycopg2.connect')
+    def test_status_update_failure_returns_false(self, mock_connect):
+        """Test a failed status update is reported rather than raised."""
+        mock_connect.return_value.cursor.return_value.__enter__.return_value.execute.side_effect = Exception("boom")
+
+        self.assertFalse(self.loader.update_status_neo4j(self.db_config, [1], True))
+        self.assertEqual(self.loader.status_update_metrics["statements"], 0)
+
+    def test_status_acks_are_coalesced(self):
+        """Test acknowledged batches share one status update and the tail is flushed."""
+        committed = []
+        with patch.object(self.loader, 'update_status_neo4j',
+                          side_effect=lambda db, ids, status: committed.append(list(ids)) or True):
+            self.loader._commit_batch_result(self.db_config, 1, 0, True, [1, 2], None)
+            self.assertEqual(committed, [])
+            self.loader._commit_batch_result(self.db_config, 2, 2, True, [3, 4], None)
+            self.loader._commit_batch_result(self.db_config, 3, 4, True, [5], None)
+            self.loader.flush_status_acks(self.db_config)
+
+        self.assertEqual(committed, [[1, 2, 3, 4], [5]])
+        self.assertEqual(self.loader.batch_metrics["completed_batches"], 3)
+        self.assertEqual(self.loader.load_metrics["total_records_processed"], 5)
+
+    def test_failed_coalesced_update_marks_every_batch_failed(self):
+        """Test every batch in a failed acknowledgement is tracked for retry."""
+        with patch.object(self.loader, 'update_status_neo4j', return_value=False):
+            self.loader._commit_batch_result(self.db_config, 1, 0, True, [1, 2], None)
+            self.loader._commit_batch_result(self.db_config, 2, 2, True, [3, 4], None)
+
+        self.assertEqual(self.loader.batch_metrics["failed_batches"], 2)
+        self.assertEqual(self.loader.batch_metrics["completed_batches"], 0)
+        self.assertEqual(len(self.loader.failure_tracker["batch_failures"]), 2)
+
+
+class TestBatchNeo4jLoaderEmbeddingCache(unittest.TestCase):
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache_path = os.path.join(self.temp_dir, "embeddings.sqlite")
+        self.loader = BatchNeo4jLoader()
+        self.loader.get_batch_config({"batch_config": {
+            "embedding_cache": {"enabled": True, "path": self.cache_path, "max_entries": 3}
+        }})
+        self.loader.embedding_model = MagicMock()
+        self.loader.embedding_model.encode.side_effect = lambda texts, show_progress_bar=True: np.array(
+            [[float(len(text)), 0.5] for text in texts], dtype=np.float32
+        )
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        if self.loader.embedding_cache:
+            self.loader.embedding_cache.close()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_unchanged_chunks_are_not_re_encoded(self):
+        """Test a second run over the same chunks is served entirely from the cache."""
+        first = self.loader.generate_embeddings(["alpha", "beta"], "size=512")
+        second = self.loader.generate_embeddings(["beta", "alpha"], "size=512")
+
+        self.assertEqual(self.loader.embedding_model.encode.call_count, 1)
+        self.assertEqual(second.dtype, np.float32)
+        self.assertEqual(second.shape, (2, 2))
+        np.testing.assert_array_equal(second, first[[1, 0]])
+        stats = self.loader.embedding_cache.get_stats()
+        self.assertEqual(stats["hits"], 2)
+        self.assertEqual(stats["misses"], 2)
+        self.assertEqual(self.loader.load_metrics["embeddings_generated"], 2)
+
+    def test_chunking_parameters_are_part_of_the_key(self):
+        """Test the same text chunked with different parameters is a cache miss."""
+        self.loader.generate_embeddings(["alpha"], "size=512")
+        self.loader.generate_embeddings(["alpha"], "size=1000")
+
+        self.assertEqual(self.loader.embedding_model.encode.call_count, 2)
+
+    def test_least_recently_used_entries_are_evicted(self):
+        """Test the cache stays within max_entries by evicting the oldest entries."""
+        self.loader.generate_embeddings(["a", "b", "c"], "")
+        self.loader.generate_embeddings(["a"], "")
+        self.loader.generate_embeddings(["d"], "")
+
+        stats = self.loader.embedding_cache.get_stats()
+        self.assertEqual(stats["entries"], 3)
+        self.assertEqual(stats["evictions"], 1)
+        self.loader.embedding_model.encode.reset_mock()
+        self.loader.generate_embeddings(["a", "d"], "")
+        self.loader.embedding_model.encode.assert_not_called()
+
+    def test_entry_count_is_tracked_without_scanning_the_table(self):
+        """Test writes keep the row count in memory, counting replaced keys once."""
+        cache = EmbeddingCache(os.path.join(self.temp_dir, "counted.sqlite"), max_entries=3)
+        statements = []
+        cache._conn.set_trace_callback(statements.append)
+
+        cache.put_many({"a": [1.0], "b": [2.0]})
+        cache.put_many({"a": [1.5], "b": [2.5]})
+        self.assertEqual(cache.entry_count(), 2)
+        cache.put_many({"c": [3.0], "d": [4.0]})
+
+        self.assertEqual(cache.entry_count(), 3)
+        self.assertEqual(cache.get_stats()["evictions"], 1)
+        self.assertNotIn("SELECT COUNT(*) FROM embeddings", statements)
+        cache.close()
+
+        reopened = EmbeddingCache(os.path.join(self.temp_dir, "counted.sqlite"), max_entries=3)
+        self.assertEqual(reopened.entry_count(), 3)
+        reopened.close()
+
+    def test_quantized_entries_round_trip_within_tolerance(self):
+        """Test float16 and int8 entries decode close to the original float32 vectors."""
+        vectors = np.random.default_rng(0).standard_normal((4, 384)).astype(np.float32)
+        for dtype, tolerance in (("float16", 1e-2), ("int8", 2e-2)):
+            cache = EmbeddingCache(os.path.join(self.temp_dir, f"{dtype}.sqlite"), dtype=dtype)
+            cache.put_many({f"k{i}": vector for i, vector in enumerate(vectors)})
+            found = cache.get_many([f"k{i}" for i in range(4)])
+            cache.close()
+
+            decoded = np.vstack([found[f"k{i}"] for i in range(4)])
+            self.assertEqual(decoded.dtype, np.float32)
+            error = np.abs(decoded - vectors).max() / np.abs(vectors).max()
+            self.assertLess(error, tolerance, dtype)
+
+    def test_cache_stats_are_written_to_batch_metrics(self):
+        """Test hit/miss counters are surfaced in the batch metrics."""
+        self.loader.generate_embeddings(["alpha"], "")
+        self.loader.write_batch_metrics(os.path.join(self.temp_dir, "metrics.json"))
+
+        self.assertEqual(self.loader.batch_metrics["embedding_cache"]["misses"], 1)
+        self.assertEqual(self.loader.batch_metrics["embedding_cache"]["entries"], 1)
+
+
+class TestBatchNeo4jLoaderIncrementalChunks(unittest.TestCase):
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.loader = BatchNeo4jLoader()
+        self.loader.get_batch_config({"batch_config": {"incremental_chunks": True}})
+        self.loader.neo4j_driver = MagicMock()
+        self.model = {
+            "nodes": [{
+                "label": "Article",
+                "node_id_property": "url",
+                "chunking_enabled": True,
+                "source_content_field": "content",
+                "properties": [{"name": "embedding", "type": "vector"}]
+            }]
+        }
+        self.config = {"chunking_config": {"default_chunk_size": 10, "default_chunk_overlap": 0,
+                                           "use_llm_chunking": False}}
+        self.record = {"id": 7, "url": "https://example.com/7", "content": "aaaaaaaaaabbbbbbbbbbcccccccccc"}
+
+    def test_chunk_ids_are_deterministic(self):
+        """Test the same article and text always produce the same chunk IDs."""
+        first = self.loader.chunk_text_content(self.record["content"], 10, 0, False, source_id=7)
+        second = self.loader.chunk_text_content(self.record["content"], 10, 0, False, source_id=7)
+        other = self.loader.chunk_text_content(self.record["content"], 10, 0, False, source_id=8)
+
+        self.assertEqual([c['chunk_id'] for c in first], [c['chunk_id'] for c in second])
+        self.assertEqual(len({c['chunk_id'] for c in first}), 3)
+        self.assertNotEqual(first[0]['chunk_id'], other[0]['chunk_id'])
+
+    def test_unchanged_chunks_are_not_re_embedded(self):
+        """Test only chunks missing from the graph are embedded."""
+        chunks = self.loader.chunk_text_content(self.record["content"], 10, 0, False, source_id=7)
+        stored = {7: {chunks[0]['chunk_id'], chunks[1]['chunk_id'], "chunk_vanished"}}
+
+        with patch.object(self.loader, 'get_stored_chunk_ids', return_value=stored), \
+             patch.object(self.loader, 'generate_embeddings', return_value=[[0.1, 0.2]]) as mock_embed:
+            chunk_records = self.loader.process_vector_embeddings([self.record], self.model, self.config)
+
+        mock_embed.assert_called_once()
+        self.assertEqual(mock_embed.call_args[0][0], ["cccccccccc"])
+        self.assertEqual([c.get('unchanged', False) for c in chunk_records], [True, True, False])
+        self.assertEqual(self.loader.load_metrics["chunks_created"], 1)
+        self.assertEqual(self.loader.load_metrics["chunks_unchanged"], 2)
+
+    def test_write_skips_unchanged_and_deletes_vanished_chunks(self):
+        """Test unchanged chunks are not re-written and vanished chunks are deleted per article."""
+        chunk_records = [
+            {"chunk_id": "c1", "source_id": 7, "unchanged": True},
+            {"chunk_id": "c2", "source_id": 7, "embedding": [0.1]}
+        ]
+        summary = MagicMock()
+        summary.counters.nodes_deleted = 4
+
+        with patch.object(self.loader, 'load_nodes_to_neo4j') as mock_nodes, \
+             patch.object(self.loader, 'load_chunk_relationships') as mock_chunk_rels, \
+             patch.object(self.loader, 'load_relationships_to_neo4j'), \
+             patch.object(self.loader, 'load_tag_nodes_and_relationships'), \
+             patch.object(self.loader, 'load_written_by_relationships'), \
+             patch.object(self.loader, 'execute_write_transaction', return_value=summary) as mock_write:
+            self.loader.write_batch_to_neo4j([self.record], chunk_records, self.model, 1)
+
+        self.assertEqual(mock_nodes.call_args_list[1][0][0], [chunk_records[1]])
+        mock_chunk_rels.assert_called_once_with([chunk_records[1]])
+        cypher, params = mock_write.call_args[0]
+        self.assertIn("DETACH DELETE c", cypher)
+        self.assertEqual(params["articles"], [{"source_id": 7, "chunk_ids": ["c1", "c2"]}])
+        self.assertEqual(self.loader.load_metrics["chunks_deleted"], 4)
+
+    def test_emptied_article_loses_all_its_chunks(self):
+        """Test an article whose text is now empty has every stored chunk deleted."""
+        emptied = {"id": 8, "url": "https://example.com/8", "content": ""}
+        unselected = {"id": 9, "url": "https://example.com/9"}
+        chunk_records = [{"chunk_id": "c1", "source_id": 7, "unchanged": True}]
+        summary = MagicMock()
+        summary.counters.nodes_deleted = 2
+
+        with patch.object(self.loader, 'load_nodes_to_neo4j'), \
+             patch.object(self.loader, 'load_relationships_to_neo4j'), \
+             patch.object(self.loader, 'load_tag_nodes_and_relationships'), \
+             patch.object(self.loader, 'load_written_by_relationships'), \
+             patch.object(self.loader, 'execute_write_transaction', return_value=summary) as mock_write:
+            self.loader.write_batch_to_neo4j([self.record, emptied, unselected], chunk_records, self.model, 1)
+
+        cypher, params = mock_write.call_args[0]
+        self.assertEqual(params["articles"], [
+            {"source_id": 7, "chunk_ids": ["c1"]},
+            {"source_id": 8, "chunk_ids": []}
+        ])
+
+    def test_schema_step_indexes_chunk_source_id(self):
+        """Test the Chunk.source_id lookup used by incremental re-chunking is indexed."""
+        with patch.object(self.loader, 'execute_cypher_query') as mock_query:
+            self.loader.ensure_chunk_source_index()
+
+        mock_query.assert_called_once_with(
+            "CREATE INDEX chunk_source_id IF NOT EXISTS FOR (c:Chunk) ON (c.source_id)"
+        )
+
+    def test_chunk_export_hook_appends_new_chunks_per_source(self):
+        """Test written batches are exported with new embeddings and the current chunk IDs."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir)
+        export_path = os.path.join(temp_dir, "chunk_export.jsonl")
+        self.loader.get_batch_config({"batch_config": {
+            "incremental_chunks": True, "chunk_export": {"enabled": True, "path": export_path}
+        }})
+        failing_hook = MagicMock(side_effect=Exception("index offline"))
+        self.loader.add_chunk_hook(failing_hook)
+        chunk_records = [
+            {"chunk_id": "c1", "source_id": 7, "chunk_text": "a", "unchanged": True, "source_record": self.record},
+            {"chunk_id": "c2", "source_id": 7, "chunk_text": "b", "chunk_order": 1,
+             "embedding": [0.1, 0.2], "source_record": self.record}
+        ]
+
+        with patch.object(self.loader, 'load_nodes_to_neo4j'), \
+             patch.object(self.loader, 'load_chunk_relationships'), \
+             patch.object(self.loader, 'delete_stale_chunks'), \
+             patch.object(self.loader, 'load_relationships_to_neo4j'), \
+             patch.object(self.loader, 'load_tag_nodes_and_relationships'), \
+             patch.object(self.loader, 'load_written_by_relationships'):
+            self.loader.write_batch_to_neo4j([self.record], chunk_records, self.model, 1)
+
+        with open(export_path) as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(len(lines), 1)
+        self.assertEqual(lines[0]["source_id"], 7)
+        self.assertEqual(lines[0]["url"], "https://example.com/7")
+        self.assertEqual(lines[0]["chunk_ids"], ["c1", "c2"])
+        self.assertEqual([c["chunk_id"] for c in lines[0]["chunks"]], ["c2"])
+        self.assertEqual(lines[0]["chunks"][0]["embedding"], [0.1, 0.2])
+        failing_hook.assert_called_once_with(chunk_records)
+        self.assertEqual(self.loader.batch_metrics["chunk_hook_errors"], 1)
+
+
+class FakeAsyncOpenAI:
+    """Stand-in for openai.AsyncOpenAI that answers chat completions locally."""
+
+    def __init__(self, reply, delay=0.0, failures=0, slow_calls=None):
+        self.reply = reply
+        self.delay = delay
+        self.slow_calls = slow_calls
+        self.failures = failures
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.chat = MagicMock()
+        self.chat.completions.create = self.create
+
+    async def create(self, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            if self.slow_calls is None or self.calls <= self.slow_calls:
+                await asyncio.sleep(self.delay)
+            if self.failures:
+                self.failures -= 1
+                raise Exception("rate limited")
+            response = MagicMock()
+            response.choices[0].message.content = self.reply
+            return response
+        finally:
+            self.in_flight -= 1
+
+    async def close(self):
+        pass
+
+
+class TestBatchNeo4jLoaderLLMChunking(unittest.TestCase):
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.temp_dir = tempfile.mkdtemp()
+        self.loader = BatchNeo4jLoader()
+        self.loader.configure_llm_chunking({
+            "llm_concurrency": 2,
+            "llm_timeout_seconds": 1,
+            "llm_max_retries": 1,
+            "llm_backoff_seconds": 0,
+            "llm_cache_dir": self.temp_dir
+        })
+        self.texts = [f"article {i} " + "x" * 1200 for i in range(5)]
+        self.env = patch.dict(os.environ, {"OPENAI_API_KEY": "test-key"})
+        self.env.start()
+
+    def tearDown(self):
+        """Clean up test fixtures."""
+        self.env.stop()
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_requests_run_concurrently_under_the_limit(self):
+        """Test chunk requests fan out but never exceed llm_concurrency."""
+        client = FakeAsyncOpenAI("first chunk\nsecond chunk", delay=0.05)
+        with patch('src.batch_loader.openai.AsyncOpenAI', return_value=client):
+            results = self.loader.chunk_texts_with_llm(self.texts, 500)
+
+        self.assertEqual(client.calls, 5)
+        self.assertEqual(client.max_in_flight, 2)
+        self.assertEqual([c['chunk_text'] for c in results[self.texts[0]]], ["first chunk", "second chunk"])
+        self.assertEqual(sum(self.loader.load_metrics["llm_chunking"]["latency_histogram"].values()), 5)
+
+    def test_responses_are_memoized_on_disk(self):
+        """Test a second run over the same texts makes no LLM calls."""
+        client = FakeAsyncOpenAI("only chunk")
+        with patch('src.batch_loader.openai.AsyncOpenAI', return_value=client):
+            self.loader.chunk_texts_with_llm(self.texts, 500)
+            self.loader.chunk_texts_with_llm(self.texts, 500)
+            self.loader.chunk_texts_with_llm(self.texts[:1], 800)
+
+        self.assertEqual(client.calls, 6)
+        self.assertEqual(self.loader.load_metrics["llm_chunking"]["cache_hits"], 5)
+
+    def test_memo_file_name_is_safe_for_any_model_name(self):
+        """Test a model name containing a path separator stays inside llm_cache_dir."""
+        self.loader.llm_chunk_model = "org/model"
+        client = FakeAsyncOpenAI("only chunk")
+        with patch('src.batch_loader.openai.AsyncOpenAI', return_value=client):
+            self.loader.chunk_texts_with_llm(self.texts[:1], 500)
+            self.loader.chunk_texts_with_llm(self.texts[:1], 500)
+
+        entries = os.listdir(self.temp_dir)
+        self.assertEqual(len(entries), 1)
+        self.assertTrue(os.path.isfile(os.path.join(self.temp_dir, entries[0])))
+        self.assertEqual(client.calls, 1)
+
+    def test_failed_request_is_retried(self):
+        """Test a failed request is retried before falling back."""
+        client = FakeAsyncOpenAI("only chunk", failures=1)
+        with patch('src.batch_loader.openai.AsyncOpenAI', return_value=client):
+            results = self.loader.chunk_texts_with_llm(self.texts[:1], 500)
+
+        self.assertEqual(client.calls, 2)
+        self.assertEqual(self.loader.load_metrics["llm_chunking"]["retries"], 1)
+        self.assertEqual(results[self.texts[0]][0]['chunk_text'], "only chunk")
+
+    def test_timeout_is_retried(self):
+        """Test a timed-out request is retried before falling back."""
+        self.loader.llm_timeout_seconds = 0.01
+        client = FakeAsyncOpenAI("only chunk", delay=0.5, slow_calls=1)
+        with patch('src.batch_loader.openai.AsyncOpenAI', return_value=client):
+            results = self.loader.chunk_texts_with_llm(self.texts[:1], 500)
+
+        metrics = self.loader.load_metrics["llm_chunking"]
+        self.assertEqual(client.calls, 2)
+        self.assertEqual(metrics["timeouts"], 1)
+        self.assertEqual(metrics["fallbacks"], 0)
+        self.assertEqual(results[self.texts[0]][0]['chunk_text'], "only chunk")
+
+    def test_timeout_falls_back_to_simple_chunking(self):
+        """Test a text that times out on every attempt is chunked simply and is not memoized."""
+        self.loader.llm_timeout_seconds = 0.01
+        client = FakeAsyncOpenAI("only chunk", delay=0.5)
+        with patch('src.batch_loader.openai.AsyncOpenAI', return_value=client):
+            results = self.loader.chunk_texts_with_llm(self.texts[:1], 500)
+
+        metrics = self.loader.load_metrics["llm_chunking"]
+        self.assertEqual(client.calls, 2)
+        self.assertEqual(metrics["timeouts"], 2)
+        self.assertEqual(metrics["fallbacks"], 1)
+        self.assertEqual(results[self.texts[0]][0]['chunk_text'], self.texts[0][:500])
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+
+class TestBatchNeo4jLoaderGraphStatistics(unittest.TestCase):
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.loader = BatchNeo4jLoader()
+        self.loader.neo4j_driver = MagicMock()
+
+    def test_counts_are_read_in_one_query(self):
+        """Test node and relationship counts come back from a single UNION ALL query."""
+        rows = [{"kind": "node", "name": "Article", "count": 10},
+                {"kind": "relationship", "name": "HAS_CHUNK", "count": 40}]
+        with patch.object(self.loader, 'execute_cypher_query', return_value={"records": rows}) as mock_query:
+            counts = self.loader.get_neo4j_counts()
+
+        mock_query.assert_called_once()
+        cypher = mock_query.call_args[0][0]
+        self.assertEqual(cypher.count("UNION ALL"), 8)
+        self.assertEqual(counts["nodes_existing_count"]["Article"], 10)
+        self.assertEqual(counts["nodes_existing_count"]["Tag"], 0)
+        self.assertEqual(counts["relationships_existing_count"]["HAS_CHUNK"], 40)
+
+    def test_schema_sizes_vector_index_to_embedding_model(self):
+        """Test the chunk vector index uses the model's dimension instead of the model file's."""
+        self.loader.embedding_model = MagicMock()
+        self.loader.embedding_model.get_sentence_embedding_dimension.return_value = 768
+        model = {"indexes": [{"type": "VECTOR", "node_label": "Chunk", "property": "embedding",
+                              "vector_dimension": 1536, "vector_similarity": "cosine"}]}
+        self.assertTrue(self.loader._has_chunk_vector_index(model))
+
+        with patch.object(self.loader, 'execute_cypher_query', return_value={"records": []}) as mock_query:
+            self.loader.apply_schema_from_model(model, vector_dimension_override=self.loader.get_embedding_dimension())
+
+        self.assertIn("`vector.dimensions`: 768", mock_query.call_args[0][0])
+        self.assertEqual(self.loader.embedding_dimension, 768)
+
+    def test_bump_graph_version_records_new_version(self):
+        """Test the graph version marker is incremented and recorded in batch metrics."""
+        with patch.object(self.loader, 'execute_cypher_query',
+                          return_value={"records": [{"version": 7}]}) as mock_query:
+            version = self.loader.bump_graph_version()
+
+        cypher, params = mock_query.call_args[0]
+        self.assertIn("MERGE (v:GraphVersion {name: $name})", cypher)
+        self.assertEqual(params, {"name": "graph"})
+        self.assertEqual(version, 7)
+        self.assertEqual(self.loader.batch_metrics["graph_version"], 7)
+
+    def test_bump_graph_version_failure_does_not_raise(self):
+        """Test a failed version bump is logged instead of failing the load."""
+        with patch.object(self.loader, 'execute_cypher_query', side_effect=Exception("unavailable")):
+            self.assertIsNone(self.loader.bump_graph_version())
+        self.assertNotIn("graph_version", self.loader.batch_metrics)
+
+    def test_apoc_counts_fall_back_to_count_store(self):
+        """Test apoc mode falls back to the count store query when APOC is missing."""
+        self.loader.get_batch_config({"batch_config": {"statistics_source": "apoc"}})
+        rows = [{"kind": "node", "name": "Chunk", "count": 3}]
+        with patch.object(self.loader, 'execute_cypher_query',
+                          side_effect=[Exception("no procedure apoc.meta.stats"), {"records": rows}]):
+            counts = self.loader.get_neo4j_counts()
+
+        self.assertEqual(counts["nodes_existing_count"]["Chunk"], 3)
+
+    def test_touched_checks_are_scoped_to_run_ids(self):
+        """Test touched integrity checks only match the IDs written in this run."""
+        self.loader.get_batch_config({"batch_config": {"integrity_checks": "touched"}})
+        self.loader.record_touched_ids([{"id": 1}, {"id": 2}], [{"chunk_id": "c1"}])
+
+        with patch.object(self.loader, 'execute_cypher_query',
+                          return_value={"records": [{"label": "Article", "orphan_count": 0}]}) as mock_query:
+            self.loader.check_orphan_nodes()
+
+        mock_query.assert_called_once()
+        cypher, params = mock_query.call_args[0]
+        self.assertIn("UNWIND $article_ids AS node_id MATCH (n:Article {id: node_id})", cypher)
+        self.assertIn("UNWIND $chunk_ids AS node_id MATCH (n:Chunk {chunk_id: node_id})", cypher)
+        self.assertNotIn("Website", cypher)
+        self.assertEqual(params, {"article_ids": [1, 2], "chunk_ids": ["c1"]})
+
+    def test_touched_checks_skip_when_nothing_was_written(self):
+        """Test no integrity query runs when the run wrote nothing."""
+        self.loader.get_batch_config({"batch_config": {"integrity_checks": "touched"}})
+        with patch.object(self.loader, 'execute_cypher_query') as mock_query:
+            self.loader.run_adhoc_tests()
+
+        mock_query.assert_not_called()
+        self.assertEqual(self.loader.adhoc_tests["status"], "completed")
+
+    def test_touched_ids_are_sent_in_chunks(self):
+        """Test touched IDs are split across round-trips and the counts summed."""
+        self.loader.get_batch_config({"batch_config": {"integrity_checks": "touched"}})
+        self.loader.record_touched_ids([{"id": i} for i in range(5)], [{"chunk_id": "c1"}])
+
+        with patch('src.batch_loader.INTEGRITY_CHECK_ID_CHUNK_SIZE', 2), \
+             patch.object(self.loader, 'execute_cypher_query',
+                          return_value={"records": [{"label": "Article", "orphan_count": 0}]}) as mock_query:
+            self.loader.check_orphan_nodes()
+
+        params = [c[0][1] for c in mock_query.call_args_list]
+        self.assertEqual(params, [
+            {"article_ids": [0, 1], "chunk_ids": ["c1"]},
+            {"article_ids": [2, 3]},
+            {"article_ids": [4]}
+        ])
+        self.assertEqual(self.loader.adhoc_tests["orphan_nodes"], {"Article": 0})
+
+    def test_async_checks_rewrite_metrics_and_close_driver(self):
+        """Test background checks finish, rewrite metrics and close the driver."""
+        driver = self.loader.neo4j_driver
+        with patch.object(self.loader, 'run_adhoc_tests') as mock_tests, \
+             patch.object(self.loader, 'write_adhoc_test_metrics') as mock_metrics:
+            self.loader.start_adhoc_tests_async("metrics.json")
+            self.assertTrue(self.loader.wait_for_adhoc_tests(timeout=5))
+
+        mock_tests.assert_called_once()
+        mock_metrics.assert_called_once_with("metrics.json")
+        driver.close.assert_called_once()
+
+    def test_async_checks_only_replace_their_section_of_the_metrics(self):
+        """Test background results land in the metrics file the main thread wrote."""
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, temp_dir, ignore_errors=True)
+        metrics_file = os.path.join(temp_dir, "metrics.json")
+        self.loader.get_batch_config({"batch_config": {"integrity_checks": "full"}})
+        self.loader.adhoc_tests["status"] = "running"
+        self.loader.batch_metrics["total_batches"] = 3
+        self.loader.write_batch_metrics(metrics_file)
+
+        release = threading.Event()
+        def slow_query(cypher, parameters):
+            release.wait(5)
+            return {"records": []}
+
+        with patch.object(self.loader, 'execute_cypher_query', side_effect=slow_query):
+            self.loader.start_adhoc_tests_async(metrics_file)
+            with open(metrics_file) as f:
+                self.assertEqual(json.load(f)["adhoc_tests"]["status"], "running")
+            self.loader.batch_metrics["total_batches"] = 99
+            release.set()
+            self.assertTrue(self.loader.wait_for_adhoc_tests(timeout=5))
+
+        with open(metrics_file) as f:
+            metrics = json.load(f)
+        self.assertEqual(metrics["adhoc_tests"]["status"], "completed")
+        self.assertNotIn("orphan_relationships", metrics["adhoc_tests"])
+        self.assertEqual(metrics["batch_metrics"]["total_batches"], 3)
+        self.assertEqual(os.listdir(temp_dir), ["metrics.json"])
+
+
+if __name__ == '__main__':
+    unittest.main()
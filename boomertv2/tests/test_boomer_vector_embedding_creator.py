@@ -0,0 +1,75 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the boomer-vector-embedding-creator micro-batching layer.
+"""
+
+import asyncio
+import unittest
+from unittest.mock import patch
+import sys
+from pathlib import Path
+
+# Add src directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+try:
+    from src import boomer_vector_embedding_creator as server
+except RuntimeError as e:  # the server module requires the mcp package
+    raise unittest.SkipTest(str(e))
+
+
+def fake_encode_batch(texts):
+    return [[float(len(text)), 1.0] for text in texts]
+
+
+class TestEmbeddingBatcher(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        """Use a fresh batcher for every test."""
+        server._batcher = server._EmbeddingBatcher(max_batch_size=8, max_wait_ms=20)
+
+    async def test_concurrent_requests_share_one_encode_call(self):
+        """Test concurrent create_embedding calls are encoded together and fanned back out."""
+        with patch.object(server, '_encode_batch', side_effect=fake_encode_batch) as mock_encode:
+            results = await asyncio.gather(*(server.create_embedding("x" * n) for n in range(1, 6)))
+
+        mock_encode.assert_called_once()
+        self.assertEqual([result["embedding"][0] for result in results], [1.0, 2.0, 3.0, 4.0, 5.0])
+        self.assertEqual(server._batcher.stats["largest_batch"], 5)
+
+    async def test_batches_are_capped_at_max_batch_size(self):
+        """Test a large request is split into batches no bigger than max_batch_size."""
+        texts = [f"text {i}" for i in range(20)]
+        with patch.object(server, '_encode_batch', side_effect=fake_encode_batch) as mock_encode:
+            result = await server.create_embeddings(texts)
+
+        self.assertEqual(result["count"], 20)
+        self.assertEqual(len(result["embeddings"]), 20)
+        self.assertTrue(all(len(call.args[0]) <= 8 for call in mock_encode.call_args_list))
+        self.assertEqual(sum(len(call.args[0]) for call in mock_encode.call_args_list), 20)
+
+    async def test_create_embeddings_keeps_positions_of_empty_texts(self):
+        """Test empty inputs get an empty embedding in place and are reported."""
+        with patch.object(server, '_encode_batch', side_effect=fake_encode_batch):
+            result = await server.create_embeddings(["ab", "  ", "abcd"])
+
+        self.assertEqual(result["embeddings"][0], [2.0, 1.0])
+        self.assertEqual(result["embeddings"][1], [])
+        self.assertEqual(result["embeddings"][2], [4.0, 1.0])
+        self.assertEqual(result["empty_indices"], [1])
+        self.assertEqual(result["dimension"], 2)
+
+    async def test_encode_failure_reaches_every_caller(self):
+        """Test a failed batch raises for each waiting request and the batcher keeps serving."""
+        with patch.object(server, '_encode_batch', side_effect=RuntimeError("model error")):
+            results = await asyncio.gather(server.create_embedding("a"), server.create_embedding("b"),
+                                           return_exceptions=True)
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+
+        with patch.object(server, '_encode_batch', side_effect=fake_encode_batch):
+            result = await server.create_embedding("abc")
+        self.assertEqual(result["embedding"], [3.0, 1.0])
+
+
+if __name__ == '__main__':
+    unittest.main()
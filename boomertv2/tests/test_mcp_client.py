@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the persistent stdio MCP client, run against a local stub MCP server.
+"""
+
+import sys
+import threading
+import unittest
+from pathlib import Path
+
+# Add src directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.mcp_client import MCPClient
+
+STUB_SERVER = str(Path(__file__).parent / "fixtures" / "stub_mcp_server.py")
+
+
+class TestMCPClientSession(unittest.TestCase):
+
+    def setUp(self):
+        """Set up a client for the stub server."""
+        self.client = MCPClient({
+            "name": "stub",
+            "command": sys.executable,
+            "args": ["-u", STUB_SERVER],
+            "request_timeout": 10
+        })
+
+    def tearDown(self):
+        self.client.close()
+
+    def test_server_is_started_once_for_many_calls(self):
+        """Test repeated calls reuse one server process."""
+        for i in range(5):
+            self.assertEqual(self.client.call_mcp_cypher_server(f"count {i}"), f"// count {i}")
+
+        stats = self.client.get_stats()
+        self.assertEqual(stats["starts"], 1)
+        self.assertTrue(stats["running"])
+        self.assertEqual(stats["calls"]["tools/call:write_cypher"]["count"], 5)
+        self.assertEqual(self.client.server_info["name"], "stub-mcp")
+
+    def test_concurrent_calls_are_pipelined_by_request_id(self):
+        """Test a slow call does not hold up later calls and responses reach the right caller."""
+        results = {}
+
+        def slow_call():
+            results["slow"] = self.client.call_tool("slow", {"seconds": 0.5, "tag": "a"})
+
+        thread = threading.Thread(target=slow_call)
+        thread.start()
+        fast = self.client.call_tool("write_cypher", {"query": "fast"})
+        self.assertNotIn("slow", results)
+        thread.join()
+
+        self.assertEqual(fast["content"][0]["text"], "// fast")
+        self.assertEqual(results["slow"]["content"][0]["text"], "slow:a")
+
+    def test_crashed_server_is_restarted(self):
+        """Test a call after a crash starts a new server process."""
+        self.client.call_mcp_cypher_server("before")
+        with self.assertRaises(Exception):
+            self.client.call_tool("crash", {}, timeout=5)
+
+        self.assertEqual(self.client.call_mcp_cypher_server("after"), "// after")
+        stats = self.client.get_stats()
+        self.assertEqual(stats["starts"], 2)
+        self.assertEqual(stats["restarts"], 1)
+        self.assertEqual(stats["calls"]["tools/call:crash"]["errors"], 1)
+
+    def test_health_check_pings_server(self):
+        """Test health checks answer over the running session."""
+        self.assertTrue(self.client.health_check())
+        self.assertEqual(self.client.get_stats()["calls"]["ping"]["count"], 1)
+
+    def test_failed_health_check_restarts_through_the_restart_limit(self):
+        """Test a hung server is restarted by the health check and counted like any restart."""
+        client = MCPClient({"name": "stub", "command": sys.executable, "args": ["-u", STUB_SERVER],
+                            "request_timeout": 1, "max_restarts": 1})
+        try:
+            client.call_tool("mute", {})
+            self.assertTrue(client.health_check())
+            stats = client.get_stats()
+            self.assertEqual(stats["starts"], 2)
+            self.assertEqual(stats["restarts"], 1)
+        finally:
+            client.close()
+
+    def test_health_check_respects_max_restarts(self):
+        """Test the health check gives up instead of restarting past max_restarts."""
+        client = MCPClient({"name": "stub", "command": sys.executable, "args": ["-u", STUB_SERVER],
+                            "request_timeout": 1, "max_restarts": 0})
+        try:
+            client.call_tool("mute", {})
+            self.assertFalse(client.health_check())
+            stats = client.get_stats()
+            self.assertEqual(stats["starts"], 1)
+            self.assertEqual(stats["restarts"], 0)
+        finally:
+            client.close()
+
+    def test_tool_error_falls_back(self):
+        """Test an error result from the tool uses the fallback query."""
+        client = MCPClient({"name": "stub", "command": sys.executable, "args": ["-u", STUB_SERVER]})
+        try:
+            self.assertEqual(client._tool_text({"content": [{"text": "ok"}]}), "ok")
+            with self.assertRaises(Exception):
+                client._tool_text(client.call_tool("fail", {}))
+        finally:
+            client.close()
+
+    def test_unavailable_server_falls_back(self):
+        """Test a server that cannot be started falls back to the basic query."""
+        client = MCPClient({"name": "missing", "command": "/nonexistent/mcp-server", "args": []})
+        query = client.call_mcp_cypher_server("count articles")
+        self.assertEqual(query, "MATCH (n) RETURN count(n) as total_count")
+
+
+if __name__ == '__main__':
+    unittest.main()
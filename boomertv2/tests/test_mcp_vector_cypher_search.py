@@ -0,0 +1,196 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the mcp-vector-cypher-search server's async search path.
+"""
+
+import asyncio
+import json
+import os
+import tempfile
+import unittest
+from unittest.mock import patch
+import sys
+from pathlib import Path
+
+# Add src directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+try:
+    from src import mcp_vector_cypher_search as server
+    from src.embedding_cache import QueryEmbeddingCache
+except RuntimeError as e:  # the server module requires the mcp package
+    raise unittest.SkipTest(str(e))
+
+
+class TestVectorCypherSearchAsync(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        """Start every test with an empty query embedding cache."""
+        server._query_embedding_cache = QueryEmbeddingCache(8, 60)
+
+    async def test_vector_search_and_cypher_run_concurrently(self):
+        """Test the vector and Cypher branches overlap and report per-step latency."""
+        events = []
+
+        async def fake_search(embedding, top_k=5):
+            events.append("search_start")
+            await asyncio.sleep(0.05)
+            events.append("search_end")
+            return [{"chunk_id": "chunk_1", "similarity_score": 0.9}]
+
+        async def fake_execute(query):
+            events.append("cypher_start")
+            await asyncio.sleep(0.05)
+            events.append("cypher_end")
+            return [{"n": 1}]
+
+        with patch.object(server, '_encode_text', return_value=[0.1, 0.2, 0.3]) as mock_encode, \
+             patch.object(server, '_search_similar_chunks', side_effect=fake_search), \
+             patch.object(server, '_execute_cypher_query', side_effect=fake_execute):
+            result = await server.vector_cypher_search("tell me about articles")
+
+        self.assertEqual(result["search_type"], "vector")
+        self.assertEqual(result["metadata"]["embedding_dimension"], 3)
+        mock_encode.assert_called_once()
+        # Cypher execution starts before the vector search finishes
+        self.assertLess(events.index("cypher_start"), events.index("search_end"))
+        latency = result["metadata"]["step_latency_ms"]
+        for step in ("embedding", "vector_search", "cypher_generation", "cypher_execution", "total"):
+            self.assertIn(step, latency)
+
+    async def test_direct_cypher_skips_embedding(self):
+        """Test direct Cypher questions never call the embedding model."""
+        async def fake_execute(query):
+            return [{"total_nodes": 3}]
+
+        with patch.object(server, '_encode_text') as mock_encode, \
+             patch.object(server, '_execute_cypher_query', side_effect=fake_execute):
+            result = await server.vector_cypher_search("count user nodes")
+
+        self.assertEqual(result["search_type"], "direct_cypher")
+        mock_encode.assert_not_called()
+        self.assertNotIn("embedding", result["metadata"]["step_latency_ms"])
+        self.assertEqual(result["metadata"]["embedding_dimension"], 0)
+
+    async def test_repeated_question_is_served_from_cache(self):
+        """Test a repeated (whitespace-variant) question is encoded once and counted as a hit."""
+        with patch.object(server, '_encode_text', return_value=[0.5, 0.5]) as mock_encode:
+            first = await server._create_embedding("what is  graph rag")
+            second = await server._create_embedding(" what is graph rag ")
+
+        self.assertEqual(first, second)
+        mock_encode.assert_called_once()
+        stats = (await server.configure_search_parameters())["embedding_cache"]
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["misses"], 1)
+        self.assertEqual(stats["hit_rate"], 0.5)
+
+    def test_cache_evicts_least_recently_used_and_expires(self):
+        """Test the cache honours its size bound and TTL."""
+        cache = QueryEmbeddingCache(2, 60)
+        cache.put("m", "a", [1.0], 1.0)
+        cache.put("m", "b", [2.0], 1.0)
+        cache.get("m", "a")
+        cache.put("m", "c", [3.0], 1.0)
+
+        self.assertIsNone(cache.get("m", "b"))
+        self.assertEqual(cache.get("m", "a"), [1.0])
+        self.assertIsNone(cache.get("other-model", "a"))
+
+        with patch.object(server.time, 'monotonic', return_value=server.time.monotonic() + 120):
+            self.assertIsNone(cache.get("m", "c"))
+        self.assertEqual(cache.get_stats()["expirations"], 1)
+
+    def test_cached_embedding_cannot_be_modified_by_callers(self):
+        """Test neither the stored list nor a returned copy can change the cached value."""
+        cache = QueryEmbeddingCache(2, 60)
+        embedding = [1.0, 2.0]
+        cache.put("m", "a", embedding, 1.0)
+        embedding[0] = 9.0
+        cache.get("m", "a").append(3.0)
+
+        self.assertEqual(cache.get("m", "a"), [1.0, 2.0])
+
+
+    async def test_hybrid_search_fuses_vector_and_lexical_results(self):
+        """Test hybrid mode runs both searches concurrently and ranks shared hits first."""
+        events = []
+
+        async def fake_vector(embedding, top_k=5):
+            events.append("vector_start")
+            await asyncio.sleep(0.05)
+            events.append("vector_end")
+            return [{"node_id": "n1", "chunk_id": "c1", "similarity_score": 0.95},
+                    {"node_id": "n2", "chunk_id": "c2", "similarity_score": 0.90}]
+
+        async def fake_lexical(question, top_k=5):
+            events.append("lexical_start")
+            await asyncio.sleep(0.05)
+            events.append("lexical_end")
+            return [{"node_id": "n3", "chunk_id": "c3", "lexical_score": 7.5},
+                    {"node_id": "n2", "chunk_id": "c2", "lexical_score": 5.0}]
+
+        async def fake_execute(query):
+            return []
+
+        with patch.object(server, '_encode_text', return_value=[0.1, 0.2]), \
+             patch.object(server, '_search_similar_chunks', side_effect=fake_vector), \
+             patch.object(server, '_search_fulltext_chunks', side_effect=fake_lexical), \
+             patch.object(server, '_execute_cypher_query', side_effect=fake_execute):
+            result = await server.vector_cypher_search("Jane Doe retirement articles", search_mode="hybrid")
+
+        self.assertEqual(result["search_type"], "hybrid")
+        self.assertLess(events.index("lexical_start"), events.index("vector_end"))
+        chunk_ids = [chunk["chunk_id"] for chunk in result["chunks"]]
+        self.assertEqual(chunk_ids[0], "c2")
+        self.assertEqual(set(chunk_ids), {"c1", "c2", "c3"})
+        self.assertEqual(result["chunks"][0]["matched_by"], ["vector", "lexical"])
+        self.assertEqual(result["chunks"][0]["lexical_score"], 5.0)
+        for step in ("embedding", "vector_search", "lexical_search", "fusion"):
+            self.assertIn(step, result["metadata"]["step_latency_ms"])
+
+    async def test_lexical_search_skips_embedding_and_rejects_unknown_mode(self):
+        """Test lexical mode never embeds and an unknown mode is reported as an error."""
+        async def fake_lexical(question, top_k=5):
+            return [{"node_id": "n1", "chunk_id": "c1", "lexical_score": 3.0}]
+
+        async def fake_execute(query):
+            return []
+
+        with patch.object(server, '_encode_text') as mock_encode, \
+             patch.object(server, '_search_fulltext_chunks', side_effect=fake_lexical), \
+             patch.object(server, '_execute_cypher_query', side_effect=fake_execute):
+            result = await server.vector_cypher_search("AARP", search_mode="lexical")
+            invalid = await server.vector_cypher_search("AARP", search_mode="semantic")
+
+        mock_encode.assert_not_called()
+        self.assertEqual(result["search_type"], "lexical")
+        self.assertEqual(result["chunks"][0]["chunk_id"], "c1")
+        self.assertEqual(invalid["search_type"], "error")
+
+    def test_escape_lucene_quotes_query_syntax(self):
+        """Test Lucene operators in a question are escaped before the full-text query."""
+        self.assertEqual(server._escape_lucene('401(k) "plans"?'), '401\\(k\\) \\"plans\\"\\?')
+
+    async def test_benchmark_reports_latency_and_recall_per_mode(self):
+        """Test the benchmark scores each mode against labelled expected chunks."""
+        async def fake_retrieve(question, mode, top_k, step_latency_ms, use_cache=True):
+            found = {"vector": ["c1"], "lexical": ["c2"], "hybrid": ["c1", "c2"]}[mode]
+            return [], [{"chunk_id": chunk_id} for chunk_id in found]
+
+        with tempfile.NamedTemporaryFile("w", suffix=".json", delete=False) as f:
+            json.dump({"queries": [{"question": "q", "expected_chunk_ids": ["c1", "c2"]}]}, f)
+        self.addCleanup(os.unlink, f.name)
+
+        with patch.object(server, '_retrieve_chunks', side_effect=fake_retrieve):
+            report = await server.benchmark_search_modes(queries_path=f.name)
+
+        self.assertEqual(report["modes"]["vector"]["mean_recall"], 0.5)
+        self.assertEqual(report["modes"]["lexical"]["mean_recall"], 0.5)
+        self.assertEqual(report["modes"]["hybrid"]["mean_recall"], 1.0)
+        self.assertEqual(report["modes"]["hybrid"]["queries"], 1)
+        self.assertIn("p95", report["modes"]["vector"]["latency_ms"])
+
+
+if __name__ == '__main__':
+    unittest.main()
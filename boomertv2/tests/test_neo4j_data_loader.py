@@ -398,6 +398,130 @@ class TestNeo4jDataLoader(unittest.TestCase):
         mock_write_metrics.assert_called_once()
 
 
+class TestNeo4jDataLoaderWriteScope(unittest.TestCase):
+    """Test the pooled write path."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.loader = Neo4jDataLoader()
+        self.loader.neo4j_driver = MagicMock()
+        self.session = self.loader.neo4j_driver.session.return_value
+        self.tx = self.session.begin_transaction.return_value
+
+    def test_configure_neo4j_performance_sets_driver_options(self):
+        """Test pool and fetch sizes are passed through to the driver."""
+        self.loader.configure_neo4j_performance({"connection_pool_size": 10, "fetch_size": 500,
+                                                 "write_transaction_max_statements": 50})
+
+        self.assertEqual(self.loader.neo4j_driver_options(), {"max_connection_pool_size": 10, "fetch_size": 500})
+        self.assertEqual(self.loader.write_scope_max_statements, 50)
+
+    def test_writes_in_scope_share_one_session_and_transaction(self):
+        """Test scoped writes reuse one session and commit once at the end."""
+        with self.loader.write_scope():
+            for i in range(3):
+                self.loader.execute_cypher_write("MERGE (n:Tag {tag_name: $name})", {"name": str(i)}, 'nodes', 'Tag')
+
+        self.loader.neo4j_driver.session.assert_called_once()
+        self.session.begin_transaction.assert_called_once()
+        self.assertEqual(self.tx.run.call_count, 3)
+        self.tx.commit.assert_called_once()
+        self.session.close.assert_called_once()
+        self.assertEqual(self.loader.cypher_latency[('nodes', 'Tag')]["count"], 3)
+
+    def test_scope_commits_every_max_statements(self):
+        """Test a long scope is split into several transactions."""
+        self.loader.write_scope_max_statements = 2
+        with self.loader.write_scope():
+            for i in range(5):
+                self.loader.execute_cypher_write("MERGE (n:Tag {tag_name: $name})", {"name": str(i)})
+
+        self.assertEqual(self.session.begin_transaction.call_count, 3)
+        self.assertEqual(self.tx.commit.call_count, 3)
+
+    def test_failed_statement_replays_earlier_statements(self):
+        """Test a failing statement only loses itself, not the statements before it."""
+        self.tx.run.side_effect = [MagicMock(), Exception("constraint violation"), MagicMock(), MagicMock()]
+
+        with self.loader.write_scope():
+            self.loader.execute_cypher_write("CREATE (n:A)", {})
+            with self.assertRaises(Exception) as context:
+                self.loader.execute_cypher_write("CREATE (n:B)", {})
+            self.loader.execute_cypher_write("CREATE (n:C)", {})
+
+        self.assertIn(Neo4jLoaderErrorCodes.NEO4J_EXECUTION_ERROR, str(context.exception))
+        self.tx.rollback.assert_called_once()
+        executed = [c[0][0] for c in self.tx.run.call_args_list]
+        self.assertEqual(executed, ["CREATE (n:A)", "CREATE (n:B)", "CREATE (n:A)", "CREATE (n:C)"])
+        # The replay is committed on its own, then C at scope exit
+        self.assertEqual(self.tx.commit.call_count, 2)
+
+    def test_each_statement_is_replayed_at_most_once(self):
+        """Test repeated failures do not replay the same statements again."""
+        def run(cypher, parameters):
+            if cypher.startswith("FAIL"):
+                raise Exception("constraint violation")
+            return MagicMock()
+        self.tx.run.side_effect = run
+
+        with self.loader.write_scope():
+            for i in range(3):
+                self.loader.execute_cypher_write(f"CREATE (n:A{i})", {})
+            for i in range(3):
+                with self.assertRaises(Exception):
+                    self.loader.execute_cypher_write(f"FAIL {i}", {})
+
+        executed = [c[0][0] for c in self.tx.run.call_args_list]
+        self.assertEqual(executed.count("CREATE (n:A0)"), 2)
+        self.assertEqual(len(executed), 9)
+
+    def test_replay_bisects_around_a_statement_that_now_fails(self):
+        """Test a replay failure drops only the statement that fails on its own."""
+        replayed = []
+        def run(cypher, parameters):
+            if cypher == "CREATE (n:E)" or (cypher == "CREATE (n:C)" and replayed):
+                raise Exception("constraint violation")
+            return MagicMock()
+        self.tx.run.side_effect = run
+        self.tx.rollback.side_effect = lambda: replayed.append(True)
+
+        with self.loader.write_scope():
+            for label in "ABCD":
+                self.loader.execute_cypher_write(f"CREATE (n:{label})", {})
+            with self.assertRaises(Exception) as context:
+                self.loader.execute_cypher_write("CREATE (n:E)", {})
+
+        self.assertIn("constraint violation", str(context.exception))
+        executed = [c[0][0] for c in self.tx.run.call_args_list]
+        self.assertEqual(executed[5:], [
+            "CREATE (n:A)", "CREATE (n:B)", "CREATE (n:C)",
+            "CREATE (n:A)", "CREATE (n:B)",
+            "CREATE (n:C)",
+            "CREATE (n:C)", "CREATE (n:D)"
+        ])
+        self.assertEqual(self.tx.commit.call_count, 2)
+
+    def test_replay_error_does_not_replace_the_original_error(self):
+        """Test the statement's own error is raised, chained to the replay failure."""
+        self.tx.run.side_effect = [MagicMock(), Exception("constraint violation")]
+
+        with self.assertRaises(Exception) as context:
+            with self.loader.write_scope():
+                self.loader.execute_cypher_write("CREATE (n:A)", {})
+                self.session.begin_transaction.side_effect = Exception("session expired")
+                self.loader.execute_cypher_write("CREATE (n:B)", {})
+
+        self.assertIn("constraint violation", str(context.exception))
+        self.assertEqual(str(context.exception.__cause__.__cause__), "session expired")
+
+    def test_bulk_write_commits_open_scope_first(self):
+        """Test a managed bulk transaction sees the scope's earlier writes."""
+        with self.loader.write_scope():
+            self.loader.execute_cypher_write("CREATE (n:A)", {})
+            self.loader.execute_write_statements([("UNWIND $rows AS row MERGE (n:B {id: row})", {"rows": [1]})])
+            self.tx.commit.assert_called_once()
+
+
 class TestNeo4jLoaderErrorCodes(unittest.TestCase):
     """Test that all Neo4j loader error codes are unique."""
     
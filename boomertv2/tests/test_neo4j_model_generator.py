@@ -280,6 +280,21 @@ class TestNeo4jModelGenerator(unittest.TestCase):
         
         self.assertIn('ERR_007', str(context.exception))
 
+    def test_create_fulltext_index_spans_labels_and_properties(self):
+        """Test FULLTEXT index definitions cover every configured label and property."""
+        index = self.generator._create_index(
+            "Chunk", "chunk_text", "FULLTEXT", index_name="chunk_text_fulltext",
+            node_labels=["Chunk", "Article"], properties=["chunk_text", "title"]
+        )
+        
+        self.assertEqual(index["type"], "FULLTEXT")
+        self.assertEqual(index["index_name"], "chunk_text_fulltext")
+        self.assertEqual(
+            index["cypher"],
+            "CREATE FULLTEXT INDEX chunk_text_fulltext IF NOT EXISTS "
+            "FOR (n:Chunk|Article) ON EACH [n.chunk_text, n.title]"
+        )
+
 
 class TestNeo4jErrorCodes(unittest.TestCase):
     """Test that all Neo4j error codes are unique."""
@@ -9,6 +9,8 @@ from .server import MCPVectorCypherServer
 from .config import Config
 from .search import VectorSearch
 from .cypher import CypherGenerator
+from .cache import QueryEmbeddingCache
+from .ann_index import ChunkANNIndex
 
 __version__ = "1.0.0"
 __author__ = "Your Name"
@@ -18,5 +20,7 @@ __all__ = [
     "MCPVectorCypherServer",
     "Config", 
     "VectorSearch",
-    "CypherGenerator"
+    "CypherGenerator",
+    "QueryEmbeddingCache",
+    "ChunkANNIndex"
 ]
\ No newline at end of file
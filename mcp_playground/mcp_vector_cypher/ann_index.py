@@ -0,0 +1,541 @@
+"""
+Offline approximate nearest neighbour index for MCP Vector Cypher Search.
+
+Chunk embeddings are kept L2-normalized in a memory-mapped float32 matrix next
+to their metadata, and partitioned with an IVF (inverted file) layout: a k-means
+codebook of centroids with every vector assigned to its nearest centroid. A
+query scores the centroids and only scans the vectors in the nprobe closest
+lists, so similarity search runs in-process without a Neo4j round-trip.
+
+On-disk layout (one directory per index):
+
+    vectors.f32   row-major float32 matrix, appended as chunks are added
+    chunks.jsonl  one metadata line per matrix row
+    ivf.npz       centroids, row assignments and the deleted-row mask
+    meta.json     dimension, row count and export offsets; written last on save
+"""
+
+import json
+import logging
+import math
+import os
+import threading
+from typing import List, Dict, Any, Optional, Iterable
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+VECTORS_FILE = "vectors.f32"
+CHUNKS_FILE = "chunks.jsonl"
+IVF_FILE = "ivf.npz"
+META_FILE = "meta.json"
+FORMAT_VERSION = 1
+
+# Metadata kept per row and returned with search results
+CHUNK_FIELDS = ("chunk_id", "content", "source_id", "title", "url")
+# Assignment of rows added before a codebook was trained; always scanned
+UNASSIGNED = -1
+# Rows scored per matrix product when scanning the whole index
+SCAN_BLOCK_ROWS = 65536
+
+
+class ChunkANNIndex:
+    """IVF index over a memory-mapped float32 matrix of chunk embeddings."""
+
+    def __init__(self, path: str, dimension: Optional[int] = None, nlist: Optional[int] = None,
+                 nprobe: int = 8, min_train_size: int = 1024, retrain_ratio: float = 0.2):
+        """
+        Initialize ChunkANNIndex, loading it from path if it exists.
+
+        Args:
+            path: Directory holding the index files
+            dimension: Embedding dimension (taken from the first added chunk if None)
+            nlist: Number of IVF lists (defaults to sqrt of the row count)
+            nprobe: Number of closest lists scanned per query
+            min_train_size: Rows needed before a codebook is trained; smaller
+                indexes are scanned exhaustively
+            retrain_ratio: Fraction of rows added or removed since the last
+                training after which needs_training() reports True
+        """
+        self.path = path
+        self.dimension = dimension
+        self.nlist = nlist
+        self.nprobe = max(1, int(nprobe))
+        self.min_train_size = max(1, int(min_train_size))
+        self.retrain_ratio = max(0.0, float(retrain_ratio))
+        self._lock = threading.RLock()
+        self._reset_state()
+        self.stats = {"searches": 0, "rows_scanned": 0, "added": 0, "removed": 0, "trainings": 0}
+
+        if os.path.exists(os.path.join(path, META_FILE)):
+            self._load()
+
+    def _reset_state(self) -> None:
+        """Clear in-memory state."""
+        self._count = 0
+        self._chunks_bytes = 0
+        self._chunks: List[Dict[str, Any]] = []
+        self._row_by_id: Dict[str, int] = {}
+        self._ids_by_source: Dict[str, set] = {}
+        self._deleted = np.zeros(0, dtype=bool)
+        self._assignments = np.zeros(0, dtype=np.int32)
+        self._centroids: Optional[np.ndarray] = None
+        self._lists: Optional[List[np.ndarray]] = None
+        self._vectors: Optional[np.memmap] = None
+        self._trained_rows = 0
+        self._changes_since_training = 0
+        self.export_offsets: Dict[str, int] = {}
+
+    def _file(self, name: str) -> str:
+        return os.path.join(self.path, name)
+
+    @property
+    def live_count(self) -> int:
+        """Number of searchable (not deleted) rows."""
+        return len(self._row_by_id)
+
+    def _load(self) -> None:
+        """Load the index, dropping rows appended after the last save."""
+        with open(self._file(META_FILE)) as f:
+            meta = json.load(f)
+        if meta.get("format_version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported ANN index format {meta.get('format_version')} in {self.path}")
+
+        count = int(meta["count"])
+        dimension = int(meta["dimension"]) if meta.get("dimension") else None
+        if self.dimension is not None and dimension is not None and dimension != self.dimension:
+            raise ValueError(f"ANN index at {self.path} has dimension {dimension}, expected {self.dimension}")
+        self.dimension = dimension
+
+        vector_bytes = count * (dimension or 0) * 4
+        chunks_bytes = int(meta["chunks_bytes"])
+        if os.path.getsize(self._file(VECTORS_FILE)) < vector_bytes or \
+                os.path.getsize(self._file(CHUNKS_FILE)) < chunks_bytes:
+            raise ValueError(f"ANN index at {self.path} is incomplete; rebuild it")
+        # An interrupted add may have appended rows that were never saved
+        os.truncate(self._file(VECTORS_FILE), vector_bytes)
+        os.truncate(self._file(CHUNKS_FILE), chunks_bytes)
+
+        with open(self._file(CHUNKS_FILE), "rb") as f:
+            self._chunks = [json.loads(line) for line in f]
+        with np.load(self._file(IVF_FILE)) as ivf:
+            centroids = ivf["centroids"]
+            self._assignments = ivf["assignments"][:count].astype(np.int32)
+            self._deleted = ivf["deleted"][:count].astype(bool)
+
+        self._count = count
+        self._chunks_bytes = chunks_bytes
+        self._centroids = centroids if len(centroids) else None
+        self._trained_rows = int(meta.get("trained_rows", 0))
+        self._changes_since_training = int(meta.get("changes_since_training", 0))
+        self.export_offsets = dict(meta.get("export_offsets", {}))
+        for row, chunk in enumerate(self._chunks):
+            if not self._deleted[row]:
+                self._index_row(row, chunk)
+        logger.info(f"Loaded ANN index from {self.path}: {self.live_count} chunks, "
+                    f"{len(self._centroids) if self._centroids is not None else 0} lists")
+
+    def _index_row(self, row: int, chunk: Dict[str, Any]) -> None:
+        self._row_by_id[chunk["chunk_id"]] = row
+        self._ids_by_source.setdefault(str(chunk.get("source_id")), set()).add(chunk["chunk_id"])
+
+    def _get_vectors(self) -> Optional[np.ndarray]:
+        """Memory-map the vector file, reopening it after rows were appended."""
+        if self._vectors is None and self._count:
+            self._vectors = np.memmap(self._file(VECTORS_FILE), dtype=np.float32, mode="r",
+                                      shape=(self._count, self.dimension))
+        return self._vectors
+
+    def _get_lists(self) -> Optional[List[np.ndarray]]:
+        """Build the inverted lists (row numbers per centroid) from the assignments."""
+        if self._centroids is None:
+            return None
+        if self._lists is None:
+            order = np.argsort(self._assignments, kind="stable")
+            bounds = np.searchsorted(self._assignments[order], np.arange(-1, len(self._centroids) + 1))
+            # Slot 0 holds unassigned rows, slot c + 1 the rows of centroid c
+            self._lists = [order[bounds[i]:bounds[i + 1]] for i in range(len(bounds) - 1)]
+        return self._lists
+
+    def _normalize(self, matrix: np.ndarray) -> np.ndarray:
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        norms[norms == 0] = 1.0
+        return (matrix / norms).astype(np.float32, copy=False)
+
+    def add(self, chunks: Iterable[Dict[str, Any]]) -> int:
+        """
+        Add chunks, replacing stored chunks with the same chunk_id.
+
+        Args:
+            chunks: Dicts with chunk_id and embedding, plus optional content
+                (or chunk_text), source_id, title and url
+
+        Returns:
+            Number of chunks added
+        """
+        latest: Dict[str, Dict[str, Any]] = {}
+        for chunk in chunks:
+            if chunk.get("chunk_id") is not None and chunk.get("embedding") is not None:
+                latest[chunk["chunk_id"]] = chunk
+        if not latest:
+            return 0
+
+        matrix = np.asarray([chunk["embedding"] for chunk in latest.values()], dtype=np.float32)
+        if matrix.ndim != 2:
+            raise ValueError("Chunk embeddings must all have the same dimension")
+        if self.dimension is None:
+            self.dimension = matrix.shape[1]
+        elif matrix.shape[1] != self.dimension:
+            raise ValueError(f"Embedding dimension {matrix.shape[1]} does not match index dimension {self.dimension}")
+        matrix = self._normalize(matrix)
+
+        records = []
+        for chunk in latest.values():
+            record = {field: chunk.get(field) for field in CHUNK_FIELDS}
+            if record["content"] is None:
+                record["content"] = chunk.get("chunk_text")
+            records.append(record)
+        lines = [(json.dumps(record, default=str) + "\n").encode("utf-8") for record in records]
+
+        with self._lock:
+            self.remove(latest.keys())
+            os.makedirs(self.path, exist_ok=True)
+            with open(self._file(VECTORS_FILE), "ab") as f:
+                f.write(matrix.tobytes())
+            with open(self._file(CHUNKS_FILE), "ab") as f:
+                f.writelines(lines)
+
+            if self._centroids is not None:
+                assignments = self._assign(matrix)
+            else:
+                assignments = np.full(len(records), UNASSIGNED, dtype=np.int32)
+            first_row = self._count
+            self._assignments = np.concatenate([self._assignments, assignments])
+            self._deleted = np.concatenate([self._deleted, np.zeros(len(records), dtype=bool)])
+            self._chunks.extend(records)
+            for offset, record in enumerate(records):
+                self._index_row(first_row + offset, record)
+            self._count += len(records)
+            self._chunks_bytes += sum(len(line) for line in lines)
+            self._changes_since_training += len(records)
+            self._vectors = None
+            self._lists = None
+            self.stats["added"] += len(records)
+        return len(records)
+
+    def remove(self, chunk_ids: Iterable[str]) -> int:
+        """
+        Remove chunks by chunk_id.
+
+        Args:
+            chunk_ids: IDs of chunks to remove
+
+        Returns:
+            Number of chunks removed
+        """
+        removed = 0
+        with self._lock:
+            for chunk_id in chunk_ids:
+                row = self._row_by_id.pop(chunk_id, None)
+                if row is None:
+                    continue
+                self._deleted[row] = True
+                source_ids = self._ids_by_source.get(str(self._chunks[row].get("source_id")))
+                if source_ids is not None:
+                    source_ids.discard(chunk_id)
+                removed += 1
+            self._changes_since_training += removed
+            self.stats["removed"] += removed
+        return removed
+
+    def replace_source(self, source_id: Any, chunk_ids: Iterable[str]) -> int:
+        """
+        Remove chunks of a source record that are no longer among its current chunks.
+
+        Args:
+            source_id: Source record ID
+            chunk_ids: Current chunk IDs of the source record
+
+        Returns:
+            Number of chunks removed
+        """
+        with self._lock:
+            stale = self._ids_by_source.get(str(source_id), set()) - set(chunk_ids)
+            return self.remove(list(stale))
+
+    def apply_export(self, export_path: str, lines_per_step: int = 1000) -> Dict[str, int]:
+        """
+        Apply chunks appended to a batch loader chunk export since the last call.
+
+        Each export line holds the source_id, title and url of one source record
+        and the chunks written for it; lines that list chunk_ids also drop the
+        record's chunks missing from that list.
+        The byte offset consumed is saved with the index, so repeated calls only
+        read new lines. A trailing partial line is left for the next call.
+
+        Args:
+            export_path: Path of the JSONL chunk export
+            lines_per_step: Lines applied per add/remove step
+
+        Returns:
+            Counts of lines read and chunks added and removed
+        """
+        key = os.path.abspath(export_path)
+        offset = self.export_offsets.get(key, 0)
+        if os.path.getsize(export_path) < offset:
+            logger.info(f"Chunk export {export_path} was truncated, reading it from the start")
+            offset = 0
+
+        totals = {"lines": 0, "added": 0, "removed": 0}
+
+        def apply(entries: List[Dict[str, Any]]) -> None:
+            # Later lines win: add every chunk, then keep only each source's last listed IDs
+            self.add(
+                {"source_id": entry.get("source_id"), "title": entry.get("title"), "url": entry.get("url"), **chunk}
+                for entry in entries for chunk in entry.get("chunks", [])
+            )
+            totals["added"] += sum(len(entry.get("chunks", [])) for entry in entries)
+            current_ids = {str(entry["source_id"]): entry["chunk_ids"] for entry in entries if "chunk_ids" in entry}
+            for source_id, chunk_ids in current_ids.items():
+                totals["removed"] += self.replace_source(source_id, chunk_ids)
+
+        with self._lock, open(export_path, "rb") as f:
+            f.seek(offset)
+            entries = []
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                offset += len(line)
+                if line.strip():
+                    entries.append(json.loads(line))
+                    totals["lines"] += 1
+                if len(entries) >= lines_per_step:
+                    apply(entries)
+                    entries = []
+            if entries:
+                apply(entries)
+            self.export_offsets[key] = offset
+
+            if self.needs_training():
+                self.train()
+            else:
+                self.save()
+
+        if totals["lines"]:
+            logger.info(f"Applied {totals['lines']} chunk export lines from {export_path}: "
+                        f"{totals['added']} added, {totals['removed']} removed")
+        return totals
+
+    def needs_training(self) -> bool:
+        """
+        Check whether the codebook should be (re)trained.
+
+        Returns:
+            True if an untrained index reached min_train_size, or if the rows
+            changed since the last training exceed retrain_ratio of its size
+        """
+        if self._centroids is None:
+            return self.live_count >= self.min_train_size
+        return self._changes_since_training > self.retrain_ratio * max(1, self._trained_rows)
+
+    def _assign(self, matrix: np.ndarray) -> np.ndarray:
+        """Assign normalized rows to their most similar centroid."""
+        assignments = np.empty(len(matrix), dtype=np.int32)
+        for start in range(0, len(matrix), SCAN_BLOCK_ROWS):
+            block = np.asarray(matrix[start:start + SCAN_BLOCK_ROWS])
+            assignments[start:start + len(block)] = np.argmax(block @ self._centroids.T, axis=1)
+        return assignments
+
+    def train(self, iterations: int = 10, sample_size: int = 100000, seed: int = 0) -> None:
+        """
+        Compact deleted rows, train the k-means codebook and save the index.
+
+        Indexes smaller than min_train_size drop their codebook and are
+        scanned exhaustively.
+
+        Args:
+            iterations: k-means iterations
+            sample_size: Maximum rows sampled for training
+            seed: Random seed for sampling and initialization
+        """
+        with self._lock:
+            self._compact()
+            vectors = self._get_vectors()
+            rows = self._count
+
+            if rows < self.min_train_size:
+                self._centroids = None
+                self._assignments = np.full(rows, UNASSIGNED, dtype=np.int32)
+            else:
+                nlist = min(rows, self.nlist or max(1, int(math.sqrt(rows))))
+                rng = np.random.default_rng(seed)
+                sample = np.asarray(vectors[np.sort(rng.choice(rows, min(rows, sample_size), replace=False))])
+                centroids = sample[rng.choice(len(sample), nlist, replace=False)].copy()
+
+                for _ in range(iterations):
+                    self._centroids = centroids
+                    labels = self._assign(sample)
+                    sums = np.zeros_like(centroids)
+                    np.add.at(sums, labels, sample)
+                    counts = np.bincount(labels, minlength=nlist)
+                    # Reseed empty lists from random sample rows
+                    empty = counts == 0
+                    sums[empty] = sample[rng.choice(len(sample), int(empty.sum()))]
+                    centroids = self._normalize(sums)
+
+                self._centroids = centroids
+                self._assignments = self._assign(vectors)
+
+            self._lists = None
+            self._trained_rows = rows
+            self._changes_since_training = 0
+            self.stats["trainings"] += 1
+            self.save()
+        logger.info(f"Trained ANN index with {rows} chunks and "
+                    f"{len(self._centroids) if self._centroids is not None else 0} lists")
+
+    def _compact(self) -> None:
+        """Rewrite the vector and metadata files without deleted rows."""
+        if not self._deleted.any():
+            return
+        keep = np.flatnonzero(~self._deleted)
+        vectors = self._get_vectors()
+
+        vectors_tmp = self._file(VECTORS_FILE + ".tmp")
+        chunks_tmp = self._file(CHUNKS_FILE + ".tmp")
+        chunks = [self._chunks[row] for row in keep]
+        lines = [(json.dumps(chunk, default=str) + "\n").encode("utf-8") for chunk in chunks]
+        with open(vectors_tmp, "wb") as f:
+            for start in range(0, len(keep), SCAN_BLOCK_ROWS):
+                f.write(np.asarray(vectors[keep[start:start + SCAN_BLOCK_ROWS]]).tobytes())
+        with open(chunks_tmp, "wb") as f:
+            f.writelines(lines)
+
+        self._vectors = None
+        del vectors
+        os.replace(vectors_tmp, self._file(VECTORS_FILE))
+        os.replace(chunks_tmp, self._file(CHUNKS_FILE))
+
+        self._chunks = chunks
+        self._count = len(chunks)
+        self._chunks_bytes = sum(len(line) for line in lines)
+        self._assignments = self._assignments[keep]
+        self._deleted = np.zeros(self._count, dtype=bool)
+        self._row_by_id = {}
+        self._ids_by_source = {}
+        for row, chunk in enumerate(chunks):
+            self._index_row(row, chunk)
+
+    def search(self, embedding: List[float], top_k: int = 5,
+               threshold: Optional[float] = None) -> List[Dict[str, Any]]:
+        """
+        Find the chunks most similar to an embedding.
+
+        Scores use the same scale as the Neo4j cosine vector index,
+        (1 + cosine) / 2, so thresholds carry over unchanged.
+
+        Args:
+            embedding: Query embedding
+            top_k: Number of chunks to return
+            threshold: Minimum similarity score
+
+        Returns:
+            Chunks with content, chunk_id, source_id, title, url and similarity_score, best first
+        """
+        query = np.asarray(embedding, dtype=np.float32)
+        if self.dimension is not None and query.shape != (self.dimension,):
+            raise ValueError(f"Query dimension {query.shape} does not match index dimension {self.dimension}")
+        query = self._normalize(query[None, :])[0]
+
+        with self._lock:
+            vectors = self._get_vectors()
+            if vectors is None or not self.live_count or top_k <= 0:
+                return []
+            deleted = self._deleted
+            lists = self._get_lists()
+
+            if lists is None:
+                rows = np.arange(self._count)
+                scores = np.concatenate([
+                    np.asarray(vectors[start:start + SCAN_BLOCK_ROWS]) @ query
+                    for start in range(0, self._count, SCAN_BLOCK_ROWS)
+                ])
+            else:
+                probe = np.argsort(self._centroids @ query)[::-1][:self.nprobe]
+                # Sorted row numbers keep memory-mapped reads sequential
+                rows = np.sort(np.concatenate([lists[0]] + [lists[c + 1] for c in probe]))
+                scores = np.asarray(vectors[rows]) @ query
+
+            live = ~deleted[rows]
+            rows, scores = rows[live], (1.0 + scores[live]) / 2.0
+            if threshold is not None:
+                keep = scores >= threshold
+                rows, scores = rows[keep], scores[keep]
+
+            if len(rows) > top_k:
+                best = np.argpartition(-scores, top_k - 1)[:top_k]
+                rows, scores = rows[best], scores[best]
+            order = np.argsort(-scores, kind="stable")
+
+            self.stats["searches"] += 1
+            self.stats["rows_scanned"] += int(live.size)
+            return [dict(self._chunks[rows[i]], similarity_score=float(scores[i])) for i in order]
+
+    def save(self) -> None:
+        """Write the IVF arrays and metadata; meta.json is replaced last."""
+        with self._lock:
+            os.makedirs(self.path, exist_ok=True)
+            for name in (VECTORS_FILE, CHUNKS_FILE):
+                if not os.path.exists(self._file(name)):
+                    open(self._file(name), "ab").close()
+
+            centroids = self._centroids if self._centroids is not None else np.zeros((0, self.dimension or 0), np.float32)
+            ivf_tmp = self._file(IVF_FILE + ".tmp")
+            with open(ivf_tmp, "wb") as f:
+                np.savez(f, centroids=centroids, assignments=self._assignments, deleted=self._deleted)
+            os.replace(ivf_tmp, self._file(IVF_FILE))
+
+            meta = {
+                "format_version": FORMAT_VERSION,
+                "dimension": self.dimension,
+                "count": self._count,
+                "chunks_bytes": self._chunks_bytes,
+                "trained_rows": self._trained_rows,
+                "changes_since_training": self._changes_since_training,
+                "export_offsets": self.export_offsets
+            }
+            meta_tmp = self._file(META_FILE + ".tmp")
+            with open(meta_tmp, "w") as f:
+                json.dump(meta, f)
+            os.replace(meta_tmp, self._file(META_FILE))
+
+    def reset(self) -> None:
+        """Delete every chunk and the index files."""
+        with self._lock:
+            for name in (VECTORS_FILE, CHUNKS_FILE, IVF_FILE, META_FILE):
+                if os.path.exists(self._file(name)):
+                    os.remove(self._file(name))
+            self._reset_state()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get index statistics.
+
+        Returns:
+            Row counts, list count, probe settings, disk size and search counters
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            stats.update({
+                "path": self.path,
+                "dimension": self.dimension,
+                "chunks": self.live_count,
+                "deleted_rows": int(self._deleted.sum()),
+                "lists": len(self._centroids) if self._centroids is not None else 0,
+                "nprobe": self.nprobe,
+                "needs_training": self.needs_training(),
+                "vector_file_bytes": self._count * (self.dimension or 0) * 4
+            })
+        stats["avg_rows_scanned"] = round(stats["rows_scanned"] / stats["searches"], 1) if stats["searches"] else 0.0
+        return stats
@@ -0,0 +1,134 @@
+"""
+Query embedding cache for MCP Vector Cypher Search.
+
+boomertv2 (src/embedding_cache.py) and graphRAG-kiro (modules/embedding.py)
+build separate images and carry the same class; change the copies together.
+"""
+
+import hashlib
+import threading
+import time
+import unicodedata
+from collections import OrderedDict
+from typing import List, Dict, Any, Optional, Sequence, Tuple
+
+
+class QueryEmbeddingCache:
+    """Bounded LRU cache of query embeddings with a time-to-live."""
+
+    def __init__(self, max_entries: int = 1024, ttl_seconds: float = 3600.0):
+        """
+        Initialize QueryEmbeddingCache.
+
+        Args:
+            max_entries: Maximum number of cached embeddings (0 disables the cache)
+            ttl_seconds: Seconds an entry stays valid (0 keeps entries until evicted)
+        """
+        self.max_entries = max(0, int(max_entries))
+        self.ttl_seconds = max(0.0, float(ttl_seconds))
+        # Embeddings are stored as tuples so no caller can modify a cached value
+        self._entries: "OrderedDict[str, Tuple[Tuple[float, ...], float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "expirations": 0, "saved_encode_ms": 0.0}
+
+    @staticmethod
+    def normalize(text: str) -> str:
+        """
+        Normalize a query so trivially different spellings share an entry.
+
+        Args:
+            text: Query text
+
+        Returns:
+            NFC-normalized text with whitespace collapsed
+        """
+        return " ".join(unicodedata.normalize("NFC", text).split())
+
+    @classmethod
+    def make_key(cls, model_name: str, text: str) -> str:
+        """
+        Build the cache key for a query.
+
+        Args:
+            model_name: Embedding model name
+            text: Query text
+
+        Returns:
+            Hex sha256 digest of the model name and normalized text
+        """
+        return hashlib.sha256(f"{model_name}\x1f{cls.normalize(text)}".encode("utf-8")).hexdigest()
+
+    def get(self, model_name: str, text: str) -> Optional[List[float]]:
+        """
+        Look up a query embedding.
+
+        Args:
+            model_name: Embedding model name
+            text: Query text
+
+        Returns:
+            Copy of the cached embedding, or None on a miss or expired entry
+        """
+        if not self.max_entries:
+            return None
+
+        key = self.make_key(model_name, text)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and self.ttl_seconds and entry[1] <= time.monotonic():
+                del self._entries[key]
+                self.stats["expirations"] += 1
+                entry = None
+
+            if entry is None:
+                self.stats["misses"] += 1
+                return None
+
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            self.stats["saved_encode_ms"] += entry[2]
+        return list(entry[0])
+
+    def put(self, model_name: str, text: str, embedding: Sequence[float], encode_ms: float = 0.0) -> None:
+        """
+        Store a query embedding, evicting the least recently used entries over the bound.
+
+        Args:
+            model_name: Embedding model name
+            text: Query text
+            embedding: Embedding values
+            encode_ms: Time the encode took, credited as saved on every later hit
+        """
+        if not self.max_entries or not len(embedding):
+            return
+
+        key = self.make_key(model_name, text)
+        expires_at = time.monotonic() + self.ttl_seconds
+        with self._lock:
+            self._entries[key] = (tuple(embedding), expires_at, encode_ms)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.stats["evictions"] += 1
+
+    def clear(self) -> None:
+        """Drop every cached embedding."""
+        with self._lock:
+            self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Returns:
+            Hit/miss counters, hit rate, saved encode time and current size
+        """
+        with self._lock:
+            stats = dict(self.stats)
+            stats["entries"] = len(self._entries)
+        lookups = stats["hits"] + stats["misses"]
+        stats["hit_rate"] = round(stats["hits"] / lookups, 4) if lookups else 0.0
+        stats["saved_encode_ms"] = round(stats["saved_encode_ms"], 2)
+        stats["max_entries"] = self.max_entries
+        stats["ttl_seconds"] = self.ttl_seconds
+        return stats
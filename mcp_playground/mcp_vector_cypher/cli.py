@@ -5,9 +5,11 @@ Command-line interface for MCP Vector Cypher Search.
 
 import argparse
 import asyncio
+import json
 import sys
 from .server import MCPVectorCypherServer
 from .config import Config
+from .ann_index import ChunkANNIndex
 
 
 def main():
@@ -20,6 +22,8 @@ Examples:
   %(prog)s                    # Start MCP server with stdio transport
   %(prog)s --transport stdio  # Same as above
   %(prog)s --test            # Run a test search
+  %(prog)s --build-ann-index # Export Neo4j chunk embeddings to the offline ANN index
+  %(prog)s --sync-ann-export output/chunk_export.jsonl  # Apply new batch loader chunks
         """
     )
     
@@ -42,6 +46,18 @@ Examples:
         help="Test query to use (default: 'GPT 4o')"
     )
     
+    parser.add_argument(
+        "--build-ann-index",
+        action="store_true",
+        help="Rebuild the ANN index at ANN_INDEX_PATH from Neo4j Chunk nodes"
+    )
+    
+    parser.add_argument(
+        "--sync-ann-export",
+        metavar="PATH",
+        help="Apply chunks appended to a batch loader chunk export to the ANN index"
+    )
+    
     parser.add_argument(
         "--log-level",
         choices=["DEBUG", "INFO", "WARNING", "ERROR"],
@@ -55,7 +71,11 @@ Examples:
     config = Config()
     config.log_level = args.log_level
     
-    if args.test:
+    if args.build_ann_index:
+        asyncio.run(build_ann_index(config))
+    elif args.sync_ann_export:
+        sync_ann_export(config, args.sync_ann_export)
+    elif args.test:
         # Run test mode
         asyncio.run(run_test(config, args.query))
     else:
@@ -64,6 +84,40 @@ Examples:
         server.run(transport=args.transport)
 
 
+async def build_ann_index(config: Config):
+    """
+    Rebuild the offline ANN index from Neo4j.
+    
+    Args:
+        config: Configuration object
+    """
+    server = MCPVectorCypherServer(config)
+    try:
+        stats = await server.vector_search.build_ann_index()
+        print(json.dumps(stats, indent=2))
+    except Exception as e:
+        print(f"ANN index build failed: {e}")
+        sys.exit(1)
+    finally:
+        await server.aclose()
+
+
+def sync_ann_export(config: Config, export_path: str):
+    """
+    Apply new chunks from a batch loader chunk export to the offline ANN index.
+    
+    Args:
+        config: Configuration object
+        export_path: Path of the JSONL chunk export
+    """
+    if not config.ann_index_path:
+        print("ANN_INDEX_PATH is not set")
+        sys.exit(1)
+    index = ChunkANNIndex(config.ann_index_path, nprobe=config.ann_nprobe)
+    totals = index.apply_export(export_path)
+    print(json.dumps({**totals, "index": index.get_stats()}, indent=2))
+
+
 async def run_test(config: Config, query: str):
     """
     Run a test search.
@@ -113,7 +167,7 @@ async def run_test(config: Config, query: str):
         traceback.print_exc()
         sys.exit(1)
     finally:
-        server.close()
+        await server.aclose()
 
 
 if __name__ == "__main__":
@@ -28,6 +28,15 @@ class Config:
         
         # Embedding Model Configuration
         self.embedding_model_name = os.getenv("EMBEDDING_MODEL_NAME", "all-MiniLM-L6-v2")
+        self.embedding_workers = int(os.getenv("EMBEDDING_WORKERS", "2"))
+        self.embedding_cache_size = int(os.getenv("EMBEDDING_CACHE_SIZE", "1024"))
+        self.embedding_cache_ttl_seconds = float(os.getenv("EMBEDDING_CACHE_TTL_SECONDS", "3600"))
+        
+        # Offline ANN Index Configuration (similarity search in-process instead of in Neo4j)
+        self.ann_index_path = os.getenv("ANN_INDEX_PATH") or None
+        self.ann_nprobe = int(os.getenv("ANN_NPROBE", "8"))
+        self.ann_export_path = os.getenv("ANN_EXPORT_PATH") or None
+        self.ann_sync_interval_seconds = float(os.getenv("ANN_SYNC_INTERVAL_SECONDS", "30"))
         
         # MCP Server Configuration
         self.server_name = "mcp-vector-cypher-search"
@@ -78,6 +87,13 @@ class Config:
             "similarity_threshold": self.similarity_threshold,
             "top_k_chunks": self.top_k_chunks,
             "embedding_model_name": self.embedding_model_name,
+            "embedding_workers": self.embedding_workers,
+            "embedding_cache_size": self.embedding_cache_size,
+            "embedding_cache_ttl_seconds": self.embedding_cache_ttl_seconds,
+            "ann_index_path": self.ann_index_path,
+            "ann_nprobe": self.ann_nprobe,
+            "ann_export_path": self.ann_export_path,
+            "ann_sync_interval_seconds": self.ann_sync_interval_seconds,
             "server_name": self.server_name,
             "log_level": self.log_level,
             "current_working_directory": os.getcwd()
@@ -93,4 +109,7 @@ class Config:
             "VECTOR_INDEX_NAME": os.getenv("VECTOR_INDEX_NAME") is not None,
             "SIMILARITY_THRESHOLD": os.getenv("SIMILARITY_THRESHOLD") is not None,
             "TOP_K_CHUNKS": os.getenv("TOP_K_CHUNKS") is not None,
+            "EMBEDDING_WORKERS": os.getenv("EMBEDDING_WORKERS") is not None,
+            "ANN_INDEX_PATH": os.getenv("ANN_INDEX_PATH") is not None,
+            "ANN_EXPORT_PATH": os.getenv("ANN_EXPORT_PATH") is not None,
         }
\ No newline at end of file
@@ -4,7 +4,7 @@ Cypher query generation and execution for MCP Vector Cypher Search.
 
 import logging
 from typing import List, Dict, Any
-from neo4j import GraphDatabase
+from neo4j import AsyncGraphDatabase
 
 logger = logging.getLogger(__name__)
 
@@ -23,10 +23,10 @@ class CypherGenerator:
         self._neo4j_driver = None
     
     def get_neo4j_driver(self):
-        """Get or initialize Neo4j driver."""
+        """Get or initialize the async Neo4j driver."""
         if self._neo4j_driver is None:
             logger.info(f"Connecting to Neo4j at {self.config.neo4j_uri}")
-            self._neo4j_driver = GraphDatabase.driver(
+            self._neo4j_driver = AsyncGraphDatabase.driver(
                 self.config.neo4j_uri, 
                 auth=(self.config.neo4j_user, self.config.neo4j_password)
             )
@@ -99,11 +99,11 @@ class CypherGenerator:
         driver = self.get_neo4j_driver()
         
         try:
-            with driver.session() as session:
-                result = session.run(cypher_query)
+            async with driver.session() as session:
+                result = await session.run(cypher_query)
                 
                 records = []
-                for record in result:
+                async for record in result:
                     records.append(dict(record))
                 
                 logger.info(f"Cypher query returned {len(records)} records")
@@ -113,8 +113,8 @@ class CypherGenerator:
             logger.error(f"Error executing Cypher query: {e}")
             return [{"error": f"Query execution failed: {e}"}]
     
-    def close(self):
+    async def close(self):
         """Close connections and cleanup resources."""
         if self._neo4j_driver:
-            self._neo4j_driver.close()
+            await self._neo4j_driver.close()
             self._neo4j_driver = None
\ No newline at end of file
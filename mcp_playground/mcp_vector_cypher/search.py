@@ -2,10 +2,19 @@
 Vector search functionality for MCP Vector Cypher Search.
 """
 
+import asyncio
 import logging
+import os
+import shutil
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from sentence_transformers import SentenceTransformer
-from neo4j import GraphDatabase
+from neo4j import AsyncGraphDatabase
+
+from .cache import QueryEmbeddingCache
+from .ann_index import ChunkANNIndex
 
 logger = logging.getLogger(__name__)
 
@@ -22,23 +31,38 @@ class VectorSearch:
         """
         self.config = config
         self._embedding_model: Optional[SentenceTransformer] = None
+        self._model_lock = threading.Lock()
         self._neo4j_driver = None
+        # Bounded pool for the CPU-bound encode calls, so they never run on the event loop
+        self._embedding_executor = ThreadPoolExecutor(
+            max_workers=config.embedding_workers, thread_name_prefix="embedding"
+        )
+        self.embedding_cache = QueryEmbeddingCache(
+            config.embedding_cache_size, config.embedding_cache_ttl_seconds
+        )
+        # Offline ANN index, loaded on first use when ann_index_path is set
+        self._ann_index: Optional[ChunkANNIndex] = None
+        self._ann_lock = threading.Lock()
+        self._ann_load_failed = False
+        self._ann_sync_future = None
+        self._last_ann_sync = float("-inf")
     
     def get_embedding_model(self) -> SentenceTransformer:
         """Get or initialize the embedding model."""
-        if self._embedding_model is None:
-            logger.info(f"Loading SentenceTransformer model: {self.config.embedding_model_name}")
-            self._embedding_model = SentenceTransformer(self.config.embedding_model_name)
-            logger.info("SentenceTransformer model loaded")
+        with self._model_lock:
+            if self._embedding_model is None:
+                logger.info(f"Loading SentenceTransformer model: {self.config.embedding_model_name}")
+                self._embedding_model = SentenceTransformer(self.config.embedding_model_name)
+                logger.info("SentenceTransformer model loaded")
         return self._embedding_model
     
     def get_neo4j_driver(self):
-        """Get or initialize Neo4j driver."""
+        """Get or initialize the async Neo4j driver."""
         if self._neo4j_driver is None:
             logger.info(f"Connecting to Neo4j at {self.config.neo4j_uri}")
             logger.info(f"Using username: {self.config.neo4j_user}")
             logger.info(f"Vector index: {self.config.vector_index_name}")
-            self._neo4j_driver = GraphDatabase.driver(
+            self._neo4j_driver = AsyncGraphDatabase.driver(
                 self.config.neo4j_uri, 
                 auth=(self.config.neo4j_user, self.config.neo4j_password)
             )
@@ -49,6 +73,9 @@ class VectorSearch:
         """
         Create embedding for the given text.
         
+        Repeated questions are served from the query embedding cache; misses
+        are encoded on the embedding executor.
+        
         Args:
             text: Input text to embed
             
@@ -58,6 +85,27 @@ class VectorSearch:
         if not text or not text.strip():
             return []
         
+        model_name = self.config.embedding_model_name
+        cached = self.embedding_cache.get(model_name, text)
+        if cached is not None:
+            return cached
+        
+        start = time.perf_counter()
+        loop = asyncio.get_running_loop()
+        embedding = await loop.run_in_executor(self._embedding_executor, self.encode, text)
+        self.embedding_cache.put(model_name, text, embedding, (time.perf_counter() - start) * 1000)
+        return embedding
+    
+    def encode(self, text: str) -> List[float]:
+        """
+        Encode text with the embedding model (blocking).
+        
+        Args:
+            text: Input text to embed
+            
+        Returns:
+            List of embedding values
+        """
         model = self.get_embedding_model()
         embedding = model.encode([text], convert_to_tensor=False)[0]
         
@@ -66,13 +114,118 @@ class VectorSearch:
         else:
             return list(embedding)
     
+    def get_ann_index(self) -> Optional[ChunkANNIndex]:
+        """
+        Get or load the offline ANN index.
+        
+        Returns:
+            ChunkANNIndex, or None when ann_index_path is not set or the index failed to load
+        """
+        if not self.config.ann_index_path or self._ann_load_failed:
+            return None
+        with self._ann_lock:
+            if self._ann_index is None:
+                try:
+                    self._ann_index = ChunkANNIndex(self.config.ann_index_path, nprobe=self.config.ann_nprobe)
+                except Exception as e:
+                    logger.error(f"Failed to load ANN index from {self.config.ann_index_path}, using Neo4j: {e}")
+                    self._ann_load_failed = True
+                    return None
+        return self._ann_index
+    
+    def _schedule_ann_sync(self, index: ChunkANNIndex) -> None:
+        """Apply new batch loader chunk exports to the ANN index in the background."""
+        export_path = self.config.ann_export_path
+        if not export_path or not os.path.exists(export_path):
+            return
+        if self._ann_sync_future is not None and not self._ann_sync_future.done():
+            return
+        now = time.monotonic()
+        if now - self._last_ann_sync < self.config.ann_sync_interval_seconds:
+            return
+        self._last_ann_sync = now
+        
+        def log_failure(future) -> None:
+            if future.exception() is not None:
+                logger.error(f"Failed to apply chunk export {export_path} to the ANN index: {future.exception()}")
+        
+        self._ann_sync_future = asyncio.get_running_loop().run_in_executor(None, index.apply_export, export_path)
+        self._ann_sync_future.add_done_callback(log_failure)
+    
+    async def build_ann_index(self, batch_size: int = 1000) -> Dict[str, Any]:
+        """
+        Rebuild the ANN index from the Chunk nodes in Neo4j.
+        
+        The index is built next to ann_index_path and swapped in when complete,
+        so searches keep using the previous index meanwhile. The chunk export
+        is marked as applied up to its current size, since those chunks are
+        already in Neo4j.
+        
+        Args:
+            batch_size: Chunk nodes read per query
+            
+        Returns:
+            ANN index statistics
+        """
+        if not self.config.ann_index_path:
+            raise ValueError("ANN_INDEX_PATH is not set")
+        
+        path = self.config.ann_index_path
+        build_path = f"{path}.building"
+        shutil.rmtree(build_path, ignore_errors=True)
+        index = ChunkANNIndex(build_path, nprobe=self.config.ann_nprobe)
+        export_path = self.config.ann_export_path
+        if export_path and os.path.exists(export_path):
+            index.export_offsets[os.path.abspath(export_path)] = os.path.getsize(export_path)
+        
+        # Keyset pagination on the unique chunk_id
+        cypher_query = """
+        MATCH (c:Chunk)
+        WHERE c.embedding IS NOT NULL AND c.chunk_id > $last_chunk_id
+        RETURN c.chunk_id AS chunk_id,
+               c.chunk_text AS content,
+               c.source_id AS source_id,
+               c.title AS title,
+               c.url AS url,
+               c.embedding AS embedding
+        ORDER BY c.chunk_id
+        LIMIT $batch_size
+        """
+        
+        driver = self.get_neo4j_driver()
+        loop = asyncio.get_running_loop()
+        last_chunk_id = ""
+        async with driver.session() as session:
+            while True:
+                result = await session.run(cypher_query, last_chunk_id=last_chunk_id, batch_size=batch_size)
+                chunks = [record.data() async for record in result]
+                if not chunks:
+                    break
+                await loop.run_in_executor(None, index.add, chunks)
+                last_chunk_id = chunks[-1]["chunk_id"]
+        
+        await loop.run_in_executor(None, index.train)
+        with self._ann_lock:
+            shutil.rmtree(path, ignore_errors=True)
+            os.replace(build_path, path)
+            self._ann_index = ChunkANNIndex(path, nprobe=self.config.ann_nprobe)
+            self._ann_load_failed = False
+        
+        stats = self._ann_index.get_stats()
+        logger.info(f"Built ANN index at {path} with {stats['chunks']} chunks")
+        return stats
+    
     async def search_similar_chunks(
         self, 
         query_embedding: List[float], 
         top_k: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
-        Search for similar chunks in Neo4j using vector similarity.
+        Search for similar chunks using vector similarity.
+        
+        When an ANN index is configured and holds chunks, the search runs
+        in-process against it; otherwise, or if it fails, Neo4j's vector index
+        is queried.
         
         Args:
             query_embedding: The query embedding vector
@@ -87,6 +240,19 @@ class VectorSearch:
         if top_k is None:
             top_k = self.config.top_k_chunks
         
+        ann_index = self.get_ann_index()
+        if ann_index is not None:
+            self._schedule_ann_sync(ann_index)
+            if ann_index.live_count:
+                try:
+                    chunks = await asyncio.get_running_loop().run_in_executor(
+                        None, ann_index.search, query_embedding, top_k, self.config.similarity_threshold
+                    )
+                    logger.info(f"Found {len(chunks)} similar chunks in the ANN index")
+                    return chunks
+                except Exception as e:
+                    logger.warning(f"ANN index search failed, falling back to Neo4j: {e}")
+        
         driver = self.get_neo4j_driver()
         
         # Vector similarity search query
@@ -104,8 +270,8 @@ class VectorSearch:
         """
         
         try:
-            with driver.session() as session:
-                result = session.run(
+            async with driver.session() as session:
+                result = await session.run(
                     cypher_query,
                     query_vector=query_embedding,
                     top_k=top_k,
@@ -113,7 +279,7 @@ class VectorSearch:
                 )
                 
                 chunks = []
-                for record in result:
+                async for record in result:
                     chunks.append({
                         "content": record["content"],
                         "chunk_id": record["chunk_id"],
@@ -157,8 +323,17 @@ class VectorSearch:
         
         return False
     
-    def close(self):
-        """Close connections and cleanup resources."""
+    async def close_driver(self):
+        """Close the async Neo4j driver; it is reopened on next use."""
         if self._neo4j_driver:
-            self._neo4j_driver.close()
-            self._neo4j_driver = None
\ No newline at end of file
+            await self._neo4j_driver.close()
+            self._neo4j_driver = None
+    
+    def shutdown_executor(self):
+        """Stop the embedding executor."""
+        self._embedding_executor.shutdown(wait=False)
+    
+    async def close(self):
+        """Close connections and cleanup resources."""
+        await self.close_driver()
+        self.shutdown_executor()
\ No newline at end of file
@@ -2,8 +2,11 @@
 MCP Server implementation for Vector Cypher Search.
 """
 
+import asyncio
 import logging
-from typing import Dict, Any, Optional
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, Any, List, Optional, Tuple
 
 from .config import Config
 from .search import VectorSearch
@@ -40,9 +43,22 @@ class MCPVectorCypherServer:
         )
         
         # Initialize FastMCP server
-        self.mcp = FastMCP(self.config.server_name)
+        self.mcp = FastMCP(self.config.server_name, lifespan=self._lifespan)
         self._register_tools()
     
+    @asynccontextmanager
+    async def _lifespan(self, server: FastMCP):
+        """
+        Close the async Neo4j drivers on the event loop that served the session.
+        
+        The drivers are bound to that loop, so they cannot be closed after
+        mcp.run has returned. They are reopened lazily if another session starts.
+        """
+        try:
+            yield {}
+        finally:
+            await self.aclose_drivers()
+    
     def _register_tools(self):
         """Register MCP tools."""
         
@@ -65,7 +81,7 @@ class MCPVectorCypherServer:
                 - chunks: List of similar chunks (if vector search was used)
                 - cypher_query: The generated Cypher query
                 - cypher_results: Results from executing the Cypher query
-                - metadata: Additional information about the search
+                - metadata: Additional information about the search, including per-step latency (step_latency_ms)
             """
             return await self._vector_cypher_search(question)
         
@@ -121,34 +137,49 @@ class MCPVectorCypherServer:
         chunks = []
         cypher_results = []
         cypher_query = ""
+        query_embedding: List[float] = []
+        step_latency_ms: Dict[str, float] = {}
+        started = time.perf_counter()
+        
+        async def run_vector_search() -> Tuple[List[float], List[Dict[str, Any]]]:
+            # Step 1: Create embedding for the question (off the event loop)
+            embedding = await self._timed(step_latency_ms, "embedding", self.vector_search.create_embedding(question))
+            
+            # Step 2: Search for similar chunks
+            found = await self._timed(
+                step_latency_ms, "vector_search", self.vector_search.search_similar_chunks(embedding)
+            )
+            return embedding, found
+        
+        async def run_cypher() -> Tuple[str, List[Dict[str, Any]]]:
+            # Step 3: Generate Cypher query for detailed retrieval
+            query = await self._timed(
+                step_latency_ms, "cypher_generation", self.cypher_generator.call_mcp_neo4j_cypher(question)
+            )
+            
+            # Step 4: Execute Cypher query
+            results = []
+            if query:
+                results = await self._timed(
+                    step_latency_ms, "cypher_execution", self.cypher_generator.execute_cypher_query(query)
+                )
+            return query, results
         
         try:
             if use_vector_search:
                 logger.info("Using vector search strategy")
                 
-                # Step 1: Create embedding for the question
-                query_embedding = await self.vector_search.create_embedding(question)
-                
-                # Step 2: Search for similar chunks
-                chunks = await self.vector_search.search_similar_chunks(query_embedding)
-                
-                # Step 3: Generate Cypher query for detailed retrieval
-                # Modify question to be more specific based on found chunks
-                if chunks:
-                    chunk_ids = [chunk["chunk_id"] for chunk in chunks[:3]]  # Use top 3 chunks
-                    enhanced_question = f"{question} (related to chunks: {', '.join(chunk_ids)})"
-                    cypher_query = await self.cypher_generator.call_mcp_neo4j_cypher(enhanced_question)
-                else:
-                    cypher_query = await self.cypher_generator.call_mcp_neo4j_cypher(question)
+                # Vector search and Cypher generation/execution are independent, so run them concurrently
+                (query_embedding, chunks), (cypher_query, cypher_results) = await asyncio.gather(
+                    run_vector_search(), run_cypher()
+                )
             else:
                 logger.info("Using direct Cypher strategy")
                 
                 # Direct Cypher query generation
-                cypher_query = await self.cypher_generator.call_mcp_neo4j_cypher(question)
+                cypher_query, cypher_results = await run_cypher()
             
-            # Step 4: Execute Cypher query
-            if cypher_query:
-                cypher_results = await self.cypher_generator.execute_cypher_query(cypher_query)
+            step_latency_ms["total"] = round((time.perf_counter() - started) * 1000, 2)
             
             # Prepare response
             response = {
@@ -161,7 +192,8 @@ class MCPVectorCypherServer:
                     "chunks_found": len(chunks),
                     "cypher_records": len(cypher_results),
                     "vector_search_used": use_vector_search,
-                    "embedding_dimension": len(await self.vector_search.create_embedding(question)) if use_vector_search else 0
+                    "embedding_dimension": len(query_embedding),
+                    "step_latency_ms": step_latency_ms
                 }
             }
             
@@ -178,14 +210,27 @@ class MCPVectorCypherServer:
                 "cypher_results": cypher_results,
                 "metadata": {
                     "question": question,
-                    "error_occurred": True
+                    "error_occurred": True,
+                    "step_latency_ms": step_latency_ms
                 }
             }
     
+    @staticmethod
+    async def _timed(step_latency_ms: Dict[str, float], step: str, awaitable):
+        """Await a step and record its latency in milliseconds."""
+        start = time.perf_counter()
+        try:
+            return await awaitable
+        finally:
+            step_latency_ms[step] = round((time.perf_counter() - start) * 1000, 2)
+    
     async def _debug_configuration(self) -> Dict[str, Any]:
         """Implementation of debug_configuration tool."""
         config_dict = self.config.to_dict()
         config_dict["env_vars_found"] = self.config.get_env_vars_status()
+        config_dict["embedding_cache"] = self.vector_search.embedding_cache.get_stats()
+        ann_index = self.vector_search.get_ann_index()
+        config_dict["ann_index"] = ann_index.get_stats() if ann_index is not None else None
         return config_dict
     
     async def _configure_search_parameters(
@@ -227,7 +272,24 @@ class MCPVectorCypherServer:
         finally:
             self.close()
     
+    async def aclose_drivers(self):
+        """Close the async Neo4j drivers."""
+        try:
+            await self.vector_search.close_driver()
+            await self.cypher_generator.close()
+        except Exception as e:
+            logger.warning(f"Error while closing connections: {e}")
+    
+    async def aclose(self):
+        """Close the async Neo4j drivers and the embedding executor."""
+        await self.vector_search.close()
+        await self.cypher_generator.close()
+    
     def close(self):
-        """Close connections and cleanup resources."""
-        self.vector_search.close()
-        self.cypher_generator.close()
\ No newline at end of file
+        """
+        Cleanup resources once the server has stopped.
+        
+        The async drivers were already closed on the serving loop by the
+        lifespan hook; only the embedding executor is left to stop.
+        """
+        self.vector_search.shutdown_executor()
\ No newline at end of file
@@ -20,11 +20,14 @@ import os
 from typing import Dict, Any, List, Optional, Tuple
 import asyncio
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 import traceback
 
 from sentence_transformers import SentenceTransformer
-from neo4j import GraphDatabase
+from neo4j import AsyncGraphDatabase
 
 # Load environment variables
 from dotenv import load_dotenv
@@ -38,6 +41,8 @@ except Exception as e:  # pragma: no cover
         "mcp package is required. Install with `pip install mcp`."
     ) from e
 
+from mcp_vector_cypher.cache import QueryEmbeddingCache
+
 
 # Setup logging to both console and file
 log_dir = os.path.join(os.getcwd(), "logs")
@@ -119,6 +124,8 @@ def log_query_execution(
 SERVER_NAME = "mcp-vector-cypher-search"
 _embedding_model: SentenceTransformer | None = None
 _neo4j_driver = None
+_embedding_executor: ThreadPoolExecutor | None = None
+_embedding_model_lock = threading.Lock()
 
 
 # Configuration - loaded from environment variables with fallbacks
@@ -127,31 +134,57 @@ NEO4J_USER = os.getenv("NEO4J_USERNAME", os.getenv("NEO4J_USER", "neo4j"))
 NEO4J_PASSWORD = os.getenv("NEO4J_PASSWORD", "jhF7&asjkldfoie489w")
 VECTOR_INDEX_NAME = os.getenv("VECTOR_INDEX_NAME", "chunk_embedding_vector")
 SIMILARITY_THRESHOLD = float(os.getenv("SIMILARITY_THRESHOLD", "0.8"))
+EMBEDDING_WORKERS = int(os.getenv("EMBEDDING_WORKERS", "2"))
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+EMBEDDING_CACHE_SIZE = int(os.getenv("EMBEDDING_CACHE_SIZE", "1024"))
+EMBEDDING_CACHE_TTL_SECONDS = float(os.getenv("EMBEDDING_CACHE_TTL_SECONDS", "3600"))
 TOP_K_CHUNKS = int(os.getenv("TOP_K_CHUNKS", "10"))
 
 
+_query_embedding_cache = QueryEmbeddingCache(EMBEDDING_CACHE_SIZE, EMBEDDING_CACHE_TTL_SECONDS)
+
+
 def _get_embedding_model() -> SentenceTransformer:
     """Get or initialize the embedding model."""
     global _embedding_model
-    if _embedding_model is None:
-        logger.info("Loading SentenceTransformer model: all-MiniLM-L6-v2")
-        _embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
-        logger.info("SentenceTransformer model loaded")
+    # Executor threads may request the model concurrently; load it only once
+    with _embedding_model_lock:
+        if _embedding_model is None:
+            logger.info(f"Loading SentenceTransformer model: {EMBEDDING_MODEL_NAME}")
+            _embedding_model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+            logger.info("SentenceTransformer model loaded")
     return _embedding_model
 
 
 def _get_neo4j_driver():
-    """Get or initialize Neo4j driver."""
+    """Get or initialize the async Neo4j driver."""
     global _neo4j_driver
     if _neo4j_driver is None:
         logger.info(f"Connecting to Neo4j at {NEO4J_URI}")
         logger.info(f"Using username: {NEO4J_USER}")
         logger.info(f"Vector index: {VECTOR_INDEX_NAME}")
-        _neo4j_driver = GraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD))
+        _neo4j_driver = AsyncGraphDatabase.driver(NEO4J_URI, auth=(NEO4J_USER, NEO4J_PASSWORD))
         logger.info("Neo4j driver initialized")
     return _neo4j_driver
 
 
+def _get_embedding_executor() -> ThreadPoolExecutor:
+    """Get or initialize the bounded executor that runs SentenceTransformer.encode."""
+    global _embedding_executor
+    if _embedding_executor is None:
+        _embedding_executor = ThreadPoolExecutor(max_workers=EMBEDDING_WORKERS, thread_name_prefix="embedding")
+    return _embedding_executor
+
+
+async def _timed(step_latency_ms: Dict[str, float], step: str, awaitable):
+    """Await a step and record its latency in milliseconds."""
+    start = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        step_latency_ms[step] = round((time.perf_counter() - start) * 1000, 2)
+
+
 def _should_use_vector_search(question: str) -> bool:
     """
     Determine if the question should use vector search.
@@ -199,11 +232,8 @@ def _should_use_vector_search(question: str) -> bool:
     return True
 
 
-async def _create_embedding(text: str) -> List[float]:
-    """Create embedding for the given text."""
-    if not text or not text.strip():
-        return []
-    
+def _encode_text(text: str) -> List[float]:
+    """Encode text with the embedding model (blocking; runs on the embedding executor)."""
     model = _get_embedding_model()
     embedding = model.encode([text], convert_to_tensor=False)[0]
     
@@ -213,6 +243,22 @@ async def _create_embedding(text: str) -> List[float]:
         return list(embedding)
 
 
+async def _create_embedding(text: str) -> List[float]:
+    """Create embedding for the given text, serving repeated questions from the query cache."""
+    if not text or not text.strip():
+        return []
+    
+    cached = _query_embedding_cache.get(EMBEDDING_MODEL_NAME, text)
+    if cached is not None:
+        return cached
+    
+    start = time.perf_counter()
+    loop = asyncio.get_running_loop()
+    embedding = await loop.run_in_executor(_get_embedding_executor(), _encode_text, text)
+    _query_embedding_cache.put(EMBEDDING_MODEL_NAME, text, embedding, (time.perf_counter() - start) * 1000)
+    return embedding
+
+
 async def _search_similar_chunks(query_embedding: List[float], top_k: int = TOP_K_CHUNKS) -> List[Dict[str, Any]]:
     """
     Search for similar chunks in Neo4j using vector similarity.
@@ -244,8 +290,8 @@ async def _search_similar_chunks(query_embedding: List[float], top_k: int = TOP_
     """
     
     try:
-        with driver.session() as session:
-            result = session.run(
+        async with driver.session() as session:
+            result = await session.run(
                 cypher_query,
                 query_vector=query_embedding,
                 top_k=top_k,
@@ -253,7 +299,7 @@ async def _search_similar_chunks(query_embedding: List[float], top_k: int = TOP_
             )
             
             chunks = []
-            for record in result:
+            async for record in result:
                 chunks.append({
                     "content": record["content"],
                     "chunk_id": record["chunk_id"],
@@ -371,11 +417,11 @@ async def _execute_cypher_query(cypher_query: str) -> List[Dict[str, Any]]:
     driver = _get_neo4j_driver()
     
     try:
-        with driver.session() as session:
-            result = session.run(cypher_query)
+        async with driver.session() as session:
+            result = await session.run(cypher_query)
             
             records = []
-            for record in result:
+            async for record in result:
                 records.append(dict(record))
             
             logger.info(f"Cypher query returned {len(records)} records")
@@ -413,7 +459,7 @@ async def vector_cypher_search(question: str) -> Dict[str, Any]:
         - cypher_results: Results from executing the Cypher query
         - message: Explicit message about data availability
         - no_data_found: True if no relevant information exists in database
-        - metadata: Additional information about the search
+        - metadata: Additional information about the search, including per-step latency (step_latency_ms)
         
     IMPORTANT: If no_data_found is True or chunks is empty, respond with "I don't have information about this topic in my database" and do NOT provide general knowledge answers.
     """
@@ -457,60 +503,62 @@ async def vector_cypher_search(question: str) -> Dict[str, Any]:
     chunks = []
     cypher_results = []
     cypher_query = ""
+    query_embedding: List[float] = []
+    step_latency_ms: Dict[str, float] = {}
+    
+    async def run_vector_search() -> Tuple[List[float], List[Dict[str, Any]]]:
+        execution_path.append("vector_search_start")
+        
+        # Step 1: Create embedding for the question (off the event loop)
+        logger.info("Step 1: Creating embedding for query")
+        execution_path.append("embedding_creation")
+        embedding = await _timed(step_latency_ms, "embedding", _create_embedding(question))
+        logger.info(f"Embedding created with dimension: {len(embedding)}")
+        
+        # Step 2: Search for similar chunks
+        logger.info("Step 2: Searching for similar chunks")
+        execution_path.append("vector_similarity_search")
+        found = await _timed(step_latency_ms, "vector_search", _search_similar_chunks(embedding))
+        logger.info(f"Vector search completed: {len(found)} chunks found")
+        
+        # Log chunk details
+        for i, chunk in enumerate(found[:3]):  # Log first 3 chunks
+            logger.info(f"Chunk {i+1}: ID={chunk['chunk_id']}, Score={chunk['similarity_score']:.4f}")
+        return embedding, found
+    
+    async def run_cypher() -> Tuple[str, List[Dict[str, Any]]]:
+        # Step 3: Generate Cypher query for detailed retrieval
+        logger.info("Step 3: Generating Cypher query")
+        execution_path.append("cypher_generation")
+        query = await _timed(step_latency_ms, "cypher_generation", _call_mcp_neo4j_cypher(question))
+        logger.info(f"Generated Cypher query: {query}")
+        
+        # Step 4: Execute Cypher query
+        results = []
+        if query:
+            logger.info("Step 4: Executing Cypher query")
+            execution_path.append("cypher_execution")
+            results = await _timed(step_latency_ms, "cypher_execution", _execute_cypher_query(query))
+            logger.info(f"Cypher execution completed: {len(results)} records returned")
+        else:
+            logger.warning("No Cypher query generated")
+            execution_path.append("no_cypher_query")
+        return query, results
     
     try:
         if use_vector_search:
             logger.info("Using vector search strategy")
-            execution_path.append("vector_search_start")
-            
-            # Step 1: Create embedding for the question
-            logger.info("Step 1: Creating embedding for query")
-            execution_path.append("embedding_creation")
-            query_embedding = await _create_embedding(question)
-            logger.info(f"Embedding created with dimension: {len(query_embedding)}")
-            
-            # Step 2: Search for similar chunks
-            logger.info("Step 2: Searching for similar chunks")
-            execution_path.append("vector_similarity_search")
-            chunks = await _search_similar_chunks(query_embedding)
-            logger.info(f"Vector search completed: {len(chunks)} chunks found")
             
-            # Log chunk details
-            if chunks:
-                for i, chunk in enumerate(chunks[:3]):  # Log first 3 chunks
-                    logger.info(f"Chunk {i+1}: ID={chunk['chunk_id']}, Score={chunk['similarity_score']:.4f}")
-            
-            # Step 3: Generate Cypher query for detailed retrieval
-            logger.info("Step 3: Generating Cypher query")
-            execution_path.append("cypher_generation")
-            if chunks:
-                chunk_ids = [chunk["chunk_id"] for chunk in chunks[:3]]  # Use top 3 chunks
-                enhanced_question = f"{question} (related to chunks: {', '.join(chunk_ids)})"
-                logger.info(f"Enhanced question: {enhanced_question}")
-                cypher_query = await _call_mcp_neo4j_cypher(enhanced_question)
-            else:
-                logger.info("No chunks found, using original question for Cypher")
-                cypher_query = await _call_mcp_neo4j_cypher(question)
+            # Vector search and Cypher generation/execution are independent, so run them concurrently
+            (query_embedding, chunks), (cypher_query, cypher_results) = await asyncio.gather(
+                run_vector_search(), run_cypher()
+            )
         else:
             logger.info("Using direct Cypher strategy")
             execution_path.append("direct_cypher_start")
             
             # Direct Cypher query generation
-            logger.info("Generating Cypher query directly")
-            execution_path.append("cypher_generation")
-            cypher_query = await _call_mcp_neo4j_cypher(question)
-        
-        logger.info(f"Generated Cypher query: {cypher_query}")
-        
-        # Step 4: Execute Cypher query
-        if cypher_query:
-            logger.info("Step 4: Executing Cypher query")
-            execution_path.append("cypher_execution")
-            cypher_results = await _execute_cypher_query(cypher_query)
-            logger.info(f"Cypher execution completed: {len(cypher_results)} records returned")
-        else:
-            logger.warning("No Cypher query generated")
-            execution_path.append("no_cypher_query")
+            cypher_query, cypher_results = await run_cypher()
         
         # Check if we found any relevant results
         has_relevant_chunks = len(chunks) > 0
@@ -521,6 +569,7 @@ async def vector_cypher_search(question: str) -> Dict[str, Any]:
         
         # Calculate execution time
         execution_time = (datetime.now() - start_time).total_seconds()
+        step_latency_ms["total"] = round(execution_time * 1000, 2)
         
         # Prepare response with explicit "no data found" message
         if not has_relevant_chunks and not has_relevant_cypher:
@@ -539,7 +588,8 @@ async def vector_cypher_search(question: str) -> Dict[str, Any]:
                     "chunks_found": 0,
                     "cypher_records": 0,
                     "vector_search_used": use_vector_search,
-                    "embedding_dimension": len(await _create_embedding(question)) if use_vector_search else 0,
+                    "embedding_dimension": len(query_embedding),
+                    "step_latency_ms": step_latency_ms,
                     "database_has_no_relevant_data": True
                 }
             }
@@ -571,7 +621,8 @@ async def vector_cypher_search(question: str) -> Dict[str, Any]:
                     "chunks_found": 0,
                     "cypher_records": len(cypher_results),
                     "vector_search_used": use_vector_search,
-                    "embedding_dimension": len(await _create_embedding(question)) if use_vector_search else 0,
+                    "embedding_dimension": len(query_embedding),
+                    "step_latency_ms": step_latency_ms,
                     "no_relevant_content_chunks": True
                 }
             }
@@ -603,7 +654,8 @@ async def vector_cypher_search(question: str) -> Dict[str, Any]:
                     "chunks_found": len(chunks),
                     "cypher_records": len(cypher_results),
                     "vector_search_used": use_vector_search,
-                    "embedding_dimension": len(await _create_embedding(question)) if use_vector_search else 0,
+                    "embedding_dimension": len(query_embedding),
+                    "step_latency_ms": step_latency_ms,
                     "relevant_data_available": True
                 }
             }
@@ -659,7 +711,8 @@ async def vector_cypher_search(question: str) -> Dict[str, Any]:
                 "question": question,
                 "error_occurred": True,
                 "database_search_failed": True,
-                "execution_time": execution_time
+                "execution_time": execution_time,
+                "step_latency_ms": step_latency_ms
             }
         }
 
@@ -688,6 +741,7 @@ async def debug_configuration() -> Dict[str, Any]:
             "NEO4J_PASSWORD": os.getenv("NEO4J_PASSWORD") is not None,
             "VECTOR_INDEX_NAME": os.getenv("VECTOR_INDEX_NAME") is not None,
         },
+        "embedding_cache": _query_embedding_cache.get_stats(),
         "current_working_directory": os.getcwd()
     }
     
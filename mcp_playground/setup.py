@@ -51,6 +51,7 @@ setup(
     install_requires=[
         "neo4j>=5.0.0",
         "sentence-transformers>=2.0.0",
+        "numpy>=1.24.0",
         "python-dotenv>=1.0.0",
         "mcp>=0.1.0",
     ],
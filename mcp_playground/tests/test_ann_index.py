@@ -0,0 +1,313 @@
+#!/usr/bin/env python3
+"""
+Unit tests for the offline ANN index (ChunkANNIndex).
+"""
+
+import json
+import os
+import shutil
+import tempfile
+import unittest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+# Add the project directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from mcp_vector_cypher.ann_index import ChunkANNIndex, VECTORS_FILE, CHUNKS_FILE, META_FILE
+
+DIMENSION = 8
+
+
+def make_chunks(count, dimension=DIMENSION, seed=0, prefix="chunk", sources=4):
+    """Build chunks with random embeddings from a fixed seed."""
+    rng = np.random.default_rng(seed)
+    embeddings = rng.normal(size=(count, dimension)).astype(np.float32)
+    return [
+        {
+            "chunk_id": f"{prefix}_{i}",
+            "embedding": embeddings[i].tolist(),
+            "chunk_text": f"text {i}",
+            "source_id": i % sources,
+            "title": f"title {i % sources}",
+            "url": f"https://example.com/{i % sources}"
+        }
+        for i in range(count)
+    ]
+
+
+def brute_force(chunks, query, top_k):
+    """Return the chunk IDs with the highest cosine similarity to query."""
+    matrix = np.asarray([chunk["embedding"] for chunk in chunks], dtype=np.float32)
+    matrix /= np.linalg.norm(matrix, axis=1, keepdims=True)
+    scores = matrix @ (np.asarray(query, dtype=np.float32) / np.linalg.norm(query))
+    return [chunks[i]["chunk_id"] for i in np.argsort(-scores)[:top_k]]
+
+
+class TestChunkANNIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.test_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.test_dir, "ann_index")
+
+    def tearDown(self):
+        shutil.rmtree(self.test_dir)
+
+    def test_add_and_search_exact_match(self):
+        """Test added chunks are searchable and scored on the Neo4j cosine scale."""
+        chunks = make_chunks(20)
+        index = ChunkANNIndex(self.path)
+
+        self.assertEqual(index.add(chunks), 20)
+
+        results = index.search(chunks[3]["embedding"], top_k=3)
+        self.assertEqual(index.dimension, DIMENSION)
+        self.assertEqual(index.live_count, 20)
+        self.assertEqual(results[0]["chunk_id"], "chunk_3")
+        self.assertEqual(results[0]["content"], "text 3")
+        self.assertAlmostEqual(results[0]["similarity_score"], 1.0, places=5)
+        self.assertEqual(len(results), 3)
+
+    def test_add_replaces_chunk_with_same_id(self):
+        """Test re-adding a chunk_id replaces the stored row instead of duplicating it."""
+        chunks = make_chunks(5)
+        index = ChunkANNIndex(self.path)
+        index.add(chunks)
+
+        replacement = dict(chunks[0], embedding=chunks[1]["embedding"], chunk_text="new text")
+        index.add([replacement])
+
+        results = index.search(chunks[1]["embedding"], top_k=5)
+        self.assertEqual(index.live_count, 5)
+        self.assertEqual([r["chunk_id"] for r in results].count("chunk_0"), 1)
+        self.assertEqual(next(r for r in results if r["chunk_id"] == "chunk_0")["content"], "new text")
+
+    def test_add_rejects_wrong_dimension(self):
+        """Test embeddings with a different dimension are rejected."""
+        index = ChunkANNIndex(self.path)
+        index.add(make_chunks(3))
+
+        with self.assertRaises(ValueError):
+            index.add(make_chunks(1, dimension=DIMENSION + 1, prefix="other"))
+
+    def test_remove_hides_chunks_from_search(self):
+        """Test removed chunks are no longer returned and missing IDs are ignored."""
+        chunks = make_chunks(10)
+        index = ChunkANNIndex(self.path)
+        index.add(chunks)
+
+        self.assertEqual(index.remove(["chunk_2", "chunk_5", "missing"]), 2)
+
+        result_ids = [r["chunk_id"] for r in index.search(chunks[2]["embedding"], top_k=10)]
+        self.assertEqual(index.live_count, 8)
+        self.assertNotIn("chunk_2", result_ids)
+        self.assertNotIn("chunk_5", result_ids)
+        self.assertEqual(len(result_ids), 8)
+
+    def test_replace_source_drops_chunks_no_longer_listed(self):
+        """Test replace_source removes only the source's chunks missing from the current list."""
+        index = ChunkANNIndex(self.path)
+        index.add(make_chunks(8, sources=2))
+
+        removed = index.replace_source(0, ["chunk_0", "chunk_2"])
+
+        self.assertEqual(removed, 2)
+        self.assertEqual(index.live_count, 6)
+        result_ids = {r["chunk_id"] for r in index.search(make_chunks(1)[0]["embedding"], top_k=10)}
+        self.assertNotIn("chunk_4", result_ids)
+        self.assertNotIn("chunk_6", result_ids)
+        self.assertIn("chunk_1", result_ids)
+
+    def test_save_and_reload_from_memmap(self):
+        """Test a saved index reloads its rows, deletions and export offsets."""
+        chunks = make_chunks(30)
+        index = ChunkANNIndex(self.path)
+        index.add(chunks)
+        index.remove(["chunk_7"])
+        index.export_offsets["/tmp/export.jsonl"] = 123
+        index.save()
+        expected = index.search(chunks[11]["embedding"], top_k=5)
+
+        reloaded = ChunkANNIndex(self.path)
+
+        self.assertIsInstance(reloaded._get_vectors(), np.memmap)
+        self.assertEqual(reloaded.dimension, DIMENSION)
+        self.assertEqual(reloaded.live_count, 29)
+        self.assertEqual(reloaded.export_offsets, {"/tmp/export.jsonl": 123})
+        self.assertEqual(reloaded.search(chunks[11]["embedding"], top_k=5), expected)
+        self.assertNotIn("chunk_7", [r["chunk_id"] for r in reloaded.search(chunks[7]["embedding"], top_k=30)])
+
+    def test_reload_rejects_a_different_dimension(self):
+        """Test loading an index with an unexpected dimension fails."""
+        index = ChunkANNIndex(self.path)
+        index.add(make_chunks(3))
+        index.save()
+
+        with self.assertRaises(ValueError):
+            ChunkANNIndex(self.path, dimension=DIMENSION * 2)
+
+    def test_rows_appended_after_the_last_save_are_dropped(self):
+        """Test reloading truncates rows an interrupted add appended after the last save."""
+        chunks = make_chunks(12)
+        index = ChunkANNIndex(self.path)
+        index.add(chunks[:10])
+        index.save()
+        # Rows written to disk without a save, as after a crash mid-batch
+        index.add(chunks[10:])
+        with open(os.path.join(self.path, CHUNKS_FILE), "ab") as f:
+            f.write(b'{"chunk_id": "partial')
+
+        reloaded = ChunkANNIndex(self.path)
+
+        self.assertEqual(reloaded.live_count, 10)
+        self.assertEqual(os.path.getsize(os.path.join(self.path, VECTORS_FILE)), 10 * DIMENSION * 4)
+        self.assertEqual(reloaded.search(chunks[4]["embedding"], top_k=1)[0]["chunk_id"], "chunk_4")
+        self.assertEqual(reloaded.add(chunks[10:]), 2)
+        self.assertEqual(reloaded.search(chunks[11]["embedding"], top_k=1)[0]["chunk_id"], "chunk_11")
+
+    def test_truncated_vector_file_is_reported(self):
+        """Test a vector file shorter than meta.json records is rejected as incomplete."""
+        index = ChunkANNIndex(self.path)
+        index.add(make_chunks(10))
+        index.save()
+        os.truncate(os.path.join(self.path, VECTORS_FILE), 5 * DIMENSION * 4)
+
+        with self.assertRaises(ValueError) as context:
+            ChunkANNIndex(self.path)
+        self.assertIn("incomplete", str(context.exception))
+
+    def test_unknown_format_version_is_rejected(self):
+        """Test meta.json from another format version is rejected."""
+        index = ChunkANNIndex(self.path)
+        index.add(make_chunks(3))
+        index.save()
+        meta_path = os.path.join(self.path, META_FILE)
+        with open(meta_path) as f:
+            meta = json.load(f)
+        meta["format_version"] = 999
+        with open(meta_path, "w") as f:
+            json.dump(meta, f)
+
+        with self.assertRaises(ValueError):
+            ChunkANNIndex(self.path)
+
+    def test_train_builds_codebook_and_compacts_deleted_rows(self):
+        """Test training assigns every row to a list and drops deleted rows from disk."""
+        chunks = make_chunks(64)
+        index = ChunkANNIndex(self.path, nlist=4, min_train_size=32)
+        index.add(chunks)
+        self.assertTrue(index.needs_training())
+        index.remove([f"chunk_{i}" for i in range(8)])
+
+        index.train()
+
+        stats = index.get_stats()
+        self.assertEqual(stats["lists"], 4)
+        self.assertEqual(stats["chunks"], 56)
+        self.assertEqual(stats["deleted_rows"], 0)
+        self.assertEqual(stats["trainings"], 1)
+        self.assertFalse(index.needs_training())
+        self.assertTrue((index._assignments >= 0).all())
+        self.assertEqual(os.path.getsize(os.path.join(self.path, VECTORS_FILE)), 56 * DIMENSION * 4)
+        self.assertEqual(index.search(chunks[20]["embedding"], top_k=1)[0]["chunk_id"], "chunk_20")
+
+    def test_retrain_after_enough_changes(self):
+        """Test needs_training trips past retrain_ratio and retraining assigns new rows."""
+        chunks = make_chunks(80)
+        index = ChunkANNIndex(self.path, nlist=4, min_train_size=32, retrain_ratio=0.2)
+        index.add(chunks[:50])
+        index.train()
+
+        index.add(chunks[50:55])
+        self.assertFalse(index.needs_training())
+        index.add(chunks[55:])
+        self.assertTrue(index.needs_training())
+
+        index.train()
+
+        self.assertFalse(index.needs_training())
+        self.assertEqual(index.get_stats()["trainings"], 2)
+        self.assertEqual(index._trained_rows, 80)
+        self.assertEqual(index.search(chunks[70]["embedding"], top_k=1)[0]["chunk_id"], "chunk_70")
+
+        reloaded = ChunkANNIndex(self.path, nlist=4, min_train_size=32)
+        self.assertEqual(reloaded.get_stats()["lists"], 4)
+        self.assertEqual(reloaded.search(chunks[70]["embedding"], top_k=1)[0]["chunk_id"], "chunk_70")
+
+    def test_small_index_drops_codebook_on_train(self):
+        """Test training an index below min_train_size falls back to exhaustive scans."""
+        chunks = make_chunks(10)
+        index = ChunkANNIndex(self.path, min_train_size=32)
+        index.add(chunks)
+
+        index.train()
+
+        self.assertEqual(index.get_stats()["lists"], 0)
+        self.assertEqual(index.search(chunks[6]["embedding"], top_k=1)[0]["chunk_id"], "chunk_6")
+
+    def test_recall_against_brute_force(self):
+        """Test IVF search recall@10 stays close to an exhaustive scan on a fixed dataset."""
+        chunks = make_chunks(2000, dimension=16, seed=7)
+        queries = np.random.default_rng(11).normal(size=(50, 16)).astype(np.float32)
+        index = ChunkANNIndex(self.path, nlist=32, nprobe=8, min_train_size=256)
+        index.add(chunks)
+        index.train()
+
+        hits = 0
+        for query in queries:
+            expected = set(brute_force(chunks, query, 10))
+            found = {r["chunk_id"] for r in index.search(query.tolist(), top_k=10)}
+            hits += len(expected & found)
+
+        recall = hits / (10 * len(queries))
+        self.assertGreaterEqual(recall, 0.8)
+        self.assertLess(index.get_stats()["avg_rows_scanned"], 2000)
+
+    def test_exhaustive_scan_matches_brute_force(self):
+        """Test an untrained index returns exactly the brute force ranking."""
+        chunks = make_chunks(300, dimension=16, seed=3)
+        query = np.random.default_rng(5).normal(size=16).astype(np.float32)
+        index = ChunkANNIndex(self.path)
+        index.add(chunks)
+
+        found = [r["chunk_id"] for r in index.search(query.tolist(), top_k=10)]
+
+        self.assertEqual(found, brute_force(chunks, query, 10))
+
+    def test_apply_export_reads_only_new_complete_lines(self):
+        """Test apply_export resumes from its saved offset and leaves partial lines."""
+        chunks = make_chunks(4, sources=2)
+        export_path = os.path.join(self.test_dir, "chunks_export.jsonl")
+
+        def line(source_id, source_chunks):
+            return json.dumps({
+                "source_id": source_id,
+                "title": f"title {source_id}",
+                "chunks": [{"chunk_id": c["chunk_id"], "chunk_text": c["chunk_text"],
+                            "embedding": c["embedding"]} for c in source_chunks],
+                "chunk_ids": [c["chunk_id"] for c in source_chunks]
+            }) + "\n"
+
+        with open(export_path, "w") as f:
+            f.write(line(0, [chunks[0], chunks[2]]))
+            f.write(line(1, [chunks[1]])[:20])
+        index = ChunkANNIndex(self.path)
+        totals = index.apply_export(export_path)
+        self.assertEqual(totals, {"lines": 1, "added": 2, "removed": 0})
+
+        with open(export_path, "w") as f:
+            f.write(line(0, [chunks[0], chunks[2]]))
+            f.write(line(1, [chunks[1]]))
+            f.write(line(0, [chunks[0]]))
+        reloaded = ChunkANNIndex(self.path)
+        totals = reloaded.apply_export(export_path)
+
+        self.assertEqual(totals, {"lines": 2, "added": 2, "removed": 1})
+        self.assertEqual(reloaded.live_count, 2)
+        self.assertEqual(reloaded.apply_export(export_path)["lines"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()